@@ -8,7 +8,7 @@ import io
 import asyncio
 import threading
 
-import yaml
+from maestro.yaml_loader import load_yaml
 from maestro.workflow import Workflow, create_agents
 
 app = Flask(__name__)
@@ -19,9 +19,8 @@ position = 0
 
 
 def parse_yaml(file_path):
-    with open(file_path, "r") as file:
-        yaml_data = list(yaml.safe_load_all(file))
-    return yaml_data
+    # Parsed once and cached until the file changes; returns a modifiable copy
+    return load_yaml(file_path)
 
 
 def generate():
@@ -2,11 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import abstractmethod
+import copy
 import os
 import pickle
 import json
-from datetime import datetime
-from typing import Dict, Final, Any
+from typing import Dict, Final, Any, Optional
 
 from maestro.agents.utils import (
     TokenUsageExtractor,
@@ -15,6 +15,24 @@ from maestro.agents.utils import (
 )
 
 from maestro.agents.utils import get_content
+from maestro import events, usage
+from maestro.prompt_budget import context_window, count_tokens as budget_count_tokens
+from maestro.rate_limit import Reservation, get_rate_limiter
+
+_LEVEL_TAGS = (
+    ("DEBUG", events.DEBUG),
+    ("WARN", events.WARNING),
+    ("ERROR", events.ERROR),
+)
+
+
+def _message_level(message) -> int:
+    if isinstance(message, str):
+        tag = message.lstrip()[:5]
+        for prefix, level in _LEVEL_TAGS:
+            if tag.startswith(prefix):
+                return level
+    return events.INFO
 
 
 class Agent:
@@ -59,6 +77,16 @@ class Agent:
             else self.instructions
         )
 
+        # Requests/tokens per minute of this agent's provider, see maestro.rate_limit
+        self.rate_limit_config = agent["spec"].get("rate_limit") or {}
+        model_parameters = agent["spec"].get("model_parameters") or {}
+        self.max_response_tokens = model_parameters.get("max_tokens")
+        # Tokens the model accepts, for budgeting prompts routed with `from:`
+        self.context_window = model_parameters.get("context_window") or context_window(
+            self.agent_model
+        )
+        self._prompt_budget = None
+
         # Base token counters for LLM-style agents. Custom/scoring agents override get_token_usage.
         self.prompt_tokens: int = 0
         self.response_tokens: int = 0
@@ -79,10 +107,23 @@ class Agent:
         """Provides an Emoji for agent type"""
         return self.EMOJIS.get(self.agent_framework, "⚙️")
 
-    def print(self, message) -> str:
-        now = datetime.now()
-        formatted_time = now.strftime("%m-%d-%Y %H:%M:%S")
-        print(f"{self.emoji()} {formatted_time}: {message}")
+    def print(self, message, level=None) -> None:
+        """Emit agent output as an event, shown with the agent's emoji and time.
+
+        Args:
+            message: the output
+            level: event level, by default taken from the message's tag
+                (DEBUG, INFO, WARN or ERROR); untagged messages are INFO
+        """
+        level = level or _message_level(message)
+        if events.BUS.enabled(level):
+            events.emit(
+                level,
+                "agent.output",
+                message,
+                icon=self.emoji(),
+                agent=getattr(self, "agent_name", None),
+            )
 
     @abstractmethod
     async def run(self, prompt: str, context=None, step_index=None) -> str:
@@ -127,12 +168,90 @@ class Agent:
             "total_tokens": self.total_tokens,
         }
 
+    async def acquire_rate_limit(
+        self, prompt, base_url: Optional[str] = None, model: Optional[str] = None
+    ) -> Optional[Reservation]:
+        """Wait until the provider's rate limit allows a model call.
+
+        The call is charged one request and its estimated tokens (instructions,
+        prompt and max_tokens) on the limiter shared by all agents of the same
+        base URL and model. Settle the returned reservation with the tokens the
+        call used, so the estimate is corrected.
+
+        Args:
+            prompt: the prompt of the call
+            base_url: the provider endpoint, defaults to the agent's url
+            model: the model, defaults to the agent's model
+        Returns:
+            The reservation, or None if the provider is not rate limited
+        """
+        limiter = get_rate_limiter(
+            base_url or self.agent_url,
+            model or self.agent_model,
+            self.rate_limit_config.get("requests_per_minute"),
+            self.rate_limit_config.get("tokens_per_minute"),
+        )
+        if limiter is None:
+            return None
+        tokens = 0
+        if limiter.tokens is not None:
+            tokens = utils_count_tokens(f"{self.instructions or ''}\n{prompt}")
+            tokens += self.max_response_tokens or 0
+        return await limiter.acquire(tokens)
+
+    def prompt_budget(self) -> Optional[int]:
+        """Tokens left for the prompt once instructions and response are counted.
+
+        Returns:
+            The budget, or None if the model's context window is unknown
+        """
+        if self.context_window is None:
+            return None
+        if self._prompt_budget is None:
+            self._prompt_budget = max(
+                0,
+                self.context_window
+                - (self.max_response_tokens or 0)
+                - budget_count_tokens(self.instructions or ""),
+            )
+        return self._prompt_budget
+
+    def fork(self) -> "Agent":
+        """A copy for one workflow run, see maestro.agents.registry.
+
+        The copy shares clients, tools and other reusable state with this
+        agent. Its per-run state, the token counters, starts fresh; subclasses
+        with more per-run state reset it here.
+        """
+        clone = copy.copy(self)
+        clone.reset_token_usage()
+        return clone
+
     def reset_token_usage(self) -> None:
         """Reset token usage counters to zero."""
         self.prompt_tokens = 0
         self.response_tokens = 0
         self.total_tokens = 0
 
+    def set_token_usage(self, token_usage: Dict[str, int]) -> Dict[str, int]:
+        """Store the token usage of a run and report it for the run's accounting.
+
+        The counters are shared by every run of the instance; the usage
+        reported to `maestro.usage` belongs to the current run only.
+        """
+        self.prompt_tokens = token_usage["prompt_tokens"]
+        self.response_tokens = token_usage["response_tokens"]
+        self.total_tokens = token_usage["total_tokens"]
+        usage.report(token_usage)
+        return token_usage
+
+    def run_tokens(self) -> int:
+        """Total tokens reported by the current run so far."""
+        reported = usage.reported()
+        if reported is None:
+            return self.total_tokens
+        return reported.get("total_tokens", 0)
+
     def count_tokens(self, text: str) -> int:
         """Count tokens for text using shared utility with sensible logging."""
         agent_label = f"{self.__class__.__name__} {self.agent_name}"
@@ -142,10 +261,7 @@ class Agent:
         """Compute and store token usage for a prompt/response pair."""
         agent_label = f"{self.__class__.__name__} {self.agent_name}"
         token_usage = utils_track_token_usage(prompt, response, agent_label, self.print)
-        self.prompt_tokens = token_usage["prompt_tokens"]
-        self.response_tokens = token_usage["response_tokens"]
-        self.total_tokens = token_usage["total_tokens"]
-        return token_usage
+        return self.set_token_usage(token_usage)
 
     def extract_and_set_token_usage_from_result(self, result: Any) -> Dict[str, int]:
         """Extract token usage from a provider-specific result object and store it."""
@@ -153,10 +269,7 @@ class Agent:
         token_usage = TokenUsageExtractor.extract_from_result(
             result, agent_label, self.print
         )
-        self.prompt_tokens = token_usage["prompt_tokens"]
-        self.response_tokens = token_usage["response_tokens"]
-        self.total_tokens = token_usage["total_tokens"]
-        return token_usage
+        return self.set_token_usage(token_usage)
 
 
 def _load_agent_db():
@@ -328,14 +328,22 @@ class BeeAILocalAgent(Agent):
         await self._create_agent() if not self.agent else None
 
         self.print(f"Running {self.agent_name}...\n")
-        response = await self.agent.run(
-            prompt=prompt,
-            execution=AgentExecutionConfig(
-                max_retries_per_step=3, total_max_retries=10, max_iterations=20
-            ),
-            signal=AbortSignal.timeout(2 * 60 * 1000),
-        ).observe(self._observer)
-        answer = response.result.text
+        reservation = await self.acquire_rate_limit(prompt)
+        used_tokens = 0
+        try:
+            response = await self.agent.run(
+                prompt=prompt,
+                execution=AgentExecutionConfig(
+                    max_retries_per_step=3, total_max_retries=10, max_iterations=20
+                ),
+                signal=AbortSignal.timeout(2 * 60 * 1000),
+            ).observe(self._observer)
+            answer = response.result.text
+            used_tokens = self.count_tokens(prompt) + self.count_tokens(answer)
+        finally:
+            # A failed run gives the whole estimate back
+            if reservation is not None:
+                reservation.settle(used_tokens)
         await self.mcp_stack.aclose()
         self.print(f"Response from {self.agent_name}: {answer}\n")
         return answer
@@ -351,14 +359,22 @@ class BeeAILocalAgent(Agent):
         await self._create_agent() if not self.agent else None
 
         self.print(f"Running {self.agent_name}...\n")
-        response = await self.agent.run(
-            prompt=prompt,
-            execution=AgentExecutionConfig(
-                max_retries_per_step=3, total_max_retries=10, max_iterations=20
-            ),
-            signal=AbortSignal.timeout(2 * 60 * 1000),
-        ).observe(self._observer)
-        answer = response.result.text
+        reservation = await self.acquire_rate_limit(prompt)
+        used_tokens = 0
+        try:
+            response = await self.agent.run(
+                prompt=prompt,
+                execution=AgentExecutionConfig(
+                    max_retries_per_step=3, total_max_retries=10, max_iterations=20
+                ),
+                signal=AbortSignal.timeout(2 * 60 * 1000),
+            ).observe(self._observer)
+            answer = response.result.text
+            used_tokens = self.count_tokens(prompt) + self.count_tokens(answer)
+        finally:
+            # A failed run gives the whole estimate back
+            if reservation is not None:
+                reservation.settle(used_tokens)
         await self.mcp_stack.aclose()
         self.print(f"Response from {self.agent_name}: {answer}\n")
         return answer
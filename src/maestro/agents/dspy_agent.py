@@ -90,10 +90,21 @@ class DspyAgent(BaseAgent):
             self.print(f"Running Dspy agent: {self.agent_name} with prompt: {prompt}\n")
             self.dspy_agent = dspy.ReAct(self.dspy_signature, dspy_tools)
             result = {}
+            reservation = None
+            used_tokens = 0
             try:
+                reservation = await self.acquire_rate_limit(prompt, self.provider_url)
                 result = await self.dspy_agent.acall(user_request=prompt)
+                if result:
+                    used_tokens = self.count_tokens(prompt) + self.count_tokens(
+                        str(result.process_result)
+                    )
             except Exception as e:
                 print(f"Agent error: {e}")
+            finally:
+                # A failed run gives the whole estimate back
+                if reservation is not None:
+                    reservation.settle(used_tokens)
 
             await mcp_stack.aclose()
             if result and result.process_result:
@@ -7,16 +7,40 @@ Automatic evaluation middleware for Maestro agents using IBM Watsonx Governance.
 This module provides transparent evaluation of agent responses using watsonx evaluation metrics
 such as answer relevance, faithfulness, context relevance, etc.
 
+Responses are not evaluated inline: agents queue them and return, and a background
+thread evaluates the queued responses in batches and appends the results through
+`EvaluationLogger`. The queue is bounded; responses arriving while it is full are
+dropped and counted in `maestro_evaluations_total{result="dropped"}`. Queued
+evaluations are finished before the process exits.
+
 Usage:
     Set MAESTRO_AUTO_EVALUATION=true to enable automatic evaluation.
     Requires WATSONX_APIKEY environment variable for actual evaluations.
+
+Environment:
+    MAESTRO_EVAL_SAMPLE_RATE: percentage of responses evaluated (default: 100)
+    MAESTRO_EVAL_SAMPLE_AGENTS: percentages by agent, e.g. "writer=10,critic=50"
+    MAESTRO_EVAL_SAMPLE_WORKFLOWS: percentages by workflow name, e.g. "nightly=0"
+        An agent's percentage takes precedence over its workflow's
+    MAESTRO_EVAL_QUEUE_SIZE: responses waiting for evaluation (default: 1000)
+    MAESTRO_EVAL_BATCH_SIZE: responses evaluated together (default: 8)
+    MAESTRO_EVAL_FLUSH_TIMEOUT: seconds to finish queued evaluations at exit
+        (default: 30)
 """
 
+import asyncio
+import atexit
+import itertools
 import os
+import queue
+import random
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import pandas as pd
+from maestro import events
 from maestro.file_logger import EvaluationLogger
+from maestro.metrics import EVALUATIONS
 
 try:
     from dotenv import load_dotenv
@@ -61,6 +85,164 @@ except ImportError:
     ContextRelevanceMetric = None
     AnswerSimilarityMetric = None
 
+METRIC_NAMES = (
+    "answer_relevance",
+    "faithfulness",
+    "context_relevance",
+    "answer_similarity",
+)
+
+_interaction_ids = itertools.count()
+
+
+def _parse_rates(value: Optional[str]) -> Dict[str, float]:
+    """Parse "name=percent,..." sampling rates."""
+    rates = {}
+    for item in (value or "").split(","):
+        if "=" in item:
+            name, rate = item.rsplit("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+class EvaluationSampler:
+    """Decide which responses are evaluated, by percentage."""
+
+    def __init__(
+        self,
+        rate: float = 100.0,
+        agents: Optional[Dict[str, float]] = None,
+        workflows: Optional[Dict[str, float]] = None,
+    ):
+        self.default_rate = rate
+        self.agents = agents or {}
+        self.workflows = workflows or {}
+
+    @classmethod
+    def from_env(cls) -> "EvaluationSampler":
+        return cls(
+            float(os.getenv("MAESTRO_EVAL_SAMPLE_RATE", "100")),
+            _parse_rates(os.getenv("MAESTRO_EVAL_SAMPLE_AGENTS")),
+            _parse_rates(os.getenv("MAESTRO_EVAL_SAMPLE_WORKFLOWS")),
+        )
+
+    def rate(self, agent_name: str, workflow: Optional[str] = None) -> float:
+        """The percentage of responses of an agent (in a workflow) evaluated."""
+        if agent_name in self.agents:
+            return self.agents[agent_name]
+        if workflow in self.workflows:
+            return self.workflows[workflow]
+        return self.default_rate
+
+    def sample(self, agent_name: str, workflow: Optional[str] = None) -> bool:
+        rate = self.rate(agent_name, workflow)
+        return rate >= 100 or random.random() * 100 < rate
+
+
+class EvaluationJob:
+    """An agent response waiting for evaluation."""
+
+    __slots__ = (
+        "agent_name",
+        "prompt",
+        "response",
+        "context",
+        "expected_answer",
+        "workflow",
+        "interaction_id",
+    )
+
+    def __init__(
+        self,
+        agent_name: str,
+        prompt: str,
+        response: str,
+        context=None,
+        expected_answer=None,
+        workflow: Optional[str] = None,
+    ):
+        self.agent_name = agent_name
+        self.prompt = str(prompt)
+        self.response = str(response)
+        self.context = context
+        self.expected_answer = expected_answer
+        self.workflow = workflow
+        self.interaction_id = (
+            f"maestro_{agent_name}_{int(time.time())}_{next(_interaction_ids)}"
+        )
+
+
+class EvaluationQueue:
+    """Bounded queue of responses evaluated in batches by a background thread."""
+
+    def __init__(self, evaluate_batch, maxsize: int = 1000, batch_size: int = 8):
+        self._evaluate_batch = evaluate_batch
+        self._queue = queue.Queue(maxsize)
+        self.batch_size = batch_size
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, job: EvaluationJob) -> bool:
+        """Queue a job without waiting; False if the queue is full."""
+        self._start()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            EVALUATIONS.labels(job.agent_name, "dropped").inc()
+            return False
+        EVALUATIONS.labels(job.agent_name, "queued").inc()
+        return True
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._work, name="maestro-evaluation", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self._flush_at_exit)
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._evaluate_batch(batch)
+            except Exception as e:
+                events.warning(
+                    "evaluation.failed",
+                    "⚠️  Maestro Auto Evaluation: batch of %d failed: %s",
+                    len(batch),
+                    e,
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def pending(self) -> int:
+        """Jobs queued or being evaluated."""
+        return self._queue.unfinished_tasks
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued jobs are evaluated; False if the timeout expired."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _flush_at_exit(self) -> None:
+        self.flush(float(os.getenv("MAESTRO_EVAL_FLUSH_TIMEOUT", "30")))
+
 
 class SimpleEvaluationMiddleware:
     """
@@ -72,6 +254,15 @@ class SimpleEvaluationMiddleware:
         self.evaluator = None
         self.metrics_config = None
         self.eval_logger = EvaluationLogger()
+        self.sampler = EvaluationSampler.from_env()
+        self.queue = EvaluationQueue(
+            self.evaluate_batch,
+            int(os.getenv("MAESTRO_EVAL_QUEUE_SIZE", "1000")),
+            int(os.getenv("MAESTRO_EVAL_BATCH_SIZE", "8")),
+        )
+        self._unavailable_reported = False
+        # The evaluator accumulates the results of a run, one batch at a time
+        self._evaluator_lock = threading.Lock()
 
         # Initialize evaluator if watsonx is available (we'll check enabled status at runtime)
         if WATSONX_AVAILABLE:
@@ -116,74 +307,243 @@ class SimpleEvaluationMiddleware:
             print(f"⚠️  Maestro Auto Evaluation: Failed to initialize evaluator: {e}")
             self.enabled = False
 
+    def _can_evaluate(self) -> bool:
+        if WATSONX_AVAILABLE and self.evaluator:
+            return True
+        if not self._unavailable_reported:
+            self._unavailable_reported = True
+            events.warning(
+                "evaluation.unavailable",
+                "⚠️  Maestro Auto Evaluation: %s",
+                "Evaluator not initialized"
+                if WATSONX_AVAILABLE
+                else "Watsonx library not available",
+            )
+        return False
+
+    def submit(self, agent_name: str, prompt: str, response: str, **kwargs) -> bool:
+        """Queue a response for background evaluation, if enabled and sampled.
+
+        Args:
+            agent_name: Name of the agent that generated the response
+            prompt: The input prompt
+            response: The agent's response
+            **kwargs: context, expected_answer and workflow (defaults to the
+                workflow of the current run)
+
+        Returns:
+            True if the response was queued
+        """
+        if not self._is_evaluation_enabled() or not self._can_evaluate():
+            return False
+        workflow = kwargs.get("workflow") or events.bound_fields().get("workflow")
+        if not self.sampler.sample(agent_name, workflow):
+            EVALUATIONS.labels(agent_name, "sampled_out").inc()
+            return False
+        return self.queue.submit(
+            EvaluationJob(
+                agent_name,
+                prompt,
+                response,
+                kwargs.get("context"),
+                kwargs.get("expected_answer"),
+                workflow,
+            )
+        )
+
     async def evaluate_response(
         self, agent_name: str, prompt: str, response: str, **kwargs
     ) -> Optional[Dict[str, Any]]:
         """
-        Evaluate an agent response and return the evaluation results.
+        Evaluate an agent response now and return the evaluation results.
 
         Args:
             agent_name: Name of the agent that generated the response
             prompt: The input prompt
             response: The agent's response
-            **kwargs: Additional context (context, step_index, etc.)
+            **kwargs: Additional context (context, expected_answer, etc.)
 
         Returns:
             Dict with evaluation results or None if evaluation disabled/failed
         """
-
-        if not self._is_evaluation_enabled():
+        if not self._is_evaluation_enabled() or not self._can_evaluate():
             return None
+        job = EvaluationJob(
+            agent_name,
+            prompt,
+            response,
+            kwargs.get("context"),
+            kwargs.get("expected_answer"),
+            kwargs.get("workflow"),
+        )
+        return (await asyncio.to_thread(self.evaluate_batch, [job]))[0]
+
+    def evaluate_batch(self, jobs: List[EvaluationJob]) -> List[Dict[str, Any]]:
+        """Evaluate responses and append the results to the evaluation log.
+
+        The metric scores of the batch are tabulated together and the results
+        are written with one append.
+        """
+        start_time = time.time()
+        scores = {}
+        results = []
+        with self._evaluator_lock:
+            for job in jobs:
+                try:
+                    scores[job.interaction_id] = self._score(job)
+                except Exception as e:
+                    EVALUATIONS.labels(job.agent_name, "failed").inc()
+                    events.warning(
+                        "evaluation.failed",
+                        "❌ Maestro Auto Evaluation: Evaluation failed: %s",
+                        e,
+                        agent=job.agent_name,
+                    )
+                    results.append(
+                        {
+                            "agent_name": job.agent_name,
+                            "error": str(e),
+                            "status": "evaluation_failed",
+                        }
+                    )
+        evaluation_time = (time.time() - start_time) / max(1, len(jobs))
 
-        if not WATSONX_AVAILABLE:
-            print("⚠️  Maestro Auto Evaluation: Watsonx library not available")
-            return None
+        try:
+            df = self._create_evaluation_dataframe(scores)
+        except Exception as df_error:
+            events.warning(
+                "evaluation.dataframe",
+                "📊 Maestro Auto Evaluation: DataFrame creation issue: %s",
+                df_error,
+            )
+            df = None
+
+        logged = []
+        for job in jobs:
+            evaluation_results = scores.get(job.interaction_id)
+            if evaluation_results is None:
+                continue
+            final_result = self._final_result(
+                job, evaluation_results, df, evaluation_time
+            )
+            self._print_evaluation_summary(final_result)
+            EVALUATIONS.labels(job.agent_name, "evaluated").inc()
+            results.append(final_result)
+            logged.append(final_result)
 
-        if not self.evaluator:
-            print("⚠️  Maestro Auto Evaluation: Evaluator not initialized")
-            return None
+        try:
+            self.eval_logger.extend(logged)
+        except Exception as log_err:
+            events.warning(
+                "evaluation.log",
+                "⚠️  Maestro Auto Evaluation: Failed to persist evaluation run: %s",
+                log_err,
+            )
+        return results
+
+    def _score(self, job: EvaluationJob) -> Dict[str, Any]:
+        """Run the watsonx metrics on a response, returning the captured results."""
+        prompt = job.prompt
+        response_text = job.response
+        events.debug(
+            "evaluation.run",
+            "🔍 Maestro Auto Evaluation: Evaluating response from %s",
+            job.agent_name,
+            agent=job.agent_name,
+        )
+
+        # Start evaluation run
+        self.evaluator.start_run()
+
+        # Create evaluation input
+        eval_input = {
+            "input_text": prompt,
+            "output": response_text,
+            "interaction_id": job.interaction_id,
+        }
 
+        # Add context if available
+        if job.context:
+            eval_input["context"] = job.context
         try:
-            start_time = time.time()
+            events.debug(
+                "evaluation.run",
+                "🔄 Maestro Auto Evaluation: Running watsonx evaluation metrics...",
+            )
 
-            # Convert response to string if needed
-            response_text = str(response) if not isinstance(response, str) else response
+            evaluation_results = {}
 
-            print(f"🔍 Maestro Auto Evaluation: Evaluating response from {agent_name}")
+            try:
+                state = EvaluationState(
+                    input_text=prompt, interaction_id=eval_input["interaction_id"]
+                )
 
-            # Start evaluation run
-            self.evaluator.start_run()
+                if "context" in eval_input and eval_input["context"]:
+                    state.context = [eval_input["context"]]
+
+                @self.evaluator.evaluate_answer_relevance
+                def run_answer_relevance(state: EvaluationState, config=None):
+                    """Function that mutates state object for answer relevance evaluation."""
+                    state.generated_text = response_text
+                    # Return a dictionary as expected by the watsonx library
+                    return {
+                        "generated_text": response_text,
+                        "input_text": state.input_text,
+                        "interaction_id": state.interaction_id,
+                        "context": state.context if hasattr(state, "context") else [],
+                    }
 
-            # Create evaluation input
-            eval_input = {
-                "input_text": prompt,
-                "output": response_text,
-                "interaction_id": f"maestro_{agent_name}_{int(time.time())}",
-            }
+                run_answer_relevance(state, None)
+                evaluation_results["answer_relevance"] = "triggered"
 
-            # Add context if available
-            if "context" in kwargs and kwargs["context"]:
-                eval_input["context"] = kwargs["context"]
-            try:
-                print(
-                    "🔄 Maestro Auto Evaluation: Running watsonx evaluation metrics..."
+            except Exception as relevance_error:
+                events.warning(
+                    "evaluation.metric",
+                    "⚠️  Answer relevance evaluation failed: %s",
+                    relevance_error,
                 )
+                evaluation_results["answer_relevance"] = None
 
-                evaluation_results = {}
+            try:
+                if "context" in eval_input and eval_input["context"]:
 
-                try:
-                    state = EvaluationState(
-                        input_text=prompt, interaction_id=eval_input["interaction_id"]
+                    @self.evaluator.evaluate_faithfulness
+                    def run_faithfulness(state: EvaluationState, config=None):
+                        """Function that mutates state object for faithfulness evaluation."""
+                        state.generated_text = response_text
+                        state.context = state.context
+                        return {
+                            "generated_text": response_text,
+                            "input_text": state.input_text,
+                            "interaction_id": state.interaction_id,
+                            "context": state.context
+                            if hasattr(state, "context")
+                            else [],
+                        }
+
+                    run_faithfulness(state, None)
+                    evaluation_results["faithfulness"] = "triggered"
+                else:
+                    events.debug(
+                        "evaluation.metric",
+                        "ℹ️  Skipping faithfulness evaluation (no context provided)",
                     )
+            except Exception as faithfulness_error:
+                events.warning(
+                    "evaluation.metric",
+                    "⚠️  Faithfulness evaluation failed: %s",
+                    faithfulness_error,
+                )
+                evaluation_results["faithfulness"] = None
 
-                    if "context" in eval_input and eval_input["context"]:
-                        state.context = [eval_input["context"]]
+            try:
+                if "context" in eval_input and eval_input["context"]:
 
-                    @self.evaluator.evaluate_answer_relevance
-                    def run_answer_relevance(state: EvaluationState, config=None):
-                        """Function that mutates state object for answer relevance evaluation."""
+                    @self.evaluator.evaluate_context_relevance
+                    def run_context_relevance(state: EvaluationState, config=None):
+                        """Function that mutates state object for context relevance evaluation."""
                         state.generated_text = response_text
-                        # Return a dictionary as expected by the watsonx library
+                        state.context = state.context
                         return {
                             "generated_text": response_text,
                             "input_text": state.input_text,
@@ -193,246 +553,179 @@ class SimpleEvaluationMiddleware:
                             else [],
                         }
 
-                    run_answer_relevance(state, None)
-                    evaluation_results["answer_relevance"] = "triggered"
+                    run_context_relevance(state, None)
+                    evaluation_results["context_relevance"] = "triggered"
+                else:
+                    events.debug(
+                        "evaluation.metric",
+                        "ℹ️  Skipping context relevance evaluation (no context provided)",
+                    )
+            except Exception as context_relevance_error:
+                events.warning(
+                    "evaluation.metric",
+                    "⚠️  Context relevance evaluation failed: %s",
+                    context_relevance_error,
+                )
+                evaluation_results["context_relevance"] = None
 
-                except Exception as relevance_error:
-                    print(f"⚠️  Answer relevance evaluation failed: {relevance_error}")
-                    evaluation_results["answer_relevance"] = None
+            try:
+                if job.expected_answer:
 
-                try:
-                    if "context" in eval_input and eval_input["context"]:
-
-                        @self.evaluator.evaluate_faithfulness
-                        def run_faithfulness(state: EvaluationState, config=None):
-                            """Function that mutates state object for faithfulness evaluation."""
-                            state.generated_text = response_text
-                            state.context = state.context
-                            return {
-                                "generated_text": response_text,
-                                "input_text": state.input_text,
-                                "interaction_id": state.interaction_id,
-                                "context": state.context
-                                if hasattr(state, "context")
-                                else [],
-                            }
-
-                        run_faithfulness(state, None)
-                        evaluation_results["faithfulness"] = "triggered"
-                    else:
-                        print(
-                            "ℹ️  Skipping faithfulness evaluation (no context provided)"
-                        )
-                except Exception as faithfulness_error:
-                    print(f"⚠️  Faithfulness evaluation failed: {faithfulness_error}")
-                    evaluation_results["faithfulness"] = None
+                    @self.evaluator.evaluate_answer_similarity
+                    def run_answer_similarity(state: EvaluationState, config=None):
+                        """Function that mutates state object for answer similarity evaluation."""
+                        state.generated_text = response_text
+                        state.expected_answer = job.expected_answer
+                        return {
+                            "generated_text": response_text,
+                            "input_text": state.input_text,
+                            "interaction_id": state.interaction_id,
+                            "expected_answer": job.expected_answer,
+                        }
 
-                try:
-                    if "context" in eval_input and eval_input["context"]:
-
-                        @self.evaluator.evaluate_context_relevance
-                        def run_context_relevance(state: EvaluationState, config=None):
-                            """Function that mutates state object for context relevance evaluation."""
-                            state.generated_text = response_text
-                            state.context = state.context
-                            return {
-                                "generated_text": response_text,
-                                "input_text": state.input_text,
-                                "interaction_id": state.interaction_id,
-                                "context": state.context
-                                if hasattr(state, "context")
-                                else [],
-                            }
-
-                        run_context_relevance(state, None)
-                        evaluation_results["context_relevance"] = "triggered"
-                    else:
-                        print(
-                            "ℹ️  Skipping context relevance evaluation (no context provided)"
-                        )
-                except Exception as context_relevance_error:
-                    print(
-                        f"⚠️  Context relevance evaluation failed: {context_relevance_error}"
+                    run_answer_similarity(state, None)
+                    evaluation_results["answer_similarity"] = "triggered"
+                else:
+                    events.debug(
+                        "evaluation.metric",
+                        "ℹ️  Skipping answer similarity evaluation (no expected answer provided)",
                     )
-                    evaluation_results["context_relevance"] = None
+            except Exception as answer_similarity_error:
+                events.warning(
+                    "evaluation.metric",
+                    "⚠️  Answer similarity evaluation failed: %s",
+                    answer_similarity_error,
+                )
 
-                try:
-                    if "expected_answer" in kwargs and kwargs["expected_answer"]:
-
-                        @self.evaluator.evaluate_answer_similarity
-                        def run_answer_similarity(state: EvaluationState, config=None):
-                            """Function that mutates state object for answer similarity evaluation."""
-                            state.generated_text = response_text
-                            state.expected_answer = kwargs["expected_answer"]
-                            return {
-                                "generated_text": response_text,
-                                "input_text": state.input_text,
-                                "interaction_id": state.interaction_id,
-                                "expected_answer": kwargs["expected_answer"],
-                            }
-
-                        run_answer_similarity(state, None)
-                        evaluation_results["answer_similarity"] = "triggered"
-                    else:
-                        print(
-                            "ℹ️  Skipping answer similarity evaluation (no expected answer provided)"
-                        )
-                except Exception as answer_similarity_error:
-                    print(
-                        f"⚠️  Answer similarity evaluation failed: {answer_similarity_error}"
-                    )
+            events.debug(
+                "evaluation.run",
+                "📊 Maestro Auto Evaluation: Completed %d metrics",
+                len(evaluation_results),
+            )
 
-                print(
-                    f"📊 Maestro Auto Evaluation: Completed {len(evaluation_results)} metrics"
+        except Exception as eval_error:
+            events.warning(
+                "evaluation.failed",
+                "⚠️  Maestro Auto Evaluation: Evaluation call failed: %s",
+                eval_error,
+            )
+            evaluation_results = {}
+        online_results = getattr(
+            self.evaluator, "_AgenticEvaluator__online_metric_results", []
+        )
+
+        for metric_result in online_results:
+            if metric_result.name in METRIC_NAMES:
+                evaluation_results[f"{metric_result.name}_score"] = metric_result.value
+                evaluation_results[f"{metric_result.name}_method"] = (
+                    metric_result.method
                 )
-
-            except Exception as eval_error:
-                print(
-                    f"⚠️  Maestro Auto Evaluation: Evaluation call failed: {eval_error}"
+                evaluation_results[f"{metric_result.name}_provider"] = (
+                    metric_result.provider
                 )
-                evaluation_results = {}
-            online_results = getattr(
-                self.evaluator, "_AgenticEvaluator__online_metric_results", []
-            )
 
-            for metric_result in online_results:
-                if metric_result.name in [
-                    "answer_relevance",
-                    "faithfulness",
-                    "context_relevance",
-                    "answer_similarity",
-                ]:
+        self.evaluator.end_run()
+        eval_result = self.evaluator.get_result()
+
+        # Check if we have any metrics results in the evaluator result
+        if hasattr(eval_result, "metrics_results") and eval_result.metrics_results:
+            for metric_result in eval_result.metrics_results:
+                # Store the actual scores
+                if metric_result.name in METRIC_NAMES:
                     evaluation_results[f"{metric_result.name}_score"] = (
                         metric_result.value
                     )
-                    evaluation_results[f"{metric_result.name}_method"] = (
-                        metric_result.method
-                    )
-                    evaluation_results[f"{metric_result.name}_provider"] = (
-                        metric_result.provider
-                    )
-
-            self.evaluator.end_run()
-            eval_result = self.evaluator.get_result()
-
-            # Check if we have any metrics results in the evaluator result
-            if hasattr(eval_result, "metrics_results") and eval_result.metrics_results:
-                for metric_result in eval_result.metrics_results:
-                    # Store the actual scores
-                    if metric_result.name in [
-                        "answer_relevance",
-                        "faithfulness",
-                        "context_relevance",
-                        "answer_similarity",
-                    ]:
-                        evaluation_results[f"{metric_result.name}_score"] = (
-                            metric_result.value
-                        )
-
-            if evaluation_results:
-                try:
-                    df = self._create_evaluation_dataframe(
-                        evaluation_results, eval_input["interaction_id"]
-                    )
-                    evaluation_data = self._extract_evaluation_data(df)
-                except Exception as df_error:
-                    print(
-                        f"📊 Maestro Auto Evaluation: DataFrame creation issue: {df_error}"
-                    )
-                    evaluation_data = {
-                        "status": "dataframe_creation_failed",
-                        "note": "Failed to create DataFrame from captured results",
-                        "framework": "watsonx_governance",
-                        "metrics_count": len(
-                            [
-                                k
-                                for k in evaluation_results.keys()
-                                if k.endswith("_score")
-                            ]
-                        ),
-                    }
-            else:
-                evaluation_data = {
-                    "status": "no_metrics",
-                    "note": "No evaluation metrics were captured",
-                    "framework": "watsonx_governance",
-                }
-
-            end_time = time.time()
-            evaluation_time = end_time - start_time
-
-            final_result = {
-                "agent_name": agent_name,
-                "prompt": prompt,
-                "response": response_text,
-                "evaluation_time_ms": int(evaluation_time * 1000),
-                "timestamp": int(time.time()),
-                "evaluator": "watsonx_governance",
-                "metrics": evaluation_data,
-                "watsonx_scores": {
-                    key: value
-                    for key, value in evaluation_results.items()
-                    if key.endswith("_score")
-                },
-                "watsonx_methods": {
-                    key: value
-                    for key, value in evaluation_results.items()
-                    if key.endswith("_method")
-                },
-                "watsonx_providers": {
-                    key: value
-                    for key, value in evaluation_results.items()
-                    if key.endswith("_provider")
-                },
+        return evaluation_results
+
+    def _final_result(
+        self,
+        job: EvaluationJob,
+        evaluation_results: Dict[str, Any],
+        df: Optional[pd.DataFrame],
+        evaluation_time: float,
+    ) -> Dict[str, Any]:
+        if not evaluation_results:
+            evaluation_data = {
+                "status": "no_metrics",
+                "note": "No evaluation metrics were captured",
+                "framework": "watsonx_governance",
             }
-
-            self._print_evaluation_summary(final_result)
-
-            try:
-                if "run_id" not in final_result:
-                    final_result["run_id"] = f"{agent_name}_{final_result['timestamp']}"
-                self.eval_logger.append(final_result)
-            except Exception as log_err:
-                print(
-                    f"⚠️  Maestro Auto Evaluation: Failed to persist evaluation run: {log_err}"
-                )
-
-            return final_result
-
-        except Exception as e:
-            print(f"❌ Maestro Auto Evaluation: Evaluation failed: {e}")
-            return {
-                "agent_name": agent_name,
-                "error": str(e),
-                "status": "evaluation_failed",
+        elif df is not None:
+            evaluation_data = self._extract_evaluation_data(df, job.interaction_id)
+        else:
+            evaluation_data = {
+                "status": "dataframe_creation_failed",
+                "note": "Failed to create DataFrame from captured results",
+                "framework": "watsonx_governance",
+                "metrics_count": len(
+                    [k for k in evaluation_results.keys() if k.endswith("_score")]
+                ),
             }
 
+        timestamp = int(time.time())
+        final_result = {
+            "agent_name": job.agent_name,
+            "prompt": job.prompt,
+            "response": job.response,
+            "evaluation_time_ms": int(evaluation_time * 1000),
+            "timestamp": timestamp,
+            "evaluator": "watsonx_governance",
+            "metrics": evaluation_data,
+            "watsonx_scores": {
+                key: value
+                for key, value in evaluation_results.items()
+                if key.endswith("_score")
+            },
+            "watsonx_methods": {
+                key: value
+                for key, value in evaluation_results.items()
+                if key.endswith("_method")
+            },
+            "watsonx_providers": {
+                key: value
+                for key, value in evaluation_results.items()
+                if key.endswith("_provider")
+            },
+            "run_id": f"{job.agent_name}_{timestamp}",
+        }
+        if job.workflow:
+            final_result["workflow"] = job.workflow
+        return final_result
+
     def _create_evaluation_dataframe(
-        self, evaluation_results: Dict[str, Any], interaction_id: str
+        self, scores: Dict[str, Dict[str, Any]]
     ) -> pd.DataFrame:
-        """Create a DataFrame from captured evaluation results.
+        """Create a DataFrame from the captured evaluation results of a batch.
 
         This works around the watsonx library bug where to_df() fails.
+
+        Args:
+            scores: evaluation results by interaction id
+        Returns:
+            One row of metric values per interaction id
         """
 
         df_data = []
-        for metric_name, score in evaluation_results.items():
-            if metric_name.endswith("_score"):
-                base_name = metric_name.replace("_score", "")
-                method = evaluation_results.get(f"{base_name}_method", "unknown")
-                provider = evaluation_results.get(f"{base_name}_provider", "unknown")
-
-                df_data.append(
-                    {
-                        "interaction_id": interaction_id,
-                        "metric_name": base_name,
-                        "value": score,
-                        "method": method,
-                        "provider": provider,
-                        "applies_to": "interaction",
-                        "node_name": "evaluation",
-                    }
-                )
+        for interaction_id, evaluation_results in scores.items():
+            for metric_name, score in evaluation_results.items():
+                if metric_name.endswith("_score"):
+                    base_name = metric_name.replace("_score", "")
+                    method = evaluation_results.get(f"{base_name}_method", "unknown")
+                    provider = evaluation_results.get(
+                        f"{base_name}_provider", "unknown"
+                    )
+
+                    df_data.append(
+                        {
+                            "interaction_id": interaction_id,
+                            "metric_name": base_name,
+                            "value": score,
+                            "method": method,
+                            "provider": provider,
+                            "applies_to": "interaction",
+                            "node_name": "evaluation",
+                        }
+                    )
 
         if df_data:
             df = pd.DataFrame(df_data)
@@ -456,12 +749,15 @@ class SimpleEvaluationMiddleware:
         else:
             return pd.DataFrame()
 
-    def _extract_evaluation_data(self, df) -> Dict[str, Any]:
-        """Extract evaluation data from watsonx DataFrame."""
+    def _extract_evaluation_data(self, df, interaction_id: str) -> Dict[str, Any]:
+        """Extract the evaluation data of an interaction from a watsonx DataFrame."""
         if df.empty:
             return {"status": "no_data", "note": "No evaluation metrics available"}
+        rows = df[df["interaction_id"] == interaction_id]
+        if rows.empty:
+            return {"status": "no_data", "note": "No evaluation metrics available"}
 
-        row = df.iloc[0]
+        row = rows.iloc[0]
         metrics = {}
         for col in df.columns:
             if col.startswith(
@@ -479,34 +775,36 @@ class SimpleEvaluationMiddleware:
 
         return {
             "status": "success",
-            "dataframe_shape": df.shape,
+            "dataframe_shape": (1, df.shape[1]),
             "dataframe_columns": list(df.columns),
             "metrics": metrics,
         }
 
     def _print_evaluation_summary(self, result: Dict[str, Any]) -> None:
-        """Print a concise evaluation summary."""
+        """Emit a concise evaluation summary."""
         agent_name = result.get("agent_name", "unknown")
         eval_time = result.get("evaluation_time_ms", 0)
 
-        print(f"📊 Maestro Auto Evaluation Summary for {agent_name}:")
-        print(f"   ⏱️  Evaluation time: {eval_time}ms")
+        lines = [
+            f"📊 Maestro Auto Evaluation Summary for {agent_name}:",
+            f"   ⏱️  Evaluation time: {eval_time}ms",
+        ]
 
         metrics = result.get("metrics", {})
         if isinstance(metrics, dict):
             if "status" in metrics:
-                print(f"   📈 Status: {metrics['status']}")
+                lines.append(f"   📈 Status: {metrics['status']}")
                 if "note" in metrics:
-                    print(f"   📝 Note: {metrics['note']}")
+                    lines.append(f"   📝 Note: {metrics['note']}")
 
             metric_values = metrics.get("metrics", {}) if "metrics" in metrics else {}
             if metric_values:
-                print(f"   📏 Metrics calculated: {len(metric_values)}")
+                lines.append(f"   📏 Metrics calculated: {len(metric_values)}")
                 for key, value in metric_values.items():
-                    print(f"      {key}: {value}")
+                    lines.append(f"      {key}: {value}")
 
         if "watsonx_scores" in result and result["watsonx_scores"]:
-            print("   🎯 Watsonx Evaluation Scores:")
+            lines.append("   🎯 Watsonx Evaluation Scores:")
             for metric_name, score in result["watsonx_scores"].items():
                 method = result.get("watsonx_methods", {}).get(
                     f"{metric_name.replace('_score', '')}_method", "unknown"
@@ -514,14 +812,21 @@ class SimpleEvaluationMiddleware:
                 provider = result.get("watsonx_providers", {}).get(
                     f"{metric_name.replace('_score', '')}_provider", "unknown"
                 )
-                print(f"      {metric_name}: {score:.3f} ({method} via {provider})")
+                lines.append(
+                    f"      {metric_name}: {score:.3f} ({method} via {provider})"
+                )
         else:
-            print("   🗄️  Database structure preview:")
-            print(f"      agent_name: {result.get('agent_name')}")
-            print(f"      timestamp: {result.get('timestamp')}")
-            print(f"      prompt_length: {len(result.get('prompt', ''))}")
-            print(f"      response_length: {len(result.get('response', ''))}")
-            print(f"      evaluator: {result.get('evaluator')}")
+            lines.extend(
+                [
+                    "   🗄️  Database structure preview:",
+                    f"      agent_name: {result.get('agent_name')}",
+                    f"      timestamp: {result.get('timestamp')}",
+                    f"      prompt_length: {len(result.get('prompt', ''))}",
+                    f"      response_length: {len(result.get('response', ''))}",
+                    f"      evaluator: {result.get('evaluator')}",
+                ]
+            )
+        events.info("evaluation.summary", lambda: "\n".join(lines), agent=agent_name)
 
 
 _evaluation_middleware = None
@@ -537,11 +842,13 @@ def get_evaluation_middleware() -> SimpleEvaluationMiddleware:
 
 async def auto_evaluate_response(
     agent_name: str, prompt: str, response: str, **kwargs
-) -> Optional[Dict[str, Any]]:
+) -> bool:
     """
     Convenience function for automatic response evaluation.
 
     This is the main function that agents will call to evaluate their responses.
+    It only queues the response, so the agent's run is not delayed; see
+    `SimpleEvaluationMiddleware.submit`.
     """
     middleware = get_evaluation_middleware()
-    return await middleware.evaluate_response(agent_name, prompt, response, **kwargs)
+    return middleware.submit(agent_name, prompt, response, **kwargs)
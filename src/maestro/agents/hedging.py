@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Hedged and fallback model requests.
+
+A slow provider response holds up every later step of a sequential workflow.
+Agents can opt in to two policies in their `model_parameters`:
+
+    model_parameters:
+      hedge:
+        delay_ms: 2000       # send a duplicate request after 2s, or
+        percentile: 95       # after the p95 latency observed so far
+        model: gpt-4o-mini   # model and url of the duplicate (default: same)
+        url: https://backup.example.com/v1
+      fallback:
+        model: gpt-4o-mini   # model and url to retry on (default: same)
+        url: https://backup.example.com/v1
+        timeout_s: 60        # give up on the first request after 60s
+
+A hedge races the duplicate against the original request: the first result
+wins and the other request is cancelled. A fallback retries a request that
+failed with a 5xx status, a connection error or a timeout. Time spent waiting
+for a rate limit before a request is sent counts toward neither its latency
+nor its timeout or hedge delay.
+
+`maestro_hedge_requests_total` counts requests by result: every `request`
+made under a policy, hedges `sent`, `primary_won` and `hedge_won`, and
+`fallback` retries; the hedge rate is sent/request. The tokens estimated for
+the prompts of cancelled requests are counted in
+`maestro_hedge_extra_tokens_total`.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from maestro.metrics import HEDGE_EXTRA_TOKENS, HEDGE_REQUESTS
+from maestro.utils import percentile
+
+LATENCY_WINDOW = 500
+MIN_LATENCY_SAMPLES = 20
+
+
+class Target:
+    """Model and endpoint of a request; None fields mean the agent's own."""
+
+    __slots__ = ("model", "url")
+
+    def __init__(self, model: Optional[str] = None, url: Optional[str] = None):
+        self.model = model
+        self.url = url
+
+    @classmethod
+    def from_dict(cls, params: Dict[str, Any]) -> "Target":
+        return cls(params.get("model"), params.get("url"))
+
+    @property
+    def is_primary(self) -> bool:
+        return self.model is None and self.url is None
+
+    def __repr__(self) -> str:
+        return f"Target(model={self.model!r}, url={self.url!r})"
+
+
+PRIMARY = Target()
+
+
+class LatencyTracker:
+    """Recent latencies of successful requests, per model and endpoint."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._window = window
+        self._latencies: Dict[Tuple, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Tuple, seconds: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self._window)
+            latencies.append(seconds)
+
+    def percentile(self, key: Tuple, percent: float) -> Optional[float]:
+        """The latency percentile, or None before MIN_LATENCY_SAMPLES requests."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if len(latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        return percentile(latencies, percent)
+
+
+LATENCIES = LatencyTracker()
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed request may succeed on another attempt or endpoint."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status >= 500
+    # openai.APITimeoutError and APIConnectionError have no status code
+    return type(error).__name__ in ("APITimeoutError", "APIConnectionError")
+
+
+class RequestPolicy:
+    """Hedging and fallback settings of an agent."""
+
+    def __init__(
+        self,
+        hedge_delay: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge: Optional[Target] = None,
+        fallback: Optional[Target] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.hedge = hedge
+        self.fallback = fallback
+        self.timeout = timeout
+
+    @classmethod
+    def from_params(cls, params: Optional[Dict[str, Any]]) -> Optional["RequestPolicy"]:
+        """Read the policy of `model_parameters`, None if neither is configured.
+
+        Raises:
+            ValueError: If a hedge has neither a delay nor a percentile
+        """
+        params = params or {}
+        hedge, fallback = params.get("hedge"), params.get("fallback")
+        if not hedge and not fallback:
+            return None
+        policy = cls()
+        if hedge:
+            if "delay_ms" in hedge:
+                policy.hedge_delay = hedge["delay_ms"] / 1000
+            if "percentile" in hedge:
+                policy.hedge_percentile = hedge["percentile"]
+            if policy.hedge_delay is None and policy.hedge_percentile is None:
+                raise ValueError("hedge needs a delay_ms or a percentile")
+            policy.hedge = Target.from_dict(hedge)
+        if fallback:
+            policy.fallback = Target.from_dict(fallback)
+            policy.timeout = fallback.get("timeout_s")
+        return policy
+
+    def delay(self, key: Tuple) -> Optional[float]:
+        """Seconds to wait for the first request before hedging, None to not hedge.
+
+        With both a delay and a percentile, the delay applies until enough
+        latencies are observed.
+        """
+        if self.hedge is None:
+            return None
+        if self.hedge_percentile is not None:
+            observed = LATENCIES.percentile(key, self.hedge_percentile)
+            if observed is not None:
+                return observed
+        return self.hedge_delay
+
+
+def _request(call, acquire, target: Target, permit):
+    return call(target) if acquire is None else call(target, permit)
+
+
+async def _permit(acquire, target: Target):
+    return await acquire(target) if acquire is not None else None
+
+
+async def _timed(
+    call, acquire, target: Target, permit, key: Tuple, timeout: Optional[float]
+):
+    start = time.perf_counter()
+    if timeout:
+        result = await asyncio.wait_for(
+            _request(call, acquire, target, permit), timeout
+        )
+    else:
+        result = await _request(call, acquire, target, permit)
+    LATENCIES.record(key, time.perf_counter() - start)
+    return result
+
+
+async def _acquired(
+    call, acquire, target: Target, key: Tuple, timeout: Optional[float]
+):
+    # Waiting for the permit is neither timed nor timed out
+    permit = await _permit(acquire, target)
+    return await _timed(call, acquire, target, permit, key, timeout)
+
+
+async def _hedged(
+    policy: RequestPolicy,
+    call,
+    acquire,
+    agent_name: str,
+    key: Tuple,
+    estimated_tokens: int,
+    hedge: bool,
+):
+    # The hedge delay starts once the original request may be sent
+    permit = await _permit(acquire, PRIMARY)
+    primary = asyncio.ensure_future(
+        _timed(call, acquire, PRIMARY, permit, key, policy.timeout)
+    )
+    delay = policy.delay(key) if hedge else None
+    if delay is None:
+        return await primary
+    names = {primary: "primary_won"}
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        HEDGE_REQUESTS.labels(agent_name, "sent").inc()
+        target = policy.hedge
+        hedge_key = key if target.is_primary else (agent_name, target.model, target.url)
+        duplicate = asyncio.ensure_future(
+            _acquired(call, acquire, target, hedge_key, None)
+        )
+        names[duplicate] = "hedge_won"
+        pending = set(names)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    HEDGE_REQUESTS.labels(agent_name, names[task]).inc()
+                    if pending:
+                        HEDGE_EXTRA_TOKENS.labels(agent_name).inc(estimated_tokens)
+                    return task.result()
+            if not pending:
+                # Both failed: report the error of the original request
+                return primary.result()
+    finally:
+        for task in names:
+            if not task.done():
+                task.cancel()
+
+
+async def run_with_policy(
+    policy: Optional[RequestPolicy],
+    call: Callable[[Target], Awaitable[Any]],
+    agent_name: str,
+    model: Optional[str] = None,
+    url: Optional[str] = None,
+    estimated_tokens: int = 0,
+    hedge: bool = True,
+    acquire: Optional[Callable[[Target], Awaitable[Any]]] = None,
+):
+    """Make a model request with the hedging and fallback of a policy.
+
+    Args:
+        policy: the agent's policy; None makes a single request
+        call: makes the request to a target, PRIMARY for the agent's own
+            model and endpoint
+        agent_name: agent the metrics are reported for
+        model, url: the agent's model and endpoint, to track their latency
+        estimated_tokens: tokens of the request, counted as extra spend
+            when a hedge is cancelled
+        hedge: False to only apply the fallback, e.g. for requests running
+            tools that must not be called twice
+        acquire: waits until a request to a target may be sent, e.g. for a
+            rate limit, and returns a permit passed to call as its second
+            argument; the wait is not part of the request's latency, timeout
+            or hedge delay
+    Returns:
+        The result of the request that succeeded first
+    """
+    if policy is None:
+        permit = await _permit(acquire, PRIMARY)
+        return await _request(call, acquire, PRIMARY, permit)
+    key = (agent_name, model, url)
+    HEDGE_REQUESTS.labels(agent_name, "request").inc()
+    try:
+        return await _hedged(
+            policy, call, acquire, agent_name, key, estimated_tokens, hedge
+        )
+    except Exception as e:
+        if policy.fallback is None or not is_retryable(e):
+            raise
+        HEDGE_REQUESTS.labels(agent_name, "fallback").inc()
+        permit = await _permit(acquire, policy.fallback)
+        return await _request(call, acquire, policy.fallback, permit)
@@ -1,9 +1,13 @@
 #! /usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import os
 
 from dotenv import load_dotenv
 
+from maestro import events
+
 from .agent import Agent
 from .evaluation_middleware import auto_evaluate_response
 
@@ -38,12 +42,21 @@ class MockAgent(Agent):
         tools = agent["spec"].get("tools")
         if tools:
             for tool in tools:
-                print(f"Mock agent:Loading {tool}")
-
-        print(
-            f"🤖 Mock agent: name={self.agent_name}, model={self.agent_model}, description={self.agent_desc}, tools={self.agent_tools}, instructions={self.instructions}"
+                events.debug("agent.tool", "Mock agent:Loading %s", tool)
+
+        events.debug(
+            "agent.created",
+            "🤖 Mock agent: name=%s, model=%s, description=%s, tools=%s, instructions=%s",
+            self.agent_name,
+            self.agent_model,
+            self.agent_desc,
+            self.agent_tools,
+            self.instructions,
+            agent=self.agent_name,
         )
         self.agent_id = self.agent_name
+        # Artificial model latency, e.g. for benchmarking the workflow engine
+        self.latency = float(os.getenv("MAESTRO_MOCK_LATENCY_MS", "0")) / 1000
 
     async def run(self, prompt: str, context=None, step_index=None) -> str:
         """
@@ -51,7 +64,11 @@ class MockAgent(Agent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-        print(f"🤖 Running {self.agent_name}...")
+        events.info(
+            "agent.run", "🤖 Running %s...", self.agent_name, agent=self.agent_name
+        )
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
         answer = f"Mock agent: answer for {prompt}"
         if self.instructions:
             answer = eval_expression(self.instructions, prompt)
@@ -71,7 +88,13 @@ class MockAgent(Agent):
             step_index=step_index,
         )
 
-        print(f"🤖 Response from {self.agent_name}: {answer}")
+        events.info(
+            "agent.response",
+            "🤖 Response from %s: %s",
+            self.agent_name,
+            answer,
+            agent=self.agent_name,
+        )
         return answer
 
     async def run_streaming(self, prompt: str) -> str:
@@ -80,7 +103,11 @@ class MockAgent(Agent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-        print(f"🤖 Running {self.agent_name}...")
+        events.info(
+            "agent.run", "🤖 Running %s...", self.agent_name, agent=self.agent_name
+        )
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
         answer = f"Mock agent: answer for {prompt}"
 
         # Automatic evaluation middleware (same as run method)
@@ -88,5 +115,11 @@ class MockAgent(Agent):
             agent_name=self.agent_name, prompt=prompt, response=answer
         )
 
-        print(f"🤖 Response from {self.agent_name}: {answer}")
+        events.info(
+            "agent.response",
+            "🤖 Response from %s: %s",
+            self.agent_name,
+            answer,
+            agent=self.agent_name,
+        )
         return answer
@@ -10,22 +10,25 @@ from typing import Final, List, Optional, Any, Dict
 import logfire
 
 # raw responses for streaming
-from openai.types.responses import ResponseTextDeltaEvent
 
 from agents import (
     Agent as UnderlyingAgent,
+    OpenAIChatCompletionsModel,
+    OpenAIResponsesModel,
     Runner as UnderlyingRunner,
     AsyncOpenAI as UnderlyingClient,
     set_tracing_disabled,
-    set_default_openai_client,
-    set_default_openai_api,
+    set_tracing_export_api_key,
     Tool,
     ModelSettings,
     WebSearchTool,
 )
 from agents.extensions.models.litellm_model import LitellmModel
 
+from maestro.agents import stream_events
 from maestro.agents.agent import Agent as MaestroAgent
+from maestro.agents.hedging import PRIMARY, RequestPolicy, Target, run_with_policy
+from maestro.agents.openai_clients import get_openai_client
 from maestro.agents.openai_mcp import (
     setup_mcp_servers,
     MCPServerInstance,
@@ -44,6 +47,9 @@ TOOL_REQUIRES_RESPONSES_API: Final[bool] = True
 OPENAI_DEFAULT_URL: Final[str] = "https://api.openai.com/v1"
 OPENAI_DEFAULT_MODEL: Final[str] = "gpt-4o-mini"
 
+# Logfire instrumentation is process-wide and set up by the first agent
+_logfire_configured = False
+
 
 class OpenAIAgent(MaestroAgent):
     """
@@ -80,32 +86,42 @@ class OpenAIAgent(MaestroAgent):
         self.print(
             f"INFO [OpenAIAgent {self.agent_name}]: Using Model: {self.model_name}"
         )
-        self.client: UnderlyingClient = UnderlyingClient(
-            base_url=self.base_url,
-            api_key=self.api_key,
-        )
         self.static_tools: List[Tool] = self._initialize_static_tools(spec_dict)
 
         self.model_params: Dict[str, Any] = self._initialize_model_parameters(spec_dict)
         self.max_tokens: Optional[int] = self.model_params.get("max_tokens")
         self.extra_headers: Optional[Dict[str, str]] = self._initialize_extra_headers()
+        # Opt-in hedged and fallback requests, see maestro.agents.hedging
+        self.request_policy: Optional[RequestPolicy] = RequestPolicy.from_params(
+            spec_dict.get("model_parameters")
+        )
         self._configure_agents_library()
 
+    @property
+    def client(self) -> UnderlyingClient:
+        """The client shared by agents of the same endpoint, key and headers."""
+        return get_openai_client(self.base_url, self.api_key, self.extra_headers)
+
     def _configure_agents_library(self) -> None:
-        set_default_openai_client(client=self.client, use_for_tracing=True)
+        global _logfire_configured
 
         # Only use OpenAPI tracing for official endpoint
         set_tracing_disabled(not self.endpoint_has_tracing)
+        if self.endpoint_has_tracing:
+            set_tracing_export_api_key(self.api_key)
 
         # Logfire instruments OpenAPI calls with OpenTelemetry (logfire SAAS disabled)
         # Set OTEL_EXPORTER_OTLP_TRACES_ENDPOINT
-        logfire.configure(
-            service_name=self.agent_name,
-            send_to_logfire=False,
-            distributed_tracing=True,
-        )
-        logfire.instrument_openai(self.client)
-        logfire.instrument_openai_agents()
+        if not _logfire_configured:
+            logfire.configure(
+                service_name=self.agent_name,
+                send_to_logfire=False,
+                distributed_tracing=True,
+            )
+            # Instruments all OpenAI clients, including the shared ones
+            logfire.instrument_openai()
+            logfire.instrument_openai_agents()
+            _logfire_configured = True
 
         if self.use_litellm:
             self.print(
@@ -114,7 +130,6 @@ class OpenAIAgent(MaestroAgent):
         else:
             # responses API is new api - assume compatible endpoints don't yet support
             if self.uses_chat_completions:
-                set_default_openai_api("chat_completions")
                 self.print(
                     f"INFO [OpenAIAgent {self.agent_name}]: Using 'chat_completions' API (via OpenAI client)."
                 )
@@ -379,6 +394,40 @@ class OpenAIAgent(MaestroAgent):
         """Try to extract token usage from the result object."""
         self.extract_and_set_token_usage_from_result(result)
 
+    def _model_for(self, target: Target) -> Any:
+        """The Agents SDK model of a target, using the shared client of its endpoint."""
+        model = target.model or self.model_name
+        url = target.url or self.base_url
+        if self.use_litellm:
+            return LitellmModel(
+                model=model,
+                api_key=self.api_key,
+                base_url=url if url != OPENAI_DEFAULT_URL else None,
+            )
+        client = get_openai_client(url, self.api_key, self.extra_headers)
+        if url != OPENAI_DEFAULT_URL:
+            return OpenAIChatCompletionsModel(model=model, openai_client=client)
+        return OpenAIResponsesModel(model=model, openai_client=client)
+
+    async def _reserve(self, prompt: str, target: Target):
+        """Wait for the rate limit of a target, returning the reservation."""
+        return await self.acquire_rate_limit(
+            prompt, target.url or self.base_url, target.model or self.model_name
+        )
+
+    async def _run_on(self, underlying_agent, prompt: str, target: Target, reservation):
+        """Run the agent on a target, returning the result and its reservation."""
+        if not target.is_primary:
+            underlying_agent = underlying_agent.clone(model=self._model_for(target))
+        try:
+            result = await UnderlyingRunner.run(underlying_agent, prompt)
+        except BaseException:
+            # Failed, lost hedges and cancelled requests give their estimate back
+            if reservation is not None:
+                reservation.settle(0)
+            raise
+        return result, reservation
+
     # TODO: Cleanup streaming vs non-streaming
     # Maestro doesn't yet have support to specify streaming vs non-streaming, so these
     # 4 methods allow overriding via environment settings.
@@ -386,6 +435,7 @@ class OpenAIAgent(MaestroAgent):
     async def _run_internal(self, prompt: str) -> str:
         """Internal implementation for non-streaming run."""
         result: Optional[Any] = None
+        reservation = None
 
         try:
             active_mcp_servers: List[MCPServerInstance]
@@ -396,24 +446,12 @@ class OpenAIAgent(MaestroAgent):
             active_mcp_servers.extend(maestro_mcp_servers)
 
             async with mcp_stack:
-                model_to_use: Any  # Type hint for clarity
                 # LiteLLM needs more than the model name in Agents SDK
                 if self.use_litellm:
                     self.print(
                         f"INFO [OpenAIAgent {self.agent_name}]: Using LiteLLM backend for model: {self.model_name}"
                     )
-                    litellm_base_url = (
-                        self.base_url if self.base_url != OPENAI_DEFAULT_URL else None
-                    )
-                    model_to_use = LitellmModel(
-                        model=self.model_name,
-                        api_key=self.api_key,
-                        base_url=litellm_base_url,
-                    )
-                else:
-                    model_to_use = (
-                        self.model_name
-                    )  # Use the string name for standard OpenAI client
+                model_to_use = self._model_for(PRIMARY)
                 model_settings_dict: Dict[str, Any] = {}
 
                 for param in [
@@ -427,7 +465,8 @@ class OpenAIAgent(MaestroAgent):
                     if param in self.model_params:
                         model_settings_dict[param] = self.model_params[param]
 
-                if self.extra_headers is not None:
+                # Shared clients send the extra headers; LiteLLM has no client
+                if self.extra_headers is not None and self.use_litellm:
                     model_settings_dict["extra_headers"] = self.extra_headers
 
                 model_settings_obj = ModelSettings(**model_settings_dict)
@@ -444,7 +483,21 @@ class OpenAIAgent(MaestroAgent):
                 underlying_agent = UnderlyingAgent(**agent_kwargs)
 
                 self.print(f"Running {self.agent_name} with prompt...")
-                result = await UnderlyingRunner.run(underlying_agent, prompt)
+                result, reservation = await run_with_policy(
+                    self.request_policy,
+                    lambda target, reservation: self._run_on(
+                        underlying_agent, prompt, target, reservation
+                    ),
+                    self.agent_name,
+                    self.model_name,
+                    self.base_url,
+                    estimated_tokens=self.count_tokens(prompt)
+                    if self.request_policy
+                    else 0,
+                    # Tools must not be called twice by racing requests
+                    hedge=not (active_mcp_servers or self.static_tools),
+                    acquire=lambda target: self._reserve(prompt, target),
+                )
                 self.print(
                     f"DEBUG [OpenAIAgent {self.agent_name}]: Agent run completed."
                 )
@@ -454,27 +507,30 @@ class OpenAIAgent(MaestroAgent):
             self.print(error_msg)
             self.print(traceback.format_exc())
             return f"Error during agent execution: {e}"
+        else:
+            # Process result and print final output once
+            final_str = self._process_agent_result(result)
 
-        # Process result and print final output once
-        final_str = self._process_agent_result(result)
-
-        if self.total_tokens == 0:
-            actual_usage = await self._get_actual_token_usage(prompt, final_str)
-            self.prompt_tokens = actual_usage["prompt_tokens"]
-            self.response_tokens = actual_usage["response_tokens"]
-            self.total_tokens = actual_usage["total_tokens"]
-
-            self.print(
-                f"INFO [OpenAIAgent {self.agent_name}]: Actual API tokens - Prompt: {self.prompt_tokens}, Response: {self.response_tokens}, Total: {self.total_tokens}"
-            )
+            # Counters are shared by concurrent runs; check this run's own usage
+            if self.run_tokens() == 0:
+                actual_usage = self.set_token_usage(
+                    await self._get_actual_token_usage(prompt, final_str)
+                )
 
-        self.print(f"Response from {self.agent_name}: {final_str}")
+                self.print(
+                    f"INFO [OpenAIAgent {self.agent_name}]: Actual API tokens - Prompt: {actual_usage['prompt_tokens']}, Response: {actual_usage['response_tokens']}, Total: {actual_usage['total_tokens']}"
+                )
+            self.print(f"Response from {self.agent_name}: {final_str}")
 
-        return final_str
+            return final_str
+        finally:
+            # Failed runs report no usage and give the whole estimate back
+            if reservation is not None:
+                reservation.settle(self.run_tokens())
 
     async def _run_streaming_internal(self, prompt: str) -> str:
         final_output_chunks: List[str] = []
-        last_event_was_delta = False
+        reservation = None
 
         self.print(f"Running {self.agent_name} with prompt (streaming)...")
         try:
@@ -484,21 +540,11 @@ class OpenAIAgent(MaestroAgent):
             )
 
             async with mcp_stack:
-                model_to_use: Any
                 if self.use_litellm:
                     self.print(
                         f"INFO [OpenAIAgent {self.agent_name}]: Using LiteLLM backend for model: {self.model_name} (streaming)"
                     )
-                    litellm_base_url = (
-                        self.base_url if self.base_url != OPENAI_DEFAULT_URL else None
-                    )
-                    model_to_use = LitellmModel(
-                        model=self.model_name,
-                        api_key=self.api_key,
-                        base_url=litellm_base_url,
-                    )
-                else:
-                    model_to_use = self.model_name
+                model_to_use = self._model_for(PRIMARY)
 
                 model_settings_dict: Dict[str, Any] = {}
 
@@ -513,7 +559,8 @@ class OpenAIAgent(MaestroAgent):
                     if param in self.model_params:
                         model_settings_dict[param] = self.model_params[param]
 
-                if self.extra_headers is not None:
+                # Shared clients send the extra headers; LiteLLM has no client
+                if self.extra_headers is not None and self.use_litellm:
                     model_settings_dict["extra_headers"] = self.extra_headers
                 model_settings_obj = ModelSettings(**model_settings_dict)
 
@@ -528,101 +575,60 @@ class OpenAIAgent(MaestroAgent):
                 # Create the *OpenAI* Agent (renamed to avoid clash)
                 underlying_agent = UnderlyingAgent(**agent_kwargs)
 
+                reservation = await self.acquire_rate_limit(prompt, self.base_url)
                 run_result_streaming = UnderlyingRunner.run_streamed(
                     underlying_agent, prompt
                 )
-                stream = run_result_streaming.stream_events()
-                event = None
-
-                # TODO: Refactor some stream handling into common routine across backends? Code verbose
-                async for event in stream:
-                    if event.type == "raw_response_event":
-                        if isinstance(event.data, ResponseTextDeltaEvent):
-                            delta_value = event.data.delta
-                            print(delta_value, end="", flush=True)
-                            final_output_chunks.append(delta_value)
-                            last_event_was_delta = True
-                    elif event.type == "run_item_stream_event":
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-
-                        if event.name == "tool_called":
-                            tool_call_info = getattr(event.item, "tool_call", None)
-                            if tool_call_info:
-                                self.print(
-                                    f"DEBUG [OpenAIAgent {self.agent_name}]: Starting tool call: {getattr(tool_call_info, 'name', 'N/A')} with args: {getattr(tool_call_info, 'arguments', '{}')}"
-                                )
-                            else:
-                                self.print(
-                                    f"DEBUG [OpenAIAgent {self.agent_name}]: Starting tool call (details unavailable in event.item)"
-                                )
-                        elif event.name == "tool_output":
-                            tool_output = getattr(event.item, "output", "N/A")
-                            self.print(
-                                f"DEBUG [OpenAIAgent {self.agent_name}]: Finished tool call. Output: {str(tool_output)[:100]}..."
-                            )
-                        elif event.name == "message_output_created":
-                            # message_text = ItemHelpers.text_message_output(event.item) # Can be verbose
-                            self.print(
-                                f"DEBUG [OpenAIAgent {self.agent_name}]: Message output item created."
-                            )
-                            pass
-                        elif event.name == "run_completed":
-                            self.print(
-                                f"DEBUG [OpenAIAgent {self.agent_name}]: Agent stream processing finished (run_item_stream_event: {event.name})."
+                usage = [0, 0, 0]
+                async for event in stream_events.adapt(
+                    run_result_streaming.stream_events(), self.agent_name
+                ):
+                    if isinstance(event, stream_events.TextDelta):
+                        final_output_chunks.append(event.text)
+                    elif isinstance(event, stream_events.Usage):
+                        usage[0] += event.prompt_tokens
+                        usage[1] += event.response_tokens
+                        usage[2] += event.total_tokens
+                    stream_events.publish(event)
+                if usage[2]:
+                    self.set_token_usage(
+                        dict(
+                            zip(
+                                ("prompt_tokens", "response_tokens", "total_tokens"),
+                                usage,
                             )
-                        else:
-                            self.print(
-                                f"DEBUG [OpenAIAgent {self.agent_name}]: Received run item event: {event.name}"
-                            )
-
-                    elif event.type == "agent_updated_stream_event":
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-                        self.print(
-                            f"DEBUG [OpenAIAgent {self.agent_name}]: Agent updated to: {event.new_agent.name}"
-                        )
-                    else:
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-                        self.print(
-                            f"DEBUG [OpenAIAgent {self.agent_name}]: Received unknown event type: {event.type}"
                         )
-
-                if last_event_was_delta:
-                    print("")
+                    )
 
         except Exception as e:
-            if last_event_was_delta:
-                print("")
             error_msg = (
                 f"ERROR [OpenAIAgent {self.agent_name}]: Agent stream failed: {e}"
             )
             self.print(error_msg)
             self.print(traceback.format_exc())
             return f"Error during agent streaming execution: {e}"
+        else:
+            # Create the final output from all the bits we've received
+            final_output_str = "".join(final_output_chunks)
 
-        # Create the final output from all the bits we've received
-        final_output_str = "".join(final_output_chunks)
-
-        if self.total_tokens == 0:
-            actual_usage = await self._get_actual_token_usage(prompt, final_output_str)
-            self.prompt_tokens = actual_usage["prompt_tokens"]
-            self.response_tokens = actual_usage["response_tokens"]
-            self.total_tokens = actual_usage["total_tokens"]
+            # Counters are shared by concurrent runs; check this run's own usage
+            if self.run_tokens() == 0:
+                actual_usage = self.set_token_usage(
+                    await self._get_actual_token_usage(prompt, final_output_str)
+                )
 
+                self.print(
+                    f"INFO [OpenAIAgent {self.agent_name}]: Actual API tokens - Prompt: {actual_usage['prompt_tokens']}, Response: {actual_usage['response_tokens']}, Total: {actual_usage['total_tokens']}"
+                )
             self.print(
-                f"INFO [OpenAIAgent {self.agent_name}]: Actual API tokens - Prompt: {self.prompt_tokens}, Response: {self.response_tokens}, Total: {self.total_tokens}"
+                f"Final Response from {self.agent_name} (streaming collected): {final_output_str}"
             )
 
-        self.print(
-            f"Final Response from {self.agent_name} (streaming collected): {final_output_str}"
-        )
-
-        return final_output_str
+            return final_output_str
+        finally:
+            # Failed runs report no usage and give the whole estimate back
+            if reservation is not None:
+                reservation.settle(self.run_tokens())
 
     async def run(self, prompt: str, context=None, step_index=None) -> str:
         """
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Shared OpenAI API clients.
+
+Agents calling the same endpoint with the same API key and extra headers share
+one `AsyncOpenAI` client, and with it one HTTP connection pool, instead of each
+agent opening connections of its own. Agents hand their client to the Agents
+SDK model explicitly, so no process-wide default client is changed and agents
+on different endpoints can run concurrently.
+
+Clients are kept per event loop (see `maestro.loop_pools`).
+
+Environment:
+    MAESTRO_OPENAI_MAX_CONNECTIONS: connections per client (default: 100)
+    MAESTRO_OPENAI_MAX_KEEPALIVE: idle connections kept per client (default: 20)
+    MAESTRO_OPENAI_KEEPALIVE_EXPIRY: seconds idle connections are kept (default: 30)
+    MAESTRO_OPENAI_HTTP2: use HTTP/2 when the h2 package is installed
+        (default: true)
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from maestro.loop_pools import LoopPool
+
+
+def http2_enabled() -> bool:
+    if os.getenv("MAESTRO_OPENAI_HTTP2", "true").lower() != "true":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("MAESTRO_OPENAI_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("MAESTRO_OPENAI_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("MAESTRO_OPENAI_KEEPALIVE_EXPIRY", "30")),
+    )
+
+
+def client_key(
+    base_url: str, api_key: Optional[str], headers: Optional[Dict[str, str]] = None
+) -> Tuple:
+    # Keep API keys out of the key, which may end up in debug output
+    digest = hashlib.sha256((api_key or "").encode()).hexdigest()
+    return (base_url, digest, tuple(sorted((headers or {}).items())))
+
+
+_clients = LoopPool(lambda client: client.close())
+# Clients requested outside of an event loop
+_unbound: Dict[Tuple, AsyncOpenAI] = {}
+_lock = threading.Lock()
+
+
+def get_openai_client(
+    base_url: str, api_key: Optional[str], headers: Optional[Dict[str, str]] = None
+) -> AsyncOpenAI:
+    """Return the shared client of an endpoint, API key and extra headers.
+
+    Args:
+        base_url: the API endpoint
+        api_key: the API key
+        headers: extra headers sent with every request
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    key = client_key(base_url, api_key, headers)
+    with _lock:
+        clients = _unbound if loop is None else _clients.clients(loop)
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = AsyncOpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                default_headers=headers,
+                http_client=DefaultAsyncHttpxClient(
+                    limits=pool_limits(), http2=http2_enabled()
+                ),
+            )
+    return client
+
+
+def clear_openai_clients() -> None:
+    with _lock:
+        _clients.clear()
+        _unbound.clear()
@@ -5,6 +5,7 @@ import shlex
 from contextlib import AsyncExitStack
 from typing import List, Optional, Union, Tuple, Callable
 from maestro.tool_utils import find_mcp_service
+from maestro.tracing import span
 
 from agents.mcp import MCPServerSse, MCPServerStdio, MCPServerStreamableHttp
 
@@ -82,7 +83,8 @@ async def setup_mcp_servers(
                 )
                 server_id = endpoint_def
 
-            await stack.enter_async_context(server)
+            with span("maestro.mcp.connect", {"maestro.mcp_server": server.name}):
+                await stack.enter_async_context(server)
             active_servers.append(server)
             print_func(
                 f"INFO [{agent_name} - MCP Setup]: MCP Server ({server_type}) connected: {server.name} ({server_id})"
@@ -151,7 +153,8 @@ async def get_mcp_servers(tools, stack):
                     server = MCPServerStreamableHttp(
                         name=tool_name, params={"url": url + "/mcp", "headers": headers}
                     )
-                await server.connect()
+                with span("maestro.mcp.connect", {"maestro.mcp_server": tool_name}):
+                    await server.connect()
                 mcp_servers.append(server)
                 await stack.enter_async_context(server)
     return mcp_servers
@@ -1,51 +1,288 @@
+"""Agent answering prompts from a vector database served over MCP.
+
+Query agents share one long-lived MCP client per server URL instead of
+connecting for every query; a client that fails is dropped and the call is
+retried once on a fresh connection (see `maestro.loop_pools`).
+
+Search results are cached for a time to live, keyed by server, database,
+collection, limit and query, and concurrent identical queries share one
+search. When a loop step feeds the agent a list, the searches are sent
+together over the shared client before the items are run.
+
+With `query_input.index` set, the agent searches an embedded vector index built
+by `maestro index` instead (see `maestro.vector_index`), embedding the queries
+of a batch together and scoring them in one matrix product.
+
+Environment:
+    MAESTRO_QUERY_CACHE_TTL: seconds search results are cached (default: 300,
+        0 disables caching)
+    MAESTRO_QUERY_CACHE_SIZE: search results cached (default: 256)
+    MAESTRO_QUERY_CONCURRENCY: searches in flight per batch (default: 8)
+"""
+
+import asyncio
 import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Union
 
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from jinja2 import Template
 
 from maestro.agents.agent import Agent
+from maestro.loop_pools import LoopPool
+from maestro.metrics import CACHE_REQUESTS, MCP_TOOL_LATENCY
+from maestro.tracing import span
+
+DEFAULT_URL = "http://localhost:8030/mcp/"
+
+
+async def _close(connection: asyncio.Future) -> None:
+    if connection.done() and not connection.exception():
+        await connection.result().__aexit__(None, None, None)
+
+
+# Connections to MCP servers by URL, and searches in flight by cache key
+_clients = LoopPool(_close)
+_searches = LoopPool()
+
+
+async def _connect(url: str, agent_name: str) -> Client:
+    client = Client(url, timeout=30)
+    with span("maestro.mcp.connect", {"maestro.agent": agent_name}):
+        await client.__aenter__()
+    return client
+
+
+async def get_mcp_client(url: str, agent_name: str = "") -> Client:
+    """Return the shared, connected MCP client of a URL on the running loop."""
+    clients = _clients.clients()
+    connection = clients.get(url)
+    if connection is None:
+        connection = clients[url] = asyncio.ensure_future(_connect(url, agent_name))
+    try:
+        # A cancelled caller must not cancel the connection others wait for
+        return await asyncio.shield(connection)
+    except Exception:
+        if clients.get(url) is connection:
+            del clients[url]
+        raise
+
+
+async def discard_mcp_client(url: str, client: Client) -> None:
+    """Drop a client from the pool and close it."""
+    clients = _clients.clients()
+    connection = clients.get(url)
+    if connection is not None and connection.done() and not connection.exception():
+        if connection.result() is client:
+            del clients[url]
+    try:
+        await client.__aexit__(None, None, None)
+    except Exception:
+        pass
+
+
+class ResultCache:
+    """Search results with a time to live, least recently used evicted first."""
+
+    def __init__(self, max_size: Optional[int] = None):
+        if max_size is None:
+            max_size = int(os.getenv("MAESTRO_QUERY_CACHE_SIZE", "256"))
+        self.max_size = max_size
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[List[dict]]:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._results[key]
+                entry = None
+            if entry is None:
+                CACHE_REQUESTS.labels("query", "miss").inc()
+                return None
+            self._results.move_to_end(key)
+            CACHE_REQUESTS.labels("query", "hit").inc()
+            return entry[1]
+
+    def put(self, key: Hashable, docs: List[dict], ttl: float) -> None:
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._results[key] = (time.monotonic() + ttl, docs)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+RESULT_CACHE = ResultCache()
 
 
 class QueryAgent(Agent):
     def __init__(self, agent_def: dict) -> None:
         super().__init__(agent_def)
-        self.db_name = agent_def["metadata"]["query_input"]["db_name"]
-        self.collection_name = agent_def["metadata"]["query_input"].get(
-            "collection_name", "MaestroDocs"
+        query_input = agent_def["metadata"]["query_input"]
+        self.index_path = query_input.get("index")
+        self.nprobe = query_input.get("nprobe")
+        self.embedding_url = query_input.get("embedding_url")
+        self.db_name = (
+            query_input.get("db_name", self.index_path)
+            if self.index_path
+            else query_input["db_name"]
+        )
+        self.collection_name = query_input.get("collection_name", "MaestroDocs")
+        self.limit = query_input.get("limit", 10)
+        self.cache_ttl = float(
+            query_input.get("cache_ttl", os.getenv("MAESTRO_QUERY_CACHE_TTL", "300"))
         )
-        self.limit = agent_def["metadata"]["query_input"].get("limit", 10)
         self.output_template = Template(self.agent_output or "{{result}}")
 
-    async def run(self, prompt: str, context=None, step_index=None) -> str:
-        self.print(f"Running {self.agent_name} with prompt...")
+    @property
+    def url(self) -> str:
+        return self.agent_url or DEFAULT_URL
 
-        async with Client(
-            self.agent_url or "http://localhost:8030/mcp/", timeout=30
-        ) as client:
-            self.print(f"Querying vector database '{self.db_name}'...")
-            params = {
-                "input": {
-                    "db_name": self.db_name,
-                    "query": prompt,
-                    "limit": self.limit,
-                    "collection_name": self.collection_name,
-                }
-            }
-            tool_result = await client.call_tool("search", params)
+    def _cache_key(self, query: str) -> tuple:
+        if self.index_path:
+            return (self.index_path, self.nprobe, self.limit, query)
+        return (self.url, self.db_name, self.collection_name, self.limit, query)
 
+    async def _search_index(self, queries: List[str]) -> List[List[dict]]:
+        from maestro.vector_index import embed, open_index
+
+        index = open_index(self.index_path)
+        vectors = await embed(
+            queries, index.model, self.embedding_url or index.meta.get("url")
+        )
+        with span(
+            "maestro.index.search",
+            {"maestro.agent": self.agent_name, "maestro.queries": len(queries)},
+        ):
+            hits = index.search(vectors, self.limit, self.nprobe)
+        return [
+            [{**index.documents[row], "score": score} for row, score in results]
+            for results in hits
+        ]
+
+    async def _call_search(self, query: str) -> Any:
+        params = {
+            "input": {
+                "db_name": self.db_name,
+                "query": query,
+                "limit": self.limit,
+                "collection_name": self.collection_name,
+            }
+        }
+        for attempt in range(2):
+            client = await get_mcp_client(self.url, self.agent_name)
+            start = time.perf_counter()
             try:
-                output = "\n\n".join(
-                    [doc["text"] for doc in json.loads(tool_result.data)]
+                with span(
+                    "maestro.mcp.call_tool",
+                    {"maestro.agent": self.agent_name, "maestro.tool": "search"},
+                ):
+                    return await client.call_tool("search", params)
+            except ToolError:
+                raise
+            except Exception:
+                # The pooled connection may have gone stale; reconnect once
+                await discard_mcp_client(self.url, client)
+                if attempt:
+                    raise
+            finally:
+                MCP_TOOL_LATENCY.labels(self.agent_name, "search").observe(
+                    time.perf_counter() - start
+                )
+
+    async def search(self, query: str) -> Union[List[dict], str]:
+        """Search the vector database.
+
+        Returns:
+            The matching documents, or the raw tool output when it is not a
+            list of documents
+        """
+        key = self._cache_key(query)
+        docs = RESULT_CACHE.get(key) if self.cache_ttl > 0 else None
+        if docs is not None:
+            return docs
+
+        searches = _searches.clients()
+        pending = searches.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        pending = searches[key] = asyncio.ensure_future(self._search(key, query))
+        pending.add_done_callback(lambda _: searches.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _search(self, key: tuple, query: str) -> Union[List[dict], str]:
+        self.print(f"Querying vector database '{self.db_name}'...")
+        if self.index_path:
+            docs = (await self._search_index([query]))[0]
+            RESULT_CACHE.put(key, docs, self.cache_ttl)
+            return docs
+        tool_result = await self._call_search(query)
+        try:
+            docs = json.loads(tool_result.data)
+        except json.JSONDecodeError:
+            return tool_result.data
+        RESULT_CACHE.put(key, docs, self.cache_ttl)
+        return docs
+
+    async def search_batch(self, queries: List[str]) -> List[Union[List[dict], str]]:
+        """Search many queries at once, over the shared client or the index."""
+        unique = list(dict.fromkeys(queries))
+        if self.index_path:
+            results = {}
+            for query in unique:
+                docs = (
+                    RESULT_CACHE.get(self._cache_key(query))
+                    if self.cache_ttl > 0
+                    else None
                 )
+                if docs is not None:
+                    results[query] = docs
+            missing = [query for query in unique if query not in results]
+            if missing:
+                for query, docs in zip(missing, await self._search_index(missing)):
+                    RESULT_CACHE.put(self._cache_key(query), docs, self.cache_ttl)
+                    results[query] = docs
+            return [results[query] for query in queries]
+
+        limit = asyncio.Semaphore(int(os.getenv("MAESTRO_QUERY_CONCURRENCY", "8")))
 
-                answer = self.output_template.render(result=output, prompt=prompt)
+        async def bounded(query):
+            async with limit:
+                return await self.search(query)
+
+        results = dict(zip(unique, await asyncio.gather(*map(bounded, unique))))
+        return [results[query] for query in queries]
+
+    async def prefetch(self, prompts: List[str]) -> None:
+        """Search the prompts of a loop together, caching the results."""
+        if self.cache_ttl > 0 and len(prompts) > 1:
+            await self.search_batch(prompts)
+
+    async def run(self, prompt: str, context=None, step_index=None) -> str:
+        self.print(f"Running {self.agent_name} with prompt...")
 
-                self.print(f"Response from {self.agent_name}: {answer}\n")
+        docs = await self.search(prompt)
+        if isinstance(docs, str):
+            self.print(f"ERROR [QueryAgent {self.agent_name}]: {docs}")
+            return docs
 
-                return answer
-            except json.JSONDecodeError:
-                self.print(f"ERROR [QueryAgent {self.agent_name}]: {tool_result.data}")
-                return tool_result.data
+        output = "\n\n".join([doc["text"] for doc in docs])
+        answer = self.output_template.render(result=output, prompt=prompt)
+        self.print(f"Response from {self.agent_name}: {answer}\n")
+        return answer
 
     async def run_streaming(self, prompt: str) -> str:
         return await self.run(prompt)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Agent instances reused across workflow runs.
+
+Creating an agent can be expensive: OpenAI agents build API clients and set
+up instrumentation, CrewAI agents import their crew modules. The registry
+keeps one instance per agent definition, keyed by a hash of the definition and
+the agent class, and hands each workflow run a fork of it. A fork shares the
+reusable state of the instance (clients, tools, caches) but has its own per-run
+state (token counters, the workflow it logs to), so concurrent runs do not see
+each other's usage. A changed definition hashes differently and gets a new
+instance; `invalidate()` drops instances explicitly.
+
+Environment:
+    MAESTRO_AGENT_CACHE_SIZE: agent instances kept (default: 256, 0 disables reuse)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from maestro.metrics import CACHE_REQUESTS
+
+
+def definition_hash(agent_def: dict, cls: type) -> str:
+    """Hash of an agent definition and the class that runs it."""
+    text = json.dumps(agent_def, sort_keys=True, default=str)
+    return hashlib.sha256(
+        f"{cls.__module__}.{cls.__qualname__}\n{text}".encode()
+    ).hexdigest()
+
+
+def fork(agent: Any) -> Any:
+    """A copy of an agent for one workflow run."""
+    if hasattr(agent, "fork"):
+        return agent.fork()
+    return copy.copy(agent)
+
+
+class AgentRegistry:
+    """Agent instances by definition hash, least recently used evicted first."""
+
+    def __init__(self, max_size: Optional[int] = None):
+        if max_size is None:
+            max_size = int(os.getenv("MAESTRO_AGENT_CACHE_SIZE", "256"))
+        self.max_size = max_size
+        self._agents: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, agent_def: dict, cls: type) -> Any:
+        """Return a fork of the instance of a definition, creating it if needed."""
+        if self.max_size <= 0:
+            return cls(agent_def)
+        key = definition_hash(agent_def, cls)
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is not None:
+                self._agents.move_to_end(key)
+                CACHE_REQUESTS.labels("agents", "hit").inc()
+            else:
+                CACHE_REQUESTS.labels("agents", "miss").inc()
+                # Constructors may keep the definition; the key must not change
+                agent = cls(copy.deepcopy(agent_def))
+                self._agents[key] = agent
+                if len(self._agents) > self.max_size:
+                    self._agents.popitem(last=False)
+        return fork(agent)
+
+    def invalidate(self, name: Optional[str] = None) -> int:
+        """Drop the instances of an agent name, or all without a name.
+
+        Returns:
+            The number of instances dropped
+        """
+        with self._lock:
+            if name is None:
+                count = len(self._agents)
+                self._agents.clear()
+                return count
+            keys = [
+                key
+                for key, agent in self._agents.items()
+                if getattr(agent, "agent_name", None) == name
+            ]
+            for key in keys:
+                del self._agents[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+
+AGENT_REGISTRY = AgentRegistry()
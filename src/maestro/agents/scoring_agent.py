@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import os
+from collections import OrderedDict
 from maestro.agents.agent import Agent
+from maestro.metrics import CACHE_REQUESTS
 from opik.evaluation.metrics import AnswerRelevance, Hallucination
 from opik import opik_context
 
@@ -10,12 +13,21 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Scores of recent (prompt, response, context) triples kept per agent
+SCORE_CACHE_SIZE = 256
+# Responses of a batch scored at the same time
+BATCH_CONCURRENCY = int(os.getenv("MAESTRO_SCORING_CONCURRENCY", "4"))
+
 
 class ScoringAgent(Agent):
     """
     Agent that takes two inputs (prompt & response) plus an optional
     `context` list.  The response is always converted to a string before scoring.
     Metrics are printed, and the original response is returned.
+
+    The judge metrics are created once per agent and scored concurrently in
+    worker threads, so the event loop is not blocked while the judge model
+    answers. Scores of identical inputs are reused.
     """
 
     def __init__(self, agent: dict) -> None:
@@ -26,6 +38,9 @@ class ScoringAgent(Agent):
             self._litellm_model = raw_model
         else:
             self._litellm_model = f"ollama/{raw_model}"
+        self._metrics = None
+        self._scores = OrderedDict()
+        self._pending = {}
 
     async def run(
         self, prompt: str, response: str, context: list[str] | None = None
@@ -48,7 +63,7 @@ class ScoringAgent(Agent):
         response_text = response
         ctx = context or [prompt]
 
-        scoring_metrics = self._calculate_metrics(prompt, response_text, ctx)
+        scoring_metrics = await self._calculate_metrics(prompt, response_text, ctx)
         if scoring_metrics is None:
             return {"prompt": response_text, "scoring_metrics": None}
 
@@ -56,18 +71,90 @@ class ScoringAgent(Agent):
         self._print_metrics(response_text, scoring_metrics)
         return self._format_response(response_text, scoring_metrics)
 
-    def _calculate_metrics(
+    async def score_batch(
+        self, items: list[tuple[str, str, list[str] | None]]
+    ) -> list[dict | None]:
+        """Score many (prompt, response, context) triples with the same judges.
+
+        Up to MAESTRO_SCORING_CONCURRENCY (default 4) triples are scored at a
+        time and repeated triples are scored once.
+
+        Returns:
+          The metrics of each triple, None where they could not be calculated.
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def score(prompt, response, context):
+            async with semaphore:
+                return await self._calculate_metrics(
+                    prompt, str(response), context or [prompt]
+                )
+
+        return await asyncio.gather(*(score(*item) for item in items))
+
+    def _get_metrics(self) -> tuple:
+        """The judge metrics of this agent, created on first use."""
+        if self._metrics is None:
+            self._metrics = (
+                AnswerRelevance(model=self._litellm_model),
+                Hallucination(model=self._litellm_model),
+            )
+        return self._metrics
+
+    async def _calculate_metrics(
         self, prompt: str, response_text: str, context: list[str]
     ) -> dict | None:
         """Calculate relevance and hallucination metrics for the response."""
+        key = (prompt, response_text, tuple(context))
+        cached = self._scores.get(key)
+        if cached is not None:
+            self._scores.move_to_end(key)
+            CACHE_REQUESTS.labels("scoring", "hit").inc()
+            return dict(cached)
+        # Concurrent requests for the same scores wait for the first one
+        pending = self._pending.get(key)
+        if pending is not None:
+            # Unlike awaiting it, wait() does not raise when the first one is cancelled
+            await asyncio.wait((pending,))
+            if pending.cancelled():
+                return await self._calculate_metrics(prompt, response_text, context)
+            CACHE_REQUESTS.labels("scoring", "hit").inc()
+            result = pending.result()
+            return dict(result) if result is not None else None
+        CACHE_REQUESTS.labels("scoring", "miss").inc()
+
+        pending = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._score(prompt, response_text, context)
+        except BaseException:
+            pending.cancel()
+            raise
+        finally:
+            del self._pending[key]
+        pending.set_result(result)
+        if result is not None:
+            self._scores[key] = result
+            if len(self._scores) > SCORE_CACHE_SIZE:
+                self._scores.popitem(last=False)
+            result = dict(result)
+        return result
+
+    async def _score(
+        self, prompt: str, response_text: str, context: list[str]
+    ) -> dict | None:
         os.environ["OPIK_TRACK_DISABLE"] = "true"
 
         try:
-            answer_relevance = AnswerRelevance(model=self._litellm_model)
-            hallucination = Hallucination(model=self._litellm_model)
-
-            rel_eval = answer_relevance.score(prompt, response_text, context=context)
-            hall_eval = hallucination.score(prompt, response_text, context=context)
+            answer_relevance, hallucination = self._get_metrics()
+
+            rel_eval, hall_eval = await asyncio.gather(
+                asyncio.to_thread(
+                    answer_relevance.score, prompt, response_text, context=context
+                ),
+                asyncio.to_thread(
+                    hallucination.score, prompt, response_text, context=context
+                ),
+            )
 
             rel_value = rel_eval.value
             hall_value = hall_eval.value
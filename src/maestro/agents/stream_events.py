@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Typed events of streaming agent runs.
+
+`adapt()` turns the stream of an Agents SDK run into these events once, and
+agents hand each to `publish()`. It logs all but text deltas as debug events
+and passes every event to the consumer set with `forwarding()` for the current
+context: the workflow, while it is streamed, yields them with the name of the
+running step, and the workflow server sends them to `/chat/stream` clients.
+Nothing is written to the terminal per delta.
+"""
+
+import contextlib
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from maestro import events
+
+
+class StreamEvent:
+    """An event of a streaming agent run."""
+
+    type = "event"
+    __slots__ = ("agent",)
+
+    def __init__(self, agent: str):
+        self.agent = agent
+
+    def to_dict(self) -> Dict[str, Any]:
+        fields = {"type": self.type}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                fields[name] = getattr(self, name)
+        return fields
+
+    def message(self) -> str:
+        return self.type
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+
+class TextDelta(StreamEvent):
+    type = "text_delta"
+    __slots__ = ("text",)
+
+    def __init__(self, agent: str, text: str):
+        super().__init__(agent)
+        self.text = text
+
+
+class ToolCallStarted(StreamEvent):
+    type = "tool_call_started"
+    __slots__ = ("call_id", "name", "arguments")
+
+    def __init__(self, agent: str, call_id: str, name: str, arguments: str):
+        super().__init__(agent)
+        self.call_id = call_id
+        self.name = name
+        self.arguments = arguments
+
+    def message(self) -> str:
+        return f"Starting tool call: {self.name} with args: {self.arguments}"
+
+
+class ToolCallFinished(StreamEvent):
+    type = "tool_call_finished"
+    __slots__ = ("call_id", "output")
+
+    def __init__(self, agent: str, call_id: str, output: str):
+        super().__init__(agent)
+        self.call_id = call_id
+        self.output = output
+
+    def message(self) -> str:
+        return f"Finished tool call. Output: {self.output[:100]}..."
+
+
+class MessageCreated(StreamEvent):
+    type = "message_created"
+    __slots__ = ("text",)
+
+    def __init__(self, agent: str, text: str):
+        super().__init__(agent)
+        self.text = text
+
+    def message(self) -> str:
+        return "Message output item created."
+
+
+class AgentSwitched(StreamEvent):
+    type = "agent_switched"
+    __slots__ = ("new_agent",)
+
+    def __init__(self, agent: str, new_agent: str):
+        super().__init__(agent)
+        self.new_agent = new_agent
+
+    def message(self) -> str:
+        return f"Agent updated to: {self.new_agent}"
+
+
+class Usage(StreamEvent):
+    """Token usage of one model response of the run."""
+
+    type = "usage"
+    __slots__ = ("prompt_tokens", "response_tokens", "total_tokens")
+
+    def __init__(
+        self, agent: str, prompt_tokens: int, response_tokens: int, total_tokens: int
+    ):
+        super().__init__(agent)
+        self.prompt_tokens = prompt_tokens
+        self.response_tokens = response_tokens
+        self.total_tokens = total_tokens
+
+    def message(self) -> str:
+        return (
+            f"Usage - Prompt: {self.prompt_tokens}, Response: "
+            f"{self.response_tokens}, Total: {self.total_tokens}"
+        )
+
+
+_consumer: ContextVar[Optional[Callable[[StreamEvent], None]]] = ContextVar(
+    "maestro_stream_events", default=None
+)
+
+
+@contextlib.contextmanager
+def forwarding(consume: Callable[[StreamEvent], None]):
+    """Pass the stream events of agent runs started in this block to consume."""
+    token = _consumer.set(consume)
+    try:
+        yield
+    finally:
+        _consumer.reset(token)
+
+
+def publish(event: StreamEvent) -> None:
+    """Log an event and pass it to the consumer of the current context."""
+    if event.type != TextDelta.type:
+        events.debug(f"agent.{event.type}", event.message, agent=event.agent)
+    consume = _consumer.get()
+    if consume is not None:
+        consume(event)
+
+
+async def adapt(stream: AsyncIterator[Any], agent: str) -> AsyncIterator[StreamEvent]:
+    """Typed events of the `stream_events()` of an Agents SDK run."""
+    from agents import ItemHelpers
+    from openai.types.responses import ResponseCompletedEvent, ResponseTextDeltaEvent
+
+    async for event in stream:
+        if event.type == "raw_response_event":
+            if isinstance(event.data, ResponseTextDeltaEvent):
+                yield TextDelta(agent, event.data.delta)
+            elif isinstance(event.data, ResponseCompletedEvent):
+                usage = event.data.response.usage
+                if usage is not None:
+                    yield Usage(
+                        agent,
+                        usage.input_tokens,
+                        usage.output_tokens,
+                        usage.total_tokens,
+                    )
+        elif event.type == "run_item_stream_event":
+            raw = getattr(event.item, "raw_item", None)
+            if event.name == "tool_called":
+                yield ToolCallStarted(
+                    agent,
+                    _get(raw, "call_id") or _get(raw, "id") or "",
+                    _get(raw, "name") or getattr(raw, "type", "tool"),
+                    _get(raw, "arguments") or "{}",
+                )
+            elif event.name == "tool_output":
+                yield ToolCallFinished(
+                    agent,
+                    _get(raw, "call_id") or "",
+                    str(getattr(event.item, "output", "")),
+                )
+            elif event.name == "message_output_created":
+                yield MessageCreated(agent, ItemHelpers.text_message_output(event.item))
+        elif event.type == "agent_updated_stream_event":
+            yield AgentSwitched(agent, event.new_agent.name)
+
+
+def _get(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Batch execution of a workflow over many prompts.
+
+Inputs are read from a JSONL or CSV file, run concurrently over one set of
+agents with a concurrency limit, and written to an output JSONL file as each
+run finishes. Rerunning a batch with the same output file skips the inputs that
+already finished successfully.
+"""
+
+import asyncio
+import copy
+import csv
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from maestro.usage import TOKEN_KEYS, UsageLedger
+from maestro.utils import percentile
+from maestro.workflow import Workflow
+
+DEFAULT_CONCURRENCY = 4
+PERCENTILES = (50, 90, 95, 99)
+
+
+def load_batch_inputs(path) -> List[Tuple[str, Any]]:
+    """Read (id, prompt) pairs from a JSONL or CSV file.
+
+    JSONL lines are either objects with a `prompt` and an optional `id`, or
+    plain JSON strings. CSV files use the `prompt` and `id` columns, or the
+    first column other than `id` as the prompt. Inputs without an id are
+    numbered from 1 in file order.
+    """
+    path = Path(path)
+    inputs = []
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            columns = [name for name in reader.fieldnames or () if name != "id"]
+            if not columns:
+                raise ValueError(f"{path}: no prompt column")
+            column = "prompt" if "prompt" in columns else columns[0]
+            for number, row in enumerate(reader, start=1):
+                inputs.append((row.get("id") or str(number), row[column]))
+    else:
+        with open(path, encoding="utf-8") as f:
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{number}: invalid JSON: {e}") from e
+                if isinstance(data, dict):
+                    if "prompt" not in data:
+                        raise ValueError(f"{path}:{number}: missing 'prompt'")
+                    inputs.append((str(data.get("id", number)), data["prompt"]))
+                else:
+                    inputs.append((str(number), data))
+
+    ids = [input_id for input_id, _ in inputs]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"{path}: input ids must be unique")
+    return inputs
+
+
+def load_finished(output_path) -> List[Dict[str, Any]]:
+    """Return the successful records already written to an output file."""
+    output_path = Path(output_path)
+    if not output_path.exists():
+        return []
+    records = []
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "success":
+                records.append(record)
+    return records
+
+
+def summarize(records: Iterable[Dict[str, Any]], skipped: int = 0) -> Dict[str, Any]:
+    """Summarize batch records: counts, latency percentiles, token and cost totals."""
+    records = list(records)
+    latencies = sorted(r["duration_ms"] for r in records if "duration_ms" in r)
+    tokens = dict.fromkeys(TOKEN_KEYS, 0)
+    cost = 0.0
+    for record in records:
+        for key in TOKEN_KEYS:
+            tokens[key] += (record.get("token_usage") or {}).get(key) or 0
+        cost += record.get("cost") or 0
+    latency = {f"p{p}": percentile(latencies, p) for p in PERCENTILES}
+    latency["max"] = latencies[-1] if latencies else 0
+    latency["mean"] = round(sum(latencies) / len(latencies)) if latencies else 0
+    return {
+        "total": len(records) + skipped,
+        "succeeded": sum(1 for r in records if r.get("status") == "success"),
+        "failed": sum(1 for r in records if r.get("status") == "error"),
+        "skipped": skipped,
+        "latency_ms": latency,
+        "token_usage": tokens,
+        "cost": round(cost, 6),
+    }
+
+
+class BatchRunner:
+    """Run a workflow definition over many prompts with shared agents."""
+
+    def __init__(
+        self,
+        agents_yaml,
+        workflow_yaml: dict,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        workflow_id: Optional[str] = None,
+        logger=None,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"Invalid concurrency: {concurrency}")
+        self.agent_defs = agents_yaml
+        # Runs mutate their definition (agent names are resolved to agents),
+        # so every run starts from a copy of the pristine YAML
+        self.definition = copy.deepcopy(workflow_yaml)
+        self.concurrency = concurrency
+        self.workflow_id = workflow_id
+        self.logger = logger
+        self._agents = None
+
+    def _shared_agents(self) -> Dict[str, Any]:
+        if self._agents is None:
+            template = Workflow(
+                self.agent_defs,
+                copy.deepcopy(self.definition),
+                workflow_id=self.workflow_id,
+                logger=self.logger,
+            )
+            template._create_agents()
+            self._agents = template.agents
+        return self._agents
+
+    def run_id(self, input_id: str) -> str:
+        """The workflow id of the run of an input, which names its log file."""
+        name = re.sub(r"[^\w.-]", "_", str(input_id))
+        return f"{self.workflow_id}-{name}" if self.workflow_id else name
+
+    async def run_one(self, input_id: str, prompt: Any) -> Dict[str, Any]:
+        """Run the workflow for one input and return its output record."""
+        workflow = Workflow(
+            self.agent_defs,
+            copy.deepcopy(self.definition),
+            workflow_id=self.run_id(input_id),
+            logger=self.logger,
+            agents=self._shared_agents(),
+        )
+        record = {"id": input_id, "workflow_id": workflow.workflow_id, "prompt": prompt}
+        start = time.perf_counter()
+        try:
+            result = await workflow.run(prompt)
+            record["status"] = "success"
+            if result is None:
+                # run() returns None when the exception agent handled a failure
+                record["status"] = "error"
+                record["error"] = (
+                    "workflow failed and was handled by its exception agent"
+                )
+            elif isinstance(result, dict):
+                record["output"] = result.get("final_prompt")
+                record["steps"] = {
+                    k: v for k, v in result.items() if k != "final_prompt"
+                }
+            else:
+                record["output"] = result
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = str(e)
+        record["duration_ms"] = int((time.perf_counter() - start) * 1000)
+        # Token usage and cost come from the ledger of the run
+        totals = (workflow.usage or UsageLedger()).totals()
+        record["token_usage"] = {key: totals[key] for key in TOKEN_KEYS}
+        record["cost"] = totals["cost"]
+        return record
+
+    async def run(self, inputs, output_path, on_record=None) -> Dict[str, Any]:
+        """Run all inputs not yet finished in `output_path` and append results.
+
+        Args:
+            inputs: (id, prompt) pairs, e.g. from load_batch_inputs()
+            output_path: JSONL file that records are appended to
+            on_record: optional callback invoked with each finished record
+        Returns:
+            The summary of the records written by this call
+        """
+        output_path = Path(output_path)
+        finished = {record["id"] for record in load_finished(output_path)}
+        pending = [(i, p) for i, p in inputs if i not in finished]
+        skipped = len(inputs) - len(pending)
+        records = []
+        queue = iter(pending)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "a", encoding="utf-8") as out:
+
+            async def worker():
+                for input_id, prompt in queue:
+                    record = await self.run_one(input_id, prompt)
+                    out.write(json.dumps(record, default=str) + "\n")
+                    out.flush()
+                    records.append(record)
+                    if on_record:
+                        on_record(record)
+
+            if pending:
+                self._shared_agents()
+            await asyncio.gather(
+                *(worker() for _ in range(min(self.concurrency, len(pending))))
+            )
+        return summarize(records, skipped=skipped)
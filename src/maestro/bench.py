@@ -0,0 +1,372 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Performance benchmarks of the workflow engine.
+
+Workflows of a given shape and size are generated in memory and run with mock
+agents that sleep for a configurable artificial latency. Everything that is not
+agent latency is engine overhead: step scheduling in `Workflow._condition`,
+`Step.run`, metrics, tracing and, for the serve scenario, the HTTP layer.
+
+Shapes:
+    linear       N steps, one agent each
+    parallel     one step running N agents in parallel
+    loop         one step looping one agent over an N item list
+    conditional  N steps, each with an `if` condition to the next step
+    serve        the linear workflow through POST /chat of the workflow server
+
+Results are plain JSON so they can be stored and compared across commits. The
+agent runs are logged to a temporary directory, not to the run logs of
+`maestro logs`.
+"""
+
+import asyncio
+import contextlib
+import copy
+import itertools
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, UTC
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from maestro import logging_hooks
+from maestro.file_logger import FileLogger
+from maestro.utils import percentile
+from maestro.workflow import Workflow
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SHAPES = ("linear", "parallel", "loop", "conditional")
+SCENARIOS = SHAPES + ("serve",)
+DEFAULT_SIZE = 10
+DEFAULT_ITERATIONS = 20
+DEFAULT_LATENCY_MS = 0.0
+LAG_INTERVAL = 0.005
+
+
+def _agent(name: str) -> Dict[str, Any]:
+    return {
+        "apiVersion": "maestro/v1alpha1",
+        "kind": "Agent",
+        "metadata": {"name": name, "labels": {"app": "bench"}},
+        "spec": {"model": "mock", "framework": "mock", "description": "bench agent"},
+    }
+
+
+def generate_workflow(shape: str, size: int) -> Tuple[List[dict], dict, Dict[str, int]]:
+    """Generate the agents and workflow definitions of a benchmark shape.
+
+    Args:
+        shape: one of SHAPES
+        size: number of agent calls per run
+    Returns:
+        (agent definitions, workflow definition, counts) where counts holds the
+        number of agent calls, steps executed and agent calls on the critical
+        path of one run
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown benchmark shape: {shape}")
+    if size < 1:
+        raise ValueError(f"Invalid benchmark size: {size}")
+
+    names = [f"agent{i}" for i in range(1, size + 1)]
+    prompt = "benchmark prompt"
+    if shape == "linear":
+        steps = [{"name": f"step{i}", "agent": name} for i, name in enumerate(names, 1)]
+        counts = {"agent_calls": size, "steps": size, "critical_calls": size}
+    elif shape == "parallel":
+        steps = [{"name": "fanout", "parallel": list(names)}]
+        counts = {"agent_calls": size, "steps": 1, "critical_calls": 1}
+    elif shape == "loop":
+        names = names[:1]
+        prompt = "[" + ",".join(str(i) for i in range(size)) + "]"
+        steps = [{"name": "loop", "loop": {"agent": names[0], "until": "True"}}]
+        counts = {"agent_calls": size, "steps": 1, "critical_calls": size}
+    else:
+        last = f"step{size}"
+        steps = []
+        for i, name in enumerate(names, 1):
+            step = {"name": f"step{i}", "agent": name}
+            if i < size:
+                step["condition"] = [
+                    {"if": "len(input) > 0", "then": f"step{i + 1}", "else": last}
+                ]
+            steps.append(step)
+        counts = {"agent_calls": size, "steps": size, "critical_calls": size}
+
+    workflow = {
+        "apiVersion": "maestro/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {"name": f"bench-{shape}", "labels": {"app": "bench"}},
+        "spec": {
+            "template": {
+                "metadata": {"name": f"bench-{shape}"},
+                "agents": list(names),
+                "prompt": prompt,
+                "steps": steps,
+            }
+        },
+    }
+    return [_agent(name) for name in names], workflow, counts
+
+
+class EventLoopLagMonitor:
+    """Measure how late the event loop wakes up a periodic sleeper.
+
+    Used as an async context manager around the code under test; a high lag
+    means something blocked the loop (synchronous I/O, CPU heavy work).
+    """
+
+    def __init__(self, interval: float = LAG_INTERVAL):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task = None
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(loop.time() - start - self.interval, 0.0))
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    def summary(self) -> Dict[str, float]:
+        lags = sorted(lag * 1000 for lag in self.lags)
+        return {
+            "mean": round(sum(lags) / len(lags), 3) if lags else 0.0,
+            "p99": round(percentile(lags, 99), 3),
+            "max": round(lags[-1], 3) if lags else 0.0,
+        }
+
+
+@contextlib.contextmanager
+def _mock_latency(latency_ms: float):
+    """Set the latency of mock agents created inside the block."""
+    previous = os.environ.get("MAESTRO_MOCK_LATENCY_MS")
+    os.environ["MAESTRO_MOCK_LATENCY_MS"] = str(latency_ms)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("MAESTRO_MOCK_LATENCY_MS", None)
+        else:
+            os.environ["MAESTRO_MOCK_LATENCY_MS"] = previous
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the agents' console output, which would dominate the timings."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def _temporary_logs():
+    """Log the agent runs inside the block to a temporary directory."""
+    previous = logging_hooks.logger
+    with tempfile.TemporaryDirectory() as tmp:
+        logging_hooks.logger = FileLogger(tmp)
+        try:
+            yield
+        finally:
+            logging_hooks.logger = previous
+
+
+def _max_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _report(
+    scenario: str,
+    durations: List[float],
+    counts: Dict[str, int],
+    latency_ms: float,
+    lag: Dict[str, float],
+    peak_bytes: int,
+) -> Dict[str, Any]:
+    durations = sorted(durations)
+    total = sum(durations)
+    mean = total / len(durations)
+    # Whatever the mock agents did not spend sleeping was spent in the engine
+    overhead = max(mean - counts["critical_calls"] * latency_ms / 1000, 0.0)
+    return {
+        "scenario": scenario,
+        "iterations": len(durations),
+        **counts,
+        "run_ms": {
+            "mean": round(mean * 1000, 3),
+            "p50": round(percentile(durations, 50) * 1000, 3),
+            "p95": round(percentile(durations, 95) * 1000, 3),
+            "max": round(durations[-1] * 1000, 3),
+        },
+        "throughput": {
+            "runs_per_s": round(len(durations) / total, 2) if total else 0.0,
+            "steps_per_s": (
+                round(len(durations) * counts["steps"] / total, 2) if total else 0.0
+            ),
+        },
+        "overhead_us": {
+            "per_run": round(overhead * 1e6, 1),
+            "per_step": round(overhead * 1e6 / counts["steps"], 1),
+            "per_agent_call": round(overhead * 1e6 / counts["agent_calls"], 1),
+        },
+        "event_loop_lag_ms": lag,
+        "memory": {
+            "peak_alloc_kb": peak_bytes // 1024,
+            "max_rss_kb": _max_rss_kb(),
+        },
+    }
+
+
+async def bench_shape(
+    shape: str,
+    size: int = DEFAULT_SIZE,
+    iterations: int = DEFAULT_ITERATIONS,
+    latency_ms: float = DEFAULT_LATENCY_MS,
+) -> Dict[str, Any]:
+    """Run a generated workflow `iterations` times and report its performance.
+
+    Agents are created once and shared by all runs, as in batch mode, so the
+    timings cover running the workflow and not creating its agents.
+    """
+    agent_defs, definition, counts = generate_workflow(shape, size)
+    run_ids = itertools.count()
+    with _mock_latency(latency_ms), _quiet(), _temporary_logs():
+        template = Workflow(agent_defs, copy.deepcopy(definition))
+        template._create_agents()
+        agents = template.agents
+
+        async def run_once():
+            workflow = Workflow(
+                agent_defs,
+                copy.deepcopy(definition),
+                workflow_id=f"bench-{shape}-{next(run_ids)}",
+                agents=agents,
+            )
+            start = time.perf_counter()
+            await workflow.run()
+            return time.perf_counter() - start
+
+        # Warm up imports and caches outside of the measurements
+        await run_once()
+        durations = []
+        async with EventLoopLagMonitor() as monitor:
+            for _ in range(iterations):
+                durations.append(await run_once())
+
+        tracemalloc.start()
+        try:
+            await run_once()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return _report(shape, durations, counts, latency_ms, monitor.summary(), peak)
+
+
+async def bench_serve(
+    size: int = DEFAULT_SIZE,
+    iterations: int = DEFAULT_ITERATIONS,
+    latency_ms: float = DEFAULT_LATENCY_MS,
+) -> Dict[str, Any]:
+    """Benchmark POST /chat of the workflow server with the linear workflow.
+
+    Requests go through the ASGI app in process, so the timings include
+    request parsing, creating the run's workflow and agents and serializing the
+    response, but no network.
+    """
+    import httpx
+
+    from maestro.cli.fastapi_serve import FastAPIWorkflowServer
+
+    agent_defs, definition, counts = generate_workflow("linear", size)
+    with tempfile.TemporaryDirectory() as tmp:
+        agents_file = os.path.join(tmp, "agents.yaml")
+        workflow_file = os.path.join(tmp, "workflow.yaml")
+        with open(agents_file, "w") as f:
+            yaml.safe_dump_all(agent_defs, f)
+        with open(workflow_file, "w") as f:
+            yaml.safe_dump(definition, f)
+
+        with _mock_latency(latency_ms), _quiet(), _temporary_logs():
+            server = FastAPIWorkflowServer(agents_file, workflow_file)
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+
+                async def run_once():
+                    start = time.perf_counter()
+                    response = await client.post(
+                        "/chat", json={"prompt": "benchmark prompt"}
+                    )
+                    response.raise_for_status()
+                    return time.perf_counter() - start
+
+                await run_once()
+                durations = []
+                async with EventLoopLagMonitor() as monitor:
+                    for _ in range(iterations):
+                        durations.append(await run_once())
+
+                tracemalloc.start()
+                try:
+                    await run_once()
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+    return _report("serve", durations, counts, latency_ms, monitor.summary(), peak)
+
+
+async def run_benchmarks(
+    scenarios=SCENARIOS,
+    size: int = DEFAULT_SIZE,
+    iterations: int = DEFAULT_ITERATIONS,
+    latency_ms: float = DEFAULT_LATENCY_MS,
+) -> Dict[str, Any]:
+    """Run the benchmark scenarios and return the JSON report."""
+    if iterations < 1:
+        raise ValueError(f"Invalid iterations: {iterations}")
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenario: {', '.join(unknown)}")
+
+    results = []
+    for scenario in scenarios:
+        if scenario == "serve":
+            results.append(await bench_serve(size, iterations, latency_ms))
+        else:
+            results.append(await bench_shape(scenario, size, iterations, latency_ms))
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "parameters": {
+            "size": size,
+            "iterations": iterations,
+            "latency_ms": latency_ms,
+        },
+        "results": results,
+    }
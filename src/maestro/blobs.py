@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Content-addressed store of large workflow step outputs.
+
+Step outputs of at least `MAESTRO_BLOB_THRESHOLD` characters are written once
+to a file named by the SHA-256 of their content, and the workflow keeps a
+small `BlobRef` in its step results and context instead of the text. Steps
+materialize a reference when their agent runs, and run logs record the
+reference instead of the full text. Identical outputs, e.g. of concurrent runs
+over the same document, are stored once.
+
+Blobs are read through memory maps, so the pages of a blob are shared by all
+runs and worker processes reading it instead of being copied into each.
+
+Environment:
+    MAESTRO_BLOB_THRESHOLD: size in characters from which step outputs are
+        stored as blobs (default: 0, outputs are kept in memory)
+    MAESTRO_BLOB_DIR: blob directory (default: ~/.maestro/blobs)
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+BLOB_THRESHOLD_ENV = "MAESTRO_BLOB_THRESHOLD"
+BLOB_DIR_ENV = "MAESTRO_BLOB_DIR"
+
+home_path = Path.home()
+if os.access(home_path, os.W_OK):
+    DEFAULT_BLOB_DIR = home_path / ".maestro" / "blobs"
+else:
+    DEFAULT_BLOB_DIR = Path("./blobs")
+
+
+class BlobRef:
+    """Reference to a stored text; `str()` reads the text."""
+
+    __slots__ = ("store", "digest", "size", "length")
+
+    def __init__(self, store: "BlobStore", digest: str, size: int, length: int):
+        self.store = store
+        self.digest = digest
+        self.size = size
+        self.length = length
+
+    def __str__(self) -> str:
+        return self.store.read(self.digest)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BlobRef):
+            return self.digest == other.digest
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f"<BlobRef sha256:{self.digest[:12]} {self.size} bytes>"
+
+    def preview(self, length: int = 200) -> str:
+        """The beginning of the text, read without loading the whole blob."""
+        head = self.store.read_bytes(self.digest, length * 4)
+        return head.decode("utf-8", errors="ignore")[:length]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "blob": f"sha256:{self.digest}",
+            "bytes": self.size,
+            "chars": self.length,
+        }
+
+
+class BlobStore:
+    """Content-addressed files of texts, in two-level directories by digest."""
+
+    def __init__(self, root=None, threshold: int = 0):
+        """
+        Args:
+            root: blob directory, created if needed
+            threshold: size in characters from which `spill()` stores texts;
+                0 keeps all texts in memory
+        """
+        self.root = Path(root) if root else DEFAULT_BLOB_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, text: str) -> BlobRef:
+        """Store a text, unless a blob with the same content exists."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        try:
+            # Refresh the time of existing blobs for prune()
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        return BlobRef(self, digest, len(data), len(text))
+
+    def read_bytes(self, digest: str, limit: Optional[int] = None) -> bytes:
+        """Read a blob, or its first `limit` bytes."""
+        with open(self._path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return m[:limit]
+
+    def read(self, digest: str) -> str:
+        """Read the text of a blob."""
+        with open(self._path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                # Decode straight from the mapped pages, without a bytes copy
+                with memoryview(m) as view:
+                    return str(view, "utf-8")
+
+    def spill(self, value):
+        """Return a reference for texts above the threshold, other values as is."""
+        if self.threshold and isinstance(value, str) and len(value) >= self.threshold:
+            return self.put(value)
+        return value
+
+    def prune(self, max_age: float) -> int:
+        """Remove blobs not stored or re-stored in the last `max_age` seconds.
+
+        Returns:
+            The number of removed blobs
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.root.glob("??/*"):
+            if not path.name.startswith(".") and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def materialize(value):
+    """Return the text of a blob reference, other values as is."""
+    return str(value) if isinstance(value, BlobRef) else value
+
+
+def loggable(value):
+    """A value for run logs: blob references as such, other values as strings."""
+    return value.to_dict() if isinstance(value, BlobRef) else str(value)
+
+
+_stores: Dict[tuple, BlobStore] = {}
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """Return the blob store configured by the environment, or None if disabled."""
+    threshold = int(os.getenv(BLOB_THRESHOLD_ENV, "0") or 0)
+    if threshold <= 0:
+        return None
+    root = os.getenv(BLOB_DIR_ENV) or str(DEFAULT_BLOB_DIR)
+    key = (root, threshold)
+    if key not in _stores:
+        _stores[key] = BlobStore(root, threshold)
+    return _stores[key]
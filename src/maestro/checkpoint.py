@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Durable checkpoints of workflow runs, keyed by workflow id.
+
+After each completed step the workflow appends one record to the store with the
+step output, the step to run next and the agent's token usage. Writes are
+incremental: the file store appends a JSON line and the SQLite store inserts a
+row, so the cost of a checkpoint does not grow with the length of the run.
+
+A run is resumed from the record of its last completed step. Steps are the
+unit of recovery; a step that was interrupted is run again from its start.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CHECKPOINT_STORE_ENV = "MAESTRO_CHECKPOINT_STORE"
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+home_path = Path.home()
+if os.access(home_path, os.W_OK):
+    DEFAULT_CHECKPOINT_DIR = home_path / ".maestro" / "checkpoints"
+else:
+    DEFAULT_CHECKPOINT_DIR = Path("./checkpoints")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+class Checkpoint:
+    """The recorded state of one workflow run."""
+
+    def __init__(
+        self,
+        workflow_id: str,
+        workflow_name: str = "",
+        prompt: Any = "",
+        status: str = "running",
+        steps: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.workflow_id = workflow_id
+        self.workflow_name = workflow_name
+        self.prompt = prompt
+        self.status = status
+        self.steps = steps or []
+
+    @property
+    def last_step(self) -> Optional[Dict[str, Any]]:
+        return self.steps[-1] if self.steps else None
+
+    @property
+    def next_step(self) -> Optional[str]:
+        """Name of the step to run next, or None when the run has finished."""
+        return self.last_step["next_step"] if self.steps else None
+
+    @property
+    def step_index(self) -> int:
+        return self.last_step["step_index"] + 1 if self.steps else 0
+
+    @property
+    def step_results(self) -> Dict[str, Any]:
+        return {record["step_name"]: record["output"] for record in self.steps}
+
+    @property
+    def token_usage(self) -> Dict[str, Dict[str, Any]]:
+        """Last recorded token usage of each agent."""
+        usage = {}
+        for record in self.steps:
+            if record.get("agent_name") and record.get("token_usage"):
+                usage[record["agent_name"]] = record["token_usage"]
+        return usage
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflow_id": self.workflow_id,
+            "workflow_name": self.workflow_name,
+            "status": self.status,
+            "completed_steps": len(self.steps),
+            "next_step": self.next_step,
+        }
+
+
+class CheckpointStore:
+    """Base class for checkpoint stores."""
+
+    def start_run(self, workflow_id: str, workflow_name: str, prompt: Any) -> None:
+        raise NotImplementedError
+
+    def save_step(self, workflow_id: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def finish_run(self, workflow_id: str, status: str) -> None:
+        raise NotImplementedError
+
+    def load(self, workflow_id: str) -> Optional[Checkpoint]:
+        raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Append-only JSONL file per workflow run."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else DEFAULT_CHECKPOINT_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, workflow_id: str) -> Path:
+        if not workflow_id or os.sep in workflow_id or workflow_id.startswith("."):
+            raise ValueError(f"Invalid workflow id: {workflow_id!r}")
+        return self.directory / f"{workflow_id}.jsonl"
+
+    def _append(self, workflow_id: str, data: Dict[str, Any]) -> None:
+        with open(self._path(workflow_id), "a", encoding="utf-8") as f:
+            f.write(_dumps(data) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start_run(self, workflow_id, workflow_name, prompt):
+        self._append(
+            workflow_id,
+            {
+                "type": "run",
+                "workflow_id": workflow_id,
+                "workflow_name": workflow_name,
+                "prompt": prompt,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
+
+    def save_step(self, workflow_id, record):
+        self._append(workflow_id, {"type": "step", **record})
+
+    def finish_run(self, workflow_id, status):
+        self._append(workflow_id, {"type": "status", "status": status})
+
+    def load(self, workflow_id):
+        path = self._path(workflow_id)
+        if not path.exists():
+            return None
+        checkpoint = Checkpoint(workflow_id)
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from a crash mid-write
+                    break
+                kind = data.pop("type", None)
+                if kind == "run":
+                    checkpoint = Checkpoint(
+                        workflow_id, data.get("workflow_name", ""), data.get("prompt")
+                    )
+                elif kind == "step":
+                    checkpoint.steps.append(data)
+                elif kind == "status":
+                    checkpoint.status = data["status"]
+        return checkpoint
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints in a SQLite database, one row per completed step."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "workflow_id TEXT PRIMARY KEY, workflow_name TEXT, prompt TEXT, "
+                "status TEXT, updated_at TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS steps ("
+                "workflow_id TEXT, step_index INTEGER, record TEXT, "
+                "PRIMARY KEY (workflow_id, step_index))"
+            )
+
+    def start_run(self, workflow_id, workflow_name, prompt):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, 'running', ?)",
+                (
+                    workflow_id,
+                    workflow_name,
+                    _dumps(prompt),
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM steps WHERE workflow_id = ?", (workflow_id,)
+            )
+
+    def save_step(self, workflow_id, record):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO steps VALUES (?, ?, ?)",
+                (workflow_id, record["step_index"], _dumps(record)),
+            )
+
+    def finish_run(self, workflow_id, status):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE workflow_id = ?",
+                (status, datetime.now(UTC).isoformat(), workflow_id),
+            )
+
+    def load(self, workflow_id):
+        with self._lock:
+            run = self._conn.execute(
+                "SELECT workflow_name, prompt, status FROM runs WHERE workflow_id = ?",
+                (workflow_id,),
+            ).fetchone()
+            if run is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT record FROM steps WHERE workflow_id = ? ORDER BY step_index",
+                (workflow_id,),
+            ).fetchall()
+        return Checkpoint(
+            workflow_id,
+            run[0],
+            json.loads(run[1]),
+            run[2],
+            [json.loads(row[0]) for row in rows],
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def get_checkpoint_store(location=None) -> CheckpointStore:
+    """Return the checkpoint store at `location`.
+
+    The location defaults to MAESTRO_CHECKPOINT_STORE, then to
+    ~/.maestro/checkpoints. Paths ending in .db, .sqlite or .sqlite3 use SQLite;
+    anything else is a directory of JSONL files.
+    """
+    location = location or os.getenv(CHECKPOINT_STORE_ENV) or DEFAULT_CHECKPOINT_DIR
+    if str(location).endswith(SQLITE_SUFFIXES):
+        return SQLiteCheckpointStore(location)
+    return FileCheckpointStore(location)
@@ -13,20 +13,25 @@ import asyncio
 import subprocess
 
 import yaml
-import jsonschema
 import psutil
 
-from jsonschema.exceptions import ValidationError, SchemaError
-from importlib.resources import files
 from dotenv import load_dotenv
 
 from maestro.deploy import Deploy
 from maestro.workflow import Workflow, create_agents
 from maestro.cli.common import Console, parse_yaml
 from maestro.file_logger import FileLogger
+from maestro.checkpoint import get_checkpoint_store
+from maestro.batch import BatchRunner, DEFAULT_CONCURRENCY, load_batch_inputs
+from maestro import bench, log_index, vector_index
+from maestro.events import configure_events
+from maestro.loop_pools import closing_loop_pools
+from maestro.tracing import configure_tracing
 from maestro.mcptool import create_mcptools
 from datetime import datetime, UTC
 from maestro.cli.fastapi_serve import serve_agent, serve_workflow
+from maestro.cli.stub_llm import StubLLMConfig, serve_stub_llm
+from maestro.validation import validate_paths
 from maestro.cli.containered_agent import create_containered_agent
 
 load_dotenv()
@@ -70,6 +75,14 @@ class CLI:
             return CleanCmd(self.args)
         elif self.args.get("create-cr") and self.args["create-cr"]:
             return CreateCrCmd(self.args)
+        elif self.args.get("bench") and self.args["bench"]:
+            return BenchCmd(self.args)
+        elif self.args.get("stub-llm") and self.args["stub-llm"]:
+            return StubLLMCmd(self.args)
+        elif self.args.get("index") and self.args["index"]:
+            return IndexCmd(self.args)
+        elif self.args.get("logs") and self.args["logs"]:
+            return LogsCmd(self.args)
         else:
             raise Exception("Invalid command")
 
@@ -81,6 +94,7 @@ class Command:
     def __init__(self, args):
         self.args = args
         self.__init_dry_run()
+        configure_events(verbose=bool(self.args.get("--verbose")))
 
     def __init_dry_run(self):
         if self.args.get("--dry-run") and self.args["--dry-run"]:
@@ -109,6 +123,23 @@ class Command:
     def dry_run(self):
         return self.__dry_run
 
+    def _positive_int(self, option, default, what=None):
+        """The value of an option as an integer of at least 1, or the default.
+
+        Raises:
+            ValueError: the value is not an integer of at least 1
+        """
+        value_str = self.args.get(option)
+        if value_str is None:
+            return default
+        try:
+            value = int(value_str)
+        except (ValueError, TypeError):
+            value = 0
+        if value < 1:
+            raise ValueError(f"Invalid {what or option.lstrip('-')}: {value_str}")
+        return value
+
     def execute(self):
         func = self.dispatch()
         rc = func()
@@ -144,12 +175,21 @@ class Command:
             return self.clean
         elif self.args["create-cr"]:
             return self.create_cr
+        elif self.args.get("bench"):
+            return self.bench
+        elif self.args.get("stub-llm"):
+            return self.stub_llm
+        elif self.args.get("index"):
+            return self.index
+        elif self.args.get("logs"):
+            return self.logs
         else:
             raise Exception("Invalid subcommand")
 
 
 # validate command group
 #  maestro validate SCHEMA_FILE YAML_FILE [options]
+#  maestro validate YAML_FILE [YAML_FILES...] [options]
 class ValidateCmd(Command):
     """Command handler for validating YAML files against JSON schemas."""
 
@@ -159,69 +199,19 @@ class ValidateCmd(Command):
 
     # private
 
-    def __discover_schema_file(self, yaml_file):
-        yaml_data = parse_yaml(yaml_file)
-        if isinstance(yaml_data, list) and len(yaml_data) > 0:
-            yaml_data = yaml_data[0]
-        kind = yaml_data.get("kind")
-        if kind == "Agent":
-            return str(files("maestro").joinpath("schemas/agent_schema.json"))
-        elif kind == "Tool":
-            return str(files("maestro").joinpath("schemas/tool_schema.json"))
-        elif kind == "MCPTool":
-            return str(
-                files("maestro").joinpath("schemas/tool_toolhive_schema_full.json")
-            )
-        elif kind == "Workflow":
-            return str(files("maestro").joinpath("schemas/workflow_schema.json"))
-        elif kind == "WorkflowRun":
-            Console.ok("WorkflowRun is not supported")
-            return None
-        elif kind == "CustomResourceDefinition":
-            Console.ok("CustomResourceDefinition is not supported")
-            return None
-        else:
-            raise ValueError(f"Unknown kind: {kind}")
-
-    def __validate(self, schema_file, yaml_file):
-        Console.print(f"validating {yaml_file} with schema {schema_file}")
-        if schema_file is None:
-            # Try to discover the schema file based on the yaml file
-            if "agents.yaml" in yaml_file:
-                schema_file = str(
-                    files("maestro").joinpath("schemas/agent_schema.json")
-                )
-            elif "workflow.yaml" in yaml_file:
-                schema_file = str(
-                    files("maestro").joinpath("schemas/workflow_schema.json")
-                )
-            else:
-                raise RuntimeError(
-                    "Could not determine schema file from yaml file name"
-                )
-        with open(schema_file, "r", encoding="utf-8") as f:
-            schema = json.load(f)
-        with open(yaml_file, "r", encoding="utf-8") as f:
-            yamls = yaml.safe_load_all(f)
-            for yaml_data in yamls:
-                try:
-                    if self.verbose():
-                        Console.print(
-                            f"Validating YAML data: {json.dumps(yaml_data, indent=2)}"
-                        )
-                        Console.print(f"Against schema: {json.dumps(schema, indent=2)}")
-                    jsonschema.validate(yaml_data, schema)
-                    if not self.silent():
-                        Console.ok("YAML file is valid.")
-                except ValidationError as ve:
-                    self._check_verbose()
-                    Console.error(f"YAML file is NOT valid:\n {str(ve.message)}")
-                    return 1
-                except SchemaError as se:
-                    self._check_verbose()
-                    Console.error(f"Schema file is NOT valid:\n {str(se.message)}")
-                    return 1
-        return 0
+    def __print_file_report(self, report):
+        schemas = sorted({d["schema"] for d in report["documents"] if d.get("schema")})
+        Console.print(f"validating {report['file']} with schema {', '.join(schemas)}")
+        for error in report["errors"]:
+            Console.error(f"Invalid YAML file: {report['file']}: {error['message']}")
+        for document in report["documents"]:
+            if document.get("skipped"):
+                Console.ok(f"{document['kind']} is not supported")
+            for error in document["errors"]:
+                where = f"{error['path']}: " if error["path"] else ""
+                Console.error(f"YAML file is NOT valid:\n {where}{error['message']}")
+        if report["valid"] and not self.silent():
+            Console.ok("YAML file is valid.")
 
     # public
 
@@ -231,6 +221,35 @@ class ValidateCmd(Command):
     def YAML_FILE(self):
         return self.args["YAML_FILE"]
 
+    def YAML_FILES(self):
+        return self.args.get("YAML_FILES") or []
+
+    def paths(self):
+        paths = [self.YAML_FILE()] + self.YAML_FILES()
+        schema_file = self.SCHEMA_FILE()
+        if schema_file and not schema_file.endswith(".json"):
+            # `maestro validate a.yaml b.yaml` parses as SCHEMA_FILE YAML_FILE
+            paths.insert(0, schema_file)
+        return paths
+
+    def schema_file(self):
+        schema_file = self.SCHEMA_FILE()
+        if schema_file and schema_file.endswith(".json"):
+            return schema_file
+        return None
+
+    def workers(self):
+        return self._positive_int("--workers", None, "number of workers")
+
+    def output(self):
+        return self.args.get("--output")
+
+    def format(self):
+        output_format = self.args.get("--format") or "text"
+        if output_format not in ("text", "json"):
+            raise ValueError(f"Invalid format: {output_format}")
+        return output_format
+
     def name(self):
         return "validate"
 
@@ -240,17 +259,30 @@ class ValidateCmd(Command):
         Returns:
             int: Return code (0 for success, 1 for failure)
         """
-        if self.SCHEMA_FILE() is None or self.SCHEMA_FILE() == "":
-            discovered_schema_file = ""
-            try:
-                discovered_schema_file = self.__discover_schema_file(self.YAML_FILE())
-                if not discovered_schema_file:
-                    return 0
-            except Exception as e:
-                Console.error(f"Invalid YAML file: {self.YAML_FILE()}: {str(e)}")
-                return 1
-            return self.__validate(discovered_schema_file, self.YAML_FILE())
-        return self.__validate(self.SCHEMA_FILE(), self.YAML_FILE())
+        try:
+            report = validate_paths(self.paths(), self.schema_file(), self.workers())
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to validate: {str(e)}")
+            return 1
+        if not report["files"]:
+            Console.error(f"No YAML files found in: {' '.join(self.paths())}")
+            return 1
+
+        if self.output():
+            with open(self.output(), "w") as f:
+                json.dump(report, f, indent=2)
+        if self.format() == "json":
+            Console.print(json.dumps(report, indent=2))
+        else:
+            for file_report in report["files"]:
+                self.__print_file_report(file_report)
+            summary = report["summary"]
+            if summary["files"] > 1 and not self.silent():
+                Console.print(
+                    f"{summary['files']} files validated, {summary['invalid_files']} invalid"
+                )
+        return 0 if report["valid"] else 1
 
 
 # Create command group
@@ -314,13 +346,65 @@ class RunCmd(Command):
     def prompt(self):
         return self.args.get("--prompt")
 
+    def resume(self):
+        return self.args.get("--resume")
+
+    def checkpoint(self):
+        return bool(self.args.get("--checkpoint") or self.resume())
+
+    def batch(self):
+        return self.args.get("--batch")
+
+    def output(self):
+        output = self.args.get("--output")
+        if output:
+            return output
+        root, _ = os.path.splitext(self.batch())
+        return f"{root}.results.jsonl"
+
+    def concurrency(self):
+        return self._positive_int("--concurrency", DEFAULT_CONCURRENCY)
+
     def name(self):
         return "run"
 
+    def __run_batch(self, agents_yaml, workflow_yaml, workflow_id, logger):
+        """Run the workflow once per input of the --batch file."""
+        try:
+            inputs = load_batch_inputs(self.batch())
+            runner = BatchRunner(
+                agents_yaml,
+                workflow_yaml[0],
+                concurrency=self.concurrency(),
+                workflow_id=workflow_id,
+                logger=logger,
+            )
+
+            def report(record):
+                if not self.silent():
+                    Console.print(
+                        f"[BATCH] {record['id']}: {record['status']} ({record['duration_ms']} ms)"
+                    )
+
+            summary = asyncio.run(
+                closing_loop_pools(runner.run(inputs, self.output(), on_record=report))
+            )
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to run batch: {str(e)}")
+            return 1
+
+        Console.print(json.dumps(summary, indent=2))
+        if not self.silent():
+            Console.ok(f"Batch results written to {self.output()}")
+        return 1 if summary["failed"] else 0
+
     def run(self):
         """Run a workflow with specified agents and workflow files."""
         logger = FileLogger()
-        workflow_id = logger.generate_workflow_id()
+        workflow_id = self.resume() or logger.generate_workflow_id()
+        configure_tracing()
+        checkpoint_store = get_checkpoint_store() if self.checkpoint() else None
 
         try:
             if self.args.get("--evaluate"):
@@ -346,7 +430,10 @@ class RunCmd(Command):
                     "⚠️ No agents.yaml path provided or found — skipping custom_agent label handling."
                 )
 
-        if self.prompt():
+        if self.batch():
+            return self.__run_batch(agents_yaml, workflow_yaml, workflow_id, logger)
+
+        if self.prompt() and not self.resume():
             prompt = self.__read_prompt()
             workflow_yaml[0]["spec"]["template"]["prompt"] = prompt
 
@@ -356,9 +443,19 @@ class RunCmd(Command):
                 workflow=workflow_yaml[0],
                 workflow_id=workflow_id,
                 logger=logger,
+                checkpoint_store=checkpoint_store,
             )
             start_time = datetime.now(UTC)
-            result = asyncio.run(workflow.run())
+            if self.resume():
+                Console.print(f"Resuming workflow run {workflow_id}")
+                result = asyncio.run(closing_loop_pools(workflow.resume()))
+            elif checkpoint_store is not None:
+                Console.print(
+                    f"Checkpointing workflow run {workflow_id}, resume with --resume {workflow_id}"
+                )
+                result = asyncio.run(closing_loop_pools(workflow.run()))
+            else:
+                result = asyncio.run(closing_loop_pools(workflow.run()))
             end_time = datetime.now(UTC)
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
@@ -951,6 +1048,8 @@ class ServeCmd(Command):
         agent_name: str = None,
         host: str = "127.0.0.1",
         port: int = 8000,
+        workers: int = 1,
+        reload: bool = False,
     ):
         framework = self._get_agent_framework(agents_file, agent_name)
         if framework == "container":
@@ -962,7 +1061,7 @@ class ServeCmd(Command):
         else:
             """Serve an agent via FastAPI."""
             try:
-                serve_agent(agents_file, agent_name, host, port)
+                serve_agent(agents_file, agent_name, host, port, workers, reload)
             except Exception as e:
                 self._check_verbose()
                 raise RuntimeError(f"Failed to serve agent: {str(e)}") from e
@@ -973,10 +1072,15 @@ class ServeCmd(Command):
         workflow_file: str,
         host: str = "127.0.0.1",
         port: int = 8000,
+        workers: int = 1,
+        reload: bool = False,
+        checkpoint: bool = False,
     ):
         """Serve an agent via FastAPI."""
         try:
-            serve_workflow(agents_file, workflow_file, host, port)
+            serve_workflow(
+                agents_file, workflow_file, host, port, workers, reload, checkpoint
+            )
         except Exception as e:
             self._check_verbose()
             raise RuntimeError(f"Failed to serve workflow: {str(e)}") from e
@@ -1020,6 +1124,15 @@ class ServeCmd(Command):
         except (ValueError, TypeError):
             raise ValueError(f"Invalid port number: {port_str}")
 
+    def workers(self):
+        return self._positive_int("--workers", 1, "number of workers")
+
+    def reload(self):
+        return bool(self.args.get("--reload"))
+
+    def checkpoint(self):
+        return bool(self.args.get("--checkpoint"))
+
     def name(self):
         return "serve"
 
@@ -1034,7 +1147,13 @@ class ServeCmd(Command):
         if workflow_file_arg and workflow_file_arg != "None":
             try:
                 self.__serve_workflow(
-                    self.AGENTS_FILE(), self.WORKFLOW_FILE(), self.host(), self.port()
+                    self.AGENTS_FILE(),
+                    self.WORKFLOW_FILE(),
+                    self.host(),
+                    self.port(),
+                    self.workers(),
+                    self.reload(),
+                    self.checkpoint(),
                 )
                 if not self.silent():
                     Console.ok("Workflow server started successfully")
@@ -1045,7 +1164,12 @@ class ServeCmd(Command):
         else:
             try:
                 self.__serve_agent(
-                    self.AGENTS_FILE(), self.agent_name(), self.host(), self.port()
+                    self.AGENTS_FILE(),
+                    self.agent_name(),
+                    self.host(),
+                    self.port(),
+                    self.workers(),
+                    self.reload(),
                 )
                 if not self.silent():
                     Console.ok("Agent server started successfully")
@@ -1054,3 +1178,264 @@ class ServeCmd(Command):
                 Console.error(f"Unable to serve agent: {str(e)}")
                 return 1
         return 0
+
+
+# Bench command group
+#  maestro bench [options]
+class BenchCmd(Command):
+    """Command handler for benchmarking the workflow engine."""
+
+    def __init__(self, args):
+        self.args = args
+        super().__init__(self.args)
+
+    def scenarios(self):
+        scenario_str = self.args.get("--scenario")
+        if not scenario_str:
+            return bench.SCENARIOS
+        return tuple(s.strip() for s in scenario_str.split(",") if s.strip())
+
+    def size(self):
+        return self._positive_int("--size", bench.DEFAULT_SIZE)
+
+    def iterations(self):
+        return self._positive_int("--iterations", bench.DEFAULT_ITERATIONS)
+
+    def latency(self):
+        latency_str = self.args.get("--latency")
+        if latency_str is None:
+            return bench.DEFAULT_LATENCY_MS
+        try:
+            latency = float(latency_str)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid latency: {latency_str}")
+        if latency < 0:
+            raise ValueError(f"Invalid latency: {latency_str}")
+        return latency
+
+    def output(self):
+        return self.args.get("--output")
+
+    def name(self):
+        return "bench"
+
+    def bench(self):
+        """Run the benchmark scenarios and print or write the JSON report."""
+        try:
+            report = asyncio.run(
+                bench.run_benchmarks(
+                    self.scenarios(),
+                    size=self.size(),
+                    iterations=self.iterations(),
+                    latency_ms=self.latency(),
+                )
+            )
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to run benchmarks: {str(e)}")
+            return 1
+
+        if self.output():
+            with open(self.output(), "w") as f:
+                json.dump(report, f, indent=2)
+            if not self.silent():
+                for result in report["results"]:
+                    Console.print(
+                        f"[BENCH] {result['scenario']}: {result['run_ms']['mean']} ms/run, "
+                        f"{result['overhead_us']['per_step']} us/step overhead"
+                    )
+                Console.ok(f"Benchmark results written to {self.output()}")
+        else:
+            Console.print(json.dumps(report, indent=2))
+        return 0
+
+
+# StubLLM command group
+#  maestro stub-llm [options]
+class StubLLMCmd(Command):
+    """Command handler for serving the stub OpenAI compatible model server."""
+
+    def __init__(self, args):
+        self.args = args
+        super().__init__(self.args)
+
+    def __float(self, option, default):
+        value_str = self.args.get(option)
+        if value_str is None:
+            return default
+        try:
+            return float(value_str)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid {option.lstrip('-')}: {value_str}")
+
+    def host(self):
+        host_str = self.args.get("--host")
+        if host_str is None:
+            return "127.0.0.1"
+        return host_str
+
+    def port(self):
+        port_str = self.args.get("--port")
+        if port_str is None:
+            return 8000
+        try:
+            return int(port_str)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid port number: {port_str}")
+
+    def error_status(self):
+        status_str = self.args.get("--error-status")
+        if status_str is None:
+            return 500
+        try:
+            return int(status_str)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid error status: {status_str}")
+
+    def config(self):
+        return StubLLMConfig(
+            latency_ms=self.__float("--latency", 0.0),
+            jitter_ms=self.__float("--jitter", 0.0),
+            distribution=self.args.get("--distribution") or "fixed",
+            tokens_per_second=self.__float("--token-rate", 0.0),
+            error_rate=self.__float("--error-rate", 0.0),
+            error_status=self.error_status(),
+            response=self.args.get("--response"),
+        )
+
+    def name(self):
+        return "stub-llm"
+
+    def stub_llm(self):
+        """Serve the stub model server until interrupted.
+
+        Returns:
+            int: Return code (0 for success, 1 for failure)
+        """
+        try:
+            serve_stub_llm(self.config(), self.host(), self.port())
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to serve stub LLM: {str(e)}")
+            return 1
+        return 0
+
+
+# Index command group
+#  maestro index INDEX_DIR DOCUMENTS... [options]
+class IndexCmd(Command):
+    """Command handler for building embedded vector indexes of query agents."""
+
+    def __init__(self, args):
+        self.args = args
+        super().__init__(self.args)
+
+    def index_dir(self):
+        return self.args["INDEX_DIR"]
+
+    def documents(self):
+        return self.args["DOCUMENTS"]
+
+    def model(self):
+        return self.args.get("--embedding-model") or vector_index.HASH_MODEL
+
+    def index_type(self):
+        return self.args.get("--index-type") or "flat"
+
+    def name(self):
+        return "index"
+
+    def index(self):
+        """Embed the documents and write the index directory.
+
+        Returns:
+            int: Return code (0 for success, 1 for failure)
+        """
+        try:
+            index = asyncio.run(
+                vector_index.build_index(
+                    self.index_dir(),
+                    self.documents(),
+                    model=self.model(),
+                    url=self.args.get("--embedding-url"),
+                    index_type=self.index_type(),
+                    lists=self._positive_int("--lists", None),
+                    chunk_size=self._positive_int(
+                        "--chunk-size", vector_index.DEFAULT_CHUNK_SIZE
+                    ),
+                )
+            )
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to build index: {str(e)}")
+            return 1
+        if not self.silent():
+            Console.ok(
+                f"Indexed {len(index)} documents in {self.index_dir()} "
+                f"({index.index_type}, {index.model})"
+            )
+        return 0
+
+
+# Logs command group
+#  maestro logs [LOG_DIR] [options]
+class LogsCmd(Command):
+    """Command handler for analyzing the run and evaluation logs."""
+
+    def __init__(self, args):
+        self.args = args
+        super().__init__(self.args)
+
+    def log_dir(self):
+        return self.args.get("LOG_DIR")
+
+    def by(self):
+        by_str = self.args.get("--by")
+        if not by_str:
+            return ("agent",)
+        return tuple(s.strip() for s in by_str.split(",") if s.strip())
+
+    def format(self):
+        output_format = self.args.get("--format") or "text"
+        if output_format not in ("text", "json"):
+            raise ValueError(f"Invalid format: {output_format}")
+        return output_format
+
+    def output(self):
+        return self.args.get("--output")
+
+    def name(self):
+        return "logs"
+
+    def logs(self):
+        """Update the log index and print or write the report.
+
+        Returns:
+            int: Return code (0 for success, 1 for failure)
+        """
+        try:
+            output_format = self.format()
+            with log_index.LogIndex(self.log_dir()) as index:
+                stats = index.update()
+                report = index.report(self.by(), self.args.get("--since"))
+        except Exception as e:
+            self._check_verbose()
+            Console.error(f"Unable to analyze logs: {str(e)}")
+            return 1
+
+        if self.output():
+            with open(self.output(), "w") as f:
+                json.dump(log_index.to_records(report), f, indent=2)
+            if not self.silent():
+                Console.ok(f"Log report written to {self.output()}")
+        elif output_format == "json":
+            Console.print(json.dumps(log_index.to_records(report), indent=2))
+        else:
+            if self.verbose():
+                Console.print(
+                    f"[LOGS] {stats['files']} log files, {stats['read']} read, "
+                    f"{stats['records']} new records"
+                )
+            tables = list(log_index.format_report(report))
+            Console.print("\n\n".join(tables) if tables else "No logs found")
+        return 0
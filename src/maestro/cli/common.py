@@ -5,7 +5,8 @@
 
 import os
 import sys
-import yaml
+
+from maestro.yaml_loader import load_yaml
 
 VERBOSE = False
 
@@ -26,18 +27,19 @@ class Colors:
 def parse_yaml(file_path):
     """Parse a YAML file and return a list of dictionaries.
 
+    Files are parsed once and cached until they change; each call returns a
+    new copy of the documents that the caller may modify.
+
     Args:
         file_path (str): The path to the YAML file.
 
     Returns:
         list: A list of dictionaries containing the parsed YAML data.
     """
-    yaml_data = "--"
     try:
-        with open(file_path, "r") as file:
-            yaml_data = list(yaml.safe_load_all(file))
-            for d in yaml_data:
-                d["source_file"] = os.path.abspath(file_path)
+        yaml_data = load_yaml(file_path)
+        for d in yaml_data:
+            d["source_file"] = os.path.abspath(file_path)
         return yaml_data
     except Exception:
         Console.error(f"Could not parse YAML file: {file_path}")
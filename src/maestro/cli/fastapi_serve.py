@@ -3,25 +3,70 @@
 
 """FastAPI server module for serving Maestro agents via HTTP endpoints."""
 
+import copy
 import json
 import os
+import re
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from pydantic import BaseModel
 
+from maestro import events
 from maestro.workflow import create_agents, Workflow, get_agent_class
 from maestro.agents.agent import restore_agent
+from maestro.agents.registry import AGENT_REGISTRY
+from maestro.checkpoint import get_checkpoint_store
 from maestro.cli.common import parse_yaml, Console
+from maestro.loop_pools import lifespan
+from maestro.mermaid import render_mermaid
+from maestro.metrics import CONTENT_TYPE_LATEST, INFLIGHT_REQUESTS, generate_latest
+from maestro.tracing import configure_tracing, remote_context
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Environment used to hand serve arguments to worker processes, which build
+# their own app through the factories at the bottom of this module.
+SERVE_AGENTS_FILE_ENV = "MAESTRO_SERVE_AGENTS_FILE"
+SERVE_WORKFLOW_FILE_ENV = "MAESTRO_SERVE_WORKFLOW_FILE"
+SERVE_AGENT_NAME_ENV = "MAESTRO_SERVE_AGENT_NAME"
+SERVE_RELOAD_ENV = "MAESTRO_SERVE_RELOAD"
+SERVE_CHECKPOINT_ENV = "MAESTRO_SERVE_CHECKPOINT"
+# Workflow ids chosen by clients name log and checkpoint files
+WORKFLOW_ID_PATTERN = re.compile(r"[\w.-]+")
+
+
+def _if_none_match(request: Request) -> set:
+    """Return the entity tags listed in a request's If-None-Match header."""
+    header = request.headers.get("if-none-match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _file_signature(*paths) -> Tuple:
+    """Return (path, mtime, size) for each existing path, used to detect YAML changes."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
@@ -49,20 +94,26 @@ class HealthResponse(BaseModel):
 class FastAPIServer:
     """FastAPI server for serving Maestro agents."""
 
-    def __init__(self, agents_file: str, agent_name: Optional[str] = None):
+    def __init__(
+        self, agents_file: str, agent_name: Optional[str] = None, reload: bool = False
+    ):
         """Initialize the FastAPI server.
 
         Args:
             agents_file: Path to the agents YAML file
             agent_name: Specific agent name to serve (if multiple agents in file)
+            reload: Reload the agents when the agents file changes
         """
         self.agents_file = agents_file
         self.agent_name = agent_name
+        self.reload = reload
         self.agents = {}
+        self._signature = None
         self.app = FastAPI(
             title="Maestro Agent Server",
             description="HTTP API for serving Maestro agents",
             version="1.0.0",
+            lifespan=lifespan,
         )
         allowed_origins = [
             x.strip() for x in os.getenv("CORS_ALLOW_ORIGINS", "").split(",")
@@ -78,10 +129,14 @@ class FastAPIServer:
     def _setup_routes(self):
         """Set up FastAPI routes."""
 
+        inflight_chat = INFLIGHT_REQUESTS.labels("agent", "/chat")
+
         @self.app.post("/chat", response_model=ChatResponse)
         async def chat(request: ChatRequest):
             """Chat with the agent."""
+            inflight_chat.inc()
             try:
+                self._reload_if_changed()
                 if not self.agents:
                     raise HTTPException(status_code=500, detail="No agents loaded")
                 agent = None
@@ -111,6 +166,8 @@ class FastAPIServer:
             except Exception as e:
                 Console.error(f"Error in chat endpoint: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
+            finally:
+                inflight_chat.dec()
 
         @self.app.get("/health", response_model=HealthResponse)
         async def health():
@@ -131,13 +188,20 @@ class FastAPIServer:
                 or (list(self.agents.keys())[0] if self.agents else None),
             }
 
+        @self.app.get("/metrics")
+        async def metrics():
+            """Prometheus metrics for this server process."""
+            return PlainTextResponse(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
     def _load_agents(self):
         """Load agents from the agents file."""
         try:
+            signature = _file_signature(self.agents_file)
             agents_yaml = parse_yaml(self.agents_file)
             create_agents(agents_yaml)
 
-            # Load agents into memory
+            # Load agents into memory, swapping them in only once all are built
+            agents = {}
             for agent_def in agents_yaml:
                 agent_name = agent_def["metadata"]["name"]
                 if not self.agent_name or agent_name == self.agent_name:
@@ -155,11 +219,14 @@ class FastAPIServer:
                         )
                         agent = cls(agent_def)
 
-                    self.agents[agent_name] = agent
+                    agents[agent_name] = agent
 
-            if not self.agents:
+            if not agents:
                 raise RuntimeError(f"No agents found in {self.agents_file}")
 
+            self.agents = agents
+            self._signature = signature
+
             Console.ok(
                 f"Loaded {len(self.agents)} agent(s): {list(self.agents.keys())}"
             )
@@ -168,6 +235,19 @@ class FastAPIServer:
             Console.error(f"Failed to load agents: {str(e)}")
             raise
 
+    def _reload_if_changed(self):
+        """Reload agents if reload is enabled and the agents file changed.
+
+        A failed reload keeps the previously loaded agents serving.
+        """
+        if not self.reload or _file_signature(self.agents_file) == self._signature:
+            return
+        Console.print(f"Reloading agents from {self.agents_file}")
+        try:
+            self._load_agents()
+        except Exception:
+            self._signature = _file_signature(self.agents_file)
+
     async def _stream_response(self, agent, prompt: str):
         """Stream response from agent."""
         try:
@@ -188,11 +268,93 @@ class FastAPIServer:
         uvicorn.run(self.app, host=host, port=port, log_level="info")
 
 
+def validate_agent_definitions(agents_file: str, agent_name: Optional[str] = None):
+    """Parse and validate an agents file without instantiating any agent.
+
+    Args:
+        agents_file: Path to the agents YAML file
+        agent_name: Specific agent name to serve
+
+    Raises:
+        RuntimeError: If the file has no agents or the named agent is missing
+    """
+    agents_yaml = parse_yaml(agents_file)
+    names = [agent_def["metadata"]["name"] for agent_def in agents_yaml]
+    if not names:
+        raise RuntimeError(f"No agents found in {agents_file}")
+    if agent_name and agent_name not in names:
+        raise RuntimeError(
+            f"Agent '{agent_name}' not found in {agents_file}. Available agents: {names}"
+        )
+    return agents_yaml
+
+
+def validate_workflow_definitions(agents_file: str, workflow_file: str):
+    """Parse and validate a workflow and its agents without instantiating agents.
+
+    Args:
+        agents_file: Path to the agents YAML file
+        workflow_file: Path to the workflow YAML file
+
+    Raises:
+        RuntimeError: If the workflow is malformed or references unknown agents
+    """
+    agents_yaml = parse_yaml(agents_file)
+    workflow_yaml = parse_yaml(workflow_file)
+    if not workflow_yaml:
+        raise RuntimeError(f"No workflow found in {workflow_file}")
+    workflow = workflow_yaml[0]
+    if not workflow.get("metadata", {}).get("name"):
+        raise RuntimeError(f"Workflow in {workflow_file} has no metadata.name")
+    names = {agent_def["metadata"]["name"] for agent_def in agents_yaml}
+    for step in workflow["spec"]["template"].get("steps", []):
+        agent = step.get("agent")
+        if isinstance(agent, str) and agent not in names:
+            raise RuntimeError(
+                f"Step '{step.get('name')}' references undefined agent '{agent}'"
+            )
+    return agents_yaml, workflow_yaml
+
+
+def _run_workers(factory: str, host: str, port: int, workers: int, env: dict):
+    """Run uvicorn with several worker processes, each building its own app.
+
+    Workers are started from an import string so that every process owns its
+    agent instances (shared-nothing); arguments are passed via environment.
+    """
+    for key, value in env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = str(value)
+    uvicorn.run(
+        factory,
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+    )
+
+
+def create_agent_app() -> FastAPI:
+    """App factory used by agent server worker processes."""
+    configure_tracing("maestro-agent-server")
+    server = FastAPIServer(
+        os.environ[SERVE_AGENTS_FILE_ENV],
+        os.getenv(SERVE_AGENT_NAME_ENV) or None,
+        reload=os.getenv(SERVE_RELOAD_ENV, "false").lower() == "true",
+    )
+    return server.app
+
+
 def serve_agent(
     agents_file: str,
     agent_name: Optional[str] = None,
     host: str = "127.0.0.1",
     port: int = 8000,
+    workers: int = 1,
+    reload: bool = False,
 ):
     """Serve an agent via FastAPI.
 
@@ -201,15 +363,53 @@ def serve_agent(
         agent_name: Specific agent name to serve
         host: Host to bind to
         port: Port to serve on
+        workers: Number of worker processes
+        reload: Reload agents when the agents file changes
     """
-    server = FastAPIServer(agents_file, agent_name)
+    if workers > 1:
+        validate_agent_definitions(agents_file, agent_name)
+        Console.print(
+            f"Starting Maestro agent server on {host}:{port} with {workers} workers"
+        )
+        _run_workers(
+            "maestro.cli.fastapi_serve:create_agent_app",
+            host,
+            port,
+            workers,
+            {
+                SERVE_AGENTS_FILE_ENV: os.path.abspath(agents_file),
+                SERVE_AGENT_NAME_ENV: agent_name,
+                SERVE_RELOAD_ENV: str(reload).lower(),
+            },
+        )
+        return
+    configure_tracing("maestro-agent-server")
+    server = FastAPIServer(agents_file, agent_name, reload=reload)
     server.run(host, port)
 
 
 class WorkflowChatRequest(BaseModel):
-    """Request model for chat endpoint."""
+    """Request model for chat endpoint.
 
-    prompt: str
+    Workflow steps calling a served workflow send the inputs of the step as
+    JSON values besides the prompt. A client choosing the workflow id of the
+    run can follow its events on /events while it runs; the id is made of
+    letters, digits, "_", "." and "-" and must not be the id of a checkpointed
+    run.
+    """
+
+    prompt: str = ""
+    inputs: Optional[List[Any]] = None
+    workflow_id: Optional[str] = None
+
+    def text(self) -> str:
+        """The workflow prompt: the prompt, or else the inputs as text."""
+        if self.prompt or not self.inputs:
+            return self.prompt
+        return "\n\n".join(
+            value if isinstance(value, str) else json.dumps(value)
+            for value in self.inputs
+        )
 
 
 class WorkflowChatResponse(BaseModel):
@@ -218,6 +418,7 @@ class WorkflowChatResponse(BaseModel):
     response: str
     workflow_name: str
     timestamp: str
+    workflow_id: Optional[str] = None
 
 
 class WorkflowHealthResponse(BaseModel):
@@ -231,20 +432,34 @@ class WorkflowHealthResponse(BaseModel):
 class FastAPIWorkflowServer:
     """FastAPI server for serving Maestro workflow."""
 
-    def __init__(self, agents_file: str, workflow_file: str):
+    def __init__(
+        self,
+        agents_file: str,
+        workflow_file: str,
+        reload: bool = False,
+        checkpoint_store=None,
+    ):
         """Initialize the FastAPI server.
 
         Args:
             agents_file: Path to the agents YAML file
             workflow_file: Path to the workflow YAML file
+            reload: Reload the workflow when either YAML file changes
+            checkpoint_store: Checkpoint each run in this store so it can be resumed
         """
         self.agents_file = agents_file
         self.workflow_file = workflow_file
+        self.reload = reload
+        self.checkpoint_store = checkpoint_store
         self.workflow = {}
+        self._definitions = None
+        self._diagram = None
+        self._signature = None
         self.app = FastAPI(
             title="Maestro Workflow Server",
             description="HTTP API for serving Maestro workflow",
             version="1.0.0",
+            lifespan=lifespan,
         )
         allowed_origins = [
             x.strip() for x in os.getenv("CORS_ALLOW_ORIGINS", "").split(",")
@@ -254,64 +469,126 @@ class FastAPIWorkflowServer:
             allow_origins=allowed_origins,
             allow_methods=["GET", "POST"],
         )
+        self._events = events.QueueSink(os.getenv("MAESTRO_EVENTS_LEVEL", "info"))
+        self._event_streams = 0
+        self._events_lock = threading.Lock()
         self._setup_routes()
         self._load_workflow()
-        self.workflow_name = self.workflow.workflow["metadata"]["name"]
 
-    async def _stream_workflow_response(self, prompt: str):
+    @contextmanager
+    def _subscribe_events(self, **match):
+        """Subscribe to events; the sink is on the bus only while subscribed."""
+        with self._events_lock:
+            if self._event_streams == 0:
+                events.BUS.add_sink(self._events)
+            self._event_streams += 1
+        try:
+            with self._events.subscribe(**match) as queue:
+                yield queue
+        finally:
+            with self._events_lock:
+                self._event_streams -= 1
+                if self._event_streams == 0:
+                    events.BUS.remove_sink(self._events)
+
+    async def _stream_events(self, level: int, match: dict):
+        """Stream the events at or above a level as server-sent events."""
+        with self._subscribe_events(**match) as queue:
+            while True:
+                event = await queue.get()
+                if event.level >= level:
+                    yield events.QueueSink.sse(event)
+
+    async def _stream_workflow_response(
+        self, prompt: str, trace_carrier=None, workflow_id=None
+    ):
         """Stream workflow response per step."""
         try:
-            async for step_data in self.workflow.run_streaming(prompt):
-                if "error" in step_data:
-                    yield f"data: {json.dumps({'error': step_data['error']})}\n\n"
-                elif "final_result" in step_data:
-                    try:
-                        str_response = json.dumps(step_data["final_result"])
-                    except Exception:
-                        str_response = str(step_data["final_result"])
-                    yield f"data: {json.dumps({'response': str_response, 'workflow_name': self.workflow_name, 'workflow_complete': True})}\n\n"
-                else:
-                    step_name = step_data.get("step_name", "unknown")
-                    step_result = step_data.get("step_result", "")
-                    agent_name = step_data.get("agent_name", "unknown")
-
-                    try:
-                        str_result = (
-                            json.dumps(step_result)
-                            if isinstance(step_result, dict)
-                            else str(step_result)
-                        )
-                    except Exception:
-                        str_result = str(step_result)
-
-                    response_data = {
-                        "step_name": step_name,
-                        "step_result": str_result,
-                        "agent_name": agent_name,
-                        "step_complete": True,
-                    }
-                    if "prompt_tokens" in step_data:
-                        response_data["prompt_tokens"] = step_data["prompt_tokens"]
-                    if "response_tokens" in step_data:
-                        response_data["response_tokens"] = step_data["response_tokens"]
-                    if "total_tokens" in step_data:
-                        response_data["total_tokens"] = step_data["total_tokens"]
-
-                    yield f"data: {json.dumps(response_data)}\n\n"
+            with remote_context(trace_carrier), events.bind(workflow_id=workflow_id):
+                async for step_data in self.workflow.run_streaming(prompt):
+                    if "error" in step_data:
+                        yield f"data: {json.dumps({'error': step_data['error']})}\n\n"
+                    elif "stream_event" in step_data:
+                        event = {
+                            "step_name": step_data["step_name"],
+                            "event": step_data["stream_event"],
+                        }
+                        yield f"data: {json.dumps(event, default=str)}\n\n"
+                    elif "final_result" in step_data:
+                        complete = {
+                            "workflow_name": self.workflow_name,
+                            "workflow_id": workflow_id,
+                            "workflow_complete": True,
+                        }
+                        try:
+                            complete["response"] = json.dumps(step_data["final_result"])
+                            complete["result"] = step_data["final_result"]
+                        except Exception:
+                            complete["response"] = str(step_data["final_result"])
+                        yield f"data: {json.dumps(complete)}\n\n"
+                    else:
+                        step_name = step_data.get("step_name", "unknown")
+                        step_result = step_data.get("step_result", "")
+                        agent_name = step_data.get("agent_name", "unknown")
+
+                        try:
+                            str_result = (
+                                json.dumps(step_result)
+                                if isinstance(step_result, dict)
+                                else str(step_result)
+                            )
+                        except Exception:
+                            str_result = str(step_result)
+
+                        response_data = {
+                            "step_name": step_name,
+                            "step_result": str_result,
+                            "agent_name": agent_name,
+                            "step_complete": True,
+                        }
+                        if "prompt_tokens" in step_data:
+                            response_data["prompt_tokens"] = step_data["prompt_tokens"]
+                        if "response_tokens" in step_data:
+                            response_data["response_tokens"] = step_data[
+                                "response_tokens"
+                            ]
+                        if "total_tokens" in step_data:
+                            response_data["total_tokens"] = step_data["total_tokens"]
+                        if "remote_workflow" in step_data:
+                            response_data["remote_workflow"] = step_data[
+                                "remote_workflow"
+                            ]
+
+                        yield f"data: {json.dumps(response_data)}\n\n"
         except Exception as e:
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
 
     def _setup_routes(self):
         """Set up FastAPI routes."""
 
+        inflight_chat = INFLIGHT_REQUESTS.labels("workflow", "/chat")
+        inflight_stream = INFLIGHT_REQUESTS.labels("workflow", "/chat/stream")
+        inflight_resume = INFLIGHT_REQUESTS.labels("workflow", "/resume")
+
         @self.app.post("/chat", response_model=WorkflowChatResponse)
-        async def chat(request: WorkflowChatRequest):
+        async def chat(request: WorkflowChatRequest, http_request: Request):
             """Chat with the workflow."""
+            inflight_chat.inc()
             try:
+                self._reload_if_changed()
                 if not self.workflow:
                     raise HTTPException(status_code=500, detail="No workflow loaded")
 
-                response = await self.workflow.run(request.prompt)
+                # Runs of the shared workflow have no id; their events get one
+                workflow_id = self._new_run_id(request.workflow_id)
+                workflow = self.workflow
+                if self.checkpoint_store is not None:
+                    workflow = self._new_workflow(workflow_id)
+                with (
+                    remote_context(http_request.headers),
+                    events.bind(workflow_id=workflow_id),
+                ):
+                    response = await workflow.run(request.text())
                 try:
                     str_response = json.dumps(response)
                 except Exception:
@@ -320,11 +597,16 @@ class FastAPIWorkflowServer:
                     response=str_response,
                     workflow_name=self.workflow_name,
                     timestamp=datetime.utcnow().isoformat() + "Z",
+                    workflow_id=workflow_id,
                 )
 
+            except HTTPException:
+                raise
             except Exception as e:
                 Console.error(f"Error in chat endpoint: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
+            finally:
+                inflight_chat.dec()
 
         @self.app.get("/health", response_model=WorkflowHealthResponse)
         async def health():
@@ -336,44 +618,213 @@ class FastAPIWorkflowServer:
             )
 
         @self.app.get("/diagram")
-        async def diagram():
-            """Return Mermaid diagram for the current workflow."""
+        async def diagram(http_request: Request):
+            """Return Mermaid diagram for the current workflow.
+
+            The response carries an ETag, so clients revalidating with
+            If-None-Match get an empty 304 while the workflow is unchanged.
+            """
             try:
+                self._reload_if_changed()
                 if not self.workflow:
                     raise HTTPException(status_code=500, detail="No workflow loaded")
-                mermaid_str = self.workflow.to_mermaid("sequenceDiagram")
-                return {"diagram": mermaid_str, "workflow_name": self.workflow_name}
+                mermaid_str, etag = self._sequence_diagram()
+                headers = {"ETag": etag, "Cache-Control": "no-cache"}
+                tags = _if_none_match(http_request)
+                if etag in tags or "*" in tags:
+                    return Response(status_code=304, headers=headers)
+                return JSONResponse(
+                    {"diagram": mermaid_str, "workflow_name": self.workflow_name},
+                    headers=headers,
+                )
+            except HTTPException:
+                raise
             except Exception as e:
                 Console.error(f"Error in diagram endpoint: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.post("/chat/stream")
-        async def chat_stream(request: WorkflowChatRequest):
+        async def chat_stream(request: WorkflowChatRequest, http_request: Request):
             """Chat with the workflow using streaming."""
             try:
+                self._reload_if_changed()
                 if not self.workflow:
                     raise HTTPException(status_code=500, detail="No workflow loaded")
 
                 return StreamingResponse(
-                    self._stream_workflow_response(request.prompt),
+                    self._track_inflight(
+                        inflight_stream,
+                        self._stream_workflow_response(
+                            request.text(),
+                            dict(http_request.headers),
+                            self._new_run_id(request.workflow_id),
+                        ),
+                    ),
                     media_type="text/plain",
                 )
 
+            except HTTPException:
+                raise
             except Exception as e:
                 Console.error(f"Error in chat stream endpoint: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.get("/events")
+        async def stream_events(workflow_id: Optional[str] = None, level: str = "info"):
+            """Stream engine and agent events, optionally of one workflow run.
+
+            Every run has a workflow id: the one sent with its chat request, or
+            else a generated one returned with its response.
+            """
+            try:
+                minimum = events.parse_level(level)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            match = {"workflow_id": workflow_id} if workflow_id else {}
+            return StreamingResponse(
+                self._stream_events(minimum, match), media_type="text/event-stream"
+            )
+
+        @self.app.get("/metrics")
+        async def metrics():
+            """Prometheus metrics for this server process."""
+            return PlainTextResponse(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+        @self.app.get("/checkpoints/{workflow_id}")
+        async def checkpoint(workflow_id: str):
+            """Return the checkpoint status of a workflow run."""
+            found = self._load_checkpoint(workflow_id)
+            return found.to_dict()
+
+        @self.app.post("/resume/{workflow_id}", response_model=WorkflowChatResponse)
+        async def resume(workflow_id: str):
+            """Resume a checkpointed workflow run after its last completed step."""
+            self._load_checkpoint(workflow_id)
+            inflight_resume.inc()
+            try:
+                self._reload_if_changed()
+                response = await self._new_workflow(workflow_id).resume()
+                try:
+                    str_response = json.dumps(response)
+                except Exception:
+                    str_response = str(response)
+                return WorkflowChatResponse(
+                    response=str_response,
+                    workflow_name=self.workflow_name,
+                    timestamp=datetime.utcnow().isoformat() + "Z",
+                    workflow_id=workflow_id,
+                )
+            except Exception as e:
+                Console.error(f"Error in resume endpoint: {str(e)}")
+                raise HTTPException(status_code=500, detail=str(e))
+            finally:
+                inflight_resume.dec()
+
+    def _sequence_diagram(self):
+        """Return (markdown, etag) of the loaded workflow's sequence diagram."""
+        workflow, diagram = self.workflow, self._diagram
+        if diagram is None:
+            diagram = render_mermaid(workflow.workflow, "sequenceDiagram")
+            if workflow is self.workflow:
+                self._diagram = diagram
+        return diagram
+
+    def _new_run_id(self, workflow_id: Optional[str]) -> str:
+        """Return the id of a new run, the client's if valid, or raise an HTTP error."""
+        if not workflow_id:
+            return uuid.uuid4().hex
+        if not WORKFLOW_ID_PATTERN.fullmatch(workflow_id):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid workflow id '{workflow_id}': use letters, "
+                "digits, '_', '.' and '-'",
+            )
+        if self.checkpoint_store is not None:
+            try:
+                found = self.checkpoint_store.load(workflow_id)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            if found is not None:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Workflow run '{workflow_id}' has a checkpoint; "
+                    f"use /resume/{workflow_id} to continue it",
+                )
+        return workflow_id
+
+    def _load_checkpoint(self, workflow_id: str):
+        """Return the checkpoint of a run or raise an HTTP error."""
+        if self.checkpoint_store is None:
+            raise HTTPException(status_code=400, detail="Checkpointing is not enabled")
+        try:
+            found = self.checkpoint_store.load(workflow_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if found is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No checkpoint for workflow run '{workflow_id}'",
+            )
+        return found
+
+    def _new_workflow(self, workflow_id: str) -> Workflow:
+        """Build a workflow instance of its own for one checkpointed run."""
+        agents_yaml, workflow_yaml = self._definitions
+        return Workflow(
+            copy.deepcopy(agents_yaml),
+            copy.deepcopy(workflow_yaml[0]),
+            workflow_id=workflow_id,
+            checkpoint_store=self.checkpoint_store,
+        )
+
+    async def _track_inflight(self, gauge, stream):
+        """Count a streaming response as in flight until it is fully sent."""
+        gauge.inc()
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            gauge.dec()
+
     def _load_workflow(self):
         """Load agents from the agents file."""
         try:
+            signature = _file_signature(self.agents_file, self.workflow_file)
             agents_yaml = parse_yaml(self.agents_file)
             workflow_yaml = parse_yaml(self.workflow_file)
-            self.workflow = Workflow(agents_yaml, workflow_yaml[0])
+            definitions = (copy.deepcopy(agents_yaml), copy.deepcopy(workflow_yaml))
+            workflow = Workflow(agents_yaml, workflow_yaml[0])
+            self.workflow = workflow
+            self._definitions = definitions
+            self._diagram = None
+            self.workflow_name = workflow.workflow["metadata"]["name"]
+            self._signature = signature
             Console.ok("Workflow loaded")
         except Exception as e:
             Console.error(f"Failed to load workflow: {str(e)}")
             raise
 
+    def _reload_if_changed(self):
+        """Reload the workflow if reload is enabled and a YAML file changed.
+
+        Requests already running keep the workflow they started with, and a
+        failed reload keeps the previously loaded workflow serving.
+        """
+        if not self.reload:
+            return
+        if _file_signature(self.agents_file, self.workflow_file) == self._signature:
+            return
+        Console.print(f"Reloading workflow from {self.workflow_file}")
+        # Agents may read instructions or code from files the hash does not cover
+        for agent_def in self._definitions[0] or []:
+            name = isinstance(agent_def, dict) and agent_def["metadata"].get("name")
+            if name:
+                AGENT_REGISTRY.invalidate(name)
+        try:
+            self._load_workflow()
+        except Exception:
+            self._signature = _file_signature(self.agents_file, self.workflow_file)
+
     def run(self, host: str = "127.0.0.1", port: int = 8000):
         """Run the FastAPI server."""
         Console.print(f"Starting Maestro workflow server on {host}:{port}")
@@ -383,8 +834,27 @@ class FastAPIWorkflowServer:
         uvicorn.run(self.app, host=host, port=port, log_level="info")
 
 
+def create_workflow_app() -> FastAPI:
+    """App factory used by workflow server worker processes."""
+    configure_tracing("maestro-workflow-server")
+    checkpoint = os.getenv(SERVE_CHECKPOINT_ENV, "false").lower() == "true"
+    server = FastAPIWorkflowServer(
+        os.environ[SERVE_AGENTS_FILE_ENV],
+        os.environ[SERVE_WORKFLOW_FILE_ENV],
+        reload=os.getenv(SERVE_RELOAD_ENV, "false").lower() == "true",
+        checkpoint_store=get_checkpoint_store() if checkpoint else None,
+    )
+    return server.app
+
+
 def serve_workflow(
-    agents_file: str, workflow_file: str, host: str = "127.0.0.1", port: int = 8000
+    agents_file: str,
+    workflow_file: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    reload: bool = False,
+    checkpoint: bool = False,
 ):
     """Serve a workflow via FastAPI.
 
@@ -393,6 +863,33 @@ def serve_workflow(
         workflow_file: Path to the workflow YAML file
         host: Host to bind to
         port: Port to serve on
+        workers: Number of worker processes
+        reload: Reload the workflow when either YAML file changes
+        checkpoint: Checkpoint runs so they can be resumed with /resume
     """
-    server = FastAPIWorkflowServer(agents_file, workflow_file)
+    if workers > 1:
+        validate_workflow_definitions(agents_file, workflow_file)
+        Console.print(
+            f"Starting Maestro workflow server on {host}:{port} with {workers} workers"
+        )
+        _run_workers(
+            "maestro.cli.fastapi_serve:create_workflow_app",
+            host,
+            port,
+            workers,
+            {
+                SERVE_AGENTS_FILE_ENV: os.path.abspath(agents_file),
+                SERVE_WORKFLOW_FILE_ENV: os.path.abspath(workflow_file),
+                SERVE_RELOAD_ENV: str(reload).lower(),
+                SERVE_CHECKPOINT_ENV: str(checkpoint).lower(),
+            },
+        )
+        return
+    configure_tracing("maestro-workflow-server")
+    server = FastAPIWorkflowServer(
+        agents_file,
+        workflow_file,
+        reload=reload,
+        checkpoint_store=get_checkpoint_store() if checkpoint else None,
+    )
     server.run(host, port)
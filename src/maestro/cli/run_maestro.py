@@ -13,11 +13,15 @@ Usage:
   maestro run AGENTS_FILE WORKFLOW_FILE [options]
   maestro serve AGENTS_FILE [options]
   maestro serve  AGENTS_FILE WORKFLOW_FILE [options]
-  maestro validate YAML_FILE [options]
   maestro validate SCHEMA_FILE YAML_FILE [options]
+  maestro validate YAML_FILE [YAML_FILES...] [options]
   maestro meta-agents TEXT_FILE [options]
   maestro clean [options]
   maestro create-cr YAML_FILE [options]
+  maestro bench [options]
+  maestro stub-llm [options]
+  maestro index INDEX_DIR DOCUMENTS... [options]
+  maestro logs [LOG_DIR] [options]
 
   maestro (-h | --help)
   maestro (-v | --version)
@@ -29,6 +33,32 @@ Options:
   --prompt               Reads a user prompt and executes workflow with it
   --auto-prompt          Run prompt by default if specified
   --evaluate             Enable optional evaluation (same as MAESTRO_AUTO_EVALUATION=true)
+  --checkpoint           Checkpoint workflow runs after each step (see MAESTRO_CHECKPOINT_STORE)
+  --resume ID            Resume the checkpointed workflow run ID after its last completed step
+  --batch FILE           Run the workflow once per prompt in a JSONL or CSV file
+  --output FILE          Output JSONL file for --batch (default: FILE.results.jsonl), or JSON file for bench, validate and logs
+  --concurrency N        Number of --batch inputs to run concurrently (default: 4)
+
+  --scenario NAMES       Comma separated bench scenarios: linear, parallel, loop, conditional, serve (default: all)
+  --size N               Number of agent calls per bench workflow run (default: 10)
+  --iterations N         Number of runs per bench scenario (default: 20)
+  --latency MS           Artificial latency in milliseconds of each bench agent call or stub-llm response (default: 0)
+
+  --jitter MS            Spread of the stub-llm latency in milliseconds (default: 0)
+  --distribution NAME    Stub-llm latency distribution: fixed, uniform, normal, exponential (default: fixed)
+  --token-rate N         Stub-llm response tokens per second, 0 for no delay (default: 0)
+  --error-rate P         Probability of a stub-llm request failing with --error-status (default: 0)
+  --error-status CODE    HTTP status of injected stub-llm errors (default: 500)
+  --response TEXT        Canned stub-llm response (default: echo the last user message)
+
+  --embedding-model NAME Embedding model of index: hash or an OpenAI compatible embeddings model (default: hash)
+  --embedding-url URL    Embeddings API URL of index (default: OPENAI_BASE_URL)
+  --index-type TYPE      Index type: flat or ivf (default: flat)
+  --lists N              Number of ivf index clusters (default: square root of the document count)
+  --chunk-size N         Characters per index document chunk (default: 1000)
+
+  --by FIELDS            Comma separated fields to group logged agent runs by: agent, model, workflow (default: agent)
+  --since TIME           Only logs since an ISO date or time, or a duration ago such as 30m, 24h or 7d
 
   --node-ui              Deploys locally as Node.js UI application
 
@@ -45,6 +75,9 @@ Options:
   --host HOST            Host to bind to (default: 127.0.0.1)
   --agent-name NAME      Specific agent name to serve (if multiple in file)
   --streaming            Enable streaming responses
+  --workers N            Number of worker processes to serve with (default: 1) or validate with (default: CPU count)
+  --format FORMAT        Output format of validate and logs: text or json (default: text)
+  --reload               Reload served agents or workflow when their YAML files change
   --ui-port PORT         Port for UI server (default: 5173)
 
   -h --help              Show this screen.
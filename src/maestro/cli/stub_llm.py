@@ -0,0 +1,387 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Stub OpenAI compatible model server for offline load and latency testing.
+
+The server answers the chat completions and Responses APIs, streamed (SSE) or
+not, with usage fields, so agents, evaluation metrics and the workflow server
+can be exercised end to end without a model or network access. Responses echo
+the last user message, or return a canned text. Latency before the first
+token, the token rate of the response and injected errors are configurable.
+
+Tokens are whitespace separated words; usage counts are consistent with the
+text returned but are not those of any real tokenizer.
+"""
+
+import asyncio
+import contextlib
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from maestro.cli.common import Console
+
+DISTRIBUTIONS = ("fixed", "uniform", "normal", "exponential")
+STUB_MODEL = "maestro-stub"
+
+
+class StubLLMConfig:
+    """Behavior of the stub model server.
+
+    Args:
+        latency_ms: mean latency before the first token, in milliseconds
+        jitter_ms: spread of the latency (half width for uniform, standard
+            deviation for normal); unused by fixed and exponential
+        distribution: latency distribution, one of DISTRIBUTIONS
+        tokens_per_second: rate at which response tokens are produced, 0 for
+            no delay between tokens
+        error_rate: probability of answering a request with an error
+        error_status: HTTP status of injected errors
+        response: canned response text, None to echo the last user message
+        seed: seed of the random generator, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        distribution: str = "fixed",
+        tokens_per_second: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        response: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        if latency_ms < 0 or jitter_ms < 0 or tokens_per_second < 0:
+            raise ValueError("Latency, jitter and token rate must not be negative")
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"Invalid error rate: {error_rate}")
+        if not 400 <= error_status <= 599:
+            raise ValueError(f"Invalid error status: {error_status}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.distribution = distribution
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.response = response
+        self.random = random.Random(seed)
+
+    def sample_latency(self) -> float:
+        """Return the latency before the first token of a response, in seconds."""
+        mean = self.latency_ms
+        if self.distribution == "uniform":
+            value = self.random.uniform(mean - self.jitter_ms, mean + self.jitter_ms)
+        elif self.distribution == "normal":
+            value = self.random.gauss(mean, self.jitter_ms)
+        elif self.distribution == "exponential":
+            value = self.random.expovariate(1 / mean) if mean > 0 else 0.0
+        else:
+            value = mean
+        return max(value, 0.0) / 1000
+
+    def token_delay(self) -> float:
+        return 1 / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def inject_error(self) -> bool:
+        return self.error_rate > 0 and self.random.random() < self.error_rate
+
+
+def _text(content: Any) -> str:
+    """Text of a message content: a string or a list of content parts."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "") for part in content if isinstance(part, dict)
+        )
+    return ""
+
+
+def _tokens(text: str) -> List[str]:
+    """Split text into tokens that concatenate back to the text."""
+    words = text.split(" ")
+    return [word + " " for word in words[:-1]] + [words[-1]] if text else []
+
+
+def _count(text: str) -> int:
+    return len(text.split())
+
+
+def _sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+class StubLLMServer:
+    """FastAPI app implementing the stub model endpoints."""
+
+    def __init__(self, config: Optional[StubLLMConfig] = None):
+        self.config = config or StubLLMConfig()
+        self.requests = 0
+        self.app = FastAPI(
+            title="Maestro Stub LLM Server",
+            description="OpenAI compatible stub model for load and latency testing",
+            version="1.0.0",
+        )
+        self._setup_routes()
+
+    def _reply(self, messages: List[Dict[str, Any]]) -> str:
+        if self.config.response is not None:
+            return self.config.response
+        for message in reversed(messages):
+            if message.get("role", "user") == "user":
+                return _text(message.get("content"))
+        return ""
+
+    def _error(self) -> JSONResponse:
+        status = self.config.error_status
+        headers = {"Retry-After": "1"} if status == 429 else None
+        return JSONResponse(
+            status_code=status,
+            headers=headers,
+            content={
+                "error": {
+                    "message": f"Injected error with status {status}",
+                    "type": "rate_limit_error" if status == 429 else "server_error",
+                    "code": "stub_injected_error",
+                }
+            },
+        )
+
+    async def _stream_tokens(self, text: str):
+        delay = self.config.token_delay()
+        for token in _tokens(text):
+            if delay:
+                await asyncio.sleep(delay)
+            yield token
+
+    def _setup_routes(self):
+        @self.app.get("/v1/models")
+        async def models():
+            return {
+                "object": "list",
+                "data": [{"id": STUB_MODEL, "object": "model", "owned_by": "maestro"}],
+            }
+
+        @self.app.get("/health")
+        async def health():
+            return {"status": "healthy", "requests": self.requests}
+
+        @self.app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            self.requests += 1
+            await asyncio.sleep(self.config.sample_latency())
+            if self.config.inject_error():
+                return self._error()
+
+            messages = body.get("messages", [])
+            text = self._reply(messages)
+            prompt_tokens = sum(_count(_text(m.get("content"))) for m in messages)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": _count(text),
+                "total_tokens": prompt_tokens + _count(text),
+            }
+            completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+            model = body.get("model", STUB_MODEL)
+            created = int(time.time())
+
+            if not body.get("stream"):
+                return {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+
+            include_usage = (body.get("stream_options") or {}).get("include_usage")
+
+            def chunk(delta, finish_reason=None):
+                return {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                    ],
+                }
+
+            async def stream():
+                yield _sse(chunk({"role": "assistant", "content": ""}))
+                async for token in self._stream_tokens(text):
+                    yield _sse(chunk({"content": token}))
+                yield _sse(chunk({}, "stop"))
+                if include_usage:
+                    yield _sse({**chunk({}), "choices": [], "usage": usage})
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
+        @self.app.post("/v1/responses")
+        async def responses(request: Request):
+            body = await request.json()
+            self.requests += 1
+            await asyncio.sleep(self.config.sample_latency())
+            if self.config.inject_error():
+                return self._error()
+
+            items = body.get("input", "")
+            if isinstance(items, str):
+                items = [{"role": "user", "content": items}]
+            messages = [item for item in items if "content" in item]
+            text = self._reply(messages)
+            input_tokens = _count(body.get("instructions") or "") + sum(
+                _count(_text(m.get("content"))) for m in messages
+            )
+            usage = {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": _count(text),
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + _count(text),
+            }
+            message_id = f"msg_{uuid.uuid4().hex}"
+            part = {"type": "output_text", "text": text, "annotations": []}
+            message = {
+                "id": message_id,
+                "type": "message",
+                "status": "completed",
+                "role": "assistant",
+                "content": [part],
+            }
+            response = {
+                "id": f"resp_{uuid.uuid4().hex}",
+                "object": "response",
+                "created_at": int(time.time()),
+                "status": "completed",
+                "model": body.get("model", STUB_MODEL),
+                "instructions": body.get("instructions"),
+                "output": [message],
+                "parallel_tool_calls": True,
+                "tool_choice": "auto",
+                "tools": [],
+                "error": None,
+                "incomplete_details": None,
+                "metadata": {},
+                "usage": usage,
+            }
+
+            if not body.get("stream"):
+                return response
+
+            async def stream():
+                sequence = iter(range(1 << 30))
+
+                def event(kind, **data):
+                    return _sse(
+                        {"type": kind, "sequence_number": next(sequence), **data}, kind
+                    )
+
+                pending = {**response, "status": "in_progress", "output": []}
+                pending.pop("usage")
+                in_progress = {**message, "status": "in_progress", "content": []}
+                position = {"item_id": message_id, "output_index": 0}
+
+                yield event("response.created", response=pending)
+                yield event("response.in_progress", response=pending)
+                yield event(
+                    "response.output_item.added", output_index=0, item=in_progress
+                )
+                yield event(
+                    "response.content_part.added",
+                    **position,
+                    content_index=0,
+                    part={**part, "text": ""},
+                )
+                async for token in self._stream_tokens(text):
+                    yield event(
+                        "response.output_text.delta",
+                        **position,
+                        content_index=0,
+                        delta=token,
+                        logprobs=[],
+                    )
+                yield event(
+                    "response.output_text.done",
+                    **position,
+                    content_index=0,
+                    text=text,
+                    logprobs=[],
+                )
+                yield event(
+                    "response.content_part.done", **position, content_index=0, part=part
+                )
+                yield event("response.output_item.done", output_index=0, item=message)
+                yield event("response.completed", response=response)
+
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+@contextlib.contextmanager
+def run_stub_server(config: Optional[StubLLMConfig] = None, host: str = "127.0.0.1"):
+    """Run a stub model server in a background thread on a free port.
+
+    Yields:
+        The server, with its OpenAI base URL in `base_url`
+    """
+    server = StubLLMServer(config)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, 0))
+    uvicorn_server = uvicorn.Server(
+        uvicorn.Config(server.app, log_level="warning", lifespan="off")
+    )
+    thread = threading.Thread(
+        target=uvicorn_server.run, kwargs={"sockets": [sock]}, daemon=True
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not uvicorn_server.started:
+            if not thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Stub LLM server did not start")
+            time.sleep(0.01)
+        server.base_url = f"http://{host}:{sock.getsockname()[1]}/v1"
+        yield server
+    finally:
+        uvicorn_server.should_exit = True
+        thread.join(timeout=10)
+        sock.close()
+
+
+def serve_stub_llm(
+    config: Optional[StubLLMConfig] = None,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+):
+    """Serve the stub model server until interrupted.
+
+    Args:
+        config: behavior of the stub model
+        host: Host to bind to
+        port: Port to serve on
+    """
+    server = StubLLMServer(config)
+    Console.print(f"Starting stub LLM server on http://{host}:{port}/v1")
+    uvicorn.run(server.app, host=host, port=port, log_level="info")
@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Leveled event bus for workflow and agent output.
+
+Code on the hot path emits events instead of printing. An event is only
+created when a sink accepts its level, and its message is formatted only when
+a sink renders it: messages are either %-style templates with arguments, or
+callables returning the text. Emitting below the bus level costs one integer
+comparison.
+
+Sinks:
+    ConsoleSink  prints messages to stdout, as maestro always has
+    JSONLSink    appends one JSON object per event to a file
+    OTelSink     records events on the current OpenTelemetry span
+    QueueSink    feeds asyncio queues, e.g. for server-sent events
+
+Events carry the fields bound with `bind()` (such as the workflow id of the
+current run), so output of concurrent runs can be told apart.
+
+Environment:
+    MAESTRO_LOG_LEVEL: console level, debug, info, warning or error
+        (default: info; `--verbose` selects debug, which reproduces all output)
+    MAESTRO_EVENTS_FILE: also write events to this JSONL file
+    MAESTRO_EVENTS_LEVEL: level of the JSONL and OpenTelemetry sinks
+        (default: info)
+    MAESTRO_EVENTS_OTEL: record events on OpenTelemetry spans when true
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, UTC
+from typing import Any, Dict, Iterator, List
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+DISABLED = 100
+
+_fields: ContextVar[Dict[str, Any]] = ContextVar("maestro_event_fields", default={})
+
+
+def parse_level(level) -> int:
+    """Return the numeric level of a level name or number."""
+    if isinstance(level, int):
+        return level
+    name = str(level).strip().lower()
+    try:
+        return LEVELS["warning" if name == "warn" else name]
+    except KeyError:
+        raise ValueError(f"Unknown event level: {level}")
+
+
+class Event:
+    """An emitted event; `message` is formatted on first access."""
+
+    __slots__ = ("level", "name", "time", "fields", "icon", "_message", "_args")
+
+    def __init__(self, level, name, message, args=(), fields=None, icon=None):
+        self.level = level
+        self.name = name
+        self.time = time.time()
+        self.fields = fields or {}
+        self.icon = icon
+        self._message = message
+        self._args = args
+
+    @property
+    def message(self) -> str:
+        if self._args:
+            self._message = str(self._message) % self._args
+            self._args = ()
+        elif callable(self._message):
+            self._message = self._message()
+        elif not isinstance(self._message, str):
+            self._message = str(self._message)
+        return self._message
+
+    def text(self) -> str:
+        """The console line of the event."""
+        if self.icon is None:
+            return self.message
+        timestamp = datetime.fromtimestamp(self.time).strftime("%m-%d-%Y %H:%M:%S")
+        return f"{self.icon} {timestamp}: {self.message}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "time": datetime.fromtimestamp(self.time, UTC).isoformat(),
+            "level": LEVEL_NAMES.get(self.level, str(self.level)),
+            "event": self.name,
+            "message": self.message,
+            **self.fields,
+        }
+
+
+class Sink:
+    """Base class of event sinks."""
+
+    def __init__(self, level=INFO):
+        self.level = parse_level(level)
+
+    def emit(self, event: Event) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class ConsoleSink(Sink):
+    """Print event messages to a stream, stdout by default."""
+
+    def __init__(self, level=INFO, stream=None):
+        super().__init__(level)
+        self.stream = stream
+
+    def emit(self, event):
+        # Look up stdout on each event so redirect_stdout keeps working
+        print(event.text(), file=self.stream or sys.stdout)
+
+
+class JSONLSink(Sink):
+    """Append events as JSON lines to a file."""
+
+    def __init__(self, path, level=INFO):
+        super().__init__(level)
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, event):
+        line = json.dumps(event.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class OTelSink(Sink):
+    """Add events to the current OpenTelemetry span, if it is recording."""
+
+    def emit(self, event):
+        from opentelemetry import trace
+
+        span = trace.get_current_span()
+        if span.is_recording():
+            attributes = {
+                key: value if isinstance(value, (str, bool, int, float)) else str(value)
+                for key, value in event.to_dict().items()
+            }
+            span.add_event(event.name, attributes)
+
+
+class QueueSink(Sink):
+    """Put events on the asyncio queues of subscribers, e.g. SSE clients.
+
+    Events may be emitted from any thread; they are handed to each
+    subscriber's event loop. Subscribers that fall behind lose events rather
+    than slowing down the emitter.
+    """
+
+    def __init__(self, level=INFO, maxsize: int = 1000):
+        super().__init__(level)
+        self.maxsize = maxsize
+        self._subscribers: List[tuple] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self, **match) -> Iterator[asyncio.Queue]:
+        """Subscribe to events whose fields equal `match`, e.g. workflow_id."""
+        queue = asyncio.Queue(maxsize=self.maxsize)
+        subscriber = (asyncio.get_running_loop(), queue, match)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    @staticmethod
+    def _put(queue, event):
+        if not queue.full():
+            queue.put_nowait(event)
+
+    def emit(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue, match in subscribers:
+            if all(event.fields.get(k) == v for k, v in match.items()):
+                loop.call_soon_threadsafe(self._put, queue, event)
+
+    @staticmethod
+    def sse(event: Event) -> str:
+        """Format an event as a server-sent event."""
+        return (
+            f"event: {event.name}\ndata: {json.dumps(event.to_dict(), default=str)}\n\n"
+        )
+
+
+class EventBus:
+    """Dispatch events to the sinks that accept their level."""
+
+    def __init__(self):
+        self.sinks: List[Sink] = []
+        self.level = DISABLED
+
+    def _update_level(self):
+        self.level = min((sink.level for sink in self.sinks), default=DISABLED)
+
+    def add_sink(self, sink: Sink) -> Sink:
+        self.sinks = self.sinks + [sink]
+        self._update_level()
+        return sink
+
+    def remove_sink(self, sink: Sink) -> None:
+        self.sinks = [s for s in self.sinks if s is not sink]
+        self._update_level()
+        sink.close()
+
+    def set_level(self, level, sink_type=ConsoleSink) -> None:
+        """Change the level of the sinks of a type, by default the console."""
+        for sink in self.sinks:
+            if isinstance(sink, sink_type):
+                sink.level = parse_level(level)
+        self._update_level()
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def emit(self, level: int, name: str, message, *args, icon=None, **fields):
+        """Emit an event.
+
+        Args:
+            level: DEBUG, INFO, WARNING or ERROR
+            name: dotted event name, e.g. "workflow.routing"
+            message: a %-style template formatted with `args`, or a callable
+                returning the message
+            icon: prefix of the console line, which then also shows the time
+            fields: structured fields of the event
+        """
+        if level < self.level:
+            return
+        bound = _fields.get()
+        event = Event(level, name, message, args, {**bound, **fields}, icon)
+        for sink in self.sinks:
+            if level >= sink.level:
+                try:
+                    sink.emit(event)
+                except Exception as e:
+                    print(f"[events] sink {type(sink).__name__} failed: {e}")
+
+    def debug(self, name, message, *args, **fields):
+        self.emit(DEBUG, name, message, *args, **fields)
+
+    def info(self, name, message, *args, **fields):
+        self.emit(INFO, name, message, *args, **fields)
+
+    def warning(self, name, message, *args, **fields):
+        self.emit(WARNING, name, message, *args, **fields)
+
+    def error(self, name, message, *args, **fields):
+        self.emit(ERROR, name, message, *args, **fields)
+
+
+@contextmanager
+def bind(**fields):
+    """Add fields to the events emitted inside the block (and its tasks)."""
+    token = _fields.set({**_fields.get(), **fields})
+    try:
+        yield
+    finally:
+        _fields.reset(token)
+
+
+def bound_fields() -> Dict[str, Any]:
+    """The fields bound with `bind()` in the current context."""
+    return dict(_fields.get())
+
+
+BUS = EventBus()
+CONSOLE = BUS.add_sink(ConsoleSink(os.getenv("MAESTRO_LOG_LEVEL", "info")))
+
+debug = BUS.debug
+info = BUS.info
+warning = BUS.warning
+error = BUS.error
+emit = BUS.emit
+
+
+def configure_events(verbose: bool = False) -> None:
+    """Set the console level and add the sinks configured by the environment.
+
+    Args:
+        verbose: show debug events on the console, as `--verbose` does
+    """
+    if verbose:
+        BUS.set_level(DEBUG)
+    level = os.getenv("MAESTRO_EVENTS_LEVEL", "info")
+    path = os.getenv("MAESTRO_EVENTS_FILE")
+    if path and not any(isinstance(s, JSONLSink) for s in BUS.sinks):
+        BUS.add_sink(JSONLSink(path, level))
+    otel = os.getenv("MAESTRO_EVENTS_OTEL", "false").lower() == "true"
+    if otel and not any(isinstance(s, OTelSink) for s in BUS.sinks):
+        try:
+            import opentelemetry  # noqa: F401
+        except ImportError:
+            return
+        BUS.add_sink(OTelSink(level))
@@ -6,6 +6,8 @@ import json
 from datetime import datetime, UTC
 from pathlib import Path
 
+from maestro.blobs import loggable
+
 home_path = Path.home()
 if os.access(home_path, os.W_OK):
     DEFAULT_LOG_DIR = home_path / ".maestro" / "logs"
@@ -38,23 +40,28 @@ class FileLogger:
         end_time=None,
         duration_ms=None,
         token_usage=None,
+        workflow_name=None,
+        error=None,
     ):
         log_path = self.log_dir / f"maestro_run_{workflow_id}.jsonl"
         data = {
             "log_type": "agent_response",
             "timestamp": datetime.now(UTC).isoformat(),
             "workflow_id": workflow_id,
+            "workflow_name": workflow_name,
             "step_index": step_index,
             "agent_name": agent_name,
             "model": model,
-            "input": str(input_text),
-            "response": str(response_text),
+            "input": loggable(input_text),
+            "response": loggable(response_text),
             "tool_used": str(tool_used) if tool_used else None,
             "start_time": start_time.isoformat() if start_time else None,
             "end_time": end_time.isoformat() if end_time else None,
             "duration_ms": duration_ms,
             "token_usage": token_usage,
         }
+        if error is not None:
+            data["error"] = error
         self._write_json_line(log_path, data)
 
     def log_workflow_run(
@@ -76,8 +83,8 @@ class FileLogger:
             "workflow_id": workflow_id,
             "workflow_name": workflow_name,
             "status": status,
-            "prompt": str(prompt),
-            "output": str(output),
+            "prompt": loggable(prompt),
+            "output": loggable(output),
             "models_used": models_used,
             "start_time": start_time.isoformat() if start_time else None,
             "end_time": end_time.isoformat() if end_time else None,
@@ -123,3 +130,10 @@ class EvaluationLogger:
         if "timestamp" not in enriched:
             enriched["timestamp"] = datetime.now(UTC).isoformat()
         self._write_json_line(self._log_path_for_today(), enriched)
+
+    def extend(self, runs: list) -> None:
+        """Append several evaluation runs, opening the log file once."""
+        now = datetime.now(UTC).isoformat()
+        lines = [json.dumps({"timestamp": now, **run}) + "\n" for run in runs]
+        with open(self._log_path_for_today(), "a", encoding="utf-8") as f:
+            f.writelines(lines)
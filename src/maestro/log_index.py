@@ -0,0 +1,388 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Incremental index and analytics of maestro run logs.
+
+Run logs (`maestro_run_<id>.jsonl`) and evaluation logs
+(`maestro_evals_<date>.jsonl`) are append-only, so the index keeps, per log
+file, the offset up to which it has been read. An update reads only the lines
+appended since then, up to the last complete line, and files whose size,
+modification time and inode did not change are skipped after a `stat`. Files
+that were replaced, or changed without growing, are indexed again. The index
+lives in a SQLite file next to the logs and holds one small row per agent run,
+workflow run and evaluation score, without the prompts and responses.
+
+Reports are computed from the index with pandas: latency percentiles, token
+usage, cost (from the model prices of `maestro.usage`) and error rates of
+agent runs per agent, model and/or workflow, the same of workflow runs per
+workflow and the evaluation scores per agent and metric.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from maestro import usage
+from maestro.file_logger import DEFAULT_LOG_DIR
+
+INDEX_FILE = "maestro_logs.db"
+GROUPS = ("agent", "model", "workflow")
+QUANTILES = (0.5, 0.95, 0.99)
+TOKEN_KEYS = usage.TOKEN_KEYS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY, offset INTEGER, size INTEGER, mtime REAL,
+    inode INTEGER, records INTEGER
+);
+CREATE TABLE IF NOT EXISTS calls (
+    file TEXT, workflow_id TEXT, workflow TEXT, agent TEXT, model TEXT,
+    timestamp TEXT, duration_ms REAL, prompt_tokens INTEGER,
+    response_tokens INTEGER, total_tokens INTEGER, error INTEGER
+);
+CREATE TABLE IF NOT EXISTS runs (
+    file TEXT, workflow_id TEXT, workflow TEXT, status TEXT, timestamp TEXT,
+    duration_ms REAL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    file TEXT, agent TEXT, timestamp TEXT, metric TEXT, value REAL
+);
+CREATE INDEX IF NOT EXISTS calls_file ON calls (file);
+CREATE INDEX IF NOT EXISTS runs_file ON runs (file);
+CREATE INDEX IF NOT EXISTS scores_file ON scores (file);
+"""
+_TABLES = ("calls", "runs", "scores")
+_DURATION = re.compile(r"^(\d+)([mhd])$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+
+def parse_since(value: Optional[str]) -> Optional[str]:
+    """The ISO timestamp of `--since`: an ISO date or time, or e.g. 30m, 24h, 7d ago."""
+    if not value:
+        return None
+    match = _DURATION.match(value.strip())
+    if match:
+        delta = timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+        return (datetime.now(UTC) - delta).isoformat()
+    try:
+        since = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid since: {value}")
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # Log timestamps are UTC and compared as text
+    return since.astimezone(UTC).isoformat()
+
+
+def _timestamp(value: Any) -> Optional[str]:
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, UTC).isoformat()
+    return value
+
+
+def _tokens(token_usage: Any) -> List[int]:
+    if not isinstance(token_usage, dict):
+        return [0, 0, 0]
+    return [int(token_usage.get(key) or 0) for key in TOKEN_KEYS]
+
+
+def _is_error(record: dict) -> bool:
+    if record.get("error"):
+        return True
+    # Agents that catch their failures answer with the error instead
+    response = record.get("response")
+    return isinstance(response, str) and response.startswith("Error during agent")
+
+
+class LogIndex:
+    """The index of the log files of a directory, in a SQLite sidecar file."""
+
+    def __init__(self, log_dir=None, path=None):
+        self.log_dir = Path(log_dir) if log_dir else DEFAULT_LOG_DIR
+        self.path = Path(path) if path else self.log_dir / INDEX_FILE
+        self._conn = sqlite3.connect(self.path)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "LogIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def update(self) -> Dict[str, int]:
+        """Index the lines appended to the log files since the last update.
+
+        Files that were replaced are indexed again; the rows of files that
+        were removed are dropped.
+
+        Returns:
+            The number of log files, files read and records indexed
+        """
+        known = {
+            name: (offset, size, mtime, inode)
+            for name, offset, size, mtime, inode in self._conn.execute(
+                "SELECT name, offset, size, mtime, inode FROM files"
+            )
+        }
+        stats = {"files": 0, "read": 0, "records": 0}
+        seen = set()
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                stats["files"] += 1
+                seen.add(entry.name)
+                stat = entry.stat()
+                offset, size, mtime, inode = known.get(entry.name, (0, 0, None, None))
+                if (stat.st_size, stat.st_mtime, stat.st_ino) == (size, mtime, inode):
+                    continue
+                with self._conn:
+                    if inode is not None and self._replaced(
+                        entry.name, stat, offset, size, inode
+                    ):
+                        self._forget(entry.name)
+                        offset = 0
+                    records = self._read(entry.name, offset, stat)
+                stats["read"] += 1
+                stats["records"] += records
+        with self._conn:
+            for name in known.keys() - seen:
+                self._forget(name)
+        return stats
+
+    def _replaced(
+        self, name: str, stat: os.stat_result, offset: int, size: int, inode: int
+    ) -> bool:
+        """Whether a changed file was replaced or rewritten, not appended to."""
+        # Appending grows a file
+        if stat.st_ino != inode or stat.st_size <= size or stat.st_size < offset:
+            return True
+        if offset == 0:
+            return False
+        # The lines read before must still end where they did
+        with open(self.log_dir / name, "rb") as f:
+            f.seek(offset - 1)
+            return f.read(1) != b"\n"
+
+    def _forget(self, name: str) -> None:
+        for table in _TABLES:
+            self._conn.execute(f"DELETE FROM {table} WHERE file = ?", (name,))
+        self._conn.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    def _read(self, name: str, offset: int, stat: os.stat_result) -> int:
+        """Index the complete lines of a file after offset, in one transaction."""
+        rows = {table: [] for table in _TABLES}
+        with open(self.log_dir / name, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Being written; read on the next update
+                    break
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    self._rows(name, record, rows)
+        for table, table_rows in rows.items():
+            if table_rows:
+                marks = ", ".join("?" * len(table_rows[0]))
+                self._conn.executemany(
+                    f"INSERT INTO {table} VALUES ({marks})", table_rows
+                )
+        records = sum(len(table_rows) for table_rows in rows.values())
+        self._conn.execute(
+            "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (name) DO UPDATE "
+            "SET offset = excluded.offset, size = excluded.size, "
+            "mtime = excluded.mtime, inode = excluded.inode, "
+            "records = records + excluded.records",
+            (name, offset, stat.st_size, stat.st_mtime, stat.st_ino, records),
+        )
+        return records
+
+    @staticmethod
+    def _rows(name: str, record: dict, rows: Dict[str, list]) -> None:
+        log_type = record.get("log_type")
+        if log_type == "agent_response":
+            rows["calls"].append(
+                (
+                    name,
+                    record.get("workflow_id"),
+                    record.get("workflow_name"),
+                    record.get("agent_name"),
+                    record.get("model"),
+                    record.get("timestamp"),
+                    record.get("duration_ms"),
+                    *_tokens(record.get("token_usage")),
+                    int(_is_error(record)),
+                )
+            )
+        elif log_type == "workflow_summary":
+            rows["runs"].append(
+                (
+                    name,
+                    record.get("workflow_id"),
+                    record.get("workflow_name"),
+                    record.get("status"),
+                    record.get("timestamp"),
+                    record.get("duration_ms"),
+                )
+            )
+        elif isinstance(record.get("watsonx_scores"), dict):
+            timestamp = _timestamp(record.get("timestamp"))
+            for metric, value in record["watsonx_scores"].items():
+                if isinstance(value, (int, float)):
+                    rows["scores"].append(
+                        (
+                            name,
+                            record.get("agent_name"),
+                            timestamp,
+                            metric.removesuffix("_score"),
+                            value,
+                        )
+                    )
+
+    def _frame(self, query: str, since: Optional[str]) -> pd.DataFrame:
+        params = ()
+        if since:
+            query += " WHERE timestamp >= ?"
+            params = (since,)
+        return pd.read_sql_query(query, self._conn, params=params)
+
+    def calls(self, since: Optional[str] = None) -> pd.DataFrame:
+        """Agent runs, with the workflow of runs logged without one."""
+        return self._frame(
+            "SELECT * FROM (SELECT COALESCE(c.agent, '') AS agent, "
+            "COALESCE(c.model, '') AS model, "
+            "COALESCE(c.workflow, r.workflow, '') AS workflow, c.timestamp, "
+            "c.duration_ms, c.prompt_tokens, c.response_tokens, c.total_tokens, "
+            "c.error FROM calls c LEFT JOIN (SELECT workflow_id, MAX(workflow) "
+            "AS workflow FROM runs GROUP BY workflow_id) r USING (workflow_id))",
+            since,
+        )
+
+    def runs(self, since: Optional[str] = None) -> pd.DataFrame:
+        return self._frame(
+            "SELECT COALESCE(workflow, '') AS workflow, status, timestamp, "
+            "duration_ms FROM runs",
+            since,
+        )
+
+    def scores(self, since: Optional[str] = None) -> pd.DataFrame:
+        return self._frame(
+            "SELECT COALESCE(agent, '') AS agent, metric, timestamp, value FROM scores",
+            since,
+        )
+
+    def report(
+        self, by: Sequence[str] = ("agent",), since: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Summaries of the agent runs grouped by `by`, the workflow runs and the scores.
+
+        Args:
+            by: columns of GROUPS to group agent runs by
+            since: only logs from this time on, as accepted by parse_since()
+        """
+        for group in by:
+            if group not in GROUPS:
+                raise ValueError(f"Invalid group: {group}")
+        since = parse_since(since)
+        return {
+            "calls": summarize_calls(self.calls(since), by),
+            "runs": summarize_runs(self.runs(since)),
+            "evaluations": summarize_scores(self.scores(since)),
+        }
+
+
+def _latency(grouped, column: str) -> pd.DataFrame:
+    latency = grouped[column].quantile(list(QUANTILES)).unstack()
+    latency.columns = [f"p{round(q * 100)}_ms" for q in latency.columns]
+    return latency
+
+
+def _costs(calls: pd.DataFrame) -> pd.Series:
+    prices = {model: usage.price(model) or (0.0, 0.0) for model in calls.model.unique()}
+    prompt_price = calls.model.map({m: p[0] for m, p in prices.items()})
+    response_price = calls.model.map({m: p[1] for m, p in prices.items()})
+    return (
+        calls.prompt_tokens * prompt_price + calls.response_tokens * response_price
+    ) / 1_000_000
+
+
+def summarize_calls(
+    calls: pd.DataFrame, by: Sequence[str] = ("agent",)
+) -> pd.DataFrame:
+    """Latency percentiles, tokens, cost and error rate of agent runs per group."""
+    by = list(by)
+    if calls.empty:
+        return pd.DataFrame(columns=by + ["calls", "errors", "error_rate"])
+    grouped = calls.assign(cost=_costs(calls)).groupby(by)
+    summary = grouped.agg(
+        calls=("error", "size"),
+        errors=("error", "sum"),
+        mean_ms=("duration_ms", "mean"),
+        **{key: (key, "sum") for key in TOKEN_KEYS},
+        cost=("cost", "sum"),
+    )
+    summary.insert(2, "error_rate", summary.errors / summary.calls)
+    summary = summary.join(_latency(grouped, "duration_ms"))
+    return summary.reset_index().sort_values("calls", ascending=False, kind="stable")
+
+
+def summarize_runs(runs: pd.DataFrame) -> pd.DataFrame:
+    """Latency percentiles and error rate of workflow runs per workflow."""
+    if runs.empty:
+        return pd.DataFrame(columns=["workflow", "runs", "errors", "error_rate"])
+    grouped = runs.assign(error=runs.status != "success").groupby("workflow")
+    summary = grouped.agg(
+        runs=("error", "size"),
+        errors=("error", "sum"),
+        mean_ms=("duration_ms", "mean"),
+    )
+    summary.insert(2, "error_rate", summary.errors / summary.runs)
+    summary = summary.join(_latency(grouped, "duration_ms"))
+    return summary.reset_index().sort_values("runs", ascending=False, kind="stable")
+
+
+def summarize_scores(scores: pd.DataFrame) -> pd.DataFrame:
+    """Evaluation scores per agent and metric."""
+    if scores.empty:
+        return pd.DataFrame(columns=["agent", "metric", "count", "mean"])
+    return (
+        scores.groupby(["agent", "metric"])["value"]
+        .agg(["count", "mean", "min", "max"])
+        .reset_index()
+    )
+
+
+def to_records(frames: Dict[str, pd.DataFrame]) -> Dict[str, List[Dict[str, Any]]]:
+    """The report as JSON-ready lists of rows."""
+    return {
+        name: json.loads(frame.to_json(orient="records"))
+        for name, frame in frames.items()
+    }
+
+
+def format_report(frames: Dict[str, pd.DataFrame]) -> Iterable[str]:
+    """The non-empty tables of a report as text."""
+    titles = {
+        "calls": "Agent runs",
+        "runs": "Workflow runs",
+        "evaluations": "Evaluation scores",
+    }
+    for name, frame in frames.items():
+        if frame.empty:
+            continue
+        yield f"{titles[name]}:\n{frame.to_string(index=False, float_format=lambda v: f'{v:.6g}')}"
@@ -1,21 +1,75 @@
 import time
 from datetime import datetime, UTC
+from maestro import events, usage
 from maestro.file_logger import FileLogger
+from maestro.metrics import AGENT_LATENCY, ERRORS, TOKENS, record_token_usage
+from maestro.tracing import span
 
 logger = FileLogger()
 
 
+def _workflow_name(agent) -> str:
+    workflow = getattr(agent, "_workflow_instance", None)
+    if workflow is None or not isinstance(workflow.workflow, dict):
+        return ""
+    return workflow.workflow.get("metadata", {}).get("name", "")
+
+
 def log_agent_run(workflow_id, agent_name, agent_model):
     def decorator(run_func):
+        # Bind metric children once per wrapped agent, not per call
+        workflow_name = _workflow_name(getattr(run_func, "__self__", None))
+        agent_latency = AGENT_LATENCY.labels(workflow_name, agent_name)
+        agent_errors = ERRORS.labels(workflow_name, "", agent_name)
+        prompt_tokens = TOKENS.labels(workflow_name, agent_name, "prompt")
+        response_tokens = TOKENS.labels(workflow_name, agent_name, "response")
+        workflow = getattr(
+            getattr(run_func, "__self__", None), "_workflow_instance", None
+        )
+        blob_store = getattr(workflow, "blob_store", None)
+        span_attributes = {
+            "maestro.workflow": workflow_name,
+            "maestro.agent": agent_name,
+            "maestro.model": agent_model,
+        }
+
         async def wrapper(*args, **kwargs):
             step_index = kwargs.pop("step_index", None)
             if step_index is None:
                 raise ValueError("Missing step_index for logging.")
 
+            # A run that used up its budget makes no further model calls
+            usage.check_budget()
+            # Agents shared by runs log to the run calling them
+            run_id = events.bound_fields().get("workflow_id") or workflow_id
             perf_start = time.perf_counter()
             start_time = datetime.now(UTC)
 
-            result = await run_func(*args, **kwargs)
+            try:
+                with (
+                    span("maestro.agent.run", span_attributes),
+                    usage.call() as reported,
+                ):
+                    result = await run_func(*args, **kwargs)
+            except Exception as e:
+                agent_errors.inc()
+                # Failed runs are logged too, for the error rates of `maestro logs`
+                end_time = datetime.now(UTC)
+                logger.log_agent_response(
+                    workflow_id=run_id,
+                    step_index=step_index,
+                    agent_name=agent_name,
+                    model=agent_model,
+                    input_text="",
+                    response_text="",
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration_ms=int((time.perf_counter() - perf_start) * 1000),
+                    token_usage=dict(reported) or None,
+                    workflow_name=workflow_name,
+                    error=str(e),
+                )
+                raise
 
             end_time = datetime.now(UTC)
             perf_end = time.perf_counter()
@@ -24,22 +78,34 @@ def log_agent_run(workflow_id, agent_name, agent_model):
             input_text = ""
             if len(args) > 0:
                 input_text = args[0]
-            token_usage = None
-            if hasattr(run_func.__self__, "get_token_usage"):
+            # The usage reported by this run, not the counters of the agent
+            # instance, which concurrent runs of the agent overwrite
+            token_usage = dict(reported) if reported else None
+            if token_usage is None and hasattr(run_func.__self__, "get_token_usage"):
                 token_usage = run_func.__self__.get_token_usage()
 
+            agent_latency.observe(execution_time)
+            record_token_usage(prompt_tokens, response_tokens, token_usage)
+            usage.record(agent_name, agent_model, token_usage)
+
+            response_text = result
+            if blob_store is not None:
+                # Log large texts as references to the blobs of the step outputs
+                input_text = blob_store.spill(input_text)
+                response_text = blob_store.spill(result)
             logger.log_agent_response(
-                workflow_id=workflow_id,
+                workflow_id=run_id,
                 step_index=step_index,
                 agent_name=agent_name,
                 model=agent_model,
                 input_text=input_text,
-                response_text=result,
+                response_text=response_text,
                 tool_used=None,
                 start_time=start_time,
                 end_time=end_time,
                 duration_ms=int(execution_time * 1000),
                 token_usage=token_usage,
+                workflow_name=workflow_name,
             )
             if hasattr(run_func.__self__, "_workflow_instance"):
                 run_func.__self__._workflow_instance._track_agent_execution_time(
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Connections kept per event loop.
+
+HTTP and MCP connections belong to the event loop that opened them and cannot
+be used from another one. A `LoopPool` keeps the shared clients of each loop
+and forgets them when the loop is garbage collected. Pools with a `close`
+function also release their clients when `close_loop_pools()` is awaited on
+the loop, as `maestro run` does before exiting and the servers do when they
+shut down.
+"""
+
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+_pools: List["LoopPool"] = []
+
+
+class LoopPool:
+    """Shared clients of each event loop, by key."""
+
+    def __init__(self, close: Optional[Callable[[Any], Awaitable[None]]] = None):
+        """
+        Args:
+            close: closes a client of the pool, called by `close()`
+        """
+        self._close = close
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        _pools.append(self)
+
+    def clients(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Dict:
+        """The clients of a loop, by default the running one."""
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._loops.setdefault(loop, {})
+
+    async def close(self) -> None:
+        """Remove the clients of the running loop and close them."""
+        with self._lock:
+            clients = self._loops.pop(asyncio.get_running_loop(), {})
+        if self._close is None:
+            return
+        for client in clients.values():
+            try:
+                await self._close(client)
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        """Forget the clients of all loops without closing them."""
+        with self._lock:
+            self._loops.clear()
+
+
+async def close_loop_pools() -> None:
+    """Close the clients of all pools on the running loop."""
+    for pool in list(_pools):
+        await pool.close()
+
+
+async def closing_loop_pools(awaitable: Awaitable) -> Any:
+    """Await a run and then close the clients it opened, e.g. in asyncio.run()."""
+    try:
+        return await awaitable
+    finally:
+        await close_loop_pools()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """FastAPI lifespan closing the clients of the server's loop on shutdown."""
+    yield
+    await close_loop_pools()
@@ -3,7 +3,74 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright © 2025 IBM
 
+import hashlib
+import json
 import re
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+from maestro.metrics import CACHE_REQUESTS
+
+MERMAID_CACHE_SIZE = 128
+
+_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_hits = CACHE_REQUESTS.labels("mermaid", "hit")
+_cache_misses = CACHE_REQUESTS.labels("mermaid", "miss")
+
+
+def _agent_ref(value):
+    # Steps of a workflow that has run hold Agent instances instead of names
+    return getattr(value, "agent_name", None) or str(value)
+
+
+def definition_hash(workflow) -> str:
+    """Return a stable hash of a workflow definition."""
+    try:
+        canonical = json.dumps(
+            workflow, sort_keys=True, default=_agent_ref, separators=(",", ":")
+        )
+    except TypeError:
+        # e.g. mixed-type keys that cannot be sorted
+        canonical = repr(workflow)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def render_mermaid(
+    workflow, kind="sequenceDiagram", orientation="TD"
+) -> Tuple[str, str]:
+    """Render a workflow as Mermaid markdown, memoized per definition.
+
+    Returns:
+        (markdown, etag): the diagram and a strong HTTP ETag identifying it.
+    """
+    key = (definition_hash(workflow), kind, orientation)
+    etag = f'"{key[0][:32]}-{kind}-{orientation}"'
+    with _cache_lock:
+        markdown = _cache.get(key)
+        if markdown is not None:
+            _cache.move_to_end(key)
+    if markdown is not None:
+        _cache_hits.inc()
+        return markdown, etag
+
+    _cache_misses.inc()
+    markdown = Mermaid(workflow, kind, orientation).to_markdown()
+    with _cache_lock:
+        _cache[key] = markdown
+        while len(_cache) > MERMAID_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return markdown, etag
+
+
+def clear_mermaid_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _is_context_only(step) -> bool:
+    return any(k in step for k in ("context", "outputs"))
 
 
 class Mermaid:
@@ -14,6 +81,19 @@ class Mermaid:
         self.kind = kind
         self.orientation = orientation
 
+        steps = workflow.get("spec", {}).get("template", {}).get("steps") or []
+        # step name -> agent of the first step with that name
+        self._step_agents = {}
+        for step in steps:
+            self._step_agents.setdefault(step["name"], step.get("agent"))
+        # index of the next step that is not context-only, for each step
+        self._next_real = [None] * len(steps)
+        following = None
+        for i in range(len(steps) - 1, -1, -1):
+            self._next_real[i] = following
+            if not _is_context_only(steps[i]):
+                following = i
+
     def to_markdown(self) -> str:
         if self.kind == "sequenceDiagram":
             return self.__to_sequenceDiagram()
@@ -38,11 +118,8 @@ class Mermaid:
         return sanitized
 
     def __agent_for_step(self, step_name):
-        for step in self.workflow["spec"]["template"]["steps"]:
-            if step["name"] == step_name:
-                agent = step.get("agent")
-                return self.__fix_agent_name(agent) if agent else None
-        return None
+        agent = self._step_agents.get(step_name)
+        return self.__fix_agent_name(agent) if agent else None
 
     # returns a markdown of the workflow as a mermaid sequence diagram
     #
@@ -68,7 +145,7 @@ class Mermaid:
             a = step.get("agent")
             if not a:
                 continue
-            if any(k in step for k in ("context", "outputs")):
+            if _is_context_only(step):
                 continue
             if a not in seen:
                 seen.append(a)
@@ -88,7 +165,7 @@ class Mermaid:
         agentL = None
         for i, step in enumerate(steps):
             # skip scoring/context-only steps
-            if any(k in step for k in ("context", "outputs")):
+            if _is_context_only(step):
                 continue
             # update agentL only when this step names a real agent
             if step.get("agent"):
@@ -96,12 +173,9 @@ class Mermaid:
 
             # find next real agent for the arrow
             agentR = None
-            for nxt in steps[i + 1 :]:
-                if any(k in nxt for k in ("context", "outputs")):
-                    continue
-                if nxt.get("agent"):
-                    agentR = self.__fix_agent_name(nxt["agent"])
-                break
+            nxt = self._next_real[i]
+            if nxt is not None and steps[nxt].get("agent"):
+                agentR = self.__fix_agent_name(steps[nxt]["agent"])
 
             if agentR:
                 sb += f"{agentL}->>{agentR}: {step['name']}\n"
@@ -207,18 +281,16 @@ class Mermaid:
         while i < len(steps):
             step = steps[i]
             # skip scoring/context-only steps
-            if any(k in step for k in ("context", "outputs")):
+            if _is_context_only(step):
                 i += 1
                 continue
 
             aL = self.__fix_agent_name(step.get("agent"))
             # find next real step
             aR = None
-            for nxt in steps[i + 1 :]:
-                if any(k in nxt for k in ("context", "outputs")):
-                    continue
-                aR = self.__fix_agent_name(nxt.get("agent"))
-                break
+            nxt = self._next_real[i]
+            if nxt is not None:
+                aR = self.__fix_agent_name(steps[nxt].get("agent"))
 
             if aR:
                 sb += f"{aL}-- {step['name']} -->{aR}\n"
@@ -0,0 +1,383 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Process-wide metrics in the Prometheus text exposition format.
+
+Metrics are aggregated in memory and exposed by the `/metrics` endpoint of the
+FastAPI servers. Label values are bound once with `labels(...)`, which returns a
+cached child keyed by the label tuple, so hot paths can hold on to the child and
+avoid allocating label dicts per request.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self.value += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0.0
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def reset(self) -> None:
+        self.set(0.0)
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.bucket_counts = [0] * len(self.bucket_counts)
+            self.count = 0
+            self.sum = 0.0
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Return the child for the given label values, creating it once."""
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {values}"
+            )
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._new_child()
+                self._children[values] = child
+        return child
+
+    def clear(self) -> None:
+        """Reset all values; children already bound by callers stay valid."""
+        for child in list(self._children.values()):
+            child.reset()
+
+    def _snapshot(self) -> List[Tuple[Tuple[str, ...], object]]:
+        return [
+            (tuple(str(v) for v in values), child)
+            for values, child in list(self._children.items())
+        ]
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._snapshot()
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, e.g. in-flight requests."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    """Cumulative histogram of observed values (seconds by convention)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        bucket_names = self.labelnames + ("le",)
+        for values, child in self._snapshot():
+            cumulative = 0
+            for bound, count in zip(
+                self.buckets + (float("inf"),), child.bucket_counts
+            ):
+                cumulative += count
+                labels = _format_labels(bucket_names, values + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_count{labels} {child.count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by the `/metrics` endpoint."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def clear(self) -> None:
+        """Reset all recorded values, keeping the registered metrics."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def generate_latest(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def generate_latest(registry: MetricsRegistry = REGISTRY) -> str:
+    """Render all metrics in the Prometheus text format."""
+    return registry.generate_latest()
+
+
+WORKFLOW_LATENCY = REGISTRY.register(
+    Histogram(
+        "maestro_workflow_duration_seconds",
+        "End-to-end workflow run latency.",
+        ("workflow",),
+    )
+)
+STEP_LATENCY = REGISTRY.register(
+    Histogram(
+        "maestro_step_duration_seconds",
+        "Workflow step latency.",
+        ("workflow", "step"),
+    )
+)
+AGENT_LATENCY = REGISTRY.register(
+    Histogram(
+        "maestro_agent_duration_seconds",
+        "Agent run latency.",
+        ("workflow", "agent"),
+    )
+)
+MCP_TOOL_LATENCY = REGISTRY.register(
+    Histogram(
+        "maestro_mcp_tool_call_duration_seconds",
+        "MCP tool call latency.",
+        ("agent", "tool"),
+    )
+)
+TOKENS = REGISTRY.register(
+    Counter(
+        "maestro_tokens_total",
+        "Tokens used by agent runs.",
+        ("workflow", "agent", "type"),
+    )
+)
+ERRORS = REGISTRY.register(
+    Counter(
+        "maestro_errors_total",
+        "Errors raised by workflows, steps and agents.",
+        ("workflow", "step", "agent"),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "maestro_cache_requests_total",
+        "Cache lookups by cache and result (hit or miss).",
+        ("cache", "result"),
+    )
+)
+INFLIGHT_REQUESTS = REGISTRY.register(
+    Gauge(
+        "maestro_inflight_requests",
+        "Requests currently being served.",
+        ("server", "endpoint"),
+    )
+)
+RATE_LIMIT_AVAILABLE = REGISTRY.register(
+    Gauge(
+        "maestro_rate_limit_available",
+        "Remaining requests and tokens per minute budget by provider and model.",
+        ("base_url", "model", "budget"),
+    )
+)
+RATE_LIMIT_WAIT = REGISTRY.register(
+    Histogram(
+        "maestro_rate_limit_wait_seconds",
+        "Time calls waited for the rate limit of their provider and model.",
+        ("base_url", "model"),
+    )
+)
+HEDGE_REQUESTS = REGISTRY.register(
+    Counter(
+        "maestro_hedge_requests_total",
+        "Model requests under a hedging or fallback policy, by agent and result.",
+        ("agent", "result"),
+    )
+)
+HEDGE_EXTRA_TOKENS = REGISTRY.register(
+    Counter(
+        "maestro_hedge_extra_tokens_total",
+        "Estimated prompt tokens of hedged requests that were cancelled.",
+        ("agent",),
+    )
+)
+EVALUATIONS = REGISTRY.register(
+    Counter(
+        "maestro_evaluations_total",
+        "Auto-evaluation of agent responses by agent and result.",
+        ("agent", "result"),
+    )
+)
+
+
+def record_token_usage(tokens_child_prompt, tokens_child_response, token_usage):
+    """Add a token usage dict (prompt_tokens/response_tokens) to two bound counters."""
+    if not isinstance(token_usage, dict):
+        return
+    prompt_tokens = token_usage.get("prompt_tokens") or 0
+    response_tokens = token_usage.get("response_tokens") or 0
+    if prompt_tokens > 0:
+        tokens_child_prompt.inc(prompt_tokens)
+    if response_tokens > 0:
+        tokens_child_response.inc(response_tokens)
@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Token budgets of prompts assembled from several workflow sources.
+
+A step with `from:` sources gets the outputs of earlier steps joined into its
+prompt. When the joined prompt does not fit the context window of the step's
+model, each source is trimmed to a share of the budget before the model is
+called, instead of failing at the provider after the upstream steps were paid
+for. Sources smaller than their share are kept whole and leave the rest to
+the larger ones.
+
+The budget is the step's `budget.max_tokens` or, by default, the context window
+of the agent's model (from `model_parameters.context_window` or the known
+models below) less its response `max_tokens` and instructions. Policies say
+how a source is shortened:
+
+    head       keep the beginning (default)
+    tail       keep the end
+    middle     keep the beginning and the end
+    summarize  replace the source with its summary by the `summarizer` agent
+    keep       never shorten the source
+
+Tokens are counted with tiktoken's cl100k_base encoding when it is available,
+and estimated at 4 characters per token otherwise.
+"""
+
+import functools
+import math
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from maestro.blobs import BlobRef
+
+POLICIES = ("head", "tail", "middle", "summarize", "keep")
+DEFAULT_POLICY = "head"
+TRIM_MARKER = "[...]"
+CHARS_PER_TOKEN = 4
+
+# Context windows of common models, matched by the longest name prefix
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "o1": 200000,
+    "o3": 200000,
+    "o4-mini": 200000,
+    "llama3.1": 131072,
+    "llama3.2": 131072,
+    "llama3.3": 131072,
+    "llama3": 8192,
+    "granite3": 131072,
+    "granite-3": 131072,
+    "qwen2.5": 32768,
+    "qwen3": 40960,
+    "mistral": 32768,
+    "gemma3": 131072,
+}
+_PREFIXES = sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True)
+
+
+def context_window(model: Optional[str]) -> Optional[int]:
+    """The context window of a known model, e.g. "openai/gpt-4o" or "llama3.1:8b"."""
+    if not model:
+        return None
+    name = model.lower().rsplit("/", 1)[-1]
+    for prefix in _PREFIXES:
+        if name.startswith(prefix):
+            return MODEL_CONTEXT_WINDOWS[prefix]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    # Loading an encoding may need a download; remember failures too
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def trim(text: str, tokens: int, policy: str = DEFAULT_POLICY) -> str:
+    """Shorten a text to about `tokens` tokens, marking where text was cut."""
+    if tokens <= 0:
+        return ""
+    encoding = _encoding()
+    if encoding is None:
+        units, size = text, tokens * CHARS_PER_TOKEN
+    else:
+        units, size = encoding.encode(text, disallowed_special=()), tokens
+    if len(units) <= size:
+        return text
+
+    def decode(part):
+        return part if encoding is None else encoding.decode(part)
+
+    if policy == "tail":
+        return f"{TRIM_MARKER}\n{decode(units[-size:])}"
+    if policy == "middle":
+        half = size // 2
+        return f"{decode(units[:half])}\n{TRIM_MARKER}\n{decode(units[len(units) - (size - half) :])}"
+    return f"{decode(units[:size])}\n{TRIM_MARKER}"
+
+
+def allocate(sizes: List[int], budget: int, fixed: List[bool]) -> List[int]:
+    """Share a token budget among sources; fixed sources are kept whole.
+
+    The rest is shared evenly, with sources smaller than their share leaving
+    what they do not need to the larger ones.
+    """
+    allocation = list(sizes)
+    remaining = budget - sum(size for size, keep in zip(sizes, fixed) if keep)
+    flexible = sorted(
+        (i for i, keep in enumerate(fixed) if not keep), key=lambda i: sizes[i]
+    )
+    for n, i in enumerate(flexible):
+        share = max(0, remaining) // (len(flexible) - n)
+        allocation[i] = min(sizes[i], share)
+        remaining -= allocation[i]
+    return allocation
+
+
+def _size(value) -> int:
+    """UTF-8 bytes of a value, an upper bound of its tokens."""
+    # Blob references know their size without being read
+    if isinstance(value, BlobRef):
+        return value.size
+    return len(str(value).encode("utf-8"))
+
+
+def _join(values: List[Any]):
+    if len(values) == 1 and values[0]:
+        return values[0]
+    return "\n\n".join([str(value) for value in values if value])
+
+
+async def assemble(
+    sources: List[Tuple[str, Any]],
+    budget: Optional[int],
+    policy: str = DEFAULT_POLICY,
+    source_policies: Optional[Dict[str, str]] = None,
+    summarize: Optional[Callable[[str, int], Awaitable[str]]] = None,
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Join the values of `from:` sources into a prompt within a token budget.
+
+    Args:
+        sources: (name, value) of each source, in prompt order
+        budget: tokens the prompt may use, None for no limit
+        policy: policy of sources without their own
+        source_policies: policies by source name
+        summarize: returns a summary of a text in at most the given number of
+            tokens, for the summarize policy
+    Returns:
+        (prompt, report); the report is None when the sources were not
+        measured because they obviously fit, and otherwise records the tokens
+        of each source, how many were kept and the trimmed total. A single
+        source that fits is returned as is.
+    """
+    values = [value for _, value in sources]
+    # Every token is at least a byte: short prompts need no tokenizer
+    if budget is None or sum(_size(v) for v in values if v) <= budget:
+        return _join(values), None
+
+    source_policies = source_policies or {}
+    texts = [str(value) if value else "" for value in values]
+    sizes = [count_tokens(text) for text in texts]
+    separators = count_tokens("\n\n") * max(0, len(texts) - 1)
+    report = {
+        "budget": budget,
+        "prompt_tokens": sum(sizes) + separators,
+        "trimmed_tokens": 0,
+        "sources": {},
+    }
+    if report["prompt_tokens"] <= budget:
+        return _join(values), report
+
+    policies = [source_policies.get(name, policy) for name, _ in sources]
+    allocation = allocate(sizes, budget - separators, [p == "keep" for p in policies])
+    for i, (name, _) in enumerate(sources):
+        if allocation[i] >= sizes[i]:
+            continue
+        if policies[i] == "summarize" and summarize is not None:
+            summary = await summarize(texts[i], allocation[i])
+            texts[i] = trim(summary, allocation[i])
+        else:
+            texts[i] = trim(texts[i], allocation[i], policies[i])
+        kept = count_tokens(texts[i])
+        report["sources"][name] = {
+            "tokens": sizes[i],
+            "kept": kept,
+            "policy": policies[i],
+        }
+        report["trimmed_tokens"] += max(0, sizes[i] - kept)
+    report["prompt_tokens"] -= report["trimmed_tokens"]
+    prompt = _join([text for text, value in zip(texts, values) if value])
+    return prompt, report
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Process-wide rate limits of model providers.
+
+All agents calling the same base URL and model share one `RateLimiter`, so
+parallel steps and concurrent server requests stay within the provider's
+requests-per-minute and tokens-per-minute budgets instead of each agent running
+into 429 errors and retrying on its own.
+
+Each budget is a token bucket refilled continuously up to its per-minute
+capacity. A call reserves one request and its estimated tokens up front; when a
+bucket runs short the reservation puts it in debt and the caller waits until
+the debt is refilled, which serves waiting callers in order. When the call
+completes, or fails, the reservation is settled with the tokens actually used,
+returning or charging the difference. A caller cancelled while waiting gives
+its request and tokens back.
+
+Limits come from the `rate_limit` field of an agent definition or, for agents
+without one, from the environment:
+    MAESTRO_RATE_LIMIT_RPM: requests per minute of each provider and model
+    MAESTRO_RATE_LIMIT_TPM: tokens per minute of each provider and model
+Agents sharing a limiter but configured differently get the strictest limits.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from maestro.metrics import RATE_LIMIT_AVAILABLE, RATE_LIMIT_WAIT
+
+RPM_ENV = "MAESTRO_RATE_LIMIT_RPM"
+TPM_ENV = "MAESTRO_RATE_LIMIT_TPM"
+
+
+class TokenBucket:
+    """A budget refilled at `per_minute` units per minute, up to `per_minute`."""
+
+    __slots__ = ("per_minute", "rate", "available", "updated")
+
+    def __init__(self, per_minute: float, now: float):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60
+        self.available = per_minute
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.available = min(
+            self.per_minute, self.available + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` units, returning the seconds until they are available."""
+        self.refill(now)
+        self.available -= amount
+        return max(0.0, -self.available / self.rate)
+
+    def give_back(self, amount: float, now: float) -> None:
+        """Return unused units, or charge more with a negative amount."""
+        self.refill(now)
+        self.available = min(self.per_minute, self.available + amount)
+
+
+class Reservation:
+    """Budget reserved for one call, settled with the call's actual usage."""
+
+    __slots__ = ("limiter", "tokens", "wait", "settled")
+
+    def __init__(self, limiter: "RateLimiter", tokens: int, wait: float):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.wait = wait
+        self.settled = False
+
+    def settle(self, actual_tokens: Optional[int] = None) -> None:
+        """Correct the token budget with the tokens the call actually used.
+
+        A failed call settles with 0, giving its whole estimate back; without
+        a count (None) the estimate stands.
+        """
+        if self.settled:
+            return
+        self.settled = True
+        if actual_tokens is not None and actual_tokens >= 0:
+            self.limiter._correct(self.tokens - actual_tokens)
+
+    def cancel(self) -> None:
+        """Give the request and the tokens back, for a call that was not made."""
+        if not self.settled:
+            self.settle(0)
+            self.limiter._correct(0, requests=1)
+
+
+class RateLimiter:
+    """Requests and tokens per minute budgets of one provider and model."""
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self.base_url = base_url
+        self.model = model
+        self._lock = threading.Lock()
+        self.requests: Optional[TokenBucket] = None
+        self.tokens: Optional[TokenBucket] = None
+        self._requests_gauge = RATE_LIMIT_AVAILABLE.labels(base_url, model, "requests")
+        self._tokens_gauge = RATE_LIMIT_AVAILABLE.labels(base_url, model, "tokens")
+        self._wait = RATE_LIMIT_WAIT.labels(base_url, model)
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        """Apply limits, keeping the stricter of existing and new ones."""
+        now = time.monotonic()
+        with self._lock:
+            if requests_per_minute and (
+                self.requests is None or requests_per_minute < self.requests.per_minute
+            ):
+                self.requests = TokenBucket(requests_per_minute, now)
+            if tokens_per_minute and (
+                self.tokens is None or tokens_per_minute < self.tokens.per_minute
+            ):
+                self.tokens = TokenBucket(tokens_per_minute, now)
+            self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        if self.requests is not None:
+            self._requests_gauge.set(self.requests.available)
+        if self.tokens is not None:
+            self._tokens_gauge.set(self.tokens.available)
+
+    def reserve(self, tokens: int = 0) -> Reservation:
+        """Reserve a request and `tokens`; the reservation says how long to wait."""
+        now = time.monotonic()
+        wait = 0.0
+        with self._lock:
+            if self.requests is not None:
+                wait = self.requests.reserve(1, now)
+            if self.tokens is not None:
+                wait = max(wait, self.tokens.reserve(tokens, now))
+            self._update_gauges()
+        self._wait.observe(wait)
+        return Reservation(self, tokens, wait)
+
+    async def acquire(self, tokens: int = 0) -> Reservation:
+        """Reserve a request and `tokens`, waiting until the budgets allow it."""
+        reservation = self.reserve(tokens)
+        if reservation.wait > 0:
+            try:
+                await asyncio.sleep(reservation.wait)
+            except asyncio.CancelledError:
+                reservation.cancel()
+                raise
+        return reservation
+
+    def _correct(self, tokens: float, requests: float = 0) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self.tokens is not None and tokens:
+                self.tokens.give_back(tokens, now)
+            if self.requests is not None and requests:
+                self.requests.give_back(requests, now)
+            self._update_gauges()
+
+    def state(self) -> Dict[str, Optional[float]]:
+        """Current budgets; negative values are debt being waited for."""
+        now = time.monotonic()
+        with self._lock:
+            state = {}
+            for name, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                state[name] = bucket.available if bucket is not None else None
+            self._update_gauges()
+        return state
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _env_limit(name: str) -> Optional[int]:
+    value = int(os.getenv(name, "0") or 0)
+    return value if value > 0 else None
+
+
+def get_rate_limiter(
+    base_url: Optional[str],
+    model: Optional[str],
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> Optional[RateLimiter]:
+    """Return the shared limiter of a provider and model, or None without limits.
+
+    Args:
+        base_url: provider endpoint, None for the framework's default
+        model: model name
+        requests_per_minute: limit of the caller, defaults to MAESTRO_RATE_LIMIT_RPM
+        tokens_per_minute: limit of the caller, defaults to MAESTRO_RATE_LIMIT_TPM
+    """
+    rpm = requests_per_minute or _env_limit(RPM_ENV)
+    tpm = tokens_per_minute or _env_limit(TPM_ENV)
+    key = (base_url or "", model or "")
+    limiter = _limiters.get(key)
+    if limiter is None:
+        if rpm is None and tpm is None:
+            return None
+        with _limiters_lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                limiter = _limiters[key] = RateLimiter(*key, rpm, tpm)
+                return limiter
+    if rpm or tpm:
+        limiter.configure(rpm, tpm)
+    return limiter
+
+
+def clear_rate_limiters() -> None:
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Sub-workflows served by other maestro processes.
+
+A workflow step with `workflow:` runs the workflow served by `maestro serve`
+at the URL of the named workflow. The step posts a JSON payload to
+`/chat/stream` and reads the step events of the remote workflow as they
+arrive. Each is published as a `workflow.remote_step` event and, while the
+calling workflow is streamed, yielded by it as a step named
+`<step>/<remote step>`, along with the agent stream events of the remote
+steps, so nested workflows stream end to end.
+
+Requests share one pooled HTTP client per event loop (see
+`maestro.loop_pools`).
+
+Environment:
+    MAESTRO_REMOTE_TIMEOUT: seconds to wait for the next event of a remote
+        workflow (default: 300)
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence
+
+import httpx
+
+from maestro import events
+from maestro.loop_pools import LoopPool
+from maestro.tracing import inject_headers
+
+# Receives the remote step events of the step running in this context
+step_events: ContextVar[Optional[Callable[[dict], None]]] = ContextVar(
+    "maestro_remote_step_events", default=None
+)
+
+_clients = LoopPool(lambda client: client.aclose())
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client of the running loop."""
+    clients = _clients.clients()
+    client = clients.get("http")
+    if client is None:
+        timeout = float(os.getenv("MAESTRO_REMOTE_TIMEOUT", "300"))
+        client = clients["http"] = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=10)
+        )
+    return client
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, default=str)
+
+
+def request_payload(args: Sequence[Any]) -> Dict[str, Any]:
+    """The `/chat` payload of a step's inputs.
+
+    The last input is the prompt, as for agents; steps with several inputs
+    also send all of them as JSON values.
+    """
+    payload = {"prompt": _text(args[-1]) if args else ""}
+    if len(args) > 1:
+        payload["inputs"] = [json.loads(json.dumps(arg, default=str)) for arg in args]
+    return payload
+
+
+@contextlib.contextmanager
+def forwarding(put: Callable[[dict], None]):
+    """Send the remote step events of steps started in this block to put."""
+    token = step_events.set(put)
+    try:
+        yield
+    finally:
+        step_events.reset(token)
+
+
+async def drain(queue: asyncio.Queue, task: asyncio.Future) -> AsyncIterator[dict]:
+    """Yield the items put in a queue until a task is done.
+
+    The task is cancelled when the consumer stops early.
+    """
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {getter, task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                yield getter.result()
+            else:
+                getter.cancel()
+        while not queue.empty():
+            yield queue.get_nowait()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _step_event(step_name: str, url: str, data: dict) -> dict:
+    event = {
+        "step_name": f"{step_name}/{data.get('step_name', 'unknown')}",
+        "step_result": data.get("step_result", ""),
+        "agent_name": data.get("agent_name"),
+        "remote_workflow": url,
+    }
+    for field in ("prompt_tokens", "response_tokens", "total_tokens"):
+        if field in data:
+            event[field] = data[field]
+    return event
+
+
+async def run_remote_workflow(
+    url: str, args: Sequence[Any], step_name: str = ""
+) -> Dict[str, Any]:
+    """Run a served workflow, forwarding its step events.
+
+    Returns:
+        The step output: the JSON text of the remote final result as `prompt`
+        and, from servers that send it, the final result itself as `result`
+    """
+    forward = step_events.get()
+    async with get_http_client().stream(
+        "POST",
+        url.rstrip("/") + "/chat/stream",
+        json=request_payload(args),
+        headers=inject_headers(),
+    ) as response:
+        if response.status_code != 200:
+            raise ValueError((await response.aread()).decode(errors="replace"))
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = json.loads(line[len("data:") :])
+            if "error" in data:
+                raise ValueError(data["error"])
+            if data.get("workflow_complete"):
+                output = {"prompt": data.get("response", "")}
+                if "result" in data:
+                    output["result"] = data["result"]
+                return output
+            if "event" in data:
+                if forward is not None:
+                    forward(
+                        {
+                            "step_name": f"{step_name}/{data.get('step_name', 'unknown')}",
+                            "stream_event": data["event"],
+                        }
+                    )
+                continue
+            event = _step_event(step_name, url, data)
+            events.info(
+                "workflow.remote_step",
+                "Remote step %s finished",
+                event["step_name"],
+                step=event["step_name"],
+                agent=event["agent_name"],
+                url=url,
+            )
+            if forward is not None:
+                forward(event)
+    raise ValueError(f"Remote workflow at {url} ended without a result")
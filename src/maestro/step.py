@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
-import requests
 import re
-import json
 from dotenv import load_dotenv
+from maestro.blobs import materialize
+from maestro.remote_workflow import run_remote_workflow
 from maestro.utils import eval_expression, convert_to_list
 
 load_dotenv()
@@ -52,6 +52,10 @@ class Step:
                 args = args[:-1]
                 context = maybe_kwargs.get("context")
                 step_index = maybe_kwargs.get("step_index")
+        # Outputs of previous steps may be blob references; agents get the text
+        args = tuple(materialize(arg) for arg in args)
+        if context is not None:
+            context = {name: materialize(value) for name, value in context.items()}
 
         if self.step_agent:
             if context is None:
@@ -97,12 +101,7 @@ class Step:
         return output
 
     async def run_workflow(self, url, *args, context=None, step_index=None):
-        response = requests.post(url + "/chat", json={"prompt": str(args)})
-        if response.status_code != 200:
-            raise ValueError(response.text)
-        response_dict = json.loads(response.text)
-        message = response_dict.get("response")
-        return {"prompt": message}
+        return await run_remote_workflow(url, args, self.step_name)
 
     def evaluate_condition(self, prompt):
         if self.step_condition[0].get("if"):
@@ -167,6 +166,9 @@ class Step:
         prompt = str(prompt)
         if "[" in prompt:
             args = convert_to_list(prompt)
+            if hasattr(agent, "prefetch"):
+                # Agents that can batch fetch for all items up front
+                await agent.prefetch(args)
             results = []
             for arg in args:
                 result = await agent.run(arg, step_index=step_index)
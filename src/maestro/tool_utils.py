@@ -11,6 +11,7 @@ from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.client.sse import sse_client
 from contextlib import AsyncExitStack
+from maestro.tracing import span
 
 plural = "mcpservers"
 singular = "mcpserver"
@@ -160,8 +161,10 @@ async def get_http_tools(url, converter, stack, accessToken):
         transport = await stack.enter_async_context(streamablehttp_client(url + "/mcp"))
     stdio, write, _ = transport
     session = await stack.enter_async_context(ClientSession(stdio, write))
-    await session.initialize()
-    tools = await session.list_tools()
+    with span("maestro.mcp.connect", {"server.address": url}):
+        await session.initialize()
+    with span("maestro.mcp.list_tools", {"server.address": url}):
+        tools = await session.list_tools()
     if converter:
         converted = []
         for tool in tools.tools:
@@ -184,8 +187,10 @@ async def get_sse_tools(url, converter, stack, accessToken):
         transport = await stack.enter_async_context(sse_client(url + "/sse"))
     stdio, write = transport
     session = await stack.enter_async_context(ClientSession(stdio, write))
-    await session.initialize()
-    tools = await session.list_tools()
+    with span("maestro.mcp.connect", {"server.address": url}):
+        await session.initialize()
+    with span("maestro.mcp.list_tools", {"server.address": url}):
+        tools = await session.list_tools()
     if converter:
         converted = []
         for tool in tools.tools:
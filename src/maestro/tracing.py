@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""OpenTelemetry spans for workflow runs, steps, agent calls and MCP calls.
+
+Sampling is decided once per trace at the root span (head-based) from
+MAESTRO_TRACE_SAMPLE_RATE, or inherited from an incoming `traceparent`. Spans of
+an unsampled trace are never created, so hot paths only pay a context variable
+lookup. TailSamplingSpanProcessor can additionally keep only slow or failed
+traces before they reach an exporter.
+
+Tracing is a no-op when the OpenTelemetry API is not installed.
+
+Environment:
+    MAESTRO_TRACE_SAMPLE_RATE: fraction of root traces to record (default: 1.0)
+    MAESTRO_TRACE_TAIL_LATENCY_MS: when set, configure_tracing() exports only
+        traces slower than this threshold or containing an error
+"""
+
+import os
+import random
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    from opentelemetry import context as otel_context, propagate, trace
+    from opentelemetry.trace import StatusCode
+
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+try:
+    from opentelemetry.sdk.trace import SpanProcessor
+except ImportError:
+    SpanProcessor = object
+
+TRACER_NAME = "maestro"
+
+_sampled: ContextVar[Optional[bool]] = ContextVar("maestro_trace_sampled", default=None)
+_NOOP_SPAN = nullcontext()
+
+
+def _sample_rate() -> float:
+    try:
+        rate = float(os.getenv("MAESTRO_TRACE_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+def _tracer():
+    return trace.get_tracer(TRACER_NAME)
+
+
+def _head_sample() -> bool:
+    """Decide whether a new root trace is recorded."""
+    parent = trace.get_current_span().get_span_context()
+    if parent.is_valid:
+        return parent.trace_flags.sampled
+    inherited = _sampled.get()
+    if inherited is not None:
+        return inherited
+    rate = _sample_rate()
+    return rate >= 1.0 or random.random() < rate
+
+
+@contextmanager
+def start_trace(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Open the root span of a unit of work, such as a workflow run.
+
+    The head sampling decision is made here and inherited by every span opened
+    below it, including spans in tasks created by `parallel` steps, since
+    asyncio tasks copy the current context.
+    """
+    if not OTEL_AVAILABLE:
+        yield None
+        return
+    sampled = _head_sample()
+    token = _sampled.set(sampled)
+    try:
+        if sampled:
+            with _tracer().start_as_current_span(name, attributes=attributes) as s:
+                yield s
+        else:
+            yield None
+    finally:
+        _sampled.reset(token)
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Open a child span, or a shared no-op context when the trace is unsampled.
+
+    Exceptions raised inside the span are recorded and mark it as an error.
+    """
+    if not OTEL_AVAILABLE or _sampled.get() is False:
+        return _NOOP_SPAN
+    return _tracer().start_as_current_span(name, attributes=attributes)
+
+
+def inject_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Add W3C trace context headers for the current span to `headers`."""
+    headers = {} if headers is None else headers
+    if OTEL_AVAILABLE and _sampled.get() is not False:
+        propagate.inject(headers)
+    return headers
+
+
+@contextmanager
+def remote_context(carrier: Optional[Mapping[str, str]]):
+    """Continue a trace started by a remote caller, e.g. a parent workflow."""
+    if not OTEL_AVAILABLE or not carrier:
+        yield
+        return
+    token = otel_context.attach(propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        otel_context.detach(token)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Buffer finished spans per trace and forward only interesting traces.
+
+    A trace is kept when its local root span lasted at least
+    `latency_threshold_ms` or when any of its spans ended with an error.
+    Buffered traces are bounded by `max_traces`; the oldest are dropped first.
+    """
+
+    def __init__(
+        self,
+        delegate,
+        latency_threshold_ms: Optional[float] = None,
+        keep_errors: bool = True,
+        max_traces: int = 1000,
+    ):
+        self.delegate = delegate
+        self.latency_threshold_ns = (
+            None if latency_threshold_ms is None else latency_threshold_ms * 1e6
+        )
+        self.keep_errors = keep_errors
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[int, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context=None):
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span):
+        trace_id = span.context.trace_id
+        with self._lock:
+            spans = self._traces.setdefault(trace_id, [])
+            spans.append(span)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+            if span.parent is not None and not span.parent.is_remote:
+                return
+            spans = self._traces.pop(trace_id, [])
+        if self._keep(span, spans):
+            for finished in spans:
+                self.delegate.on_end(finished)
+
+    def _keep(self, root, spans) -> bool:
+        if self.keep_errors and any(
+            s.status.status_code == StatusCode.ERROR for s in spans
+        ):
+            return True
+        if self.latency_threshold_ns is None:
+            return False
+        return (root.end_time - root.start_time) >= self.latency_threshold_ns
+
+    def shutdown(self):
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
+
+
+def configure_tracing(service_name: str = "maestro") -> bool:
+    """Install an OTLP exporter behind tail sampling if it is configured.
+
+    Only acts when MAESTRO_TRACE_TAIL_LATENCY_MS is set and the OpenTelemetry
+    SDK and OTLP exporter are installed. The exporter endpoint is read from the
+    standard OTEL_EXPORTER_OTLP_* environment variables.
+
+    Returns:
+        bool: True if a tracer provider was installed.
+    """
+    threshold = os.getenv("MAESTRO_TRACE_TAIL_LATENCY_MS")
+    if not OTEL_AVAILABLE or not threshold:
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+    except ImportError:
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(
+            BatchSpanProcessor(OTLPSpanExporter()),
+            latency_threshold_ms=float(threshold),
+        )
+    )
+    trace.set_tracer_provider(provider)
+    return True
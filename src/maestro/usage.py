@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Token and cost accounting of workflow runs.
+
+Agents report the token usage of a run with `report()`. The wrapper around
+agent runs in workflows (`maestro.logging_hooks.log_agent_run`) gives every
+agent run a context of its own with `call()`, so an agent instance shared by
+the iterations of a loop, the branches of a parallel step or concurrent
+workflow runs does not mix up their usage. The wrapper then records the run in
+the ledger of the workflow run, with its step, agent, model and cost, and the
+ledger sums the records per step, agent and run.
+
+Costs are computed from prices in USD per million prompt and response tokens,
+looked up by the longest matching model name prefix. Models without a price
+cost nothing and are listed as unpriced.
+
+A run budget of tokens and/or cost, from `spec.template.run_budget` of the
+workflow or the environment, stops the run with `BudgetExceeded` before its
+next agent call once it is used up.
+
+Environment:
+    MAESTRO_MODEL_PRICES: JSON object or file of extra prices, e.g.
+        {"my-model": {"prompt": 0.5, "response": 1.5}}
+    MAESTRO_RUN_MAX_TOKENS: default token budget of workflow runs
+    MAESTRO_RUN_MAX_COST: default cost budget of workflow runs, in USD
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# USD per million (prompt, response) tokens
+MODEL_PRICES = {
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4": (30.00, 60.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "o1-mini": (1.10, 4.40),
+    "o1": (15.00, 60.00),
+    "o3-mini": (1.10, 4.40),
+    "o3": (2.00, 8.00),
+    "o4-mini": (1.10, 4.40),
+}
+TOKEN_KEYS = ("prompt_tokens", "response_tokens", "total_tokens")
+
+
+class BudgetExceeded(RuntimeError):
+    """A workflow run used up its token or cost budget."""
+
+
+@functools.lru_cache(maxsize=1)
+def _prices() -> Dict[str, Tuple[float, float]]:
+    prices = dict(MODEL_PRICES)
+    extra = os.getenv("MAESTRO_MODEL_PRICES")
+    if extra:
+        if os.path.isfile(extra):
+            with open(extra) as f:
+                extra = f.read()
+        for model, price in json.loads(extra).items():
+            prices[model.lower()] = (
+                float(price.get("prompt", 0)),
+                float(price.get("response", 0)),
+            )
+    return prices
+
+
+def price(model: Optional[str]) -> Optional[Tuple[float, float]]:
+    """USD per million prompt and response tokens of a model, e.g. "openai/gpt-4o"."""
+    if not model:
+        return None
+    prices = _prices()
+    name = model.lower().rsplit("/", 1)[-1]
+    for prefix in sorted(prices, key=len, reverse=True):
+        if name.startswith(prefix):
+            return prices[prefix]
+    return None
+
+
+def cost(model: Optional[str], prompt_tokens: int, response_tokens: int) -> float:
+    """USD cost of tokens of a model, 0 for models without a price."""
+    known = price(model)
+    if known is None:
+        return 0.0
+    return (prompt_tokens * known[0] + response_tokens * known[1]) / 1_000_000
+
+
+class UsageRecord:
+    """The token usage and cost of one agent run."""
+
+    __slots__ = ("step", "agent", "model", "time", "cost", "priced") + TOKEN_KEYS
+
+    def __init__(
+        self, step, agent, model, prompt_tokens, response_tokens, total_tokens
+    ):
+        self.step = step
+        self.agent = agent
+        self.model = model
+        self.time = time.time()
+        self.prompt_tokens = prompt_tokens
+        self.response_tokens = response_tokens
+        self.total_tokens = total_tokens or prompt_tokens + response_tokens
+        self.priced = price(model) is not None
+        self.cost = cost(model, prompt_tokens, response_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _sum(records) -> Dict[str, Any]:
+    totals = dict.fromkeys(TOKEN_KEYS, 0)
+    totals["cost"] = 0.0
+    totals["calls"] = 0
+    for record in records:
+        for key in TOKEN_KEYS:
+            totals[key] += getattr(record, key)
+        totals["cost"] += record.cost
+        totals["calls"] += 1
+    return totals
+
+
+class UsageLedger:
+    """The usage records of one workflow run and its budget."""
+
+    def __init__(
+        self, max_tokens: Optional[int] = None, max_cost: Optional[float] = None
+    ):
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.records: List[UsageRecord] = []
+        self.total_tokens = 0
+        self.cost = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_workflow(cls, template: dict) -> "UsageLedger":
+        """A ledger with the run budget of a workflow template."""
+        budget = template.get("run_budget") or {}
+        max_tokens = budget.get("max_tokens", os.getenv("MAESTRO_RUN_MAX_TOKENS"))
+        max_cost = budget.get("max_cost", os.getenv("MAESTRO_RUN_MAX_COST"))
+        return cls(
+            int(max_tokens) if max_tokens is not None else None,
+            float(max_cost) if max_cost is not None else None,
+        )
+
+    def record(
+        self, step: Optional[str], agent: str, model: Optional[str], usage: dict
+    ) -> UsageRecord:
+        record = UsageRecord(
+            step,
+            agent,
+            model,
+            usage.get("prompt_tokens") or 0,
+            usage.get("response_tokens") or 0,
+            usage.get("total_tokens") or 0,
+        )
+        with self._lock:
+            self.records.append(record)
+            self.total_tokens += record.total_tokens
+            self.cost += record.cost
+        return record
+
+    def exceeded(self) -> Optional[str]:
+        """Why the budget is used up, or None."""
+        if self.max_tokens is not None and self.total_tokens >= self.max_tokens:
+            return f"used {self.total_tokens} of {self.max_tokens} tokens"
+        if self.max_cost is not None and self.cost >= self.max_cost:
+            return f"used ${self.cost:.4f} of ${self.max_cost:.4f}"
+        return None
+
+    def check(self) -> None:
+        """Raise BudgetExceeded when the budget is used up."""
+        reason = self.exceeded()
+        if reason is not None:
+            raise BudgetExceeded(f"Workflow run budget exceeded: {reason}")
+
+    def _group(self, key: str) -> Dict[str, Dict[str, Any]]:
+        groups: Dict[str, list] = {}
+        for record in list(self.records):
+            groups.setdefault(getattr(record, key) or "", []).append(record)
+        return {name: _sum(records) for name, records in groups.items()}
+
+    def by_step(self) -> Dict[str, Dict[str, Any]]:
+        return self._group("step")
+
+    def by_agent(self) -> Dict[str, Dict[str, Any]]:
+        return self._group("agent")
+
+    def totals(self, start: int = 0) -> Dict[str, Any]:
+        """Totals of the records from index start on."""
+        return _sum(self.records[start:])
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals of the run, per step and per agent, and the budget."""
+        summary = {
+            "totals": self.totals(),
+            "steps": self.by_step(),
+            "agents": self.by_agent(),
+            "unpriced_models": sorted(
+                {r.model for r in self.records if not r.priced and r.model}
+            ),
+        }
+        if self.max_tokens is not None or self.max_cost is not None:
+            summary["budget"] = {
+                "max_tokens": self.max_tokens,
+                "max_cost": self.max_cost,
+            }
+        return summary
+
+
+_ledger: ContextVar[Optional[UsageLedger]] = ContextVar(
+    "maestro_usage_ledger", default=None
+)
+_step: ContextVar[Optional[str]] = ContextVar("maestro_usage_step", default=None)
+_unchecked: ContextVar[bool] = ContextVar("maestro_usage_unchecked", default=False)
+_call: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "maestro_usage_call", default=None
+)
+
+
+def current_ledger() -> Optional[UsageLedger]:
+    return _ledger.get()
+
+
+@contextlib.contextmanager
+def _set(var: ContextVar, value) -> Iterator:
+    token = var.set(value)
+    try:
+        yield value
+    finally:
+        var.reset(token)
+
+
+def accounting(ledger: UsageLedger):
+    """Record the agent runs inside the block in a ledger."""
+    return _set(_ledger, ledger)
+
+
+def step(name: str):
+    """Attribute the agent runs inside the block to a workflow step."""
+    return _set(_step, name)
+
+
+def unchecked():
+    """Run the agents inside the block past the budget, e.g. exception handlers."""
+    return _set(_unchecked, True)
+
+
+def call():
+    """Collect the usage reported by one agent run; yields a dict of it."""
+    return _set(_call, {})
+
+
+def report(token_usage: Dict[str, Any]) -> None:
+    """Report the token usage of the current agent run.
+
+    Agents report the totals of a run, so a later report replaces an earlier one.
+    """
+    usage = _call.get()
+    if usage is not None:
+        usage.update({key: token_usage.get(key) or 0 for key in TOKEN_KEYS})
+
+
+def reported() -> Optional[Dict[str, int]]:
+    """The usage reported by the current agent run, None outside of a run."""
+    return _call.get()
+
+
+def record(agent: str, model: Optional[str], token_usage: Any) -> None:
+    """Record an agent run in the ledger of the current workflow run."""
+    ledger = _ledger.get()
+    if ledger is not None and isinstance(token_usage, dict):
+        if any(key in token_usage for key in TOKEN_KEYS):
+            ledger.record(_step.get(), agent, model, token_usage)
+
+
+def check_budget() -> None:
+    """Raise BudgetExceeded when the current workflow run used up its budget."""
+    ledger = _ledger.get()
+    if ledger is not None and not _unchecked.get():
+        ledger.check()
@@ -1,6 +1,9 @@
 #! /usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict, Any
+import math
+from typing import Dict, Any, List
+
+from maestro.tracing import span
 
 
 def eval_expression(expression, prompt):
@@ -14,7 +17,24 @@ def eval_expression(expression, prompt):
         The result of evaluating the expression.
     """
     local = {"input": prompt}
-    return eval(expression, local)
+    with span("maestro.expression", {"maestro.expression": str(expression)}):
+        return eval(expression, local)
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of a list sorted in ascending order.
+
+    Args:
+        sorted_values (list): The values, sorted ascending.
+        percent (float): The percentile, between 0 and 100.
+    Returns:
+        The percentile value, or 0.0 for an empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
 
 
 def convert_to_list(s):
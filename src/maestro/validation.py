@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Schema validation of agent, tool and workflow definition files.
+
+Each schema is compiled once per process into a cached validator. Paths may be
+files, directories (searched recursively for .yaml/.yml files) or glob
+patterns; several files are validated in a process pool. After the per-file
+schema checks, definitions are checked across files: a workflow referencing an
+agent that is not defined by any validated file of its directory (the usual
+agents.yaml next to workflow.yaml) is an error. Workflows in directories without
+agent definitions are not checked, their agents may be deployed separately.
+"""
+
+import functools
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.resources import files
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import validator_for
+
+from maestro.yaml_loader import load_yaml
+
+YAML_SUFFIXES = (".yaml", ".yml")
+SCHEMA_FILES = {
+    "Agent": "agent_schema.json",
+    "Tool": "tool_schema.json",
+    "MCPTool": "tool_toolhive_schema_full.json",
+    "Workflow": "workflow_schema.json",
+}
+UNSUPPORTED_KINDS = ("WorkflowRun", "CustomResourceDefinition")
+
+
+def schema_file_for(kind: Optional[str], yaml_file: str = "") -> Optional[str]:
+    """Return the bundled schema of a definition kind.
+
+    Definitions without a known kind fall back on the file name (agents.yaml,
+    workflow.yaml). Returns None for kinds that are not validated.
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind in UNSUPPORTED_KINDS:
+        return None
+    name = SCHEMA_FILES.get(kind)
+    if name is None:
+        base = os.path.basename(yaml_file)
+        if "agents" in base:
+            name = SCHEMA_FILES["Agent"]
+        elif "workflow" in base:
+            name = SCHEMA_FILES["Workflow"]
+        else:
+            raise ValueError(f"Unknown kind: {kind}")
+    return str(files("maestro").joinpath("schemas", name))
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator(schema_file: str):
+    """Return the compiled validator of a JSON schema file.
+
+    Raises:
+        SchemaError: If the schema itself is not valid
+    """
+    with open(schema_file, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def expand_paths(paths: Iterable[str]) -> List[str]:
+    """Expand directories and glob patterns into a sorted list of YAML files."""
+    found = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                found.update(
+                    os.path.join(root, name)
+                    for name in names
+                    if name.endswith(YAML_SUFFIXES)
+                )
+        elif glob.has_magic(path):
+            found.update(
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match)
+            )
+        else:
+            found.add(path)
+    return sorted(found)
+
+
+def _error_path(error) -> str:
+    return ".".join(str(p) for p in error.absolute_path)
+
+
+def _agent_references(workflow: Dict[str, Any]) -> List[str]:
+    """Names of the agents a workflow definition refers to."""
+    template = (workflow.get("spec") or {}).get("template") or {}
+    names = list(template.get("agents") or [])
+    for step in template.get("steps") or []:
+        names.append(step.get("agent"))
+        names.extend(step.get("parallel") or [])
+        names.append((step.get("loop") or {}).get("agent"))
+    names.append((template.get("exception") or {}).get("agent"))
+    return list(dict.fromkeys(name for name in names if isinstance(name, str)))
+
+
+def validate_file(yaml_file: str, schema_file: Optional[str] = None) -> Dict[str, Any]:
+    """Validate every document of a YAML file.
+
+    Args:
+        yaml_file: the file to validate
+        schema_file: schema to validate all documents with, by default each
+            document is validated with the bundled schema of its kind
+    Returns:
+        The file's report: its documents with their schema errors, and the
+        agents it defines and references for the cross-file checks
+    """
+    report = {
+        "file": yaml_file,
+        "valid": True,
+        "errors": [],
+        "documents": [],
+        "defines": [],
+        "references": [],
+    }
+    try:
+        documents = [doc for doc in load_yaml(yaml_file, copy=False) if doc is not None]
+    except (OSError, yaml.YAMLError) as e:
+        report["valid"] = False
+        report["errors"].append({"path": "", "message": f"Invalid YAML file: {e}"})
+        return report
+
+    for index, document in enumerate(documents):
+        kind = document.get("kind") if isinstance(document, dict) else None
+        name = None
+        if isinstance(document, dict):
+            name = (document.get("metadata") or {}).get("name")
+        result = {"index": index, "kind": kind, "name": name, "errors": []}
+        report["documents"].append(result)
+        try:
+            schema = schema_file or schema_file_for(kind, yaml_file)
+            result["schema"] = os.path.basename(schema) if schema else None
+            if schema is None:
+                result["skipped"] = True
+                continue
+            validator = get_validator(schema)
+            result["errors"] = [
+                {"path": _error_path(error), "message": error.message}
+                for error in sorted(validator.iter_errors(document), key=str)
+            ]
+        except SchemaError as se:
+            result["errors"].append(
+                {"path": "", "message": f"Schema file is NOT valid: {se.message}"}
+            )
+        except (OSError, ValueError) as e:
+            result["errors"].append({"path": "", "message": str(e)})
+
+        if kind == "Agent" and name:
+            report["defines"].append(name)
+        elif kind == "Workflow":
+            report["references"].append(
+                {"document": index, "agents": _agent_references(document)}
+            )
+    report["valid"] = not any(doc["errors"] for doc in report["documents"])
+    return report
+
+
+def _check_agent_references(reports: List[Dict[str, Any]]) -> None:
+    defined = {}
+    for report in reports:
+        directory = os.path.dirname(os.path.abspath(report["file"]))
+        defined.setdefault(directory, set()).update(report["defines"])
+    for report in reports:
+        directory = os.path.dirname(os.path.abspath(report["file"]))
+        if not defined[directory]:
+            continue
+        for reference in report["references"]:
+            document = report["documents"][reference["document"]]
+            for agent in reference["agents"]:
+                if agent not in defined[directory]:
+                    document["errors"].append(
+                        {
+                            "path": "spec.template",
+                            "message": f"workflow '{document['name']}' references undefined agent '{agent}'",
+                        }
+                    )
+                    report["valid"] = False
+
+
+def validate_paths(
+    paths: Iterable[str],
+    schema_file: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Validate the YAML files of files, directories and glob patterns.
+
+    Args:
+        paths: files, directories or glob patterns
+        schema_file: schema to validate all documents with, by default each
+            document is validated with the bundled schema of its kind
+        workers: number of worker processes, defaults to the number of CPUs
+    Returns:
+        The report: per-file results and a summary
+    """
+    yaml_files = expand_paths(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(yaml_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(yaml_files))) as pool:
+            chunksize = max(1, len(yaml_files) // (workers * 4))
+            reports = list(
+                pool.map(
+                    functools.partial(validate_file, schema_file=schema_file),
+                    yaml_files,
+                    chunksize=chunksize,
+                )
+            )
+    else:
+        reports = [validate_file(f, schema_file) for f in yaml_files]
+
+    _check_agent_references(reports)
+    for report in reports:
+        del report["defines"], report["references"]
+
+    documents = [doc for report in reports for doc in report["documents"]]
+    return {
+        "valid": all(report["valid"] for report in reports),
+        "summary": {
+            "files": len(reports),
+            "invalid_files": sum(1 for report in reports if not report["valid"]),
+            "documents": len(documents),
+            "invalid_documents": sum(1 for doc in documents if doc["errors"]),
+            "skipped_documents": sum(1 for doc in documents if doc.get("skipped")),
+        },
+        "files": reports,
+    }
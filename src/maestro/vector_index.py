@@ -0,0 +1,404 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Embedded vector index for query agents.
+
+A small or medium document collection can be searched in process instead of
+through a vector database server. `maestro index` embeds the documents and
+writes the index to a directory; query agents with `query_input.index` load it
+memory-mapped and search it without a network hop.
+
+Two index types are supported:
+    flat  exact search, scoring every document
+    ivf   approximate search: documents are clustered around `lists` centroids
+          and only the `nprobe` clusters nearest to a query are scored
+
+Vectors are normalized, so scores are cosine similarities. Queries are searched
+in batches, one matrix product per batch.
+
+Embeddings come from an OpenAI compatible embeddings API, or from the built-in
+`hash` model, which hashes words into a fixed number of dimensions. It needs no
+service and matches on shared words only.
+
+Layout of an index directory:
+    index.json       embedding model, dimension and index type
+    vectors.npy      document vectors, one row per document
+    documents.jsonl  text, url and metadata of the documents, in row order
+    centroids.npy    ivf only: cluster centroids
+    lists.npy        ivf only: document rows ordered by cluster
+    offsets.npy      ivf only: start of each cluster in lists.npy
+
+Rebuilding an index replaces its files instead of writing over them, so
+indexes loaded before keep searching the arrays they mapped.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+INDEX_TYPES = ("flat", "ivf")
+HASH_MODEL = "hash"
+HASH_DIMENSION = 512
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_NPROBE = 8
+EMBED_BATCH_SIZE = 64
+# Documents scored per block of a flat search, bounding memory use
+BLOCK_SIZE = 65536
+KMEANS_ITERATIONS = 20
+DOCUMENT_SUFFIXES = (".md", ".txt", ".rst", ".jsonl")
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return (vectors / norms).astype(np.float32)
+
+
+def hash_embed(texts: Sequence[str], dimension: int = HASH_DIMENSION) -> np.ndarray:
+    """Embed texts by hashing their words into signed buckets."""
+    vectors = np.zeros((len(texts), dimension), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in re.findall(r"\w+", text.lower()):
+            digest = int.from_bytes(
+                hashlib.blake2b(word.encode(), digest_size=8).digest(), "little"
+            )
+            vectors[row, digest % dimension] += 1 if digest >> 63 else -1
+    return _normalize(vectors)
+
+
+async def embed(
+    texts: Sequence[str],
+    model: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> np.ndarray:
+    """Embed texts with the hash model or an OpenAI compatible embeddings API.
+
+    Returns:
+        One normalized float32 row per text
+    """
+    if model == HASH_MODEL:
+        return hash_embed(texts)
+    from maestro.agents.openai_clients import get_openai_client
+
+    client = get_openai_client(
+        base_url or os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+        api_key or os.getenv("OPENAI_API_KEY", "dummy_key"),
+    )
+    rows = []
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        response = await client.embeddings.create(
+            model=model, input=list(texts[start : start + EMBED_BATCH_SIZE])
+        )
+        rows.extend(item.embedding for item in response.data)
+    return _normalize(np.array(rows, dtype=np.float32))
+
+
+def _chunks(text: str, chunk_size: int) -> List[str]:
+    """Split text at blank lines into chunks of about chunk_size characters."""
+    chunks, current = [], ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if current and len(current) + len(paragraph) + 2 > chunk_size:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def load_documents(
+    paths: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """Read documents from files and directories.
+
+    JSONL files hold one document per line with `text` and optional `url` and
+    `metadata`; other files are split into chunks at blank lines. Directories
+    are searched for .md, .txt, .rst and .jsonl files.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(
+                    os.path.join(root, name)
+                    for name in sorted(names)
+                    if name.endswith(DOCUMENT_SUFFIXES)
+                )
+        else:
+            files.append(path)
+
+    documents = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            if file.endswith(".jsonl"):
+                for line in f:
+                    if line.strip():
+                        doc = json.loads(line)
+                        documents.append(
+                            {
+                                "text": doc["text"],
+                                "url": doc.get("url", file),
+                                "metadata": doc.get("metadata", {}),
+                            }
+                        )
+                continue
+            for number, chunk in enumerate(_chunks(f.read(), chunk_size)):
+                documents.append(
+                    {"text": chunk, "url": file, "metadata": {"chunk": number}}
+                )
+    return documents
+
+
+def _kmeans(
+    vectors: np.ndarray, count: int, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means; returns the centroids and the cluster of each row."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), count, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        for cluster in range(count):
+            members = vectors[assignment == cluster]
+            # Empty clusters keep their centroid
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+        centroids = _normalize(centroids)
+    return centroids, np.argmax(vectors @ centroids.T, axis=1)
+
+
+def _top(scores: np.ndarray, limit: int) -> np.ndarray:
+    """Columns of the highest scores of each row, best first."""
+    if limit < scores.shape[1]:
+        candidates = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1)
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+class VectorIndex:
+    """Document vectors searched in process."""
+
+    def __init__(
+        self,
+        path: str,
+        meta: Dict[str, Any],
+        vectors: np.ndarray,
+        documents: List[Dict[str, Any]],
+        centroids: Optional[np.ndarray] = None,
+        lists: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None,
+    ):
+        self.path = path
+        self.meta = meta
+        self.vectors = vectors
+        self.documents = documents
+        self.centroids = centroids
+        self.lists = lists
+        self.offsets = offsets
+
+    @property
+    def model(self) -> str:
+        return self.meta["model"]
+
+    @property
+    def index_type(self) -> str:
+        return self.meta["type"]
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """Load an index directory, memory-mapping its arrays."""
+        with open(os.path.join(path, "index.json")) as f:
+            meta = json.load(f)
+        with open(os.path.join(path, "documents.jsonl"), encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+
+        def array(name):
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+
+        arrays = {}
+        if meta["type"] == "ivf":
+            arrays = {name: array(name) for name in ("centroids", "lists", "offsets")}
+        return cls(path, meta, array("vectors"), documents, **arrays)
+
+    def search(
+        self, queries: np.ndarray, limit: int = 10, nprobe: Optional[int] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """Search normalized query vectors.
+
+        Args:
+            queries: one query vector per row
+            limit: results per query
+            nprobe: ivf clusters searched per query (default: index setting)
+
+        Returns:
+            For each query, (document row, score) pairs, best first
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if not len(self) or limit <= 0:
+            return [[] for _ in queries]
+        if self.index_type == "ivf":
+            return self._search_ivf(
+                queries, limit, nprobe or self.meta.get("nprobe", DEFAULT_NPROBE)
+            )
+        return self._search_flat(queries, limit)
+
+    def _search_flat(
+        self, queries: np.ndarray, limit: int
+    ) -> List[List[Tuple[int, float]]]:
+        rows, scores = [], []
+        for start in range(0, len(self.vectors), BLOCK_SIZE):
+            block = queries @ self.vectors[start : start + BLOCK_SIZE].T
+            best = _top(block, limit)
+            rows.append(best + start)
+            scores.append(np.take_along_axis(block, best, axis=1))
+        rows, scores = np.hstack(rows), np.hstack(scores)
+        best = _top(scores, limit)
+        rows = np.take_along_axis(rows, best, axis=1)
+        scores = np.take_along_axis(scores, best, axis=1)
+        return [
+            [(int(row), float(score)) for row, score in zip(*pair)]
+            for pair in zip(rows, scores)
+        ]
+
+    def _search_ivf(
+        self, queries: np.ndarray, limit: int, nprobe: int
+    ) -> List[List[Tuple[int, float]]]:
+        nprobe = min(nprobe, len(self.centroids))
+        probes = _top(queries @ self.centroids.T, nprobe)
+        results = []
+        for query, clusters in zip(queries, probes):
+            rows = np.concatenate(
+                [
+                    self.lists[self.offsets[cluster] : self.offsets[cluster + 1]]
+                    for cluster in clusters
+                ]
+            )
+            if not len(rows):
+                results.append([])
+                continue
+            scores = self.vectors[rows] @ query
+            best = _top(scores[np.newaxis], min(limit, len(rows)))[0]
+            results.append([(int(rows[i]), float(scores[i])) for i in best])
+        return results
+
+
+def _replace(path: str, write) -> None:
+    """Write a file next to path and move it into place.
+
+    Loaded indexes map the old file, which must not change under them.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _save(path: str, name: str, array: np.ndarray) -> None:
+    _replace(os.path.join(path, f"{name}.npy"), lambda f: np.save(f, array))
+
+
+def write_index(
+    path: str,
+    documents: List[Dict[str, Any]],
+    vectors: np.ndarray,
+    model: str,
+    index_type: str = "flat",
+    lists: Optional[int] = None,
+    nprobe: int = DEFAULT_NPROBE,
+    url: Optional[str] = None,
+) -> VectorIndex:
+    """Write embedded documents to an index directory and load it."""
+    if index_type not in INDEX_TYPES:
+        raise ValueError(
+            f"Invalid index type: {index_type}, expected one of {', '.join(INDEX_TYPES)}"
+        )
+    if len(documents) != len(vectors):
+        raise ValueError("Every document needs one vector")
+    os.makedirs(path, exist_ok=True)
+    vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+    meta = {
+        "version": 1,
+        "model": model,
+        "url": url,
+        "dimension": int(vectors.shape[1]) if vectors.ndim == 2 else 0,
+        "type": index_type,
+        "count": len(documents),
+    }
+    _save(path, "vectors", vectors)
+    if index_type == "ivf":
+        count = max(1, min(lists or int(np.sqrt(len(vectors))), len(vectors)))
+        centroids, assignment = _kmeans(vectors, count)
+        _save(path, "centroids", centroids)
+        _save(path, "lists", np.argsort(assignment, kind="stable"))
+        _save(
+            path,
+            "offsets",
+            np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=count)))),
+        )
+        meta.update(lists=count, nprobe=nprobe)
+    _replace(
+        os.path.join(path, "documents.jsonl"),
+        lambda f: f.writelines(
+            (json.dumps(doc) + "\n").encode("utf-8") for doc in documents
+        ),
+    )
+    # Replaced last: a directory without it is not an index
+    _replace(
+        os.path.join(path, "index.json"),
+        lambda f: f.write(json.dumps(meta, indent=2).encode("utf-8")),
+    )
+    return VectorIndex.load(path)
+
+
+async def build_index(
+    path: str,
+    sources: Iterable[str],
+    model: str = HASH_MODEL,
+    url: Optional[str] = None,
+    index_type: str = "flat",
+    lists: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> VectorIndex:
+    """Embed the documents of files and directories into an index directory."""
+    documents = load_documents(sources, chunk_size)
+    if not documents:
+        raise ValueError("No documents found")
+    vectors = await embed([doc["text"] for doc in documents], model, url)
+    return write_index(
+        path, documents, vectors, model, index_type=index_type, lists=lists, url=url
+    )
+
+
+_indexes: Dict[str, Tuple[Tuple[int, int], VectorIndex]] = {}
+_lock = threading.Lock()
+
+
+def open_index(path: str) -> VectorIndex:
+    """Return the loaded index of a directory, reloading it when rebuilt."""
+    path = os.path.abspath(path)
+    # index.json is replaced, not rewritten, by each build
+    stat = os.stat(os.path.join(path, "index.json"))
+    version = (stat.st_ino, stat.st_mtime_ns)
+    with _lock:
+        loaded = _indexes.get(path)
+        if loaded is None or loaded[0] != version:
+            loaded = _indexes[path] = (version, VectorIndex.load(path))
+    return loaded[1]
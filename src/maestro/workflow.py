@@ -3,25 +3,47 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright © 2025 IBM
 
+import asyncio
 import os
 import time
+import uuid
 import pycron
 from typing import Dict, Any
 from dotenv import load_dotenv
 from opik import Opik
 
-from maestro.mermaid import Mermaid
+from maestro import events, prompt_budget, remote_workflow, usage
+from maestro.blobs import BlobRef, get_blob_store, materialize
+from maestro.mermaid import render_mermaid
+from maestro.metrics import ERRORS, STEP_LATENCY, WORKFLOW_LATENCY
 from maestro.step import Step
+from maestro.tracing import span, start_trace
 from maestro.utils import eval_expression, aggregate_token_usage_from_agents
 
 from maestro.agents.agent_factory import AgentFramework, AgentFactory
 from maestro.agents.agent import save_agent, restore_agent
 from maestro.agents.mock_agent import MockAgent
+from maestro.agents import stream_events
+from maestro.agents.registry import AGENT_REGISTRY
 from maestro.logging_hooks import log_agent_run  # <-- logging decorator
 
 load_dotenv()
 
 
+class _Preview:
+    """Prompt shortened for display, only when an event is rendered."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        value = self.value
+        text = value.preview(201) if isinstance(value, BlobRef) else str(value)
+        return f"{text[:200]}{'...' if len(text) > 200 else ''}"
+
+
 def get_agent_class(framework: str, mode="local") -> type:
     if os.getenv("DRY_RUN"):
         return MockAgent
@@ -41,13 +63,31 @@ def create_agents(agent_defs):
 
 
 class Workflow:
-    def __init__(self, agent_defs=None, workflow=None, workflow_id=None, logger=None):
-        self.agents = {}
+    def __init__(
+        self,
+        agent_defs=None,
+        workflow=None,
+        workflow_id=None,
+        logger=None,
+        checkpoint_store=None,
+        agents=None,
+        blob_store=None,
+    ):
+        # Agents passed in are shared with other workflow instances and are
+        # used as is instead of being created on each run
+        self._shared_agents = agents is not None
+        self.agents = agents if agents is not None else {}
         self.steps = {}
         self.agent_defs = agent_defs or []
         self.workflow = workflow or {}
+        self.checkpoint_store = checkpoint_store
+        # Large step outputs are kept as references into this store
+        self.blob_store = blob_store if blob_store is not None else get_blob_store()
+        if checkpoint_store is not None and not workflow_id:
+            workflow_id = uuid.uuid4().hex
         self.workflow_id = workflow_id
         self.logger = logger
+        self._resume_from = None
         self._opik = None
         self.scoring_metrics = None
         self.workflow_models = {}
@@ -55,6 +95,10 @@ class Workflow:
         self.workflow_end_time = None
         self.agent_execution_times = {}
         self._timing_started = False
+        # Prompt budget reports of the steps of the last run, by step name
+        self.step_metadata = {}
+        # Token usage and cost of the last run, see maestro.usage
+        self.usage = None
 
     def __del__(self):
         """Ensure timing is ended when workflow is destroyed."""
@@ -65,9 +109,40 @@ class Workflow:
         wf = self.workflow
         if isinstance(wf, list):
             wf = wf[0]
-        return Mermaid(wf, kind, orientation).to_markdown()
+        return render_mermaid(wf, kind, orientation)[0]
 
     async def run(self, prompt=""):
+        with (
+            start_trace("maestro.workflow.run", self._trace_attributes()),
+            events.bind(**self._event_fields()),
+            usage.accounting(self._new_ledger()),
+        ):
+            return await self._run(prompt)
+
+    def _event_fields(self):
+        # Runs without an id of their own keep one bound by the caller, e.g. a server
+        workflow_id = self.workflow_id or events.bound_fields().get("workflow_id")
+        return {"workflow": self._workflow_name(), "workflow_id": workflow_id}
+
+    async def resume(self, workflow_id=None):
+        """Continue a checkpointed run after its last completed step.
+
+        Args:
+            workflow_id: id of the run to resume, defaults to this workflow's id
+        Returns:
+            The result of the run, as returned by run()
+        """
+        workflow_id = workflow_id or self.workflow_id
+        if self.checkpoint_store is None:
+            raise ValueError("Cannot resume a workflow without a checkpoint store")
+        checkpoint = self.checkpoint_store.load(workflow_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for workflow run '{workflow_id}'")
+        self.workflow_id = workflow_id
+        self._resume_from = checkpoint
+        return await self.run(checkpoint.prompt)
+
+    async def _run(self, prompt=""):
         if prompt:
             self.workflow["spec"]["template"]["prompt"] = prompt
         self._create_or_restore_agents()
@@ -87,6 +162,8 @@ class Workflow:
                 return result
         except Exception as err:
             self._end_workflow_timing()
+            ERRORS.labels(self._workflow_name(), "", "").inc()
+            self._finish_checkpoint("failed")
             self._create_workflow_trace(initial_prompt, f"ERROR: {str(err)}", {})
 
             exc_def = template.get("exception")
@@ -94,12 +171,22 @@ class Workflow:
                 agent_name = exc_def.get("agent")
                 handler = self.agents.get(agent_name)
                 if handler:
-                    await handler.run(err, step_index=-1)
+                    with usage.unchecked():
+                        await handler.run(err, step_index=-1)
                     return None
             raise err
 
     async def run_streaming(self, prompt=""):
         """Run workflow with step-by-step streaming."""
+        with (
+            start_trace("maestro.workflow.run", self._trace_attributes()),
+            events.bind(**self._event_fields()),
+            usage.accounting(self._new_ledger()),
+        ):
+            async for step_result in self._run_streaming(prompt):
+                yield step_result
+
+    async def _run_streaming(self, prompt=""):
         if prompt:
             self.workflow["spec"]["template"]["prompt"] = prompt
         self._create_or_restore_agents()
@@ -120,21 +207,40 @@ class Workflow:
                 self._end_workflow_timing()
         except Exception as err:
             self._end_workflow_timing()
+            ERRORS.labels(self._workflow_name(), "", "").inc()
+            self._finish_checkpoint("failed")
             exc_def = template.get("exception")
             if exc_def:
                 agent_name = exc_def.get("agent")
                 handler = self.agents.get(agent_name)
                 if handler:
-                    await handler.run(err, step_index=-1)
+                    with usage.unchecked():
+                        await handler.run(err, step_index=-1)
                     yield {"error": str(err)}
             else:
                 yield {"error": str(err)}
 
+    def _new_ledger(self) -> usage.UsageLedger:
+        """Start the usage ledger of a run, with the run budget of the workflow."""
+        wf = self.workflow
+        if isinstance(wf, list):
+            wf = wf[0]
+        self.usage = usage.UsageLedger.for_workflow(
+            wf.get("spec", {}).get("template", {})
+        )
+        return self.usage
+
     def get_context_state(self) -> dict:
         """Get the current context state for debugging purposes."""
         return getattr(self, "_context", {})
 
     def _create_or_restore_agents(self):
+        if not self._shared_agents:
+            self._create_agents()
+        if self._has_scoring_agent():
+            self._initialize_opik()
+
+    def _create_agents(self):
         if self.agent_defs:
             for agent_def in self.agent_defs:
                 if isinstance(agent_def, str):
@@ -150,19 +256,11 @@ class Workflow:
                 cls = get_agent_class(
                     agent_def["spec"]["framework"], agent_def["spec"].get("mode")
                 )
-                agent_instance = cls(agent_def)
+                agent_instance = AGENT_REGISTRY.get(agent_def, cls)
 
                 agent_name = agent_def["metadata"]["name"]
                 agent_model = agent_def["spec"].get("model", f"code:{agent_name}")
-                agent_instance.agent_name = agent_name
-                agent_instance.agent_model = agent_model
-                agent_instance._workflow_instance = self
-                bound_method = agent_instance.run.__get__(agent_instance)
-                agent_instance.run = log_agent_run(
-                    self.workflow_id, agent_name, agent_model
-                )(bound_method)
-
-                self.agents[agent_name] = agent_instance
+                self._bind_agent(agent_instance, agent_name, agent_model)
                 if not self._is_scoring_agent(agent_def):
                     self.workflow_models[agent_name] = agent_model
 
@@ -179,22 +277,54 @@ class Workflow:
                     cls = get_agent_class(
                         agent_def["spec"]["framework"], agent_def["spec"].get("mode")
                     )
-                    agent_instance = cls(agent_def)
-
-                agent_name = name
-                agent_model = f"code:{name}"
-                agent_instance.agent_name = agent_name
-                agent_instance.agent_model = agent_model
-                agent_instance._workflow_instance = self
-                bound_method = agent_instance.run.__get__(agent_instance)
-                agent_instance.run = log_agent_run(
-                    self.workflow_id, agent_name, agent_model
-                )(bound_method)
-
-                self.agents[agent_name] = agent_instance
+                    agent_instance = AGENT_REGISTRY.get(agent_def, cls)
+
+                self._bind_agent(agent_instance, name, f"code:{name}")
+
+    def _bind_agent(self, agent_instance, agent_name, agent_model):
+        """Make an agent instance part of this workflow, logging its runs."""
+        agent_instance.agent_name = agent_name
+        agent_instance.agent_model = agent_model
+        agent_instance._workflow_instance = self
+        bound_method = agent_instance.run.__get__(agent_instance)
+        agent_instance.run = log_agent_run(self.workflow_id, agent_name, agent_model)(
+            bound_method
+        )
+        self.agents[agent_name] = agent_instance
 
-        if self._has_scoring_agent():
-            self._initialize_opik()
+    def _workflow_name(self) -> str:
+        wf = self.workflow
+        if isinstance(wf, list):
+            wf = wf[0]
+        return wf.get("metadata", {}).get("name", "")
+
+    def _trace_attributes(self) -> dict:
+        attributes = {"maestro.workflow": self._workflow_name()}
+        if self.workflow_id:
+            attributes["maestro.workflow_id"] = str(self.workflow_id)
+        return attributes
+
+    async def _run_step(self, step_name, *args, **kwargs):
+        """Run a step, recording its latency and errors in metrics and a span."""
+        workflow_name = self._workflow_name()
+        start = time.perf_counter()
+        try:
+            usage.check_budget()
+            with (
+                span(
+                    "maestro.step",
+                    {"maestro.workflow": workflow_name, "maestro.step": step_name},
+                ),
+                usage.step(step_name),
+            ):
+                return await self.steps[step_name].run(*args, **kwargs)
+        except Exception:
+            ERRORS.labels(workflow_name, step_name, "").inc()
+            raise
+        finally:
+            STEP_LATENCY.labels(workflow_name, step_name).observe(
+                time.perf_counter() - start
+            )
 
     def find_index(self, steps, name):
         for idx, step in enumerate(steps):
@@ -202,7 +332,89 @@ class Workflow:
                 return idx
         return None
 
+    def _next_step(self, steps, current, result):
+        """Return the name of the step after `current`, or None after the last."""
+        if "next" in result:
+            return result["next"]
+        if current == steps[-1]["name"]:
+            return None
+        return steps[self.find_index(steps, current) + 1]["name"]
+
+    def _restore_checkpoint(self, initial_prompt, first_step):
+        """Return (step_results, current step, prompt, step_index) to run from.
+
+        A new run records its start in the checkpoint store; a run resumed by
+        resume() continues after the last step in its checkpoint.
+        """
+        checkpoint, self._resume_from = self._resume_from, None
+        if checkpoint is None:
+            if self.checkpoint_store is not None:
+                self.checkpoint_store.start_run(
+                    self.workflow_id, self._workflow_name(), initial_prompt
+                )
+            return {}, first_step, initial_prompt, 0
+
+        for agent_name, counters in checkpoint.token_usage.items():
+            agent = self.agents.get(agent_name)
+            if agent is not None and "prompt_tokens" in counters:
+                agent.prompt_tokens = counters.get("prompt_tokens", 0)
+                agent.response_tokens = counters.get("response_tokens", 0)
+                agent.total_tokens = counters.get("total_tokens", 0)
+        if not checkpoint.steps:
+            return {}, first_step, initial_prompt, 0
+        return (
+            checkpoint.step_results,
+            checkpoint.next_step,
+            checkpoint.last_step["output"],
+            checkpoint.step_index,
+        )
+
+    def _save_checkpoint(self, step_index, step_name, output, next_step, definition):
+        """Append the result of a completed step to the checkpoint store."""
+        if self.checkpoint_store is None:
+            return
+        agent = definition.get("agent")
+        record = {
+            "step_index": step_index,
+            "step_name": step_name,
+            "output": output,
+            "next_step": next_step,
+            "agent_name": getattr(agent, "agent_name", None),
+            "token_usage": agent.get_token_usage()
+            if hasattr(agent, "get_token_usage")
+            else None,
+        }
+        self.checkpoint_store.save_step(self.workflow_id, record)
+        if next_step is None:
+            self._finish_checkpoint("completed")
+
+    def _spill(self, output):
+        """Store a large step output as a blob and return its reference."""
+        if self.blob_store is None:
+            return output
+        return self.blob_store.spill(output)
+
+    @staticmethod
+    def _final_result(prompt, step_results):
+        return {
+            "final_prompt": materialize(prompt),
+            **{name: materialize(value) for name, value in step_results.items()},
+        }
+
+    def _finish_checkpoint(self, status):
+        if self.checkpoint_store is None:
+            return
+        try:
+            self.checkpoint_store.finish_run(self.workflow_id, status)
+        except Exception as e:
+            events.warning(
+                "workflow.checkpoint",
+                "[Workflow] Warning: could not update checkpoint: %s",
+                e,
+            )
+
     async def _condition(self):
+        self.step_metadata = {}
         template = self.workflow["spec"]["template"]
         initial_prompt = template["prompt"]
         steps = template["steps"]
@@ -232,13 +444,12 @@ class Workflow:
                 loop_def["agent"] = self.agents.get(loop_def.get("agent"))
             self.steps[step["name"]] = Step(step)
 
-        step_results = {}
-        context = {}
-        current = steps[0]["name"]
-        prompt = initial_prompt
-        step_index = 0
+        step_results, current, prompt, step_index = self._restore_checkpoint(
+            initial_prompt, steps[0]["name"]
+        )
+        context = dict(step_results)
 
-        while True:
+        while current is not None:
             definition = step_defs[current]
 
             # Handle selective context routing with 'from' field
@@ -277,36 +488,40 @@ class Workflow:
                         else:
                             context_inputs.append(source)
 
-                # Join multiple inputs with newlines if multiple sources
-                if len(context_inputs) == 1:
-                    prompt = context_inputs[0]
-                else:
-                    prompt = "\n\n".join([str(inp) for inp in context_inputs if inp])
+                # Join multiple inputs with newlines, within the token budget
+                prompt = await self._assemble_prompt(
+                    current, definition, from_sources, context_inputs, step_index
+                )
 
-                print(f"\n🔍 [CONTEXT ROUTING] Step '{current}' using 'from' field:")
-                print(f"   Sources: {from_sources}")
-                print(
-                    f"   Final prompt: {prompt[:200]}{'...' if len(prompt) > 200 else ''}"
+                events.debug(
+                    "workflow.routing",
+                    "\n🔍 [CONTEXT ROUTING] Step '%s' using 'from' field:"
+                    "\n   Sources: %s\n   Final prompt: %s",
+                    current,
+                    from_sources,
+                    _Preview(prompt),
+                    step=current,
                 )
 
-                result = await self.steps[current].run(
-                    prompt, context=context, step_index=step_index
+                result = await self._run_step(
+                    current, prompt, context=context, step_index=step_index
                 )
             else:
                 # Default behavior: use output from previous step
-                print(
-                    f"\n🔍 [DEFAULT ROUTING] Step '{current}' using previous step output:"
-                )
-                prompt_str = str(prompt)
-                print(
-                    f"   Prompt: {prompt_str[:200]}{'...' if len(prompt_str) > 200 else ''}"
+                events.debug(
+                    "workflow.routing",
+                    "\n🔍 [DEFAULT ROUTING] Step '%s' using previous step output:"
+                    "\n   Prompt: %s",
+                    current,
+                    _Preview(prompt),
+                    step=current,
                 )
 
-                result = await self.steps[current].run(
-                    prompt, context=context, step_index=step_index
+                result = await self._run_step(
+                    current, prompt, context=context, step_index=step_index
                 )
 
-            prompt = result.get("prompt")
+            prompt = self._spill(result.get("prompt"))
             step_results[current] = prompt
             context[current] = prompt
             self._context = context
@@ -315,21 +530,19 @@ class Workflow:
 
             step_index += 1
 
-            if "next" in result:
-                current = result["next"]
-            else:
-                last = steps[-1]["name"]
-                if current == last:
-                    break
-                idx = self.find_index(steps, current)
-                current = steps[idx + 1]["name"]
+            next_step = self._next_step(steps, current, result)
+            self._save_checkpoint(
+                step_index - 1, current, prompt, next_step, definition
+            )
+            current = next_step
 
-        self._create_workflow_trace(initial_prompt, prompt, step_results)
+        self._create_workflow_trace(initial_prompt, materialize(prompt), step_results)
 
-        return {"final_prompt": prompt, **step_results}
+        return self._final_result(prompt, step_results)
 
     async def _condition_streaming(self):
         """Run workflow steps with streaming output."""
+        self.step_metadata = {}
         template = self.workflow["spec"]["template"]
         initial_prompt = template["prompt"]
         steps = template["steps"]
@@ -359,12 +572,11 @@ class Workflow:
                 loop_def["agent"] = self.agents.get(loop_def.get("agent"))
             self.steps[step["name"]] = Step(step)
 
-        step_results = {}
-        current = steps[0]["name"]
-        prompt = initial_prompt
-        step_index = 0
+        step_results, current, prompt, step_index = self._restore_checkpoint(
+            initial_prompt, steps[0]["name"]
+        )
 
-        while True:
+        while current is not None:
             definition = step_defs[current]
             if definition.get("from"):
                 from_sources = definition["from"]
@@ -379,47 +591,62 @@ class Workflow:
                     else:
                         context_inputs.append(source)
 
-                if len(context_inputs) == 1:
-                    step_prompt = context_inputs[0]
-                else:
-                    step_prompt = "\n\n".join(
-                        [str(inp) for inp in context_inputs if inp]
-                    )
+                step_prompt = await self._assemble_prompt(
+                    current, definition, from_sources, context_inputs, step_index
+                )
             else:
                 step_prompt = prompt
 
-            result = await self.steps[current].run(step_prompt, step_index=step_index)
+            # Agent stream events and steps of remote workflows are streamed
+            # as they happen
+            forwarded = asyncio.Queue()
+            ledger = usage.current_ledger()
+            recorded = len(ledger.records) if ledger is not None else 0
+            with (
+                remote_workflow.forwarding(forwarded.put_nowait),
+                stream_events.forwarding(
+                    lambda event, step=current: forwarded.put_nowait(
+                        {"step_name": step, "stream_event": event.to_dict()}
+                    )
+                ),
+            ):
+                running = asyncio.ensure_future(
+                    self._run_step(current, step_prompt, step_index=step_index)
+                )
+            async for remote_step in remote_workflow.drain(forwarded, running):
+                yield remote_step
+            result = running.result()
 
-            prompt = result.get("prompt")
+            prompt = self._spill(result.get("prompt"))
             step_results[current] = prompt
             step_index += 1
             agent_obj = definition.get("agent")
             token_data = {}
             if agent_obj and hasattr(agent_obj, "prompt_tokens"):
-                token_data = {
-                    "prompt_tokens": getattr(agent_obj, "prompt_tokens", 0),
-                    "response_tokens": getattr(agent_obj, "response_tokens", 0),
-                    "total_tokens": getattr(agent_obj, "total_tokens", 0),
-                }
+                # This step's own usage; the agent's counters are shared
+                if ledger is not None:
+                    token_data = ledger.totals(start=recorded)
+                    del token_data["calls"]
+                else:
+                    token_data = {
+                        key: getattr(agent_obj, key, 0) for key in usage.TOKEN_KEYS
+                    }
 
             yield {
                 "step_name": current,
-                "step_result": prompt,
+                "step_result": materialize(prompt),
                 "step_index": step_index - 1,
                 "agent_name": agent_obj.agent_name if agent_obj else None,
                 **token_data,
             }
 
-            if "next" in result:
-                current = result["next"]
-            else:
-                last = steps[-1]["name"]
-                if current == last:
-                    break
-                idx = self.find_index(steps, current)
-                current = steps[idx + 1]["name"]
+            next_step = self._next_step(steps, current, result)
+            self._save_checkpoint(
+                step_index - 1, current, prompt, next_step, definition
+            )
+            current = next_step
 
-        yield {"final_result": {"final_prompt": prompt, **step_results}}
+        yield {"final_result": self._final_result(prompt, step_results)}
 
     def _create_workflow_trace(self, initial_prompt, final_prompt, step_results):
         """
@@ -432,7 +659,9 @@ class Workflow:
             metadata = self._build_trace_metadata(step_results)
             self._create_opik_trace(initial_prompt, final_prompt, metadata)
         except Exception as e:
-            print(f"[Workflow] Warning: could not create trace: {e}")
+            events.warning(
+                "workflow.trace", "[Workflow] Warning: could not create trace: %s", e
+            )
 
     async def process_event(self, result):
         ev = self.workflow["spec"]["template"]["event"]
@@ -471,6 +700,68 @@ class Workflow:
 
         return result
 
+    async def _assemble_prompt(
+        self, step_name, definition, from_sources, context_inputs, step_index
+    ):
+        """Join the `from:` sources of a step into a prompt within its token budget.
+
+        The budget is the step's `budget.max_tokens` or what the context window
+        of its agent leaves for the prompt; see maestro.prompt_budget.
+        """
+        spec = definition.get("budget") or {}
+        budget = spec.get("max_tokens")
+        agent = definition.get("agent")
+        if isinstance(agent, str):
+            agent = self.agents.get(agent)
+        if budget is None and hasattr(agent, "prompt_budget"):
+            budget = agent.prompt_budget()
+        policy = spec.get("policy", prompt_budget.DEFAULT_POLICY)
+        source_policies = spec.get("sources") or {}
+
+        summarize = None
+        if spec.get("summarizer"):
+            summarizer = self.agents.get(spec["summarizer"])
+            if summarizer is None:
+                raise ValueError(
+                    f"Could not find summarizer agent named '{spec['summarizer']}'"
+                )
+
+            async def summarize(text, tokens):
+                window = getattr(summarizer, "prompt_budget", lambda: None)()
+                if window is not None:
+                    text = prompt_budget.trim(text, window)
+                return await summarizer.run(
+                    f"Summarize the following text in at most {tokens} tokens:"
+                    f"\n\n{text}",
+                    step_index=step_index,
+                )
+
+        elif "summarize" in (policy, *source_policies.values()):
+            raise ValueError(
+                f"Step '{step_name}' summarizes sources but has no summarizer agent"
+            )
+
+        prompt, report = await prompt_budget.assemble(
+            list(zip(from_sources, context_inputs)),
+            budget,
+            policy,
+            source_policies,
+            summarize,
+        )
+        if report is not None:
+            self.step_metadata[step_name] = report
+            if report["trimmed_tokens"]:
+                events.info(
+                    "workflow.prompt_budget",
+                    "Step '%s' prompt trimmed by %d tokens to fit its budget of %d",
+                    step_name,
+                    report["trimmed_tokens"],
+                    report["budget"],
+                    step=step_name,
+                    trimmed_tokens=report["trimmed_tokens"],
+                )
+        return prompt
+
     async def _condition_subflow(self, steps, start, prompt):
         step_defs = {step["name"]: step for step in steps}
         for step in steps:
@@ -522,22 +813,19 @@ class Workflow:
                         else:
                             context_inputs.append(source)
 
-                # Join multiple inputs with newlines if multiple sources
-                if len(context_inputs) == 1:
-                    step_prompt = context_inputs[0]
-                else:
-                    step_prompt = "\n\n".join(
-                        [str(inp) for inp in context_inputs if inp]
-                    )
+                # Join multiple inputs with newlines, within the token budget
+                step_prompt = await self._assemble_prompt(
+                    current, definition, from_sources, context_inputs, step_index
+                )
 
-                result = await self.steps[current].run(
-                    step_prompt, step_index=step_index
+                result = await self._run_step(
+                    current, step_prompt, step_index=step_index
                 )
             else:
                 # Default behavior: use output from previous step
-                result = await self.steps[current].run(prompt, step_index=step_index)
+                result = await self._run_step(current, prompt, step_index=step_index)
 
-            prompt = result.get("prompt")
+            prompt = self._spill(result.get("prompt"))
             step_results[current] = prompt
             step_index += 1
 
@@ -549,7 +837,7 @@ class Workflow:
                 idx = self.find_index(steps, current)
                 current = steps[idx + 1]["name"]
 
-        return {"final_prompt": prompt, **step_results}
+        return self._final_result(prompt, step_results)
 
     def get_step(self, step_name):
         for s in self.workflow["spec"]["template"]["steps"]:
@@ -612,6 +900,9 @@ class Workflow:
         if self._timing_started and self.workflow_end_time is None:
             self.workflow_end_time = time.time()
             self._timing_started = False
+            WORKFLOW_LATENCY.labels(self._workflow_name()).observe(
+                self.workflow_end_time - self.workflow_start_time
+            )
 
     def force_end_timing(self) -> None:
         """Force end timing if it's still running."""
@@ -648,6 +939,12 @@ class Workflow:
         """Get token usage summary for all agents."""
         return aggregate_token_usage_from_agents(self.agents)
 
+    def get_usage_summary(self) -> Dict[str, Any]:
+        """Token usage and cost of the last run, per step and agent."""
+        if self.usage is None:
+            return usage.UsageLedger().summary()
+        return self.usage.summary()
+
     def _build_trace_metadata(self, step_results: dict) -> dict:
         """Build metadata for the Opik trace."""
         metadata = {
@@ -660,8 +957,26 @@ class Workflow:
         execution_metrics = self.get_execution_metrics()
         metadata.update(execution_metrics)
 
-        total_token_usage = aggregate_token_usage_from_agents(self.agents)
-        metadata.update(total_token_usage)
+        ledger = usage.current_ledger() or self.usage
+        if ledger is not None and ledger.records:
+            # Per run, step and agent; counters of shared agents mix up runs
+            summary = ledger.summary()
+            totals = summary["totals"]
+            total_token_usage = {
+                "total_prompt_tokens": totals["prompt_tokens"],
+                "total_response_tokens": totals["response_tokens"],
+                "total_tokens": totals["total_tokens"],
+                "agent_token_usage": {
+                    agent: {key: agent_totals[key] for key in usage.TOKEN_KEYS}
+                    for agent, agent_totals in ledger.by_agent().items()
+                },
+            }
+            metadata.update(total_token_usage)
+            metadata["total_cost"] = totals["cost"]
+            metadata["usage"] = summary
+        else:
+            total_token_usage = aggregate_token_usage_from_agents(self.agents)
+            metadata.update(total_token_usage)
 
         if execution_metrics["workflow_execution_time_seconds"] > 0:
             metadata["tokens_per_second"] = (
@@ -680,6 +995,8 @@ class Workflow:
 
         if self.workflow_models:
             metadata["workflow_models"] = self.workflow_models
+        if self.step_metadata:
+            metadata["prompt_budgets"] = self.step_metadata
         if self.scoring_metrics:
             scoring_metadata = self.scoring_metrics.copy()
             if "model" in scoring_metadata:
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+"""Fast YAML loading with a process-wide cache of parsed definition files.
+
+Files are parsed with libyaml's CSafeLoader when PyYAML was built with it, and
+with the pure Python SafeLoader otherwise. Parsed documents are cached by
+absolute path and invalidated when the file's modification time or size
+changes, so servers and commands that read the same agent and workflow files
+repeatedly parse each of them once.
+
+Callers get their own copy of the cached documents: workflows resolve agent
+names in their definition in place, and those changes must not leak into the
+cache. Read-only callers can pass `copy=False` to share the cached documents.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+import yaml
+
+from maestro.metrics import CACHE_REQUESTS
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_CACHE_SIZE = 512
+
+_cache: "OrderedDict[str, Tuple[int, int, List[Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_hits = CACHE_REQUESTS.labels("yaml", "hit")
+_cache_misses = CACHE_REQUESTS.labels("yaml", "miss")
+
+
+def _copy(value):
+    # Parsed YAML only holds dicts, lists and immutable scalars, which makes
+    # this much faster than copy.deepcopy
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def load_all(stream) -> List[Any]:
+    """Parse all documents of a YAML string or stream."""
+    return list(yaml.load_all(stream, Loader=SafeLoader))
+
+
+def load_yaml(file_path, copy: bool = True) -> List[Any]:
+    """Return the documents of a YAML file, parsing it only when it changed.
+
+    Args:
+        file_path: path of the YAML file
+        copy: return a copy the caller may modify; with False the cached
+            documents are returned and must not be modified
+    Returns:
+        The list of documents in the file
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            _cache.move_to_end(path)
+        else:
+            entry = None
+    if entry is not None:
+        _cache_hits.inc()
+        documents = entry[2]
+    else:
+        _cache_misses.inc()
+        with open(path, "r", encoding="utf-8") as f:
+            documents = load_all(f)
+        with _cache_lock:
+            _cache[path] = (stat.st_mtime_ns, stat.st_size, documents)
+            while len(_cache) > YAML_CACHE_SIZE:
+                _cache.popitem(last=False)
+    return _copy(documents) if copy else documents
+
+
+def load_many(file_paths: Iterable, copy: bool = True) -> Dict[str, List[Any]]:
+    """Load several YAML files, e.g. all definitions of a directory.
+
+    Returns:
+        The documents of each file, by the path it was given as
+    """
+    return {str(path): load_yaml(path, copy=copy) for path in file_paths}
+
+
+def clear_yaml_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
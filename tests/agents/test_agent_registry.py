@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import copy
+
+import pytest
+
+from maestro import bench, logging_hooks, workflow as workflow_module
+from maestro.agents.mock_agent import MockAgent
+from maestro.agents.registry import AgentRegistry, definition_hash
+from maestro.file_logger import FileLogger
+from maestro.workflow import Workflow
+
+
+class CountingAgent(MockAgent):
+    created = 0
+
+    def __init__(self, agent):
+        super().__init__(agent)
+        CountingAgent.created += 1
+
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    registry = AgentRegistry(max_size=8)
+    monkeypatch.setattr(workflow_module, "AGENT_REGISTRY", registry)
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: CountingAgent)
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    CountingAgent.created = 0
+    return registry
+
+
+def _run(agents, definition, workflow_id=None):
+    workflow = Workflow(
+        copy.deepcopy(agents), copy.deepcopy(definition), workflow_id=workflow_id
+    )
+    asyncio.run(workflow.run())
+    return workflow
+
+
+def test_repeat_runs_reuse_agent_instances(registry):
+    agents, definition, _ = bench.generate_workflow("linear", 3)
+    first = _run(agents, definition, "one")
+    second = _run(agents, definition, "two")
+    assert CountingAgent.created == 3
+    assert len(registry) == 3
+
+    # Each run gets its own copy, logging to its own workflow
+    agent1, agent2 = first.agents["agent1"], second.agents["agent1"]
+    assert agent1 is not agent2
+    assert agent1._workflow_instance is first
+    assert agent2._workflow_instance is second
+
+    # Run wrappers are not stacked on the shared instance
+    third = _run(agents, definition, "three")
+    assert "run" not in vars(registry.get(agents[0], CountingAgent))
+    assert third.agents["agent1"].run is not agent1.run
+
+
+def test_forks_have_their_own_token_counters(registry):
+    agent_def = bench.generate_workflow("linear", 1)[0][0]
+    first = registry.get(agent_def, CountingAgent)
+    first.prompt_tokens = 10
+    second = registry.get(agent_def, CountingAgent)
+    assert second.prompt_tokens == 0
+    assert CountingAgent.created == 1
+
+
+def test_changed_definitions_and_invalidation(registry):
+    agents, definition, _ = bench.generate_workflow("linear", 2)
+    _run(agents, definition)
+    changed = copy.deepcopy(agents)
+    changed[0]["spec"]["description"] = "different"
+    assert definition_hash(changed[0], CountingAgent) != definition_hash(
+        agents[0], CountingAgent
+    )
+    _run(changed, definition)
+    assert CountingAgent.created == 3
+
+    assert registry.invalidate("agent1") == 2
+    _run(agents, definition)
+    assert CountingAgent.created == 4
+    assert registry.invalidate() == 2
+
+
+def test_registry_is_bounded():
+    registry = AgentRegistry(max_size=1)
+    agents = bench.generate_workflow("linear", 2)[0]
+    registry.get(agents[0], CountingAgent)
+    registry.get(agents[1], CountingAgent)
+    assert len(registry) == 1
+
+    disabled = AgentRegistry(max_size=0)
+    created = CountingAgent.created
+    disabled.get(agents[0], CountingAgent)
+    disabled.get(agents[0], CountingAgent)
+    assert CountingAgent.created == created + 2
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from maestro import events
+from maestro.agents import evaluation_middleware
+from maestro.agents.evaluation_middleware import (
+    EvaluationJob,
+    EvaluationQueue,
+    EvaluationSampler,
+    SimpleEvaluationMiddleware,
+    auto_evaluate_response,
+)
+from maestro.metrics import EVALUATIONS
+
+
+class FakeEvaluator:
+    """Scores every response 0.5, blocking until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.runs = 0
+
+    def start_run(self):
+        self.release.wait(5)
+        self.runs += 1
+
+    def evaluate_answer_relevance(self, fn):
+        return fn
+
+    evaluate_faithfulness = evaluate_context_relevance = evaluate_answer_relevance
+
+    def end_run(self):
+        pass
+
+    def get_result(self):
+        return SimpleNamespace(
+            metrics_results=[SimpleNamespace(name="answer_relevance", value=0.5)]
+        )
+
+
+class State(SimpleNamespace):
+    pass
+
+
+@pytest.fixture
+def middleware(monkeypatch, tmp_path):
+    monkeypatch.setenv("MAESTRO_AUTO_EVALUATION", "true")
+    monkeypatch.setenv("MAESTRO_EVAL_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("MAESTRO_EVAL_SAMPLE_AGENTS", "skipped=0")
+    monkeypatch.setattr(evaluation_middleware, "WATSONX_AVAILABLE", True)
+    monkeypatch.setattr(evaluation_middleware, "EvaluationState", State)
+    middleware = SimpleEvaluationMiddleware()
+    middleware.evaluator = FakeEvaluator()
+    monkeypatch.setattr(evaluation_middleware, "_evaluation_middleware", middleware)
+    return middleware
+
+
+def test_sampling_rates():
+    sampler = EvaluationSampler(
+        50, agents={"writer": 100, "critic": 0}, workflows={"nightly": 10}
+    )
+    assert sampler.rate("writer", "nightly") == 100
+    assert sampler.rate("reader", "nightly") == 10
+    assert sampler.rate("reader") == 50
+    assert sampler.sample("writer") and not sampler.sample("critic")
+    assert evaluation_middleware._parse_rates("Recipe Agent=5, b=0.5") == {
+        "Recipe Agent": 5.0,
+        "b": 0.5,
+    }
+
+
+def test_queue_evaluates_in_batches_and_drops_when_full():
+    batches = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def evaluate(batch):
+        started.set()
+        release.wait(5)
+        batches.append([job.prompt for job in batch])
+
+    evaluations = EvaluationQueue(evaluate, maxsize=3, batch_size=2)
+    assert evaluations.submit(EvaluationJob("queue", "a", "-"))
+    started.wait(5)
+    for prompt in "bcd":
+        assert evaluations.submit(EvaluationJob("queue", prompt, "-"))
+    assert not evaluations.submit(EvaluationJob("queue", "e", "-"))
+    assert EVALUATIONS.labels("queue", "dropped").value == 1
+
+    release.set()
+    assert evaluations.flush(5)
+    assert batches == [["a"], ["b", "c"], ["d"]]
+    assert evaluations.pending() == 0
+
+
+def test_agent_run_is_not_delayed_by_evaluation(middleware, tmp_path):
+    with events.bind(workflow="wf"):
+        queued = asyncio.run(
+            auto_evaluate_response("writer", "question", "answer", context="ctx")
+        )
+    # The evaluator is still blocked: the response was only queued
+    assert queued and middleware.queue.pending() == 1
+    assert not asyncio.run(auto_evaluate_response("skipped", "question", "answer"))
+    assert EVALUATIONS.labels("skipped", "sampled_out").value == 1
+
+    middleware.evaluator.release.set()
+    assert middleware.queue.flush(5)
+    (log,) = tmp_path.glob("maestro_evals_*.jsonl")
+    (record,) = [json.loads(line) for line in log.read_text().splitlines()]
+    assert record["agent_name"] == "writer"
+    assert record["workflow"] == "wf"
+    assert record["watsonx_scores"] == {"answer_relevance_score": 0.5}
+    assert record["metrics"]["metrics"] == {}
+    assert record["metrics"]["status"] == "success"
+
+
+def test_batch_results_are_tabulated_per_interaction(middleware):
+    middleware.evaluator.release.set()
+    jobs = [EvaluationJob("writer", f"q{i}", f"a{i}") for i in range(3)]
+    results = middleware.evaluate_batch(jobs)
+    assert [result["prompt"] for result in results] == ["q0", "q1", "q2"]
+    assert middleware.evaluator.runs == 3
+    assert EVALUATIONS.labels("writer", "evaluated").value >= 3
+
+
+def test_evaluation_disabled(monkeypatch):
+    monkeypatch.setenv("MAESTRO_AUTO_EVALUATION", "false")
+    assert not SimpleEvaluationMiddleware().submit("writer", "q", "a")
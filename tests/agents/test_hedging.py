@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+
+import pytest
+
+from maestro.agents import hedging
+from maestro.agents.hedging import RequestPolicy, Target, run_with_policy
+from maestro.metrics import HEDGE_EXTRA_TOKENS, HEDGE_REQUESTS
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+def make_call(latencies, errors=None, calls=None):
+    """A request function with a latency and optional error per target."""
+    errors = errors or {}
+    calls = calls if calls is not None else []
+
+    async def call(target):
+        name = target.model or "primary"
+        calls.append(name)
+        try:
+            await asyncio.sleep(latencies[name])
+        except asyncio.CancelledError:
+            calls.append(f"{name} cancelled")
+            raise
+        if name in errors:
+            raise errors[name]
+        return name
+
+    return call
+
+
+def counts(agent):
+    return {
+        result: HEDGE_REQUESTS.labels(agent, result).value
+        for result in ("request", "sent", "primary_won", "hedge_won", "fallback")
+    }
+
+
+@pytest.fixture(autouse=True)
+def latencies(monkeypatch):
+    monkeypatch.setattr(hedging, "LATENCIES", hedging.LatencyTracker())
+
+
+def test_policy_from_model_parameters():
+    assert RequestPolicy.from_params(None) is None
+    assert RequestPolicy.from_params({"temperature": 0.1}) is None
+
+    policy = RequestPolicy.from_params(
+        {
+            "hedge": {"delay_ms": 250, "model": "small"},
+            "fallback": {"url": "http://backup", "timeout_s": 5},
+        }
+    )
+    assert policy.hedge_delay == 0.25
+    assert policy.hedge.model == "small" and policy.hedge.url is None
+    assert policy.fallback.url == "http://backup"
+    assert policy.timeout == 5
+
+    with pytest.raises(ValueError):
+        RequestPolicy.from_params({"hedge": {"model": "small"}})
+
+
+def test_fast_primary_is_not_hedged():
+    calls = []
+    policy = RequestPolicy(hedge_delay=0.5, hedge=Target("hedge"))
+    call = make_call({"primary": 0.01, "hedge": 0.01}, calls=calls)
+    result = asyncio.run(run_with_policy(policy, call, "fast"))
+    assert result == "primary"
+    assert calls == ["primary"]
+    assert counts("fast")["sent"] == 0
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    calls = []
+    policy = RequestPolicy(hedge_delay=0.02, hedge=Target("hedge"))
+    call = make_call({"primary": 5, "hedge": 0.01}, calls=calls)
+    result = asyncio.run(run_with_policy(policy, call, "slow", estimated_tokens=42))
+    assert result == "hedge"
+    assert calls == ["primary", "hedge", "primary cancelled"]
+    assert counts("slow") == {
+        "request": 1,
+        "sent": 1,
+        "primary_won": 0,
+        "hedge_won": 1,
+        "fallback": 0,
+    }
+    assert HEDGE_EXTRA_TOKENS.labels("slow").value == 42
+
+
+def test_hedge_delay_follows_observed_latency():
+    policy = RequestPolicy(hedge_percentile=90, hedge_delay=10, hedge=Target())
+    key = ("agent", "model", "url")
+    assert policy.delay(key) == 10
+    for i in range(1, 101):
+        hedging.LATENCIES.record(key, i / 100)
+    assert policy.delay(key) == pytest.approx(0.9)
+    assert RequestPolicy(hedge_delay=1).delay(key) is None
+
+
+def test_failover_on_server_error():
+    calls = []
+    policy = RequestPolicy(fallback=Target("backup"))
+    call = make_call(
+        {"primary": 0, "backup": 0}, errors={"primary": ServerError()}, calls=calls
+    )
+    assert asyncio.run(run_with_policy(policy, call, "failover")) == "backup"
+    assert calls == ["primary", "backup"]
+    assert counts("failover")["fallback"] == 1
+
+
+def test_failover_on_timeout():
+    policy = RequestPolicy(fallback=Target("backup"), timeout=0.02)
+    call = make_call({"primary": 5, "backup": 0})
+    assert asyncio.run(run_with_policy(policy, call, "timeout")) == "backup"
+
+
+def test_client_errors_are_not_retried():
+    class BadRequest(Exception):
+        status_code = 400
+
+    policy = RequestPolicy(fallback=Target("backup"))
+    call = make_call({"primary": 0, "backup": 0}, errors={"primary": BadRequest()})
+    with pytest.raises(BadRequest):
+        asyncio.run(run_with_policy(policy, call, "client-error"))
+
+
+def test_tool_requests_are_not_hedged():
+    calls = []
+    policy = RequestPolicy(hedge_delay=0, hedge=Target("hedge"))
+    call = make_call({"primary": 0.02, "hedge": 0}, calls=calls)
+    result = asyncio.run(run_with_policy(policy, call, "tools", hedge=False))
+    assert result == "primary"
+    assert calls == ["primary"]
+
+
+def test_rate_limit_waits_are_not_timed():
+    calls = []
+    policy = RequestPolicy(
+        hedge_delay=0.05, hedge=Target("hedge"), fallback=Target("backup"), timeout=0.05
+    )
+
+    async def acquire(target):
+        await asyncio.sleep(0.1)
+        return f"{target.model or 'primary'} permit"
+
+    async def call(target, permit):
+        calls.append(permit)
+        await asyncio.sleep(0.01)
+        return "done"
+
+    result = asyncio.run(run_with_policy(policy, call, "limited", acquire=acquire))
+    assert result == "done"
+    assert calls == ["primary permit"]
+    assert counts("limited") == {
+        "request": 1,
+        "sent": 0,
+        "primary_won": 0,
+        "hedge_won": 0,
+        "fallback": 0,
+    }
+    latency = hedging.LATENCIES._latencies[("limited", None, None)][0]
+    assert latency < 0.1
+
+
+def test_without_policy():
+    call = make_call({"primary": 0})
+    assert asyncio.run(run_with_policy(None, call, "none")) == "primary"
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+
+import pytest
+from agents import OpenAIChatCompletionsModel, OpenAIResponsesModel
+
+from maestro.agents import openai_clients
+from maestro.agents.hedging import PRIMARY, Target
+from maestro.agents.openai_agent import OPENAI_DEFAULT_URL, OpenAIAgent
+from maestro.agents.openai_clients import get_openai_client
+
+
+@pytest.fixture(autouse=True)
+def clients():
+    openai_clients.clear_openai_clients()
+    yield
+    openai_clients.clear_openai_clients()
+
+
+def test_clients_are_shared_per_endpoint_key_and_headers():
+    async def lookup():
+        first = get_openai_client("http://llm/v1", "key")
+        assert get_openai_client("http://llm/v1", "key") is first
+        assert get_openai_client("http://llm/v1", "other") is not first
+        assert get_openai_client("http://other/v1", "key") is not first
+        with_headers = get_openai_client("http://llm/v1", "key", {"X-Team": "a"})
+        assert with_headers is not first
+        assert with_headers is get_openai_client(
+            "http://llm/v1", "key", {"X-Team": "a"}
+        )
+        assert with_headers.default_headers["X-Team"] == "a"
+        return first
+
+    # Connections cannot be shared between event loops
+    assert asyncio.run(lookup()) is not asyncio.run(lookup())
+
+
+def test_pool_settings(monkeypatch):
+    monkeypatch.setenv("MAESTRO_OPENAI_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("MAESTRO_OPENAI_MAX_KEEPALIVE", "3")
+    limits = openai_clients.pool_limits()
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 3
+
+    monkeypatch.setenv("MAESTRO_OPENAI_HTTP2", "false")
+    assert not openai_clients.http2_enabled()
+
+
+def test_agents_pass_shared_clients_to_models():
+    # Agent construction configures logfire; only the model selection is tested
+    agent = object.__new__(OpenAIAgent)
+    agent.model_name = "granite"
+    agent.base_url = "http://llm/v1"
+    agent.api_key = "key"
+    agent.extra_headers = None
+    agent.use_litellm = False
+
+    async def models():
+        primary = agent._model_for(PRIMARY)
+        assert isinstance(primary, OpenAIChatCompletionsModel)
+        assert primary._client is agent.client
+        alternate = agent._model_for(Target("gpt-4o", OPENAI_DEFAULT_URL))
+        assert isinstance(alternate, OpenAIResponsesModel)
+        assert alternate._client is get_openai_client(OPENAI_DEFAULT_URL, "key")
+
+    asyncio.run(models())
@@ -3,12 +3,16 @@
 
 import asyncio
 import json
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
 from fastmcp.client.client import CallToolResult
 from mcp.types import TextContent
 
-from maestro.agents.query_agent import QueryAgent
+from maestro.agents import query_agent
+from maestro.agents.query_agent import RESULT_CACHE, QueryAgent, ResultCache
+from maestro.loop_pools import close_loop_pools
 
 db_data = [
     {
@@ -68,6 +72,39 @@ class MockClient:
         )
 
 
+class CountingClient(MockClient):
+    connections = 0
+    closed = 0
+    calls = []
+    failures = 0
+
+    def __init__(self, url, timeout):
+        CountingClient.connections += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        CountingClient.closed += 1
+
+    async def call_tool(self, tool, params):
+        if CountingClient.failures:
+            CountingClient.failures -= 1
+            raise ConnectionError("connection closed")
+        CountingClient.calls.append(params["input"]["query"])
+        await asyncio.sleep(0)
+        # Only the data of the result is read
+        return SimpleNamespace(data=json.dumps(db_data))
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    RESULT_CACHE.clear()
+    CountingClient.connections = 0
+    CountingClient.closed = 0
+    CountingClient.calls = []
+    CountingClient.failures = 0
+    yield
+    RESULT_CACHE.clear()
+
+
 @patch("maestro.agents.query_agent.Client", MockClient)
 def test_query_agent():
     agent = QueryAgent(agent_def)
@@ -96,3 +133,75 @@ Question: {{prompt}}
     assert "DocTest2" in result
     assert "3rdDoc" in result
     assert "test prompt" in result
+
+
+@patch("maestro.agents.query_agent.Client", CountingClient)
+def test_query_agent_reuses_client_and_caches_results():
+    agent = QueryAgent(agent_def)
+
+    async def queries():
+        first = await agent.run("a")
+        assert await agent.run("a") == first
+        await asyncio.gather(agent.run("b"), agent.run("b"))
+
+    asyncio.run(queries())
+    assert CountingClient.connections == 1
+    assert CountingClient.calls == ["a", "b"]
+
+
+@patch("maestro.agents.query_agent.Client", CountingClient)
+def test_query_agent_batches_searches():
+    agent = QueryAgent(agent_def)
+
+    async def batch():
+        results = await agent.search_batch(["a", "b", "a"])
+        assert [len(docs) for docs in results] == [3, 3, 3]
+        await agent.run("b")
+
+    asyncio.run(batch())
+    assert CountingClient.connections == 1
+    assert sorted(CountingClient.calls) == ["a", "b"]
+
+
+@patch("maestro.agents.query_agent.Client", CountingClient)
+def test_query_agent_reconnects_once():
+    agent = QueryAgent(agent_def)
+    CountingClient.failures = 1
+    assert "TestDoc1" in asyncio.run(agent.run("a"))
+    assert CountingClient.connections == 2
+
+    CountingClient.failures = 2
+    with pytest.raises(ConnectionError):
+        asyncio.run(agent.run("b"))
+
+
+@patch("maestro.agents.query_agent.Client", CountingClient)
+def test_closing_loop_pools_closes_clients():
+    agent = QueryAgent(agent_def)
+
+    async def queries():
+        await agent.run("a")
+        await close_loop_pools()
+        assert CountingClient.closed == 1
+        await agent.run("b")
+        await close_loop_pools()
+
+    asyncio.run(queries())
+    assert CountingClient.connections == 2
+    assert CountingClient.closed == 2
+
+
+def test_result_cache_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(query_agent.time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_size=1)
+    cache.put("a", db_data, ttl=10)
+    assert cache.get("a") is db_data
+    now[0] += 11
+    assert cache.get("a") is None
+
+    cache.put("a", db_data, ttl=10)
+    cache.put("b", db_data, ttl=10)
+    assert len(cache) == 1
+    cache.put("c", db_data, ttl=0)
+    assert cache.get("c") is None
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import threading
 import pytest
 import litellm
 
@@ -65,3 +66,110 @@ def test_metrics_agent_run_with_context(monkeypatch):
 
     assert len(printed) == 1
     assert printed[0] == "Lyon\n[relevance: 0.50, hallucination: 0.20]"
+
+
+def _agent():
+    return ScoringAgent(
+        {
+            "metadata": {"name": "metrics_agent", "labels": {}},
+            "spec": {
+                "framework": "custom",
+                "model": "qwen3:latest",
+                "description": "desc",
+                "instructions": "instr",
+            },
+        }
+    )
+
+
+def test_metrics_are_scored_concurrently_and_memoized(monkeypatch):
+    calls = []
+    both_started = threading.Barrier(2, timeout=5)
+
+    class DummyScore:
+        def __init__(self, value):
+            self.value = value
+            self.reason = ["a", "b"]
+
+    def scorer(name, value):
+        def score(self, input, output, context):
+            calls.append((name, output))
+            # Fails unless relevance and hallucination run at the same time
+            both_started.wait()
+            return DummyScore(value)
+
+        return score
+
+    monkeypatch.setattr(AnswerRelevance, "score", scorer("relevance", 0.9))
+    monkeypatch.setattr(Hallucination, "score", scorer("hallucination", 0.1))
+    monkeypatch.setattr(ScoringAgent, "print", lambda self, msg: None)
+    agent = _agent()
+
+    first = asyncio.run(agent.run("q", "a"))
+    second = asyncio.run(agent.run("q", "a"))
+    assert first == second
+    assert first["scoring_metrics"]["relevance_reason"] == "a, b"
+    assert sorted(calls) == [("hallucination", "a"), ("relevance", "a")]
+    metrics = agent._get_metrics()
+    assert agent._get_metrics() is metrics
+
+
+def test_score_batch_reuses_judges(monkeypatch):
+    created = []
+    calls = []
+
+    class DummyScore:
+        value = 0.5
+        reason = ""
+
+    def init(self, model, **kwargs):
+        created.append(type(self).__name__)
+
+    def score(self, input, output, context):
+        calls.append(output)
+        return DummyScore()
+
+    for metric in (AnswerRelevance, Hallucination):
+        monkeypatch.setattr(metric, "__init__", init)
+        monkeypatch.setattr(metric, "score", score)
+    agent = _agent()
+
+    results = asyncio.run(
+        agent.score_batch([("q", "a", None), ("q", "b", ["ctx"]), ("q", "a", None)])
+    )
+    assert [r["relevance"] for r in results] == [0.5, 0.5, 0.5]
+    assert sorted(created) == ["AnswerRelevance", "Hallucination"]
+    # The repeated triple is scored once by each judge
+    assert sorted(calls) == ["a", "a", "b", "b"]
+
+
+def test_waiters_score_when_the_first_request_is_cancelled(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    class DummyScore:
+        value = 0.5
+        reason = ""
+
+    def score(self, input, output, context):
+        calls.append(output)
+        release.wait(5)
+        return DummyScore()
+
+    monkeypatch.setattr(AnswerRelevance, "score", score)
+    monkeypatch.setattr(Hallucination, "score", score)
+    monkeypatch.setattr(ScoringAgent, "print", lambda self, msg: None)
+    agent = _agent()
+
+    async def main():
+        first = asyncio.create_task(agent.run("q", "a"))
+        while not calls:
+            await asyncio.sleep(0.01)
+        second = asyncio.create_task(agent.run("q", "a"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        release.set()
+        return await second
+
+    result = asyncio.run(main())
+    assert result["scoring_metrics"]["relevance"] == 0.5
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import copy
+from types import SimpleNamespace
+
+from agents.stream_events import (
+    AgentUpdatedStreamEvent,
+    RawResponsesStreamEvent,
+    RunItemStreamEvent,
+)
+from openai.types.responses import (
+    ResponseCompletedEvent,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+
+from maestro import bench, logging_hooks, workflow as workflow_module
+from maestro.agents import stream_events
+from maestro.agents.mock_agent import MockAgent
+from maestro.file_logger import FileLogger
+from maestro.workflow import Workflow
+
+
+async def _sdk_stream():
+    for delta in ("Hel", "lo"):
+        yield RawResponsesStreamEvent(
+            data=ResponseTextDeltaEvent.model_construct(
+                type="response.output_text.delta", delta=delta
+            )
+        )
+    call = SimpleNamespace(call_id="c1", name="weather", arguments='{"city": "x"}')
+    yield RunItemStreamEvent(name="tool_called", item=SimpleNamespace(raw_item=call))
+    yield RunItemStreamEvent(
+        name="tool_output",
+        item=SimpleNamespace(raw_item={"call_id": "c1"}, output="sunny"),
+    )
+    yield AgentUpdatedStreamEvent(new_agent=SimpleNamespace(name="helper"))
+    usage = ResponseUsage.model_construct(
+        input_tokens=5, output_tokens=2, total_tokens=7
+    )
+    yield RawResponsesStreamEvent(
+        data=ResponseCompletedEvent.model_construct(
+            type="response.completed",
+            response=SimpleNamespace(usage=usage),
+        )
+    )
+
+
+def test_adapt_sdk_stream():
+    async def collect():
+        return [event async for event in stream_events.adapt(_sdk_stream(), "a")]
+
+    collected = asyncio.run(collect())
+    assert [event.type for event in collected] == [
+        "text_delta",
+        "text_delta",
+        "tool_call_started",
+        "tool_call_finished",
+        "agent_switched",
+        "usage",
+    ]
+    assert collected[2].to_dict() == {
+        "type": "tool_call_started",
+        "agent": "a",
+        "call_id": "c1",
+        "name": "weather",
+        "arguments": '{"city": "x"}',
+    }
+    assert collected[3].output == "sunny"
+    assert collected[4].new_agent == "helper"
+    assert collected[5].total_tokens == 7
+
+
+class StreamingAgent(MockAgent):
+    async def run(self, prompt, context=None, step_index=None):
+        for word in ("streamed", "answer"):
+            stream_events.publish(stream_events.TextDelta(self.agent_name, word))
+        return await super().run(prompt, context=context, step_index=step_index)
+
+
+def test_workflow_streams_agent_events(monkeypatch, tmp_path):
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: StreamingAgent)
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    agents, definition, _ = bench.generate_workflow("linear", 2)
+    workflow = Workflow(copy.deepcopy(agents), copy.deepcopy(definition))
+
+    async def stream():
+        return [step async for step in workflow.run_streaming()]
+
+    steps = asyncio.run(stream())
+    deltas = [
+        (step["step_name"], step["stream_event"]["text"])
+        for step in steps
+        if "stream_event" in step
+    ]
+    assert deltas == [
+        ("step1", "streamed"),
+        ("step1", "answer"),
+        ("step2", "streamed"),
+        ("step2", "answer"),
+    ]
+    assert [step.get("step_name") for step in steps if "step_result" in step] == [
+        "step1",
+        "step2",
+    ]
+
+    # Outside of a streamed workflow events have no consumer
+    stream_events.publish(stream_events.TextDelta("a", "ignored"))
@@ -9,7 +9,9 @@ from unittest import TestCase, mock
 from importlib.resources import files
 
 import pytest
+from docopt import docopt
 
+from maestro.cli import run_maestro
 from maestro.cli.commands import CLI
 
 
@@ -387,5 +389,25 @@ class MetaAgentsCommandTest(TestCommand):
             self.fail(f"Exception running command: {str(e)}")
 
 
+@pytest.mark.parametrize(
+    ("argv", "option", "expected"),
+    [
+        (["run", "w.yaml"], "concurrency", 4),
+        (["run", "w.yaml", "--concurrency", "8"], "concurrency", 8),
+        (["serve", "a.yaml", "--workers", "2"], "workers", 2),
+        (["serve", "a.yaml"], "workers", 1),
+        (["validate", "w.yaml", "--workers", "0"], "workers", "number of workers"),
+        (["bench", "--size", "x"], "size", "size"),
+    ],
+)
+def test_positive_int_options(argv, option, expected):
+    command = CLI(docopt(run_maestro.__doc__, argv=argv)).command()
+    if isinstance(expected, int):
+        assert getattr(command, option)() == expected
+    else:
+        with pytest.raises(ValueError, match=f"Invalid {expected}: "):
+            getattr(command, option)()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import os
+import shutil
+import tempfile
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from maestro import events
+from maestro.checkpoint import FileCheckpointStore
+from maestro.cli.fastapi_serve import (
+    FastAPIWorkflowServer,
+    create_workflow_app,
+    validate_workflow_definitions,
+    SERVE_AGENTS_FILE_ENV,
+    SERVE_WORKFLOW_FILE_ENV,
+    SERVE_RELOAD_ENV,
+)
+
+YAMLS_DIR = os.path.join(os.path.dirname(__file__), "..", "yamls")
+AGENTS_FILE = os.path.join(YAMLS_DIR, "agents", "simple_agent.yaml")
+WORKFLOW_FILE = os.path.join(YAMLS_DIR, "workflows", "simple_workflow.yaml")
+
+
+@pytest.fixture
+def dry_run(monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+
+
+@pytest.fixture
+def workflow_copy():
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, "workflow.yaml")
+    shutil.copy(WORKFLOW_FILE, path)
+    yield path
+    shutil.rmtree(tmp_dir)
+
+
+def test_validate_workflow_definitions():
+    agents_yaml, workflow_yaml = validate_workflow_definitions(
+        AGENTS_FILE, WORKFLOW_FILE
+    )
+    assert len(agents_yaml) == 5
+    assert workflow_yaml[0]["metadata"]["name"] == "simple workflow"
+
+
+def test_validate_workflow_definitions_undefined_agent(workflow_copy):
+    with open(workflow_copy) as f:
+        workflow = yaml.safe_load(f)
+    workflow["spec"]["template"]["steps"][0]["agent"] = "missing"
+    with open(workflow_copy, "w") as f:
+        yaml.safe_dump(workflow, f)
+
+    with pytest.raises(RuntimeError, match="undefined agent 'missing'"):
+        validate_workflow_definitions(AGENTS_FILE, workflow_copy)
+
+
+def test_workflow_server_reload(dry_run, workflow_copy):
+    server = FastAPIWorkflowServer(AGENTS_FILE, workflow_copy, reload=True)
+    client = TestClient(server.app)
+    assert client.get("/diagram").json()["workflow_name"] == "simple workflow"
+
+    with open(workflow_copy) as f:
+        workflow = yaml.safe_load(f)
+    workflow["metadata"]["name"] = "reloaded workflow"
+    with open(workflow_copy, "w") as f:
+        yaml.safe_dump(workflow, f)
+
+    assert client.get("/diagram").json()["workflow_name"] == "reloaded workflow"
+
+
+def test_workflow_server_reload_keeps_previous_on_error(dry_run, workflow_copy):
+    server = FastAPIWorkflowServer(AGENTS_FILE, workflow_copy, reload=True)
+    client = TestClient(server.app)
+
+    with open(workflow_copy, "w") as f:
+        f.write("metadata: [unbalanced")
+
+    response = client.get("/diagram")
+    assert response.status_code == 200
+    assert response.json()["workflow_name"] == "simple workflow"
+
+
+def test_create_workflow_app(dry_run, monkeypatch):
+    monkeypatch.setenv(SERVE_AGENTS_FILE_ENV, AGENTS_FILE)
+    monkeypatch.setenv(SERVE_WORKFLOW_FILE_ENV, WORKFLOW_FILE)
+    monkeypatch.setenv(SERVE_RELOAD_ENV, "false")
+    client = TestClient(create_workflow_app())
+    assert client.get("/health").json()["workflow_name"] == "simple workflow"
+
+
+def test_diagram_etag(dry_run):
+    client = TestClient(FastAPIWorkflowServer(AGENTS_FILE, WORKFLOW_FILE).app)
+    response = client.get("/diagram")
+    etag = response.headers["etag"]
+    assert response.json()["diagram"].startswith("sequenceDiagram")
+
+    cached = client.get("/diagram", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert (
+        client.get("/diagram", headers={"If-None-Match": '"other"'}).status_code == 200
+    )
+
+
+class CaptureSink(events.Sink):
+    def __init__(self):
+        super().__init__(events.DEBUG)
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+def test_event_streams_and_run_ids(dry_run):
+    sinks = list(events.BUS.sinks)
+    server = FastAPIWorkflowServer(AGENTS_FILE, WORKFLOW_FILE)
+    FastAPIWorkflowServer(AGENTS_FILE, WORKFLOW_FILE)
+    assert events.BUS.sinks == sinks
+
+    # The queue sink is on the bus only while /events is streamed
+    async def subscribe():
+        with server._subscribe_events(workflow_id="run-1"):
+            with server._subscribe_events():
+                assert events.BUS.sinks == sinks + [server._events]
+            assert events.BUS.sinks == sinks + [server._events]
+
+    asyncio.run(subscribe())
+    assert events.BUS.sinks == sinks
+
+    # Runs of the shared workflow carry the id of their request
+    capture = events.BUS.add_sink(CaptureSink())
+    try:
+        client = TestClient(server.app)
+        response = client.post("/chat", json={"prompt": "hi", "workflow_id": "run-1"})
+        assert response.json()["workflow_id"] == "run-1"
+        assert client.post("/chat", json={"prompt": "hi"}).json()["workflow_id"]
+    finally:
+        events.BUS.remove_sink(capture)
+    ids = [event.fields.get("workflow_id") for event in capture.events]
+    assert "run-1" in ids
+    assert None not in ids
+
+
+def test_client_workflow_ids_are_checked(dry_run, tmp_path):
+    server = FastAPIWorkflowServer(
+        AGENTS_FILE, WORKFLOW_FILE, checkpoint_store=FileCheckpointStore(tmp_path)
+    )
+    client = TestClient(server.app)
+    for path in ("/chat", "/chat/stream"):
+        response = client.post(path, json={"prompt": "hi", "workflow_id": "../x"})
+        assert response.status_code == 400
+
+    assert client.post(
+        "/chat", json={"prompt": "hi", "workflow_id": "run-1"}
+    ).is_success
+    # A run with a checkpoint is resumed, not started again
+    response = client.post("/chat", json={"prompt": "hi", "workflow_id": "run-1"})
+    assert response.status_code == 409
+    assert "/resume/run-1" in response.json()["detail"]
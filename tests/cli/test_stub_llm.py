@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import time
+
+import openai
+import pytest
+from docopt import docopt
+
+from maestro.cli import run_maestro
+from maestro.cli.commands import CLI
+from maestro.cli.stub_llm import StubLLMConfig
+
+MESSAGES = [
+    {"role": "system", "content": "You are terse"},
+    {"role": "user", "content": "hello stub server"},
+]
+
+
+def _client(server):
+    return openai.OpenAI(base_url=server.base_url, api_key="stub", max_retries=0)
+
+
+def test_chat_completions(stub_llm):
+    client = _client(stub_llm)
+    completion = client.chat.completions.create(model="m", messages=MESSAGES)
+    assert completion.choices[0].message.content == "hello stub server"
+    assert completion.usage.prompt_tokens == 6
+    assert completion.usage.completion_tokens == 3
+
+    stream = client.chat.completions.create(
+        model="m",
+        messages=MESSAGES,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    deltas, usage = [], None
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            deltas.append(chunk.choices[0].delta.content)
+        usage = chunk.usage or usage
+    assert deltas == ["hello ", "stub ", "server"]
+    assert usage.total_tokens == 9
+
+
+@pytest.mark.parametrize("stub_llm", [{"response": "canned answer"}], indirect=True)
+def test_responses_api(stub_llm):
+    client = _client(stub_llm)
+    response = client.responses.create(model="m", input="ping", instructions="be brief")
+    assert response.output_text == "canned answer"
+    assert response.usage.input_tokens == 3
+    assert response.usage.output_tokens == 2
+
+    events = list(client.responses.create(model="m", input="ping", stream=True))
+    deltas = [e.delta for e in events if e.type == "response.output_text.delta"]
+    assert deltas == ["canned ", "answer"]
+    assert events[-1].type == "response.completed"
+    assert events[-1].response.usage.total_tokens == 3
+    assert stub_llm.requests == 2
+
+
+@pytest.mark.parametrize(
+    "stub_llm", [{"latency_ms": 50, "tokens_per_second": 100}], indirect=True
+)
+def test_latency_and_token_rate(stub_llm):
+    start = time.perf_counter()
+    stream = _client(stub_llm).chat.completions.create(
+        model="m", messages=MESSAGES, stream=True
+    )
+    first = None
+    for chunk in stream:
+        if first is None and chunk.choices and chunk.choices[0].delta.content:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    assert first >= 0.05
+    assert total >= 0.05 + 0.03
+
+
+@pytest.mark.parametrize(
+    "stub_llm", [{"error_rate": 1.0, "error_status": 429}], indirect=True
+)
+def test_error_injection(stub_llm):
+    with pytest.raises(openai.RateLimitError):
+        _client(stub_llm).chat.completions.create(model="m", messages=MESSAGES)
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        StubLLMConfig(distribution="bimodal")
+    with pytest.raises(ValueError):
+        StubLLMConfig(error_rate=2)
+    config = StubLLMConfig(latency_ms=10, jitter_ms=5, distribution="uniform", seed=1)
+    assert all(0.005 <= config.sample_latency() <= 0.015 for _ in range(100))
+
+
+def test_stub_llm_command_config():
+    args = docopt(
+        run_maestro.__doc__,
+        argv=["stub-llm", "--latency", "20", "--token-rate", "50", "--response", "ok"],
+    )
+    command = CLI(args).command()
+    config = command.config()
+    assert (config.latency_ms, config.tokens_per_second) == (20, 50)
+    assert config.response == "ok"
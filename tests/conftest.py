@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import pytest
+
+from maestro.cli.stub_llm import StubLLMConfig, run_stub_server
+
+
+@pytest.fixture
+def stub_llm(request):
+    """A stub OpenAI compatible model server, configured by indirect params.
+
+    Use `@pytest.mark.parametrize("stub_llm", [{...}], indirect=True)` to pass
+    StubLLMConfig arguments; the fixture value exposes `base_url`.
+    """
+    config = StubLLMConfig(**getattr(request, "param", {}))
+    with run_stub_server(config) as server:
+        yield server
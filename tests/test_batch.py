@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import json
+import os
+
+import pytest
+import yaml
+
+from maestro import logging_hooks
+from maestro.batch import BatchRunner, load_batch_inputs, summarize
+from maestro.file_logger import FileLogger
+from maestro.agents.mock_agent import MockAgent
+
+YAMLS_DIR = os.path.join(os.path.dirname(__file__), "yamls")
+
+
+def _definitions():
+    with open(os.path.join(YAMLS_DIR, "agents", "simple_agent.yaml")) as f:
+        agents_yaml = list(yaml.safe_load_all(f))
+    with open(os.path.join(YAMLS_DIR, "workflows", "simple_workflow.yaml")) as f:
+        workflow_yaml = list(yaml.safe_load_all(f))
+    return agents_yaml, workflow_yaml[0]
+
+
+def _read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_load_batch_inputs(tmp_path):
+    jsonl = tmp_path / "inputs.jsonl"
+    jsonl.write_text(
+        '{"id": "a", "prompt": "first"}\n\n"second"\n{"prompt": "third"}\n'
+    )
+    assert load_batch_inputs(jsonl) == [("a", "first"), ("2", "second"), ("3", "third")]
+
+    csv_file = tmp_path / "inputs.csv"
+    csv_file.write_text("id,prompt\nx,hello\ny,world\n")
+    assert load_batch_inputs(csv_file) == [("x", "hello"), ("y", "world")]
+
+    # Without a prompt column the id is not taken for the prompt
+    csv_file.write_text("id,question\nx,hello\n")
+    assert load_batch_inputs(csv_file) == [("x", "hello")]
+    csv_file.write_text("id\nx\n")
+    with pytest.raises(ValueError, match="no prompt column"):
+        load_batch_inputs(csv_file)
+
+    duplicate = tmp_path / "duplicate.jsonl"
+    duplicate.write_text('{"id": 1, "prompt": "a"}\n{"id": 1, "prompt": "b"}\n')
+    with pytest.raises(ValueError, match="unique"):
+        load_batch_inputs(duplicate)
+
+
+def test_batch_run_shares_agents_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    created = []
+    original_init = MockAgent.__init__
+
+    def init(self, agent):
+        created.append(agent["metadata"]["name"])
+        original_init(self, agent)
+
+    monkeypatch.setattr(MockAgent, "__init__", init)
+
+    agents_yaml, workflow_yaml = _definitions()
+    inputs = [(str(i), f"prompt {i}") for i in range(6)]
+    output = tmp_path / "results.jsonl"
+
+    runner = BatchRunner(agents_yaml, workflow_yaml, concurrency=3)
+    summary = asyncio.run(runner.run(inputs[:4], output))
+    assert summary["succeeded"] == 4
+    assert summary["skipped"] == 0
+    assert set(summary["latency_ms"]) >= {"p50", "p95", "p99", "max"}
+    assert sorted(created) == sorted(set(created))
+
+    records = _read_jsonl(output)
+    assert sorted(r["id"] for r in records) == ["0", "1", "2", "3"]
+    assert all(r["status"] == "success" and "step3" in r["steps"] for r in records)
+
+    summary = asyncio.run(
+        BatchRunner(agents_yaml, workflow_yaml, concurrency=3).run(inputs, output)
+    )
+    assert summary["succeeded"] == 2
+    assert summary["skipped"] == 4
+    assert len(_read_jsonl(output)) == 6
+
+
+def test_batch_runs_log_per_input(tmp_path, monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    logger = FileLogger(tmp_path / "logs")
+    monkeypatch.setattr(logging_hooks, "logger", logger)
+    agents_yaml, workflow_yaml = _definitions()
+    runner = BatchRunner(agents_yaml, workflow_yaml, workflow_id="batch", logger=logger)
+    inputs = [("a", "first"), ("b/c", "second")]
+    asyncio.run(runner.run(inputs, tmp_path / "results.jsonl"))
+
+    records = _read_jsonl(tmp_path / "results.jsonl")
+    assert sorted(r["workflow_id"] for r in records) == ["batch-a", "batch-b_c"]
+    logs = sorted(path.name for path in (tmp_path / "logs").iterdir())
+    assert logs == ["maestro_run_batch-a.jsonl", "maestro_run_batch-b_c.jsonl"]
+
+
+def test_summarize():
+    records = [
+        {
+            "status": "success",
+            "duration_ms": ms,
+            "token_usage": {
+                "prompt_tokens": 2,
+                "response_tokens": 3,
+                "total_tokens": 5,
+            },
+        }
+        for ms in range(1, 101)
+    ]
+    records.append({"status": "error", "duration_ms": 1000, "token_usage": {}})
+
+    summary = summarize(records, skipped=3)
+    assert summary["total"] == 104
+    assert summary["failed"] == 1
+    assert summary["latency_ms"]["p50"] == 51
+    assert summary["latency_ms"]["p99"] == 100
+    assert summary["latency_ms"]["max"] == 1000
+    assert summary["token_usage"] == {
+        "prompt_tokens": 200,
+        "response_tokens": 300,
+        "total_tokens": 500,
+    }
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import json
+
+import pytest
+from docopt import docopt
+
+from maestro import logging_hooks
+from maestro.bench import SHAPES, generate_workflow, run_benchmarks
+from maestro.cli import run_maestro
+from maestro.cli.commands import CLI
+from maestro.file_logger import FileLogger
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_generate_workflow(shape):
+    agents, workflow, counts = generate_workflow(shape, 4)
+    steps = workflow["spec"]["template"]["steps"]
+    assert counts["agent_calls"] == 4
+    assert counts["steps"] == len(steps) or shape == "conditional"
+    assert {a["metadata"]["name"] for a in agents} == set(
+        workflow["spec"]["template"]["agents"]
+    )
+    with pytest.raises(ValueError):
+        generate_workflow(shape, 0)
+
+
+def test_run_benchmarks(monkeypatch):
+    from maestro.agents.mock_agent import MockAgent
+
+    calls = []
+    original_run = MockAgent.run
+
+    async def run(self, prompt, context=None, step_index=None):
+        calls.append(self.agent_name)
+        assert self.latency == 0.002
+        return await original_run(self, prompt, context=context, step_index=step_index)
+
+    monkeypatch.setattr(MockAgent, "run", run)
+    report = asyncio.run(
+        run_benchmarks(SHAPES + ("serve",), size=3, iterations=2, latency_ms=2)
+    )
+
+    results = {r["scenario"]: r for r in report["results"]}
+    assert set(results) == set(SHAPES) | {"serve"}
+    # each scenario runs once to warm up, `iterations` times, and once for memory
+    assert len(calls) == len(results) * 4 * 3
+    for result in results.values():
+        assert result["iterations"] == 2
+        assert result["run_ms"]["mean"] >= result["critical_calls"] * 2
+        assert result["overhead_us"]["per_step"] >= 0
+        assert result["throughput"]["runs_per_s"] > 0
+        assert set(result["event_loop_lag_ms"]) == {"mean", "p99", "max"}
+        assert result["memory"]["peak_alloc_kb"] >= 0
+    assert results["parallel"]["run_ms"]["mean"] < results["linear"]["run_ms"]["mean"]
+
+
+def test_bench_command(tmp_path):
+    output = tmp_path / "bench.json"
+    argv = ["bench", "--size", "2", "--iterations", "2", "--silent"]
+    argv += ["--output", str(output)]
+
+    args = docopt(run_maestro.__doc__, argv=argv + ["--scenario", "linear,loop"])
+    assert CLI(args).command().execute() == 0
+    report = json.loads(output.read_text())
+    assert [r["scenario"] for r in report["results"]] == ["linear", "loop"]
+
+    args = docopt(run_maestro.__doc__, argv=argv + ["--scenario", "unknown"])
+    assert CLI(args).command().execute() == 1
+
+
+def test_benchmarks_leave_run_logs_alone(monkeypatch, tmp_path):
+    logger = FileLogger(tmp_path / "logs")
+    monkeypatch.setattr(logging_hooks, "logger", logger)
+    asyncio.run(run_benchmarks(("linear", "serve"), size=2, iterations=2))
+
+    assert list((tmp_path / "logs").iterdir()) == []
+    assert logging_hooks.logger is logger
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import json
+import os
+import time
+
+from maestro import bench, logging_hooks, workflow as workflow_module
+from maestro.agents.mock_agent import MockAgent
+from maestro.blobs import BlobRef, BlobStore, get_blob_store, materialize
+from maestro.file_logger import FileLogger
+from maestro.workflow import Workflow
+
+
+def test_put_and_read(tmp_path):
+    store = BlobStore(tmp_path)
+    text = "héllo wörld " * 1000
+    ref = store.put(text)
+    assert isinstance(ref, BlobRef)
+    assert ref.length == len(text)
+    assert ref.size == len(text.encode("utf-8"))
+    assert str(ref) == text
+    assert ref.preview(5) == "héllo"
+    assert ref.to_dict()["blob"] == f"sha256:{ref.digest}"
+    assert str(store.put("")) == ""
+
+
+def test_identical_texts_are_stored_once(tmp_path):
+    store = BlobStore(tmp_path)
+    first = store.put("same output")
+    second = store.put("same output")
+    assert first == second
+    assert len(list(tmp_path.glob("??/*"))) == 1
+
+
+def test_spill_threshold(tmp_path):
+    store = BlobStore(tmp_path, threshold=10)
+    assert store.spill("short") == "short"
+    assert store.spill({"prompt": "x" * 20}) == {"prompt": "x" * 20}
+    ref = store.spill("x" * 20)
+    assert isinstance(ref, BlobRef)
+    assert materialize(ref) == "x" * 20
+    assert materialize("short") == "short"
+
+
+def test_prune(tmp_path):
+    store = BlobStore(tmp_path)
+    old = store.put("old output")
+    store.put("new output")
+    past = time.time() - 3600
+    os.utime(store._path(old.digest), (past, past))
+    assert store.prune(60) == 1
+    assert not store._path(old.digest).exists()
+    assert len(list(tmp_path.glob("??/*"))) == 1
+
+
+def test_blob_store_from_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv("MAESTRO_BLOB_THRESHOLD", raising=False)
+    assert get_blob_store() is None
+    monkeypatch.setenv("MAESTRO_BLOB_THRESHOLD", "1024")
+    monkeypatch.setenv("MAESTRO_BLOB_DIR", str(tmp_path))
+    store = get_blob_store()
+    assert store.threshold == 1024
+    assert store is get_blob_store()
+
+
+def test_workflow_keeps_large_outputs_as_references(monkeypatch, tmp_path):
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path / "logs"))
+    agents, definition, _ = bench.generate_workflow("linear", 3)
+    store = BlobStore(tmp_path / "blobs", threshold=30)
+    workflow = Workflow(agents, definition, workflow_id="blobs", blob_store=store)
+
+    result = asyncio.run(workflow.run())
+
+    context = workflow.get_context_state()
+    assert all(isinstance(value, BlobRef) for value in context.values())
+    assert result["step3"] == str(context["step3"])
+    assert result["final_prompt"] == result["step3"]
+    assert result["step3"].count("Mock agent: answer for") == 3
+
+    log = tmp_path / "logs" / "maestro_run_blobs.jsonl"
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert records[-1]["response"]["blob"] == f"sha256:{context['step3'].digest}"
+    assert records[-1]["input"]["blob"] == f"sha256:{context['step2'].digest}"
+
+
+def test_agents_get_context_as_text(monkeypatch, tmp_path):
+    seen = []
+
+    class ContextAgent(MockAgent):
+        async def run(self, prompt, context=None, step_index=None):
+            seen.extend(type(value) for value in (context or {}).values())
+            return f"{prompt} " + "x" * 40
+
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: ContextAgent)
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path / "logs"))
+    agents, definition, _ = bench.generate_workflow("linear", 3)
+    store = BlobStore(tmp_path / "blobs", threshold=30)
+    asyncio.run(Workflow(agents, definition, blob_store=store).run())
+    assert seen == [str, str, str]
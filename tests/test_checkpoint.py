@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import os
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from maestro.agents.mock_agent import MockAgent
+from maestro.checkpoint import (
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    get_checkpoint_store,
+)
+from maestro.workflow import Workflow
+
+YAMLS_DIR = os.path.join(os.path.dirname(__file__), "yamls")
+AGENTS_FILE = os.path.join(YAMLS_DIR, "agents", "simple_agent.yaml")
+WORKFLOW_FILE = os.path.join(YAMLS_DIR, "workflows", "simple_workflow.yaml")
+
+
+def _workflow(store, workflow_id=None):
+    with open(AGENTS_FILE) as f:
+        agents_yaml = list(yaml.safe_load_all(f))
+    with open(WORKFLOW_FILE) as f:
+        workflow_yaml = list(yaml.safe_load_all(f))
+    return Workflow(
+        agents_yaml, workflow_yaml[0], workflow_id=workflow_id, checkpoint_store=store
+    )
+
+
+@pytest.fixture
+def agent_calls(monkeypatch):
+    """Record agent runs and fail the first run of agent test2."""
+    monkeypatch.setenv("DRY_RUN", "1")
+    calls = []
+    failed = []
+    original_run = MockAgent.run
+
+    async def run(self, prompt, context=None, step_index=None):
+        calls.append(self.agent_name)
+        if self.agent_name == "test2" and not failed:
+            failed.append(self.agent_name)
+            raise RuntimeError("provider unavailable")
+        return await original_run(self, prompt, context=context, step_index=step_index)
+
+    monkeypatch.setattr(MockAgent, "run", run)
+    return calls
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(tmp_path / "checkpoints")
+    return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+
+
+def test_resume_skips_completed_steps(store, agent_calls):
+    workflow = _workflow(store)
+    asyncio.run(workflow.run())
+    workflow_id = workflow.workflow_id
+
+    checkpoint = store.load(workflow_id)
+    assert checkpoint.status == "failed"
+    assert [s["step_name"] for s in checkpoint.steps] == ["step1"]
+    assert checkpoint.next_step == "step2"
+
+    agent_calls.clear()
+    result = asyncio.run(_workflow(store).resume(workflow_id))
+
+    assert agent_calls == ["test2", "test3"]
+    assert set(result) >= {"step1", "step2", "step3", "final_prompt"}
+    checkpoint = store.load(workflow_id)
+    assert checkpoint.status == "completed"
+    assert [s["step_index"] for s in checkpoint.steps] == [0, 1, 2]
+    assert checkpoint.next_step is None
+
+
+def test_resume_completed_run_returns_results(store, monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    workflow = _workflow(store, workflow_id="run-1")
+    first = asyncio.run(workflow.run())
+
+    calls = []
+    monkeypatch.setattr(MockAgent, "run", lambda *args, **kwargs: calls.append(1))
+    assert asyncio.run(_workflow(store).resume("run-1")) == first
+    assert calls == []
+
+
+def test_resume_unknown_run(store):
+    with pytest.raises(ValueError, match="No checkpoint found"):
+        asyncio.run(_workflow(store).resume("missing"))
+
+
+def test_file_store_ignores_torn_last_line(tmp_path):
+    store = FileCheckpointStore(tmp_path)
+    store.start_run("run-1", "wf", "hello")
+    store.save_step(
+        "run-1",
+        {
+            "step_index": 0,
+            "step_name": "a",
+            "output": "x",
+            "next_step": "b",
+            "visit": 1,
+        },
+    )
+    with open(tmp_path / "run-1.jsonl", "a") as f:
+        f.write('{"type": "step", "step_in')
+
+    checkpoint = store.load("run-1")
+    assert checkpoint.prompt == "hello"
+    assert checkpoint.step_results == {"a": "x"}
+    assert checkpoint.next_step == "b"
+
+
+def test_get_checkpoint_store(tmp_path, monkeypatch):
+    assert isinstance(get_checkpoint_store(tmp_path / "cp"), FileCheckpointStore)
+    monkeypatch.setenv("MAESTRO_CHECKPOINT_STORE", str(tmp_path / "cp.sqlite"))
+    assert isinstance(get_checkpoint_store(), SQLiteCheckpointStore)
+
+
+def test_serve_resume_endpoint(tmp_path, agent_calls):
+    from maestro.cli.fastapi_serve import FastAPIWorkflowServer
+
+    server = FastAPIWorkflowServer(
+        AGENTS_FILE,
+        WORKFLOW_FILE,
+        checkpoint_store=FileCheckpointStore(tmp_path),
+    )
+    client = TestClient(server.app)
+
+    response = client.post("/chat", json={"prompt": "hello"})
+    assert response.status_code == 200
+    workflow_id = response.json()["workflow_id"]
+    assert client.get(f"/checkpoints/{workflow_id}").json()["next_step"] == "step2"
+
+    response = client.post(f"/resume/{workflow_id}")
+    assert response.status_code == 200
+    assert response.json()["workflow_id"] == workflow_id
+    assert client.get(f"/checkpoints/{workflow_id}").json()["status"] == "completed"
+    assert client.post("/resume/unknown").status_code == 404
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from maestro import events
+from maestro.agents.mock_agent import MockAgent
+
+
+@pytest.fixture
+def bus():
+    bus = events.EventBus()
+    stream = io.StringIO()
+    bus.add_sink(events.ConsoleSink(events.INFO, stream))
+    return bus, stream
+
+
+def test_disabled_levels_are_not_formatted(bus):
+    bus, stream = bus
+    calls = []
+
+    def message():
+        calls.append(1)
+        return "expensive"
+
+    bus.debug("test.debug", message)
+    bus.debug("test.debug", "%s", object())
+    assert calls == []
+    assert stream.getvalue() == ""
+
+    bus.info("test.info", message)
+    bus.warning("test.warning", "value=%d", 3)
+    assert calls == [1]
+    assert stream.getvalue() == "expensive\nvalue=3\n"
+
+
+def test_messages_with_percent_signs(bus):
+    bus, stream = bus
+    bus.info("test.info", "100% done")
+    bus.info("test.info", ValueError("50% failed"))
+    assert stream.getvalue() == "100% done\n50% failed\n"
+
+
+def test_set_level_shows_debug_events(bus):
+    bus, stream = bus
+    assert not bus.enabled(events.DEBUG)
+    bus.set_level("debug")
+    assert bus.enabled(events.DEBUG)
+    bus.debug("test.debug", "shown")
+    assert stream.getvalue() == "shown\n"
+
+
+def test_parse_level():
+    assert events.parse_level("WARN") == events.WARNING
+    assert events.parse_level(" error ") == events.ERROR
+    assert events.parse_level(events.DEBUG) == events.DEBUG
+    with pytest.raises(ValueError):
+        events.parse_level("loud")
+
+
+def test_jsonl_sink_records_bound_fields(tmp_path):
+    bus = events.EventBus()
+    path = tmp_path / "events.jsonl"
+    sink = bus.add_sink(events.JSONLSink(path, "debug"))
+    with events.bind(workflow_id="run-1"):
+        bus.debug("workflow.routing", "step %s", "one", step="one")
+    bus.error("workflow.error", "failed")
+    bus.remove_sink(sink)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["level"] for r in records] == ["debug", "error"]
+    assert records[0]["event"] == "workflow.routing"
+    assert records[0]["message"] == "step one"
+    assert records[0]["workflow_id"] == "run-1"
+    assert records[0]["step"] == "one"
+    assert "workflow_id" not in records[1]
+    assert bus.level == events.DISABLED
+
+
+def test_console_lines_of_agent_events(bus):
+    bus, stream = bus
+    bus.info("agent.output", "Running", icon="🤖")
+    line = stream.getvalue()
+    assert line.startswith("🤖 ") and line.endswith(": Running\n")
+
+
+def test_queue_sink_filters_subscribers():
+    async def main():
+        bus = events.EventBus()
+        sink = bus.add_sink(events.QueueSink())
+        with sink.subscribe(workflow_id="a") as queue:
+            with events.bind(workflow_id="b"):
+                bus.info("agent.output", "other run")
+            with events.bind(workflow_id="a"):
+                bus.info("agent.output", "this run")
+            event = await asyncio.wait_for(queue.get(), 1)
+        assert event.message == "this run"
+        assert queue.empty()
+        assert events.QueueSink.sse(event).startswith("event: agent.output\ndata: ")
+
+    asyncio.run(main())
+
+
+def test_agent_print_levels(capsys):
+    level = events.CONSOLE.level
+    events.BUS.set_level(events.INFO)
+    try:
+        _print_agent_messages()
+    finally:
+        events.BUS.set_level(level)
+    out = capsys.readouterr().out
+    assert "hidden" not in out
+    assert "ERROR [MockAgent mock]: shown" in out
+    assert out.startswith("🤖 ")
+    assert "Response from mock" in out
+
+
+def _print_agent_messages():
+    agent = MockAgent(
+        {"metadata": {"name": "mock"}, "spec": {"framework": "mock", "model": "m"}}
+    )
+    agent.print("DEBUG [MockAgent mock]: hidden")
+    agent.print("ERROR [MockAgent mock]: shown")
+    agent.print("Response from mock")
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import copy
+import os
+
+import pytest
+
+from maestro import bench, logging_hooks, workflow as workflow_module
+from maestro.agents.mock_agent import MockAgent
+from maestro.file_logger import EvaluationLogger, FileLogger
+from maestro.log_index import LogIndex, parse_since, to_records
+from maestro.workflow import Workflow
+
+
+def _log_calls(logger, workflow_id, count, error=None):
+    for i in range(count):
+        logger.log_agent_response(
+            workflow_id=workflow_id,
+            step_index=i,
+            agent_name="writer",
+            model="openai/gpt-4o-mini",
+            input_text="in",
+            response_text="out",
+            duration_ms=100 + i,
+            token_usage={
+                "prompt_tokens": 1000,
+                "response_tokens": 500,
+                "total_tokens": 1500,
+            },
+            error=error,
+        )
+
+
+def test_update_reads_appended_lines_only(tmp_path):
+    logger = FileLogger(tmp_path)
+    _log_calls(logger, "run1", 3)
+    with LogIndex(tmp_path) as index:
+        assert index.update() == {"files": 1, "read": 1, "records": 3}
+        assert index.update() == {"files": 1, "read": 0, "records": 0}
+
+        _log_calls(logger, "run1", 1)
+        with open(tmp_path / "maestro_run_run1.jsonl", "a") as f:
+            f.write('{"log_type": "agent_resp')
+        assert index.update()["records"] == 1
+        assert len(index.calls()) == 4
+
+        # A replaced file is indexed again
+        (tmp_path / "maestro_run_run1.jsonl").write_text("")
+        _log_calls(logger, "run1", 2)
+        assert index.update()["records"] == 2
+        assert len(index.calls()) == 2
+
+        (tmp_path / "maestro_run_run1.jsonl").unlink()
+        index.update()
+        assert index.calls().empty
+
+
+def test_update_reindexes_rewritten_files(tmp_path):
+    path = tmp_path / "maestro_run_run1.jsonl"
+    _log_calls(FileLogger(tmp_path), "run1", 2)
+    with LogIndex(tmp_path) as index:
+        index.update()
+
+        # Rewritten with the same size
+        path.write_text(path.read_text().replace("writer", "editor"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert index.update()["records"] == 2
+        assert set(index.calls()["agent"]) == {"editor"}
+
+        # Replaced with a larger file
+        other = tmp_path / "other"
+        _log_calls(FileLogger(other), "run1", 3)
+        os.replace(other / "maestro_run_run1.jsonl", path)
+        assert index.update()["records"] == 3
+        assert set(index.calls()["agent"]) == {"writer"}
+        assert len(index.calls()) == 3
+
+
+def test_report(tmp_path):
+    logger = FileLogger(tmp_path)
+    _log_calls(logger, "run1", 3)
+    _log_calls(logger, "run2", 1, error="rate limited")
+    logger.log_workflow_run("run1", "essay", "p", "o", [], "success", duration_ms=400)
+    logger.log_workflow_run("run2", "essay", "p", "", [], "error", duration_ms=200)
+    EvaluationLogger(tmp_path).append(
+        {"agent_name": "writer", "watsonx_scores": {"answer_relevance_score": 0.5}}
+    )
+
+    with LogIndex(tmp_path) as index:
+        index.update()
+        report = to_records(index.report(("workflow", "model")))
+
+    (calls,) = report["calls"]
+    assert (calls["workflow"], calls["model"]) == ("essay", "openai/gpt-4o-mini")
+    assert calls["calls"] == 4
+    assert calls["error_rate"] == 0.25
+    assert calls["total_tokens"] == 6000
+    assert calls["cost"] == pytest.approx(4 * (1000 * 0.15 + 500 * 0.60) / 1e6)
+    assert calls["p50_ms"] == 100.5
+    assert report["runs"] == [
+        {
+            "workflow": "essay",
+            "runs": 2,
+            "errors": 1,
+            "error_rate": 0.5,
+            "mean_ms": 300.0,
+            "p50_ms": 300.0,
+            "p95_ms": 390.0,
+            "p99_ms": 398.0,
+        }
+    ]
+    assert report["evaluations"][0]["metric"] == "answer_relevance"
+
+    with LogIndex(tmp_path) as index:
+        assert index.report(since="2000-01-01")["calls"]["calls"].sum() == 4
+        assert index.report(since="3000-01-01")["calls"].empty
+        with pytest.raises(ValueError):
+            index.report(("step",))
+    assert parse_since("2025-01-01T02:00:00+02:00") == "2025-01-01T00:00:00+00:00"
+    with pytest.raises(ValueError):
+        parse_since("yesterday")
+
+
+def test_failed_agent_runs_are_logged(monkeypatch, tmp_path):
+    class FailingAgent(MockAgent):
+        async def run(self, prompt, context=None, step_index=None):
+            raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: FailingAgent)
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    agents, definition, _ = bench.generate_workflow("linear", 1)
+    workflow = Workflow(agents, copy.deepcopy(definition), workflow_id="run1")
+    with pytest.raises(RuntimeError):
+        asyncio.run(workflow.run())
+
+    with LogIndex(tmp_path) as index:
+        index.update()
+        (calls,) = to_records(index.report(("agent", "workflow")))["calls"]
+    assert (calls["agent"], calls["workflow"]) == ("agent1", "bench-linear")
+    assert calls["errors"] == 1
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import os
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from maestro.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    REGISTRY,
+)
+from maestro.workflow import Workflow
+
+
+def test_counter_and_gauge_exposition():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("test_total", "A counter.", ("agent",)))
+    gauge = registry.register(Gauge("test_inflight", "A gauge."))
+
+    counter.labels("a1").inc()
+    counter.labels("a1").inc(2)
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    text = registry.generate_latest()
+    assert "# TYPE test_total counter" in text
+    assert 'test_total{agent="a1"} 3' in text
+    assert "test_inflight 1" in text
+
+
+def test_labels_are_cached():
+    counter = Counter("cached_total", "A counter.", ("workflow", "agent"))
+    assert counter.labels("w", "a") is counter.labels("w", "a")
+    with pytest.raises(ValueError):
+        counter.labels("only-one")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("test_seconds", "A histogram.", ("step",), buckets=(0.1, 1.0))
+    )
+    child = histogram.labels("s1")
+    child.observe(0.05)
+    child.observe(0.5)
+    child.observe(5)
+
+    text = registry.generate_latest()
+    assert 'test_seconds_bucket{step="s1",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{step="s1",le="1"} 2' in text
+    assert 'test_seconds_bucket{step="s1",le="+Inf"} 3' in text
+    assert 'test_seconds_count{step="s1"} 3' in text
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("escaped_total", "A counter.", ("name",)))
+    counter.labels('a "quoted"\nname').inc()
+    assert 'escaped_total{name="a \\"quoted\\"\\nname"} 1' in (
+        registry.generate_latest()
+    )
+
+
+def test_workflow_run_records_metrics(monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    REGISTRY.clear()
+    yamls = os.path.join(os.path.dirname(__file__), "yamls")
+    with open(os.path.join(yamls, "agents", "simple_agent.yaml")) as f:
+        agents_yaml = list(yaml.safe_load_all(f))
+    with open(os.path.join(yamls, "workflows", "simple_workflow.yaml")) as f:
+        workflow_yaml = list(yaml.safe_load_all(f))
+
+    workflow = Workflow(agents_yaml, workflow_yaml[0])
+    asyncio.run(workflow.run())
+
+    text = REGISTRY.generate_latest()
+    assert 'maestro_workflow_duration_seconds_count{workflow="simple workflow"} 1' in (
+        text
+    )
+    assert (
+        'maestro_step_duration_seconds_count{workflow="simple workflow",step="step2"} 1'
+        in text
+    )
+    assert (
+        'maestro_agent_duration_seconds_count{workflow="simple workflow",agent="test3"} 1'
+        in text
+    )
+
+
+def test_metrics_endpoint(monkeypatch):
+    from maestro.cli.fastapi_serve import FastAPIWorkflowServer
+
+    monkeypatch.setenv("DRY_RUN", "1")
+    yamls = os.path.join(os.path.dirname(__file__), "yamls")
+    server = FastAPIWorkflowServer(
+        os.path.join(yamls, "agents", "simple_agent.yaml"),
+        os.path.join(yamls, "workflows", "simple_workflow.yaml"),
+    )
+    client = TestClient(server.app)
+    assert client.post("/chat", json={"prompt": "hello"}).status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "maestro_step_duration_seconds_bucket" in response.text
+    assert (
+        'maestro_inflight_requests{server="workflow",endpoint="/chat"} 0'
+        in response.text
+    )
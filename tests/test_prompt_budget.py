@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+
+import pytest
+
+from maestro import logging_hooks, prompt_budget
+from maestro.file_logger import FileLogger
+from maestro.prompt_budget import (
+    TRIM_MARKER,
+    allocate,
+    assemble,
+    context_window,
+    count_tokens,
+    trim,
+)
+from maestro.workflow import Workflow
+
+
+def test_context_window_of_known_models():
+    assert context_window("gpt-4o-mini") == 128000
+    assert context_window("openai/gpt-4.1-nano") == 1047576
+    assert context_window("gpt-4") == 8192
+    assert context_window("ollama/llama3.1:8b") == 131072
+    assert context_window("my-model") is None
+    assert context_window(None) is None
+
+
+def test_trim_policies():
+    text = " ".join(f"word{i}" for i in range(400))
+    for policy in ("head", "tail", "middle"):
+        trimmed = trim(text, 20, policy)
+        assert TRIM_MARKER in trimmed
+        assert count_tokens(trimmed) <= 20 + count_tokens(f"\n{TRIM_MARKER}\n")
+    assert trim(text, 20, "head").startswith("word0")
+    assert trim(text, 20, "tail").endswith("word399")
+    middle = trim(text, 20, "middle")
+    assert middle.startswith("word0") and middle.endswith("word399")
+    assert trim("short", 20) == "short"
+
+
+def test_allocate_leaves_unused_share_to_larger_sources():
+    assert allocate([10, 500, 500], 310, [False] * 3) == [10, 150, 150]
+    assert allocate([10, 500, 500], 2000, [False] * 3) == [10, 500, 500]
+    # Kept sources are not shortened, the others share what remains
+    assert allocate([100, 500, 500], 300, [True, False, False]) == [100, 100, 100]
+
+
+def test_sources_within_budget_are_not_measured(monkeypatch):
+    def fail(text):
+        raise AssertionError("tokenized a prompt that fits")
+
+    monkeypatch.setattr(prompt_budget, "count_tokens", fail)
+    value = object()
+    prompt, report = asyncio.run(assemble([("a", "one")], 100))
+    assert prompt == "one" and report is None
+    prompt, report = asyncio.run(assemble([("a", "one"), ("b", "two")], 100))
+    assert prompt == "one\n\ntwo" and report is None
+    assert asyncio.run(assemble([("a", value)], None)) == (value, None)
+    assert asyncio.run(assemble([("a", None)], None)) == ("", None)
+
+
+def test_multibyte_sources_are_measured():
+    if prompt_budget._encoding() is None:
+        pytest.skip("needs the tiktoken encoding")
+    # Emoji take several tokens per character
+    text = "\U0001f600" * 100
+    prompt, report = asyncio.run(assemble([("a", text)], 120))
+    assert report is not None and report["trimmed_tokens"] > 0
+    assert prompt_budget.count_tokens(prompt) <= 120 + 10
+
+
+def test_assemble_trims_sources_to_budget():
+    short = "a short note"
+    long = " ".join(f"line{i}" for i in range(2000))
+    prompt, report = asyncio.run(
+        assemble(
+            [("note", short), ("log", long), ("draft", long)],
+            300,
+            source_policies={"log": "tail"},
+        )
+    )
+    assert prompt.startswith(short + "\n\n")
+    assert count_tokens(prompt) <= 300 + 2 * count_tokens(f"\n{TRIM_MARKER}\n")
+    assert set(report["sources"]) == {"log", "draft"}
+    assert report["sources"]["log"]["policy"] == "tail"
+    assert report["sources"]["draft"]["policy"] == "head"
+    assert report["trimmed_tokens"] > 0
+    assert (
+        report["prompt_tokens"]
+        == count_tokens(long) * 2
+        + count_tokens(short)
+        + 2 * count_tokens("\n\n")
+        - report["trimmed_tokens"]
+    )
+
+
+def test_assemble_summarizes_sources():
+    summarized = []
+
+    async def summarize(text, tokens):
+        summarized.append(tokens)
+        return "summary"
+
+    long = "x " * 4000
+    prompt, report = asyncio.run(
+        assemble([("doc", long)], 100, policy="summarize", summarize=summarize)
+    )
+    assert prompt == "summary"
+    assert summarized == [100]
+    assert report["sources"]["doc"]["kept"] == count_tokens("summary")
+
+
+def _workflow(budget):
+    agents = [
+        {
+            "apiVersion": "maestro/v1alpha1",
+            "kind": "Agent",
+            "metadata": {"name": name},
+            "spec": {"framework": "mock", "model": "gpt-4", "description": name},
+        }
+        for name in ("writer", "reader", "summarizer")
+    ]
+    workflow = {
+        "apiVersion": "maestro/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {"name": "budget"},
+        "spec": {
+            "template": {
+                "agents": ["writer", "reader", "summarizer"],
+                "prompt": "word " * 3000,
+                "steps": [
+                    {"name": "write", "agent": "writer"},
+                    {
+                        "name": "read",
+                        "agent": "reader",
+                        "from": ["prompt", "write"],
+                        "budget": budget,
+                    },
+                ],
+            }
+        },
+    }
+    return Workflow(agents, workflow)
+
+
+def test_workflow_trims_routed_prompt(monkeypatch, tmp_path):
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    workflow = _workflow({"max_tokens": 500, "sources": {"write": "tail"}})
+    result = asyncio.run(workflow.run())
+
+    report = workflow.step_metadata["read"]
+    assert report["budget"] == 500
+    assert report["trimmed_tokens"] > 0
+    assert report["sources"]["write"]["policy"] == "tail"
+    assert TRIM_MARKER in result["final_prompt"]
+    assert count_tokens(result["final_prompt"]) < 600
+
+
+def test_workflow_budget_defaults_to_context_window(monkeypatch, tmp_path):
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    workflow = _workflow(None)
+    asyncio.run(workflow.run())
+    # gpt-4 has an 8192 token window, enough for both sources
+    assert workflow.agents["reader"].prompt_budget() == 8192
+    assert workflow.step_metadata["read"]["trimmed_tokens"] == 0
+
+
+def test_workflow_summarizer(monkeypatch, tmp_path):
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    workflow = _workflow(
+        {"max_tokens": 500, "policy": "summarize", "summarizer": "summarizer"}
+    )
+    result = asyncio.run(workflow.run())
+    assert "Mock agent: answer for Summarize the following" in result["final_prompt"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(_workflow({"max_tokens": 500, "policy": "summarize"}).run())
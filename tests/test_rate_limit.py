@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+
+import pytest
+
+from maestro import rate_limit
+from maestro.agents import openai_agent
+from maestro.agents.hedging import PRIMARY
+from maestro.agents.mock_agent import MockAgent
+from maestro.metrics import RATE_LIMIT_AVAILABLE
+from maestro.rate_limit import RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def limiters(monkeypatch):
+    monkeypatch.delenv(rate_limit.RPM_ENV, raising=False)
+    monkeypatch.delenv(rate_limit.TPM_ENV, raising=False)
+    rate_limit.clear_rate_limiters()
+    yield
+    rate_limit.clear_rate_limiters()
+
+
+def test_requests_per_minute(clock):
+    limiter = RateLimiter("http://llm", "model", requests_per_minute=60)
+    waits = [limiter.reserve().wait for _ in range(62)]
+    assert waits[:60] == [0.0] * 60
+    assert waits[60:] == pytest.approx([1.0, 2.0])
+
+    clock.now += 30
+    assert limiter.state()["requests"] == pytest.approx(28)
+    assert limiter.state()["tokens"] is None
+
+
+def test_tokens_per_minute_are_corrected_by_usage(clock):
+    limiter = RateLimiter("http://llm", "model", tokens_per_minute=600)
+    reservation = limiter.reserve(500)
+    assert reservation.wait == 0.0
+    assert limiter.reserve(200).wait == pytest.approx(10.0)
+
+    # The first call used 100 tokens instead of the estimated 500
+    reservation.settle(100)
+    assert limiter.state()["tokens"] == pytest.approx(300)
+    reservation.settle(1)
+    assert limiter.state()["tokens"] == pytest.approx(300)
+
+    # Calls using more than estimated are charged the difference
+    limiter.reserve(100).settle(400)
+    assert limiter.state()["tokens"] == pytest.approx(-100)
+    assert RATE_LIMIT_AVAILABLE.labels("http://llm", "model", "tokens").value == -100
+
+
+def test_failed_calls_give_the_estimate_back(clock):
+    limiter = RateLimiter("http://llm", "model", tokens_per_minute=600)
+    limiter.reserve(500).settle(0)
+    assert limiter.state()["tokens"] == pytest.approx(600)
+
+    # Without a count the estimate stands
+    limiter.reserve(500).settle(None)
+    assert limiter.state()["tokens"] == pytest.approx(100)
+
+
+def test_failed_openai_requests_are_settled(clock, monkeypatch):
+    limiter = RateLimiter("http://llm", "model", tokens_per_minute=600)
+
+    async def fail(agent, prompt):
+        raise ConnectionError("reset")
+
+    monkeypatch.setattr(openai_agent.UnderlyingRunner, "run", fail)
+    # Agent construction configures logfire; only the request is tested
+    agent = object.__new__(openai_agent.OpenAIAgent)
+    with pytest.raises(ConnectionError):
+        asyncio.run(agent._run_on(None, "hello", PRIMARY, limiter.reserve(500)))
+    assert limiter.state()["tokens"] == pytest.approx(600)
+
+
+def test_budgets_refill_up_to_capacity(clock):
+    limiter = RateLimiter("http://llm", "model", 10, 1000)
+    limiter.reserve(1000)
+    clock.now += 3600
+    assert limiter.state() == {"requests": 10, "tokens": 1000}
+
+
+def test_acquire_waits_for_budget(clock, monkeypatch):
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", sleep)
+    limiter = RateLimiter("http://llm", "model", requests_per_minute=1)
+    asyncio.run(limiter.acquire())
+    asyncio.run(limiter.acquire())
+    assert slept == [pytest.approx(60.0)]
+
+
+def test_cancelled_waits_give_the_reservation_back(clock, monkeypatch):
+    async def sleep(seconds):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", sleep)
+    limiter = RateLimiter("http://llm", "model", 1, 600)
+    limiter.reserve(600)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(limiter.acquire(300))
+    assert limiter.state() == {"requests": 0, "tokens": pytest.approx(0)}
+
+
+def test_limiters_are_shared_by_provider_and_model(monkeypatch):
+    assert get_rate_limiter("http://llm", "model") is None
+
+    first = get_rate_limiter("http://llm", "model", requests_per_minute=100)
+    assert get_rate_limiter("http://llm", "model") is first
+    assert get_rate_limiter("http://llm", "other") is None
+
+    # The strictest limits of all agents sharing a limiter apply
+    get_rate_limiter("http://llm", "model", 200, 5000)
+    get_rate_limiter("http://llm", "model", 50)
+    assert first.requests.per_minute == 50
+    assert first.tokens.per_minute == 5000
+
+    monkeypatch.setenv(rate_limit.TPM_ENV, "1000")
+    assert get_rate_limiter("http://other", "model").tokens.per_minute == 1000
+
+
+def test_agent_acquire_estimates_tokens(clock):
+    agent = MockAgent(
+        {
+            "metadata": {"name": "limited"},
+            "spec": {
+                "framework": "mock",
+                "model": "model",
+                "url": "http://llm",
+                "instructions": "be brief",
+                "model_parameters": {"max_tokens": 50},
+                "rate_limit": {"requests_per_minute": 10, "tokens_per_minute": 1000},
+            },
+        }
+    )
+    reservation = asyncio.run(agent.acquire_rate_limit("hello world"))
+    assert reservation.tokens > 50
+    limiter = get_rate_limiter("http://llm", "model")
+    assert limiter.state()["requests"] == 9
+    assert limiter.state()["tokens"] == 1000 - reservation.tokens
+
+    unlimited = MockAgent(
+        {"metadata": {"name": "free"}, "spec": {"framework": "mock", "model": "x"}}
+    )
+    assert asyncio.run(unlimited.acquire_rate_limit("hello")) is None
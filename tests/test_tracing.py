@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import os
+import time
+
+import pytest
+import yaml
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from maestro import tracing
+from maestro.tracing import (
+    TailSamplingSpanProcessor,
+    inject_headers,
+    remote_context,
+    span,
+    start_trace,
+)
+from maestro.workflow import Workflow
+
+YAMLS_DIR = os.path.join(os.path.dirname(__file__), "yamls")
+
+
+def _provider(processor):
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = _provider(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_tracer", lambda: provider.get_tracer("test"))
+    return exporter
+
+
+def _simple_workflow():
+    with open(os.path.join(YAMLS_DIR, "agents", "simple_agent.yaml")) as f:
+        agents_yaml = list(yaml.safe_load_all(f))
+    with open(os.path.join(YAMLS_DIR, "workflows", "simple_workflow.yaml")) as f:
+        workflow_yaml = list(yaml.safe_load_all(f))
+    return Workflow(agents_yaml, workflow_yaml[0])
+
+
+def test_workflow_run_creates_span_tree(exporter, monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    asyncio.run(_simple_workflow().run())
+
+    spans = exporter.get_finished_spans()
+    root = next(s for s in spans if s.name == "maestro.workflow.run")
+    steps = [s for s in spans if s.name == "maestro.step"]
+    agents = [s for s in spans if s.name == "maestro.agent.run"]
+
+    assert root.parent is None
+    assert root.attributes["maestro.workflow"] == "simple workflow"
+    assert [s.attributes["maestro.step"] for s in steps] == [
+        "step1",
+        "step2",
+        "step3",
+    ]
+    assert all(s.parent.span_id == root.context.span_id for s in steps)
+    step_ids = {s.context.span_id for s in steps}
+    assert len(agents) == 3
+    assert all(a.parent.span_id in step_ids for a in agents)
+    assert {s.context.trace_id for s in spans} == {root.context.trace_id}
+
+
+def test_unsampled_trace_creates_no_spans(exporter, monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+    monkeypatch.setenv("MAESTRO_TRACE_SAMPLE_RATE", "0")
+    asyncio.run(_simple_workflow().run())
+    assert exporter.get_finished_spans() == ()
+
+
+def test_remote_context_continues_trace(exporter):
+    with start_trace("parent") as parent:
+        headers = inject_headers()
+    assert "traceparent" in headers
+
+    with remote_context(headers):
+        with start_trace("child"):
+            pass
+
+    child = next(s for s in exporter.get_finished_spans() if s.name == "child")
+    assert child.context.trace_id == parent.get_span_context().trace_id
+    assert child.parent.is_remote
+
+
+def test_tail_sampling_keeps_slow_and_failed_traces(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = _provider(
+        TailSamplingSpanProcessor(
+            SimpleSpanProcessor(exporter), latency_threshold_ms=20
+        )
+    )
+    monkeypatch.setattr(tracing, "_tracer", lambda: provider.get_tracer("test"))
+
+    with start_trace("fast"):
+        with span("fast.child"):
+            pass
+    with start_trace("slow"):
+        with span("slow.child"):
+            time.sleep(0.03)
+    with pytest.raises(RuntimeError):
+        with start_trace("failed"):
+            with span("failed.child"):
+                raise RuntimeError("boom")
+
+    names = sorted(s.name for s in exporter.get_finished_spans())
+    assert names == ["failed", "failed.child", "slow", "slow.child"]
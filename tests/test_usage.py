@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import copy
+import json
+
+import pytest
+
+from maestro import bench, logging_hooks, usage, workflow as workflow_module
+from maestro.batch import BatchRunner
+from maestro.agents.mock_agent import MockAgent
+from maestro.file_logger import FileLogger
+from maestro.workflow import Workflow
+
+
+class TokenAgent(MockAgent):
+    """Uses as many prompt tokens as its prompt has characters."""
+
+    async def run(self, prompt, context=None, step_index=None):
+        # Finish in reverse order of start, as concurrent model calls may
+        await asyncio.sleep(0.05 / len(prompt))
+        self.set_token_usage(
+            {
+                "prompt_tokens": len(prompt),
+                "response_tokens": 10,
+                "total_tokens": len(prompt) + 10,
+            }
+        )
+        return "ok"
+
+
+@pytest.fixture
+def linear(monkeypatch, tmp_path):
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: TokenAgent)
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    agents, definition, _ = bench.generate_workflow("linear", 2)
+    for agent in agents:
+        agent["spec"]["model"] = "openai/gpt-4o-mini"
+    return agents, definition
+
+
+def test_cost():
+    assert usage.price("openai/gpt-4o-mini") == (0.15, 0.60)
+    assert usage.price("gpt-4o-2024-08-06") == (2.50, 10.00)
+    assert usage.cost("gpt-4o", 1_000_000, 100_000) == pytest.approx(3.5)
+    assert usage.price("granite3.3:8b") is None
+    assert usage.cost("granite3.3:8b", 1000, 1000) == 0
+
+
+def test_concurrent_runs_of_shared_agents(linear):
+    agents, definition = linear
+    template = Workflow(agents, copy.deepcopy(definition))
+    template._create_agents()
+
+    async def run(prompt):
+        workflow = Workflow(agents, copy.deepcopy(definition), agents=template.agents)
+        await workflow.run(prompt)
+        return workflow.usage
+
+    async def run_all():
+        return await asyncio.gather(*(run("p" * n) for n in (1, 2, 3, 4)))
+
+    ledgers = asyncio.run(run_all())
+    for n, ledger in zip((1, 2, 3, 4), ledgers):
+        steps = ledger.by_step()
+        assert steps["step1"]["prompt_tokens"] == n
+        assert steps["step1"]["calls"] == 1
+        # step2 is prompted with step1's answer
+        assert steps["step2"]["prompt_tokens"] == 2
+        assert set(ledger.by_agent()) == {"agent1", "agent2"}
+        totals = ledger.totals()
+        assert totals["total_tokens"] == n + 2 + 20
+        assert totals["cost"] == pytest.approx(((n + 2) * 0.15 + 20 * 0.60) / 1_000_000)
+
+
+def test_run_budget_stops_run(linear):
+    agents, definition = linear
+    definition["spec"]["template"]["run_budget"] = {"max_tokens": 5}
+    workflow = Workflow(agents, definition)
+
+    with pytest.raises(usage.BudgetExceeded):
+        asyncio.run(workflow.run("a long enough prompt"))
+    # The first step used up the budget; the second never ran
+    assert list(workflow.usage.by_step()) == ["step1"]
+    assert workflow.get_usage_summary()["budget"] == {
+        "max_tokens": 5,
+        "max_cost": None,
+    }
+
+
+def test_batch_records_usage_of_the_run_ledger(linear, tmp_path):
+    agents, definition = linear
+    runner = BatchRunner(agents, definition, concurrency=2)
+    output = tmp_path / "results.jsonl"
+    summary = asyncio.run(runner.run([("a", "p"), ("b", "ppp")], output))
+
+    records = {r["id"]: r for r in map(json.loads, output.read_text().splitlines())}
+    assert records["a"]["token_usage"] == {
+        "prompt_tokens": 3,
+        "response_tokens": 20,
+        "total_tokens": 23,
+    }
+    assert records["b"]["token_usage"]["prompt_tokens"] == 5
+    assert records["a"]["cost"] == pytest.approx((3 * 0.15 + 20 * 0.60) / 1_000_000)
+    assert summary["token_usage"]["total_tokens"] == 23 + 25
+
+
+def test_trace_metadata_keeps_token_usage_keys(linear):
+    agents, definition = linear
+    workflow = Workflow(agents, definition)
+    asyncio.run(workflow.run("pp"))
+
+    metadata = workflow._build_trace_metadata({})
+    assert metadata["total_prompt_tokens"] == 4
+    assert metadata["total_response_tokens"] == 20
+    assert metadata["total_tokens"] == 24
+    assert metadata["agent_token_usage"]["agent1"] == {
+        "prompt_tokens": 2,
+        "response_tokens": 10,
+        "total_tokens": 12,
+    }
+    assert metadata["usage"]["totals"]["calls"] == 2
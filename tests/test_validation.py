@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import json
+import os
+import shutil
+
+import pytest
+from docopt import docopt
+
+from maestro.cli import run_maestro
+from maestro.cli.commands import CLI
+from maestro.validation import expand_paths, get_validator, validate_paths
+
+YAMLS_DIR = os.path.join(os.path.dirname(__file__), "yamls")
+
+INVALID_AGENT = """\
+apiVersion: maestro/v1alpha1
+kind: Agent
+metadata:
+  name: broken
+spec:
+  framework: 42
+"""
+
+
+@pytest.fixture
+def definitions(tmp_path):
+    shutil.copy(os.path.join(YAMLS_DIR, "agents", "simple_agent.yaml"), tmp_path)
+    nested = tmp_path / "workflows"
+    nested.mkdir()
+    shutil.copy(os.path.join(YAMLS_DIR, "workflows", "simple_workflow.yaml"), nested)
+    return tmp_path
+
+
+def test_expand_paths(definitions):
+    expected = [
+        str(definitions / "simple_agent.yaml"),
+        str(definitions / "workflows" / "simple_workflow.yaml"),
+    ]
+    assert expand_paths([str(definitions)]) == expected
+    assert expand_paths([str(definitions / "**" / "*.yaml")]) == expected
+    assert expand_paths([expected[0], str(definitions / "*.yaml")]) == expected[:1]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_paths(definitions, workers):
+    report = validate_paths([str(definitions)], workers=workers)
+    assert report["valid"]
+    assert report["summary"]["files"] == 2
+    assert report["summary"]["documents"] == 6
+
+    (definitions / "broken_agents.yaml").write_text(INVALID_AGENT)
+    report = validate_paths([str(definitions)], workers=workers)
+    assert not report["valid"]
+    broken = report["files"][0]
+    assert broken["file"].endswith("broken_agents.yaml")
+    assert broken["documents"][0]["errors"][0]["path"] == "spec.framework"
+
+
+def test_undefined_agent_across_files(definitions):
+    # Agents are resolved in the workflow's directory, which defines none
+    assert validate_paths([str(definitions)], workers=1)["valid"]
+
+    (definitions / "workflows" / "agents.yaml").write_text(
+        "apiVersion: maestro/v1alpha1\n"
+        "kind: Agent\n"
+        "metadata:\n  name: test1\n"
+        "spec:\n  framework: beeai\n  model: llama3.1\n  description: d\n"
+        "  instructions: i\n"
+    )
+    report = validate_paths([str(definitions)], workers=1)
+    assert not report["valid"]
+    errors = report["files"][-1]["documents"][0]["errors"]
+    assert [e["message"] for e in errors] == [
+        f"workflow 'simple workflow' references undefined agent '{name}'"
+        for name in ("test2", "test3", "test4")
+    ]
+
+
+def test_validator_is_cached(definitions):
+    get_validator.cache_clear()
+    validate_paths([str(definitions)], workers=1)
+    validate_paths([str(definitions)], workers=1)
+    assert get_validator.cache_info().misses == 2
+
+
+def test_validate_command_json_report(definitions, capsys):
+    argv = ["validate", str(definitions), "--format", "json", "--workers", "1"]
+    assert CLI(docopt(run_maestro.__doc__, argv=argv)).command().execute() == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["invalid_files"] == 0
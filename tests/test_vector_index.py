@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import json
+import os
+
+import numpy as np
+from docopt import docopt
+
+from maestro.agents.query_agent import RESULT_CACHE, QueryAgent
+from maestro.cli import run_maestro
+from maestro.cli.commands import CLI
+from maestro.vector_index import (
+    hash_embed,
+    load_documents,
+    open_index,
+    write_index,
+)
+
+TOPICS = ["apples", "bananas", "cherries", "dates", "elderberries", "figs"]
+
+
+def _corpus(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "fruit.md").write_text(
+        "\n\n".join(f"All about {topic} and how {topic} grow." for topic in TOPICS)
+    )
+    (docs / "extra.jsonl").write_text(
+        json.dumps({"text": "Grapes grow on vines.", "url": "grapes.html"}) + "\n"
+    )
+    return docs
+
+
+def test_load_documents_chunks_files(tmp_path):
+    documents = load_documents([str(_corpus(tmp_path))], chunk_size=40)
+    assert len(documents) == len(TOPICS) + 1
+    assert documents[0]["url"] == "grapes.html"
+    assert documents[1]["metadata"] == {"chunk": 0}
+    assert "apples" in documents[1]["text"]
+
+
+def test_flat_and_ivf_search(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    documents = [{"text": str(row)} for row in range(len(vectors))]
+    flat = write_index(str(tmp_path / "flat"), documents, vectors, "test")
+    ivf = write_index(
+        str(tmp_path / "ivf"), documents, vectors, "test", index_type="ivf", lists=8
+    )
+    assert isinstance(flat.vectors, np.memmap)
+    assert isinstance(open_index(str(tmp_path / "ivf")).lists, np.memmap)
+
+    queries = flat.vectors[[3, 42, 199]]
+    results = flat.search(queries, limit=5)
+    assert [hits[0][0] for hits in results] == [3, 42, 199]
+    assert all(
+        hits[0][1] >= hits[1][1] >= hits[4][1] and len(hits) == 5 for hits in results
+    )
+    # Probing every cluster is exact
+    exact = ivf.search(queries, limit=5, nprobe=8)
+    assert [[row for row, _ in hits] for hits in exact] == [
+        [row for row, _ in hits] for hits in results
+    ]
+    assert np.allclose(
+        [[score for _, score in hits] for hits in exact],
+        [[score for _, score in hits] for hits in results],
+    )
+    assert [hits[0][0] for hits in ivf.search(queries, limit=5, nprobe=2)] == [
+        3,
+        42,
+        199,
+    ]
+    assert len(flat.search(queries[0], limit=500)[0]) == 200
+
+
+def test_query_agent_searches_index(tmp_path):
+    RESULT_CACHE.clear()
+    index_dir = tmp_path / "index"
+    argv = ["index", str(index_dir), str(_corpus(tmp_path)), "--chunk-size", "40"]
+    args = docopt(run_maestro.__doc__, argv=argv + ["--silent"])
+    assert CLI(args).command().execute() == 0
+    assert len(open_index(str(index_dir))) == len(TOPICS) + 1
+
+    agent = QueryAgent(
+        {
+            "metadata": {
+                "name": "fruit",
+                "query_input": {"index": str(index_dir), "limit": 1},
+            },
+            "spec": {"framework": "custom", "description": "desc"},
+        }
+    )
+    assert "cherries" in asyncio.run(agent.run("cherries"))
+
+    results = asyncio.run(agent.search_batch(["figs", "grapes", "figs"]))
+    assert [docs[0]["text"] for docs in results] == [
+        "All about figs and how figs grow.",
+        "Grapes grow on vines.",
+        "All about figs and how figs grow.",
+    ]
+    RESULT_CACHE.clear()
+
+
+def test_hash_embeddings_match_shared_words():
+    vectors = hash_embed(["red apples", "apples are red", "blue sky"])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1)
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_rebuild_keeps_loaded_index_valid(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    path = str(tmp_path / "index")
+    write_index(path, [{"text": str(row)} for row in range(200)], vectors, "test")
+    old = open_index(path)
+
+    write_index(path, [{"text": "new"}], vectors[:1], "test")
+    new = open_index(path)
+    assert new is not old and len(new) == 1
+    # The old index still maps the arrays it loaded
+    assert old.search(old.vectors[[150]], limit=1)[0][0][0] == 150
+    assert not [name for name in os.listdir(path) if name.endswith(".tmp")]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import os
+
+import pytest
+import yaml
+
+from maestro import yaml_loader
+from maestro.cli.common import parse_yaml
+from maestro.yaml_loader import clear_yaml_cache, load_many, load_yaml
+
+DOCUMENTS = (
+    "kind: Agent\nmetadata:\n  name: a\n---\nkind: Agent\nmetadata:\n  name: b\n"
+)
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count the files actually parsed."""
+    clear_yaml_cache()
+    calls = []
+    original = yaml_loader.load_all
+
+    def load_all(stream):
+        calls.append(stream.name)
+        return original(stream)
+
+    monkeypatch.setattr(yaml_loader, "load_all", load_all)
+    return calls
+
+
+def test_loader_uses_libyaml_when_available():
+    assert yaml_loader.SafeLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def test_cached_until_changed(tmp_path, parses):
+    path = tmp_path / "agents.yaml"
+    path.write_text(DOCUMENTS)
+
+    first = load_yaml(path)
+    assert [d["metadata"]["name"] for d in first] == ["a", "b"]
+    first[0]["metadata"]["name"] = "changed"
+    assert load_yaml(str(path))[0]["metadata"]["name"] == "a"
+    assert len(parses) == 1
+
+    path.write_text(DOCUMENTS.replace("name: b", "name: bb"))
+    assert load_yaml(path)[1]["metadata"]["name"] == "bb"
+    assert len(parses) == 2
+
+
+def test_shared_documents_without_copy(tmp_path, parses):
+    path = tmp_path / "agents.yaml"
+    path.write_text(DOCUMENTS)
+    assert load_yaml(path, copy=False) is load_yaml(path, copy=False)
+    assert load_yaml(path) is not load_yaml(path, copy=False)
+
+
+def test_load_many(tmp_path, parses):
+    paths = []
+    for name in ("one", "two"):
+        paths.append(tmp_path / f"{name}.yaml")
+        paths[-1].write_text(DOCUMENTS)
+    documents = load_many(paths)
+    assert list(documents) == [str(p) for p in paths]
+    load_many(paths)
+    assert len(parses) == 2
+
+
+def test_parse_yaml_adds_source_file(tmp_path, parses):
+    path = tmp_path / "agents.yaml"
+    path.write_text(DOCUMENTS)
+    assert parse_yaml(str(path))[0]["source_file"] == os.path.abspath(path)
+    assert "source_file" not in load_yaml(path, copy=False)[0]
@@ -9,7 +9,13 @@ import unittest
 
 from unittest import TestCase
 
-from maestro.mermaid import Mermaid
+from maestro.mermaid import (
+    Mermaid,
+    clear_mermaid_cache,
+    definition_hash,
+    render_mermaid,
+)
+from maestro.metrics import CACHE_REQUESTS
 from maestro.workflow import Workflow
 
 
@@ -492,5 +498,48 @@ class TestMermaid_loop(TestCase):
                 self.assertTrue(m in markdown)
 
 
+# render_mermaid
+class TestRenderMermaid(TestCase):
+    def setUp(self):
+        clear_mermaid_cache()
+        self.workflow_yaml = parse_yaml(
+            os.path.join(
+                os.path.dirname(__file__), "../yamls/workflows/simple_workflow.yaml"
+            )
+        )[0]
+
+    def test_render_is_memoized_per_definition(self):
+        hits = CACHE_REQUESTS.labels("mermaid", "hit")
+        before = hits.value
+        markdown, etag = render_mermaid(self.workflow_yaml, "sequenceDiagram")
+        self.assertEqual(
+            markdown, Mermaid(self.workflow_yaml, "sequenceDiagram").to_markdown()
+        )
+        self.assertEqual(
+            render_mermaid(self.workflow_yaml, "sequenceDiagram"), (markdown, etag)
+        )
+        self.assertEqual(hits.value, before + 1)
+
+        _, flowchart_etag = render_mermaid(self.workflow_yaml, "flowchart", "LR")
+        self.assertNotEqual(etag, flowchart_etag)
+
+        self.workflow_yaml["spec"]["template"]["steps"][0]["name"] = "renamed"
+        changed, changed_etag = render_mermaid(self.workflow_yaml, "sequenceDiagram")
+        self.assertIn("renamed", changed)
+        self.assertNotEqual(etag, changed_etag)
+
+    def test_definition_hash_uses_agent_names(self):
+        class FakeAgent:
+            agent_name = "test1"
+
+        resolved = parse_yaml(
+            os.path.join(
+                os.path.dirname(__file__), "../yamls/workflows/simple_workflow.yaml"
+            )
+        )[0]
+        resolved["spec"]["template"]["steps"][0]["agent"] = FakeAgent()
+        self.assertEqual(definition_hash(resolved), definition_hash(self.workflow_yaml))
+
+
 if __name__ == "__main__":
     unittest.main()
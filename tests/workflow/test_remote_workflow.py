@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 IBM
+
+import asyncio
+import copy
+import json
+
+import httpx
+import pytest
+import yaml
+
+from maestro import bench, logging_hooks, remote_workflow, workflow as workflow_module
+from maestro.agents import stream_events
+from maestro.agents.mock_agent import MockAgent
+from maestro.cli.fastapi_serve import FastAPIWorkflowServer, WorkflowChatRequest
+from maestro.file_logger import FileLogger
+from maestro.workflow import Workflow
+
+
+@pytest.fixture
+def child(tmp_path, monkeypatch):
+    """A served two step workflow, reached in process through its ASGI app."""
+    monkeypatch.setattr(logging_hooks, "logger", FileLogger(tmp_path))
+    agents, definition, _ = bench.generate_workflow("linear", 2)
+    agents_file, workflow_file = tmp_path / "agents.yaml", tmp_path / "workflow.yaml"
+    agents_file.write_text(yaml.safe_dump_all(agents))
+    workflow_file.write_text(yaml.safe_dump(definition))
+    server = FastAPIWorkflowServer(str(agents_file), str(workflow_file))
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app))
+    monkeypatch.setattr(remote_workflow, "get_http_client", lambda: client)
+    return server
+
+
+def _parent():
+    agents = copy.deepcopy(bench.generate_workflow("linear", 1)[0])
+    agents[0]["metadata"]["name"] = "parent"
+    definition = {
+        "apiVersion": "maestro/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {"name": "parent"},
+        "spec": {
+            "template": {
+                "agents": ["parent"],
+                "workflows": [{"name": "child", "url": "http://child/"}],
+                "prompt": "hello",
+                "steps": [
+                    {"name": "first", "agent": "parent"},
+                    {"name": "remote", "workflow": "child"},
+                ],
+            }
+        },
+    }
+    return Workflow(agents, definition)
+
+
+def test_remote_steps_stream_through_parent(child):
+    async def stream():
+        return [step async for step in _parent().run_streaming()]
+
+    steps = asyncio.run(stream())
+    names = [step.get("step_name") for step in steps[:-1]]
+    assert names == ["first", "remote/step1", "remote/step2", "remote"]
+    assert steps[1]["remote_workflow"] == "http://child/"
+
+    result = json.loads(steps[3]["step_result"])
+    # The child got the first step's answer as its prompt, not a tuple repr
+    assert result["step1"] == "Mock agent: answer for Mock agent: answer for hello"
+    assert steps[-1]["final_result"]["remote"] == steps[3]["step_result"]
+
+
+def test_remote_step_output_is_structured(child):
+    output = asyncio.run(remote_workflow.run_remote_workflow("http://child", ["hi"]))
+    assert (
+        output["result"]["final_prompt"] == json.loads(output["prompt"])["final_prompt"]
+    )
+
+
+def test_request_payload():
+    assert remote_workflow.request_payload(["hi"]) == {"prompt": "hi"}
+    payload = remote_workflow.request_payload(["hi", {"n": 1}])
+    assert payload == {"prompt": '{"n": 1}', "inputs": ["hi", {"n": 1}]}
+    assert WorkflowChatRequest(inputs=["hi", {"n": 1}]).text() == 'hi\n\n{"n": 1}'
+    assert WorkflowChatRequest(prompt="p", inputs=["hi"]).text() == "p"
+
+
+def test_remote_agent_events_stream_through_parent(child, monkeypatch):
+    class DeltaAgent(MockAgent):
+        async def run(self, prompt, context=None, step_index=None):
+            stream_events.publish(stream_events.TextDelta(self.agent_name, "token"))
+            return await super().run(prompt, context=context, step_index=step_index)
+
+    monkeypatch.setattr(workflow_module, "get_agent_class", lambda *_: DeltaAgent)
+    child._load_workflow()
+
+    async def stream():
+        return [step async for step in _parent().run_streaming()]
+
+    deltas = [
+        step["step_name"] for step in asyncio.run(stream()) if "stream_event" in step
+    ]
+    assert deltas == ["first", "remote/step1", "remote/step2"]
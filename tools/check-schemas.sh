@@ -12,17 +12,12 @@ WORKFLOW_FILES=$(find . -path "./.venv" -prune -o -path "./.github/workflows" -p
 AGENT_FILES=$(find . -path "./.venv" -prune -o -path "./.github/workflows" -prune -o -name '*agents*.yaml' -print)
 TOOL_FILES=$(find . -path "./.venv" -prune -o -path "./.github/workflows" -prune -o -name '*tools*.yaml' -print)
 
-
-echo "|Filename|Type|Stats|" >> "$GITHUB_STEP_SUMMARY"
-echo "|---|---|---|" >> "$GITHUB_STEP_SUMMARY"
-
 EXCLUDED_FILES=("./crewai_test/src/crewai_test/config/agents.yaml"
 		"./operator/config/rbac/workflowrun_editor_role.yaml"
 		"./operator/config/rbac/workflowrun_viewer_role.yaml")
 
-# Check workflows
-# TODO Consolidate duplication
-for f in $WORKFLOW_FILES
+FILES=()
+for f in $WORKFLOW_FILES $AGENT_FILES $TOOL_FILES
     do
       EXCLUDE=false
       for EXCLUDED_FILE in "${EXCLUDED_FILES[@]}"; do
@@ -34,64 +29,30 @@ for f in $WORKFLOW_FILES
       done
       if ! $EXCLUDE
       then
-        if ! uv run maestro validate "$f"
-        then
-          RESULT="FAIL ❌"
-          fail+=1
-        else
-          RESULT="PASS ✅"
-        fi
-        echo "|$f|workflow|$RESULT|" >> "$GITHUB_STEP_SUMMARY"
+        FILES+=("$f")
       fi
     done
 
-# Check agents
-for f in $AGENT_FILES
-    do
-      EXCLUDE=false
-      for EXCLUDED_FILE in "${EXCLUDED_FILES[@]}"; do
-          if [[ "$f" == "$EXCLUDED_FILE" ]]; then
-	      echo $f
-              EXCLUDE=true
-              break
-          fi
-      done
-      if ! $EXCLUDE
-      then
-        if ! uv run maestro validate "$f"
-        then
-          RESULT="FAIL ❌"
-          fail+=1
-        else
-          RESULT="PASS ✅"
-        fi
-        echo "|$f|agent|$RESULT|" >> "$GITHUB_STEP_SUMMARY"
-      fi
-    done
+# Validate all files in one run: schemas are compiled once, files are
+# validated in parallel, and workflows are checked for undefined agents
+REPORT=$(mktemp)
+uv run maestro validate "${FILES[@]}" --silent --output "$REPORT" > /dev/null
 
-# Check toolss
-for f in $TOOL_FILES
-    do
-      EXCLUDE=false
-      for EXCLUDED_FILE in "${EXCLUDED_FILES[@]}"; do
-          if [[ "$f" == "$EXCLUDED_FILE" ]]; then
-	      echo $f
-              EXCLUDE=true
-              break
-          fi
-      done
-      if ! $EXCLUDE
-      then
-        if ! uv run maestro validate "$f"
-        then
-          RESULT="FAIL ❌"
-          fail+=1
-        else
-          RESULT="PASS ✅"
-        fi
-        echo "|$f|agent|$RESULT|" >> "$GITHUB_STEP_SUMMARY"
-      fi
-    done
+echo "|Filename|Type|Stats|" >> "$GITHUB_STEP_SUMMARY"
+echo "|---|---|---|" >> "$GITHUB_STEP_SUMMARY"
+uv run python - "$REPORT" >> "$GITHUB_STEP_SUMMARY" <<'EOF'
+import json
+import sys
+
+with open(sys.argv[1]) as f:
+    report = json.load(f)
+for result in report["files"]:
+    kinds = sorted({d["kind"] or "unknown" for d in result["documents"]})
+    status = "PASS ✅" if result["valid"] else "FAIL ❌"
+    print(f"|{result['file']}|{', '.join(kinds).lower()}|{status}|")
+EOF
+fail=$(uv run python -c "import json,sys; print(json.load(open(sys.argv[1]))['summary']['invalid_files'])" "$REPORT")
+rm -f "$REPORT"
 
 if [ -z "$CI" ];
  then